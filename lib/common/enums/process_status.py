@@ -3,3 +3,4 @@ from enum import Enum
 
 class ProcessStatus(Enum):
     COMPLETE = "complete"
+    RUNNING = "running"
@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class ResourceType(Enum):
+    INSTANCE = "instance"
+    SERVER = "server"
+    CONTAINER = "container"
+    VIRTUAL_IMAGE = "virtual_image"
+    INSTANCE_SNAPSHOTS = "instance_snapshots"
+    SNAPSHOT = "snapshot"
+    BACKUP = "backup"
@@ -0,0 +1,113 @@
+from typing import Optional
+
+# Defaults of the geometric ramp: 1s, 1.5s, 2.25s, ... capped at DEFAULT_MAX_INTERVAL
+DEFAULT_INITIAL_INTERVAL = 1.0
+DEFAULT_BACKOFF_FACTOR = 1.5
+DEFAULT_MAX_INTERVAL = 60.0
+
+# Number of polls a wait is sized for when the max interval is derived from its max wait time
+DEFAULT_POLLS_PER_WAIT = 60
+
+# Fraction of an ETA hint slept before re-checking, so the check lands just before the predicted completion
+DEFAULT_ETA_LEAD = 0.9
+
+
+class AdaptivePollScheduler:
+    """
+    Computes the interval before the next status check of a long running operation.
+
+    Without hints the interval ramps geometrically from `initial_interval` up to `max_interval`: state flips that
+    happen quickly are caught within a second or two, while hour-long operations are polled only every
+    `max_interval` seconds. When an ETA hint is available (e.g. from the `percent`/`statusEta` fields of a Morpheus
+    process) the next check is scheduled near the predicted completion, and the ramp restarts from
+    `initial_interval` so the completion itself is caught quickly.
+    """
+
+    def __init__(
+        self,
+        initial_interval: float = DEFAULT_INITIAL_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        eta_lead: float = DEFAULT_ETA_LEAD,
+    ):
+        """Initializes the AdaptivePollScheduler class.
+
+        Args:
+            initial_interval (float, optional): The first interval, in seconds. Defaults to DEFAULT_INITIAL_INTERVAL.
+            max_interval (float, optional): The upper bound of any interval, in seconds. \
+                Defaults to DEFAULT_MAX_INTERVAL.
+            backoff_factor (float, optional): The growth factor of the ramp. Defaults to DEFAULT_BACKOFF_FACTOR.
+            eta_lead (float, optional): The fraction of an ETA hint to sleep. Defaults to DEFAULT_ETA_LEAD.
+        """
+        self.initial_interval = min(initial_interval, max_interval)
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.eta_lead = eta_lead
+        self._attempt = 0
+
+    @classmethod
+    def for_wait(cls, max_wait_time: float, min_max_interval: float = 10) -> "AdaptivePollScheduler":
+        """Builds a scheduler sized for a wait of the given length.
+
+        The max interval is max_wait_time / DEFAULT_POLLS_PER_WAIT, but never below `min_max_interval` and never
+        above DEFAULT_MAX_INTERVAL.
+
+        Args:
+            max_wait_time (float): The maximum time of the wait, in seconds.
+            min_max_interval (float, optional): The lower bound of the max interval, usually the fixed sleep_time \
+                the wait used before. Defaults to 10.
+
+        Returns:
+            AdaptivePollScheduler: The scheduler.
+        """
+        max_interval = min(DEFAULT_MAX_INTERVAL, max(min_max_interval, max_wait_time / DEFAULT_POLLS_PER_WAIT))
+        return cls(max_interval=max_interval)
+
+    def reset(self):
+        """Restarts the ramp from the initial interval."""
+        self._attempt = 0
+
+    def next_interval(self, eta: Optional[float] = None, remaining: Optional[float] = None) -> float:
+        """Returns the interval before the next status check.
+
+        Args:
+            eta (Optional[float], optional): The predicted time until completion, in seconds. Defaults to None.
+            remaining (Optional[float], optional): The time left before the wait times out, in seconds; the \
+                interval never overshoots it. Defaults to None.
+
+        Returns:
+            float: The number of seconds to wait.
+        """
+        if eta is not None and eta > 0:
+            interval = min(self.max_interval, max(self.initial_interval, eta * self.eta_lead))
+            self._attempt = 0
+        else:
+            interval = min(self.max_interval, self.initial_interval * self.backoff_factor**self._attempt)
+            self._attempt += 1
+        if remaining is not None:
+            interval = max(0.0, min(interval, remaining))
+        return interval
+
+    @staticmethod
+    def estimate_eta(
+        percent: Optional[float] = None, status_eta: Optional[float] = None, elapsed: Optional[float] = None
+    ) -> Optional[float]:
+        """Estimates the time until an operation completes.
+
+        An explicit ETA wins. Otherwise the remaining time is extrapolated linearly from the progress percentage
+        and the time elapsed so far.
+
+        Args:
+            percent (Optional[float], optional): The completion percentage, 0-100. Defaults to None.
+            status_eta (Optional[float], optional): The reported time until completion, in seconds. \
+                Defaults to None.
+            elapsed (Optional[float], optional): The time since the operation started, in seconds. Defaults to None.
+
+        Returns:
+            Optional[float]: The predicted seconds until completion, or None without a usable hint.
+        """
+        if status_eta is not None and status_eta > 0:
+            return status_eta
+        if percent is not None and elapsed is not None and 0 < percent < 100 and elapsed > 0:
+            return elapsed * (100 - percent) / percent
+        return None
@@ -1,6 +1,7 @@
 from requests import Response
 from lib.common.enums.morpheus_api_endpoint_type import MorpheusAPIEndpoints
 from morpheus_api.configuration.utils import MorpheusAPI
+from morpheus_api.helpers.api_logging import ApiLogger
 from morpheus_api.dataclasses.backup import (
     CreateBackup,
     CreateBackupPayload,
@@ -11,6 +12,7 @@ from morpheus_api.dataclasses.common_objects import APIResponse
 import logging
 
 logger = logging.getLogger()
+api_logger = ApiLogger(logger)
 
 BACKUP_ENDPOINT = MorpheusAPIEndpoints.BACKUPS.value
 INSTANCE_ENDPOINT = MorpheusAPIEndpoints.INSTANCES.value
@@ -39,10 +41,10 @@ class BackupService(MorpheusAPI):
 
         create_backup_job_payload = CreateBackup(backup=create_backup_job_payload)
         json_data = create_backup_job_payload.model_dump(by_alias=True, exclude_none=True)
-        logger.info(f"Creating backup job with data: {json_data}")
+        api_logger.body(logging.INFO, "Creating backup job", json_data)
 
         response: Response = self._post(BACKUP_ENDPOINT, data=json_data)
-        return APIResponse(**response.json())
+        return self._decode(response, APIResponse)
 
     def delete_backup(self, backup_id: int) -> APIResponse:
         """
@@ -57,7 +59,7 @@ class BackupService(MorpheusAPI):
                 an assertion error is raised with the response status code and text.
         """
         response: Response = self._delete(f"{BACKUP_ENDPOINT}/{backup_id}")
-        return APIResponse(**response.json())
+        return self._decode(response, APIResponse)
 
     def list_instance_backups(self, instance_id: int) -> BackupData:
         """
@@ -71,7 +73,7 @@ class BackupService(MorpheusAPI):
             AssertionError: If the response status code is not 200 (OK).
         """
         response: Response = self._get(f"{INSTANCE_ENDPOINT}/{instance_id}/backups")
-        return BackupData(**response.json())
+        return self._decode(response, BackupData)
 
     def create_instance_backup(self, instance_id: int) -> APIResponse:
         """
@@ -85,4 +87,4 @@ class BackupService(MorpheusAPI):
                 an assertion error is raised with the response details.
         """
         response: Response = self._put(f"{INSTANCE_ENDPOINT}/{instance_id}/backup")
-        return APIResponse(**response.json())
+        return self._decode(response, APIResponse)
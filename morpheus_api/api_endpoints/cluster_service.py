@@ -1,6 +1,8 @@
+from typing import Iterator
 from requests import Response
 from lib.common.enums.morpheus_api_endpoint_type import MorpheusAPIEndpoints
-from morpheus_api.configuration.utils import MorpheusAPI
+from morpheus_api.configuration.utils import DEFAULT_PAGE_SIZE, MorpheusAPI
+from morpheus_api.dataclasses.query import ListQuery, list_endpoint
 from morpheus_api.dataclasses.cluster import Cluster, ClusterList
 from morpheus_api.dataclasses.datastore import Datastore, DatastoreList
 from morpheus_api.dataclasses.cluster_layout import ClusterLayout
@@ -36,10 +38,35 @@ class ClusterService(MorpheusAPI):
         Returns:
             ClusterList: The ClusterList object containing the list of clusters.
         """
-        response: Response = self._get(
-            f"{CLUSTER_ENDPOINT}?max={max}&offset={offset}&sort={sort}&direction={direction}"
+        query = ListQuery(max=max, offset=offset, sort=sort, direction=direction)
+        response: Response = self._get(list_endpoint(CLUSTER_ENDPOINT, query))
+        return self._decode(response, ClusterList)
+
+    def iter_clusters(
+        self,
+        sort: str = "name",
+        direction: str = "asc",
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[Cluster]:
+        """
+        Lazily iterates over all clusters, fetching one page at a time.
+
+        Args:
+            sort (str, optional): The field by which to sort the clusters. Defaults to "name".
+            direction (str, optional): The direction of the sort, either "asc" or "desc". Defaults to "asc".
+            page_size (int, optional): The number of clusters fetched per page. Defaults to DEFAULT_PAGE_SIZE.
+            prefetch (bool, optional): Fetch the next page in the background. Defaults to False.
+
+        Yields:
+            Cluster: Every cluster.
+        """
+        return self.paginate(
+            lambda max, offset: self.list_clusters(max=max, offset=offset, sort=sort, direction=direction),
+            "clusters",
+            page_size=page_size,
+            prefetch=prefetch,
         )
-        return ClusterList(**response.json())
 
     def get_cluster_by_id(self, cluster_id: int) -> Cluster:
         """
@@ -52,7 +79,7 @@ class ClusterService(MorpheusAPI):
             Cluster: An object containing the details of the cluster.
         """
         response: Response = self._get(f"{CLUSTER_ENDPOINT}/{cluster_id}")
-        return Cluster(**response.json())
+        return self._decode(response, Cluster)
 
     def create_cluster(self, data) -> dict:
         """
@@ -112,13 +139,18 @@ class ClusterService(MorpheusAPI):
         Returns:
             DatastoreList: A DatastoreList containing the list of datastores.
         """
-        url: str = f"{CLUSTER_ENDPOINT}/{cluster_id}/datastores"
-        params: str = (
-            f"max={max}&offset={offset}&sort={sort}&direction={direction}&phrase={phrase}&name={name}&code={code}&hideInactive={hide_inactive}"
+        query = ListQuery(
+            max=max,
+            offset=offset,
+            sort=sort,
+            direction=direction,
+            phrase=phrase,
+            name=name,
+            code=code,
+            extra={"hideInactive": hide_inactive},
         )
-
-        response: Response = self._get(f"{url}?{params}")
-        return DatastoreList(**response.json())
+        response: Response = self._get(list_endpoint(f"{CLUSTER_ENDPOINT}/{cluster_id}/datastores", query))
+        return self._decode(response, DatastoreList)
 
     def get_datastore_by_id(self, cluster_id: int, datastore_id: int) -> Datastore:
         """
@@ -132,7 +164,7 @@ class ClusterService(MorpheusAPI):
             Datastore: A Datastore containing the details of the datastore.
         """
         response: Response = self._get(f"{CLUSTER_ENDPOINT}/{cluster_id}/datastores/{datastore_id}")
-        return Datastore(**response.json())
+        return self._decode(response, Datastore)
 
     def get_cluster_layout_by_id(self, cluster_layout_id: int) -> ClusterLayout:
         """
@@ -145,4 +177,4 @@ class ClusterService(MorpheusAPI):
             ClusterLayout: An object containing the details of the cluster layout.
         """
         response: Response = self._get(f"{CLUSTER_ENDPOINT}/{cluster_layout_id}")
-        return ClusterLayout(**response.json())
+        return self._decode(response, ClusterLayout)
@@ -35,7 +35,7 @@ class ContainerService(MorpheusAPI):
             Container: A Container object populated with the data from the response
         """
         response: Response = self._get(f"{CONTAINERS_ENDPOINT}/{container_id}")
-        return Container(**response.json())
+        return self._decode(response, Container)
 
     def remove_container(self, container_id: int) -> APIResponse:
         """Remove node /computing server/container
@@ -46,4 +46,4 @@ class ContainerService(MorpheusAPI):
                 APIResponse: The APIResponse from the API.
         """
         response: Response = self._put(f"{CONTAINERS_ENDPOINT}/action?ids={container_id}&code=generic-remove-node")
-        return APIResponse(**response.json())
+        return self._decode(response, APIResponse)
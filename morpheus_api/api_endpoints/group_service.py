@@ -25,7 +25,7 @@ class GroupService(MorpheusAPI):
             AssertionError: If the response status code is not 200 (OK).
         """
         response: Response = self._get(GROUP_ENDPOINT)
-        return GroupList(**response.json())
+        return self._decode(response, GroupList)
 
     def get_group(self, group_id: int) -> Group:
         """
@@ -41,4 +41,4 @@ class GroupService(MorpheusAPI):
             AssertionError: If the response status code is not 200 (OK), an assertion error is raised.
         """
         response: Response = self._get(f"{GROUP_ENDPOINT}/{group_id}")
-        return Group(**response.json())
+        return self._decode(response, Group)
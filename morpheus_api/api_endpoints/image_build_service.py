@@ -22,7 +22,7 @@ class ImageBuildService(MorpheusAPI):
             ImageBuildList: The VirtualImageList object containing the list of virtual images.
         """
         response: Response = self._get(IMAGE_BUILD_ENDPOINT)
-        return ImageBuildList(**response.json())
+        return self._decode(response, ImageBuildList)
 
     def get_image_build_by_id(self, image_build_id: int) -> ImageBuild:
         """
@@ -35,4 +35,4 @@ class ImageBuildService(MorpheusAPI):
             ImageBuild: An object containing the details of the virtual image.
         """
         response: Response = self._get(f"{IMAGE_BUILD_ENDPOINT}/{image_build_id}")
-        return ImageBuild(**response.json())
+        return self._decode(response, ImageBuild)
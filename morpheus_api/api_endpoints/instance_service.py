@@ -1,22 +1,31 @@
+from typing import Iterator, Optional, Union
 from requests import Response
 from urllib.parse import urlencode
 from lib.common.enums.morpheus_api_endpoint_type import MorpheusAPIEndpoints
-from morpheus_api.configuration.utils import MorpheusAPI
+from morpheus_api.configuration.utils import DEFAULT_PAGE_SIZE, DEFAULT_STREAM_PAGE_SIZE, MorpheusAPI
+from morpheus_api.helpers.api_logging import ApiLogger
 from morpheus_api.dataclasses.common_objects import APIResponse
 from morpheus_api.dataclasses.container import ContainerList
 from morpheus_api.dataclasses.instance import (
     Instance,
     InstanceCreateData,
+    InstanceDetails,
     InstanceList,
     InstanceResizeData,
+    InstanceStatusList,
+    InstanceStatusResponse,
+    InstanceStatusView,
     InstanceUpdatePayload,
 )
 from morpheus_api.dataclasses.processes import ProcessList
+from morpheus_api.dataclasses.query import ListQuery, list_endpoint
+from morpheus_api.helpers.instance_history import HistoryRecord, InstanceHistoryCursor
 import logging
 
 INSTANCE_ENDPOINT = MorpheusAPIEndpoints.INSTANCES.value
 
 logger = logging.getLogger()
+api_logger = ApiLogger(logger)
 
 
 class InstanceService(MorpheusAPI):
@@ -29,10 +38,18 @@ class InstanceService(MorpheusAPI):
     NOTE: The only exception is that Backup & Snapshot specific APIs that use /api/instances endpoint will be found in their respective services.
 
     Methods:
-        list_instances(max_results=100, filter: str = "") -> InstanceList:
-            Lists all instances with optional filtering and maximum results limit.
+        list_instances(max_results=100, filter: str = "", offset: int = 0) -> InstanceList:
+            Lists one page of instances with optional filtering and maximum results limit.
+        iter_instances(filter: str = "", page_size: int = DEFAULT_PAGE_SIZE, prefetch: bool = False):
+            Lazily iterates over all instances, page by page.
+        stream_instances(filter: str = "", page_size: int = DEFAULT_STREAM_PAGE_SIZE):
+            Streams all instances, parsing them one at a time from the socket.
         get_instance(instance_id) -> Instance:
             Retrieves a specific instance by its ID.
+        get_instance_status(instance_id) -> InstanceStatusView:
+            Retrieves only the ID, status and locked state of an instance, for status polling.
+        list_instance_statuses(max_results=100, filter: str = "", offset: int = 0) -> InstanceStatusList:
+            Lists the ID, status and locked state of one page of instances, for status polling.
         create_instance(data):
             Creates a new instance with the provided data.
         delete_instance(instance_id, removeVolumes="on"):
@@ -49,31 +66,81 @@ class InstanceService(MorpheusAPI):
             Resizes an instance by its ID with the provided data.
         clone_instance(instance_id: int, clone_instance_name: str) -> dict:
             Clones a specific instance by its ID and assigns a new name to the cloned instance.
+        get_instance_history(instance_id, container_id=None, server_id=None, zone_id=None) -> ProcessList:
+            Retrieves the whole process history of an instance.
+        tail_instance_history(instance_id, cursor=None, page_size=DEFAULT_PAGE_SIZE) -> Iterator[HistoryRecord]:
+            Yields the processes and events of an instance history that are new or changed since the last call.
         add_node_to_instance(self, instance_id: int) -> APIResponse:
             Add nodes /computing servers to instance
         get_containers_for_instance(self, instance_id: int):
             This function provides details of the compute server(s) running on an instance
     """
 
-    def list_instances(self, max_results=100, filter: str = "") -> InstanceList:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The history cursors of tail_instance_history, by instance ID
+        self.history_cursors: dict[int, InstanceHistoryCursor] = {}
+
+    def list_instances(self, max_results=100, filter: Union[str, ListQuery] = "", offset: int = 0) -> InstanceList:
         """
         Retrieves a list of instances from the API.
 
         Args:
             max_results (int, optional): The maximum number of results to return. Defaults to 100.
-            filter (str, optional): A filter string to apply to the instance list. Defaults to "".
+            filter (Union[str, ListQuery], optional): The server-side filters of the instance list, e.g. \
+                ListQuery(name="web", status="running"). Defaults to "".
+            offset (int, optional): The offset from the start of the list. Defaults to 0.
         Returns:
             InstanceList: An object containing the list of instances.
         Raises:
             AssertionError: If the response status code is not 200 (OK).
         """
-        endpoint = f"{INSTANCE_ENDPOINT}?max={max_results}"
+        endpoint = list_endpoint(INSTANCE_ENDPOINT, filter, max=max_results, offset=offset)
+        response: Response = self._get(endpoint)
+        return self._decode(response, InstanceList)
 
-        if filter:
-            endpoint = f"{endpoint}&{filter}"
+    def iter_instances(
+        self, filter: Union[str, ListQuery] = "", page_size: int = DEFAULT_PAGE_SIZE, prefetch: bool = False
+    ) -> Iterator[InstanceDetails]:
+        """
+        Lazily iterates over all instances, fetching one page at a time.
 
-        response: Response = self._get(endpoint)
-        return InstanceList(**response.json())
+        Args:
+            filter (Union[str, ListQuery], optional): The server-side filters of the instance list, e.g. \
+                ListQuery(name="web", status="running"). Defaults to "".
+            page_size (int, optional): The number of instances fetched per page. Defaults to DEFAULT_PAGE_SIZE.
+            prefetch (bool, optional): Fetch the next page in the background. Defaults to False.
+        Yields:
+            InstanceDetails: Every instance matching the filter.
+        """
+        return self.paginate(
+            lambda max, offset: self.list_instances(max_results=max, filter=filter, offset=offset),
+            "instances",
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
+    def stream_instances(
+        self, filter: Union[str, ListQuery] = "", page_size: int = DEFAULT_STREAM_PAGE_SIZE
+    ) -> Iterator[InstanceDetails]:
+        """
+        Streams all instances, parsing and validating them one at a time as they are read from the socket.
+
+        Memory stays flat regardless of the number of instances, which makes it the method of choice to scan
+        tenants with thousands of instances.
+
+        Args:
+            filter (Union[str, ListQuery], optional): The server-side filters of the instance list, e.g. \
+                ListQuery(name="web", status="running"). Defaults to "".
+            page_size (int, optional): The number of instances requested per page. Defaults to DEFAULT_STREAM_PAGE_SIZE.
+        Yields:
+            InstanceDetails: Every instance matching the filter.
+        """
+
+        def build_endpoint(max: int, offset: int) -> str:
+            return list_endpoint(INSTANCE_ENDPOINT, filter, max=max, offset=offset)
+
+        return self.stream_list(build_endpoint, "instances", InstanceDetails, page_size=page_size)
 
     def get_instance(self, instance_id: int) -> Instance:
         """
@@ -88,7 +155,40 @@ class InstanceService(MorpheusAPI):
                 an assertion error is raised with the response details.
         """
         response: Response = self._get(f"{INSTANCE_ENDPOINT}/{instance_id}")
-        return Instance(**response.json())
+        return self._decode(response, Instance)
+
+    def get_instance_status(self, instance_id: int) -> InstanceStatusView:
+        """
+        Retrieve the ID, status and locked state of an instance.
+
+        Only the fields of the projection are validated, which makes it much cheaper than get_instance when
+        polling the status of an instance.
+
+        Args:
+            instance_id (int): The unique identifier of the instance.
+        Returns:
+            InstanceStatusView: The status projection of the instance.
+        """
+        response: Response = self._get(f"{INSTANCE_ENDPOINT}/{instance_id}")
+        return self._decode(response, InstanceStatusResponse).instance
+
+    def list_instance_statuses(
+        self, max_results=100, filter: Union[str, ListQuery] = "", offset: int = 0
+    ) -> InstanceStatusList:
+        """
+        Retrieves the ID, status and locked state of one page of instances.
+
+        Args:
+            max_results (int, optional): The maximum number of results to return. Defaults to 100.
+            filter (Union[str, ListQuery], optional): The server-side filters of the instance list, e.g. \
+                ListQuery(name="web", status="running"). Defaults to "".
+            offset (int, optional): The offset from the start of the list. Defaults to 0.
+        Returns:
+            InstanceStatusList: The status projections of the instances.
+        """
+        endpoint = list_endpoint(INSTANCE_ENDPOINT, filter, max=max_results, offset=offset)
+        response: Response = self._get(endpoint)
+        return self._decode(response, InstanceStatusList)
 
     def create_instance(self, instance_payload: InstanceCreateData) -> Instance:
         """
@@ -106,10 +206,10 @@ class InstanceService(MorpheusAPI):
             by_alias=True,
             exclude_none=True,
         )
-        logger.info(f"Creating instance with data: {instance_create_data}")
+        api_logger.body(logging.INFO, "Creating instance", instance_create_data)
 
         response: Response = self._post(INSTANCE_ENDPOINT, instance_create_data)
-        return Instance(**response.json())
+        return self._decode(response, Instance)
 
     def delete_instance(
         self,
@@ -134,7 +234,7 @@ class InstanceService(MorpheusAPI):
             endpoint=f"{INSTANCE_ENDPOINT}/{instance_id}?force={force}&removeVolumes={remove_volumes}",
             expecting_error=expecting_error,
         )
-        return APIResponse(**response.json())
+        return self._decode(response, APIResponse)
 
     def stop_instance(self, instance_id: int, data=None, query_params=None) -> APIResponse:
         """
@@ -153,7 +253,7 @@ class InstanceService(MorpheusAPI):
         if query_params:
             endpoint = f"{endpoint}?{query_params}"
         response: Response = self._put(endpoint, data)
-        return APIResponse(**response.json())
+        return self._decode(response, APIResponse)
 
     def start_instance(self, instance_id: int, data=None, query_params=None) -> APIResponse:
         """
@@ -172,7 +272,7 @@ class InstanceService(MorpheusAPI):
         if query_params:
             endpoint = f"{endpoint}?{query_params}"
         response: Response = self._put(endpoint, data)
-        return APIResponse(**response.json())
+        return self._decode(response, APIResponse)
 
     def restart_instance(self, instance_id: int, data=None, query_params=None) -> APIResponse:
         """
@@ -191,7 +291,7 @@ class InstanceService(MorpheusAPI):
         if query_params:
             endpoint = f"{endpoint}?{query_params}"
         response: Response = self._put(endpoint, data)
-        return APIResponse(**response.json())
+        return self._decode(response, APIResponse)
 
     def suspend_instance(self, instance_id: int, data=None, query_params=None) -> APIResponse:
         """
@@ -210,7 +310,7 @@ class InstanceService(MorpheusAPI):
         if query_params:
             endpoint = f"{endpoint}?{query_params}"
         response: Response = self._put(endpoint, data)
-        return APIResponse(**response.json())
+        return self._decode(response, APIResponse)
 
     def resize_instance(self, instance_id: int, resize_payload: InstanceResizeData) -> tuple[APIResponse, Instance]:
         """
@@ -229,13 +329,11 @@ class InstanceService(MorpheusAPI):
         """
         instance_resize_payload = resize_payload.model_dump(by_alias=True, exclude_none=True)
 
-        logger.info(f"Resizing instance with data: {instance_resize_payload}")
+        api_logger.body(logging.INFO, "Resizing instance", instance_resize_payload, instance_id=instance_id)
 
         response: Response = self._put(f"{INSTANCE_ENDPOINT}/{instance_id}/resize", instance_resize_payload)
-        response_json = response.json()
-
-        api_response = APIResponse(**response_json)
-        resized_instance = Instance(**response_json)
+        api_response = self._decode(response, APIResponse)
+        resized_instance = self._decode(response, Instance)
 
         return api_response, resized_instance
 
@@ -255,7 +353,7 @@ class InstanceService(MorpheusAPI):
             f"{INSTANCE_ENDPOINT}/{instance_id}/clone",
             data={"name": clone_instance_name},
         )
-        return APIResponse(**response.json())
+        return self._decode(response, APIResponse)
 
     def eject_instance(self, instance_id: int) -> APIResponse:
         """
@@ -273,7 +371,7 @@ class InstanceService(MorpheusAPI):
         url = f"{INSTANCE_ENDPOINT}/{instance_id}/eject"
 
         response: Response = self._put(url)
-        return APIResponse(**response.json())
+        return self._decode(response, APIResponse)
 
     def update_instance(
         self, instance_id: int, instance_update_payload: InstanceUpdatePayload
@@ -298,13 +396,11 @@ class InstanceService(MorpheusAPI):
             by_alias=True,
             exclude_none=True,
         )
-        logger.info(f"Updating instance with data: {instance_update_data}")
+        api_logger.body(logging.INFO, "Updating instance", instance_update_data, instance_id=instance_id)
 
         response: Response = self._put(url, instance_update_data)
-        response_json = response.json()
-
-        api_response = APIResponse(**response_json)
-        updated_instance = Instance(**response_json)
+        api_response = self._decode(response, APIResponse)
+        updated_instance = self._decode(response, Instance)
 
         return api_response, updated_instance
 
@@ -320,7 +416,7 @@ class InstanceService(MorpheusAPI):
             AssertionError: If the response status code is not 200 (OK).
         """
         response: Response = self._put(f"{INSTANCE_ENDPOINT}/{instance_id}/lock")
-        return APIResponse(**response.json())
+        return self._decode(response, APIResponse)
 
     def unlock_instance(self, instance_id: int) -> APIResponse:
         """
@@ -334,7 +430,7 @@ class InstanceService(MorpheusAPI):
             AssertionError: If the response status code is not 200 (OK).
         """
         response: Response = self._put(f"{INSTANCE_ENDPOINT}/{instance_id}/unlock")
-        return APIResponse(**response.json())
+        return self._decode(response, APIResponse)
 
     def get_instance_history(
         self,
@@ -365,7 +461,49 @@ class InstanceService(MorpheusAPI):
 
         query_string = f"?{urlencode(query_params)}" if query_params else ""
         response: Response = self._get(f"{INSTANCE_ENDPOINT}/{instance_id}/history{query_string}")
-        return ProcessList(**response.json())
+        return self._decode(response, ProcessList)
+
+    def tail_instance_history(
+        self, instance_id: int, cursor: Optional[InstanceHistoryCursor] = None, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Iterator[HistoryRecord]:
+        """
+        Yields the processes and events of an instance history that are new or changed since the last call.
+
+        The history is read newest first, one page at a time, until a page brings nothing new. Only the new or
+        changed records are validated into models; the unchanged ones are skipped by comparing their ID and
+        `lastUpdated` with the cursor. The first call on a cursor yields the whole history. The cursor moves
+        past a page once the page is read, so records of a page left unconsumed are not yielded again.
+
+        Usage:
+            for record in instance_service.tail_instance_history(instance_id):
+                if history_record_matches(record, "startup", "complete"):
+                    ...
+
+        Args:
+            instance_id (int): The ID of the instance.
+            cursor (Optional[InstanceHistoryCursor], optional): The cursor to move. Defaults to None, which uses \
+                the cursor the service keeps for the instance in history_cursors.
+            page_size (int, optional): The number of processes requested per page. Defaults to DEFAULT_PAGE_SIZE.
+
+        Yields:
+            HistoryRecord: The new or changed processes and events, oldest process first within a page, each \
+                process followed by its new or changed events.
+        """
+        if cursor is None:
+            cursor = self.history_cursors.setdefault(instance_id, InstanceHistoryCursor(instance_id))
+        endpoint = f"{INSTANCE_ENDPOINT}/{instance_id}/history"
+        offset = 0
+        while True:
+            response: Response = self._get(list_endpoint(endpoint, max=page_size, offset=offset))
+            page = response.json()
+            processes = page.get("processes") or []
+            records = cursor.advance(processes)
+            yield from records
+
+            meta = page.get("meta") or {}
+            offset += len(processes)
+            if not records or len(processes) < page_size or offset >= meta.get("total", offset + 1):
+                return
 
     def add_node_to_instance(self, instance_id: int) -> APIResponse:
         """Add nodes /computing servers to instance
@@ -377,7 +515,7 @@ class InstanceService(MorpheusAPI):
                 APIResponse: The APIResponse from the API.
         """
         response: Response = self._put(f"{INSTANCE_ENDPOINT}/action?ids={instance_id}&code=generic-add-node")
-        return APIResponse(**response.json())
+        return self._decode(response, APIResponse)
 
     def get_containers_for_instance(self, instance_id: int) -> ContainerList:
         """This function provides details of the compute server(s) running on an instance
@@ -388,4 +526,4 @@ class InstanceService(MorpheusAPI):
             ContainerList: list of containers
         """
         response: Response = self._get(f"{INSTANCE_ENDPOINT}/{instance_id}/containers")
-        return ContainerList(**response.json())
+        return self._decode(response, ContainerList)
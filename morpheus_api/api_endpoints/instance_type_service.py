@@ -1,7 +1,10 @@
+from typing import Iterator
 from requests import Response
 from lib.common.enums.morpheus_api_endpoint_type import MorpheusAPIEndpoints
-from morpheus_api.configuration.utils import MorpheusAPI
+from morpheus_api.configuration.utils import DEFAULT_PAGE_SIZE, MorpheusAPI
+from morpheus_api.dataclasses.query import ListQuery, list_endpoint
 from morpheus_api.dataclasses.instance import InstanceTypeList
+from morpheus_api.dataclasses.instance import InstanceType as InstanceTypeSummary
 from morpheus_api.dataclasses.instance_type_layout import InstanceTypeLayout, InstanceType
 
 INSTANCE_TYPE_ENDPOINT = MorpheusAPIEndpoints.INSTANCE_TYPES.value
@@ -40,12 +43,42 @@ class InstanceTypeService(MorpheusAPI):
         Raises:
             AssertionError: If the API response status code is not 200 (OK)
         """
-        url = f"{INSTANCE_TYPE_ENDPOINT}?max={max}&offset={offset}&sort={sort}&direction={direction}"
-        if name:
-            url = f"{url}&name={name}"
+        url = list_endpoint(
+            INSTANCE_TYPE_ENDPOINT, ListQuery(max=max, offset=offset, sort=sort, direction=direction, name=name)
+        )
 
         response: Response = self._get(url)
-        return InstanceTypeList(**response.json())
+        return self._decode(response, InstanceTypeList)
+
+    def iter_instance_types(
+        self,
+        sort: str = "name",
+        direction: str = "asc",
+        name: str = "HPE VM",
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[InstanceTypeSummary]:
+        """
+        Lazily iterates over all instance types, fetching one page at a time.
+
+        Args:
+            sort (str, optional): The field by which to sort the instance types. Defaults to "name".
+            direction (str, optional): The direction of sorting, either "asc" or "desc". Defaults to "asc".
+            name (str, optional): Name of the instance-type to filter with. Defaults to "HPE VM".
+            page_size (int, optional): The number of instance types fetched per page. Defaults to DEFAULT_PAGE_SIZE.
+            prefetch (bool, optional): Fetch the next page in the background. Defaults to False.
+
+        Yields:
+            InstanceType: Every instance type matching the filter.
+        """
+        return self.paginate(
+            lambda max, offset: self.get_all_instance_types(
+                max=max, offset=offset, sort=sort, direction=direction, name=name
+            ),
+            "instance_types",
+            page_size=page_size,
+            prefetch=prefetch,
+        )
 
     def get_instance_type_layouts(self, instance_type_id: int) -> list[InstanceTypeLayout]:
         """
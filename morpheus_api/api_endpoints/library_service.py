@@ -1,6 +1,7 @@
 from requests import Response
 from lib.common.enums.morpheus_api_endpoint_type import MorpheusAPIEndpoints
 from morpheus_api.configuration.utils import MorpheusAPI
+from morpheus_api.dataclasses.query import ListQuery, list_endpoint
 from morpheus_api.dataclasses.cluster_layout import ClusterLayoutList
 from morpheus_api.dataclasses.instance_type_layout import InstanceTypeLayout, InstanceTypeLayoutList
 
@@ -35,10 +36,9 @@ class LibraryService(MorpheusAPI):
         Returns:
             ClusterLayoutList: The ClusterLayoutList object containing the list of cluster layouts.
         """
-        response: Response = self._get(
-            f"{LIBRARY_ENDPOINT}/cluster-layouts?max={max}&offset={offset}&sort={sort}&direction={direction}"
-        )
-        return ClusterLayoutList(**response.json())
+        query = ListQuery(max=max, offset=offset, sort=sort, direction=direction)
+        response: Response = self._get(list_endpoint(f"{LIBRARY_ENDPOINT}/cluster-layouts", query))
+        return self._decode(response, ClusterLayoutList)
 
     def get_instance_type_layouts(self, instance_type_id: int) -> InstanceTypeLayoutList:
         """
@@ -51,7 +51,7 @@ class LibraryService(MorpheusAPI):
             InstanceTypeLayoutList: An object containing the list of layouts for the instance type.
         """
         response: Response = self._get(f"{LIBRARY_ENDPOINT}/instance-types/{instance_type_id}/layouts")
-        return InstanceTypeLayoutList(**response.json())
+        return self._decode(response, InstanceTypeLayoutList)
 
     def get_instance_type_layout_by_id(self, instance_type_id: int, instance_type_layout_id: int) -> InstanceTypeLayout:
         """
@@ -70,4 +70,4 @@ class LibraryService(MorpheusAPI):
         response: Response = self._get(
             f"{LIBRARY_ENDPOINT}/instance-types/{instance_type_id}/layouts{instance_type_layout_id}"
         )
-        return InstanceTypeLayout(**response.json())
+        return self._decode(response, InstanceTypeLayout)
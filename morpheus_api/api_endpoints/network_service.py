@@ -1,6 +1,7 @@
 from requests import Response
 from lib.common.enums.morpheus_api_endpoint_type import MorpheusAPIEndpoints
 from morpheus_api.configuration.utils import MorpheusAPI
+from morpheus_api.dataclasses.query import ListQuery, list_endpoint
 from morpheus_api.dataclasses.common_objects import APIResponse
 from morpheus_api.dataclasses.network import Network, NetworkList, NetworkCreateData, NetworkResponse, NetworkRouterList
 
@@ -28,11 +29,8 @@ class NetworkService(MorpheusAPI):
         Raises:
             requests.exceptions.RequestException: If the request to the network service fails.
         """
-        endpoint: str = NETWORK_ENDPOINT
-        if name:
-            endpoint += f"?name={name}"
-        response: Response = self._get(endpoint)
-        return NetworkList(**response.json())
+        response: Response = self._get(list_endpoint(NETWORK_ENDPOINT, ListQuery(name=name)))
+        return self._decode(response, NetworkList)
 
     def get_network(self, network_id: int) -> Network:
         """
@@ -48,7 +46,7 @@ class NetworkService(MorpheusAPI):
             HTTPError: If the request to the network endpoint fails.
         """
         response: Response = self._get(f"{NETWORK_ENDPOINT}/{network_id}")
-        return NetworkResponse(**response.json()).network
+        return self._decode(response, NetworkResponse).network
 
     def create_network(self, network_payload: NetworkCreateData) -> Network:
         """
@@ -68,7 +66,7 @@ class NetworkService(MorpheusAPI):
             exclude_none=True,
         )
         response: Response = self._post(NETWORK_ENDPOINT, network_create_data)
-        return NetworkResponse(**response.json()).network
+        return self._decode(response, NetworkResponse).network
 
     def delete_network(self, network_id: int) -> APIResponse:
         """
@@ -81,7 +79,7 @@ class NetworkService(MorpheusAPI):
             APIResponse: The APIResponse object containing the result of the delete operation.
         """
         response: Response = self._delete(f"{NETWORK_ENDPOINT}/{network_id}")
-        return APIResponse(**response.json())
+        return self._decode(response, APIResponse)
 
     def list_network_routers(self, name: str = "") -> NetworkRouterList:
         """
@@ -96,8 +94,5 @@ class NetworkService(MorpheusAPI):
         Raises:
             requests.exceptions.RequestException: If the request to the network service fails.
         """
-        endpoint: str = f"{NETWORK_ENDPOINT}/routers"
-        if name:
-            endpoint += f"?name={name}"
-        response: Response = self._get(endpoint)
-        return NetworkRouterList(**response.json())
+        response: Response = self._get(list_endpoint(f"{NETWORK_ENDPOINT}/routers", ListQuery(name=name)))
+        return self._decode(response, NetworkRouterList)
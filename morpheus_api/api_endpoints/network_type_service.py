@@ -1,6 +1,7 @@
 from requests import Response
 from lib.common.enums.morpheus_api_endpoint_type import MorpheusAPIEndpoints
 from morpheus_api.configuration.utils import MorpheusAPI
+from morpheus_api.dataclasses.query import ListQuery, list_endpoint
 from morpheus_api.dataclasses.network import NetworkTypeList
 
 NETWORK_TYPES_ENDPOINT = MorpheusAPIEndpoints.NETWORK_TYPES.value
@@ -24,8 +25,5 @@ class NetworkTypeService(MorpheusAPI):
         Returns:
             NetworkTypeList: An object containing the list of network types.
         """
-        endpoint: str = NETWORK_TYPES_ENDPOINT
-        if name:
-            endpoint += f"?name={name}"
-        response: Response = self._get(endpoint)
-        return NetworkTypeList(**response.json())
+        response: Response = self._get(list_endpoint(NETWORK_TYPES_ENDPOINT, ListQuery(name=name)))
+        return self._decode(response, NetworkTypeList)
@@ -31,4 +31,4 @@ class OptionService(MorpheusAPI):
         response: Response = self._get(
             f"{OPTION_ENDPOINT}/zoneNetworkOptions?zoneId={zone_id}&provisionTypeId={provision_type_id}"
         )
-        return NetworkOptions(**response.json())
+        return self._decode(response, NetworkOptions)
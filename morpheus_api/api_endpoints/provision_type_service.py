@@ -1,6 +1,8 @@
+from typing import Iterator
 from requests import Response
 from lib.common.enums.morpheus_api_endpoint_type import MorpheusAPIEndpoints
-from morpheus_api.configuration.utils import MorpheusAPI
+from morpheus_api.configuration.utils import DEFAULT_PAGE_SIZE, MorpheusAPI
+from morpheus_api.dataclasses.query import ListQuery, list_endpoint
 from morpheus_api.dataclasses.provision_type import ProvisionType, ProvisionTypeList
 
 PROVISION_TYPE_ENDPOINT = MorpheusAPIEndpoints.PROVISION_TYPES.value
@@ -38,13 +40,42 @@ class ProvisionTypeService(MorpheusAPI):
         Raises:
             AssertionError: If the response status code is not 200 (OK), an assertion error is raised.
         """
-        url = f"{PROVISION_TYPE_ENDPOINT}?max={max}&offset={offset}&sort={sort}&direction={direction}"
-
-        if name:
-            url = f"{url}&name={name}"
+        url = list_endpoint(
+            PROVISION_TYPE_ENDPOINT, ListQuery(max=max, offset=offset, sort=sort, direction=direction, name=name)
+        )
 
         response: Response = self._get(url)
-        return ProvisionTypeList(**response.json())
+        return self._decode(response, ProvisionTypeList)
+
+    def iter_provision_types(
+        self,
+        sort: str = "name",
+        direction: str = "asc",
+        name: str = "KVM",
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[ProvisionType]:
+        """
+        Lazily iterates over all provision types, fetching one page at a time.
+
+        Args:
+            sort (str, optional): The field to sort the provision types by. Defaults to "name".
+            direction (str, optional): The direction to sort the provision types. Defaults to "asc".
+            name (str, optional): The name of the provision type for filtering. Defaults to "KVM".
+            page_size (int, optional): The number of provision types fetched per page. Defaults to DEFAULT_PAGE_SIZE.
+            prefetch (bool, optional): Fetch the next page in the background. Defaults to False.
+
+        Yields:
+            ProvisionType: Every provision type matching the filter.
+        """
+        return self.paginate(
+            lambda max, offset: self.list_provision_types(
+                max=max, offset=offset, sort=sort, direction=direction, name=name
+            ),
+            "provision_types",
+            page_size=page_size,
+            prefetch=prefetch,
+        )
 
     def get_provision_type(self, provision_type_id: int) -> ProvisionType:
         """
@@ -60,4 +91,4 @@ class ProvisionTypeService(MorpheusAPI):
             AssertionError: If the response status code is not 200 (OK), an assertion error is raised.
         """
         response: Response = self._get(f"{PROVISION_TYPE_ENDPOINT}/{provision_type_id}")
-        return ProvisionType(**response.json())
+        return self._decode(response, ProvisionType)
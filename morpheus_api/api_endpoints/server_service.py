@@ -1,18 +1,26 @@
+from typing import Iterator, Optional, Union
 from requests import Response
 from lib.common.enums.morpheus_api_endpoint_type import MorpheusAPIEndpoints
-from morpheus_api.configuration.utils import MorpheusAPI
+from morpheus_api.configuration.utils import DEFAULT_PAGE_SIZE, DEFAULT_STREAM_PAGE_SIZE, MorpheusAPI
+from morpheus_api.helpers.api_logging import ApiLogger
 from morpheus_api.dataclasses.server import (
     Server,
+    ServerDetails,
     ServerList,
     ServerData,
+    ServerStatusList,
+    ServerStatusResponse,
+    ServerStatusView,
 )
 from morpheus_api.dataclasses.common_objects import APIResponse
+from morpheus_api.dataclasses.query import ServerQuery, list_endpoint
 
 import logging
 
 SERVER_ENDPOINT = MorpheusAPIEndpoints.SERVERS.value
 
 logger = logging.getLogger()
+api_logger = ApiLogger(logger)
 
 
 class ServerService(MorpheusAPI):
@@ -26,21 +34,67 @@ class ServerService(MorpheusAPI):
     Please refer to the API endpoint & can verify functionality usage in server_steps.py
     """
 
-    def list_servers(self, query_params: str = None) -> ServerList:
+    def list_servers(
+        self,
+        query_params: Union[str, ServerQuery] = None,
+        max: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> ServerList:
         """Retrieves a list of all servers.
 
         Args:
-            query_params (str, optional): _description_. Defaults to None.
+            query_params (Union[str, ServerQuery], optional): The server-side filters, e.g. \
+                ServerQuery(cluster_id=1) or "clusterId=1". Defaults to None.
+            max (Optional[int], optional): The maximum number of servers to return. Defaults to None.
+            offset (Optional[int], optional): The offset from the start of the list. Defaults to None.
 
         Returns:
             ServerList: The list of all servers.
         """
-        endpoint = SERVER_ENDPOINT
-        if query_params:
-            endpoint += f"?{query_params}"
+        endpoint = list_endpoint(SERVER_ENDPOINT, query_params, max=max, offset=offset)
         response: Response = self._get(endpoint)
-        logger.info(f"Response: {response.json()}")
-        return ServerList(**response.json())
+        api_logger.body(logging.DEBUG, "Servers", response, sample_key=f"servers:{endpoint}")
+        return self._decode(response, ServerList)
+
+    def iter_servers(
+        self, query_params: Union[str, ServerQuery] = None, page_size: int = DEFAULT_PAGE_SIZE, prefetch: bool = False
+    ) -> Iterator[ServerDetails]:
+        """Lazily iterates over all servers, fetching one page at a time.
+
+        Args:
+            query_params (Union[str, ServerQuery], optional): The server-side filters, e.g. \
+                ServerQuery(cluster_id=1). Defaults to None.
+            page_size (int, optional): The number of servers fetched per page. Defaults to DEFAULT_PAGE_SIZE.
+            prefetch (bool, optional): Fetch the next page in the background. Defaults to False.
+
+        Yields:
+            ServerDetails: Every server matching the filters.
+        """
+        return self.paginate(
+            lambda max, offset: self.list_servers(query_params=query_params, max=max, offset=offset),
+            "servers",
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
+    def stream_servers(
+        self, query_params: Union[str, ServerQuery] = None, page_size: int = DEFAULT_STREAM_PAGE_SIZE
+    ) -> Iterator[ServerDetails]:
+        """Streams all servers, parsing and validating them one at a time as they are read from the socket.
+
+        Args:
+            query_params (Union[str, ServerQuery], optional): The server-side filters, e.g. \
+                ServerQuery(cluster_id=1). Defaults to None.
+            page_size (int, optional): The number of servers requested per page. Defaults to DEFAULT_STREAM_PAGE_SIZE.
+
+        Yields:
+            ServerDetails: Every server matching the filters.
+        """
+
+        def build_endpoint(max: int, offset: int) -> str:
+            return list_endpoint(SERVER_ENDPOINT, query_params, max=max, offset=offset)
+
+        return self.stream_list(build_endpoint, "servers", ServerDetails, page_size=page_size)
 
     def get_a_specific_server(self, instance_server_id: int) -> Server:
         """
@@ -54,8 +108,37 @@ class ServerService(MorpheusAPI):
         """
         endpoint = f"{SERVER_ENDPOINT}/{instance_server_id}"
         response: Response = self._get(endpoint)
-        logger.info(f"Response: {response.json()}")
-        return Server(**response.json())
+        api_logger.body(logging.DEBUG, "Server", response, sample_key=f"server:{instance_server_id}")
+        return self._decode(response, Server)
+
+    def get_server_status(self, server_id: int) -> ServerStatusView:
+        """
+        Retrieves the ID, status and power state of a server.
+
+        Only the fields of the projection are validated, which makes it much cheaper than get_a_specific_server
+        when polling the status of a server.
+
+        Args:
+            server_id (int): The ID of the server.
+
+        Returns:
+            ServerStatusView: The status projection of the server.
+        """
+        response: Response = self._get(f"{SERVER_ENDPOINT}/{server_id}")
+        return self._decode(response, ServerStatusResponse).server
+
+    def list_server_statuses(self, query_params: Union[str, ServerQuery] = None) -> ServerStatusList:
+        """Retrieves the ID, status and power state of the servers.
+
+        Args:
+            query_params (Union[str, ServerQuery], optional): The server-side filters, e.g. \
+                ServerQuery(ids=[1, 2], max=2). Defaults to None.
+
+        Returns:
+            ServerStatusList: The status projections of the servers.
+        """
+        response: Response = self._get(list_endpoint(SERVER_ENDPOINT, query_params))
+        return self._decode(response, ServerStatusList)
 
     def manage_server_placement_for_vm(self, instance_server_id: int, server_placement_data: ServerData) -> APIResponse:
         """
@@ -73,13 +156,15 @@ class ServerService(MorpheusAPI):
             by_alias=True,
             exclude_none=True,
         )
-        logger.info(f"Creating server placement payload: {server_placement_payload}")
+        api_logger.body(
+            logging.INFO, "Managing server placement", server_placement_payload, server_id=instance_server_id
+        )
 
         response: Response = self._put(
             endpoint,
             server_placement_payload,
         )
-        return APIResponse(**response.json())
+        return self._decode(response, APIResponse)
 
     def start_a_server(self, instance_server_id: str) -> APIResponse:
         """
@@ -93,7 +178,7 @@ class ServerService(MorpheusAPI):
         """
         endpoint = f"{SERVER_ENDPOINT}/{instance_server_id}/start"
         response: Response = self._post(endpoint)
-        return APIResponse(**response.json())
+        return self._decode(response, APIResponse)
 
     def stop_a_server(self, instance_server_id: str) -> APIResponse:
         """
@@ -107,7 +192,7 @@ class ServerService(MorpheusAPI):
         """
         endpoint = f"{SERVER_ENDPOINT}/{instance_server_id}/stop"
         response: Response = self._post(endpoint)
-        return APIResponse(**response.json())
+        return self._decode(response, APIResponse)
 
     def enable_maintenance_mode(self, server_id: int) -> APIResponse:
         """This will enable maintenance mode on the HPE VME host.
@@ -119,7 +204,7 @@ class ServerService(MorpheusAPI):
             APIResponse: Success status of the operation.
         """
         response: Response = self._put(endpoint=f"{SERVER_ENDPOINT}/{server_id}/maintenance")
-        return APIResponse(**response.json())
+        return self._decode(response, APIResponse)
 
     def leave_maintenance_mode(self, server_id: int) -> APIResponse:
         """This will leave maintenance mode on the HPE VME host.
@@ -131,4 +216,4 @@ class ServerService(MorpheusAPI):
             APIResponse: Success status of the operation.
         """
         response: Response = self._put(endpoint=f"{SERVER_ENDPOINT}/{server_id}/leave-maintenance")
-        return APIResponse(**response.json())
+        return self._decode(response, APIResponse)
@@ -1,7 +1,9 @@
+from typing import Iterator
 from requests import Response
 from lib.common.enums.morpheus_api_endpoint_type import MorpheusAPIEndpoints
 from lib.common.enums.service_plan_name import ServicePlanName
-from morpheus_api.configuration.utils import MorpheusAPI
+from morpheus_api.configuration.utils import DEFAULT_PAGE_SIZE, MorpheusAPI
+from morpheus_api.dataclasses.query import ListQuery, list_endpoint
 from morpheus_api.dataclasses.service_plan import ServicePlan, ServicePlanList
 
 SERVICE_PLAN_ENDPOINT = MorpheusAPIEndpoints.SERVICE_PLANS.value
@@ -37,13 +39,42 @@ class ServicePlanService(MorpheusAPI):
         Returns:
             ServicePlanList: The ServicePlanList object containing the list of cluster layouts.
         """
-        url = f"{SERVICE_PLAN_ENDPOINT}?max={max}&offset={offset}&sort={sort}&direction={direction}"
-
-        if name:
-            url = f"{url}&name={name.value}"
+        query = ListQuery(max=max, offset=offset, sort=sort, direction=direction, name=name.value if name else None)
+        url = list_endpoint(SERVICE_PLAN_ENDPOINT, query)
 
         response: Response = self._get(url)
-        return ServicePlanList(**response.json())
+        return self._decode(response, ServicePlanList)
+
+    def iter_service_plans(
+        self,
+        sort: str = "name",
+        direction: str = "asc",
+        name: ServicePlanName = ServicePlanName.CPU_1_MEMORY_1_GB,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[ServicePlan]:
+        """
+        Lazily iterates over all service plans, fetching one page at a time.
+
+        Args:
+            sort (str, optional): The field by which to sort the service plans. Defaults to "name".
+            direction (str, optional): The direction of the sort, either "asc" or "desc". Defaults to "asc".
+            name (ServicePlanName, optional): Name of the service plan to filter with. \
+                Defaults to ServicePlanName.CPU_1_MEMORY_1_GB.
+            page_size (int, optional): The number of service plans fetched per page. Defaults to DEFAULT_PAGE_SIZE.
+            prefetch (bool, optional): Fetch the next page in the background. Defaults to False.
+
+        Yields:
+            ServicePlan: Every service plan matching the filter.
+        """
+        return self.paginate(
+            lambda max, offset: self.list_service_plans(
+                max=max, offset=offset, sort=sort, direction=direction, name=name
+            ),
+            "service_plans",
+            page_size=page_size,
+            prefetch=prefetch,
+        )
 
     def get_service_plan_by_id(self, service_plan_id: int) -> ServicePlan:
         """
@@ -56,4 +87,4 @@ class ServicePlanService(MorpheusAPI):
             ServicePlan: An object containing the details of the service plan.
         """
         response: Response = self._get(f"{SERVICE_PLAN_ENDPOINT}/{service_plan_id}")
-        return ServicePlan(**response.json())
+        return self._decode(response, ServicePlan)
@@ -1,6 +1,7 @@
 from requests import Response
 from lib.common.enums.morpheus_api_endpoint_type import MorpheusAPIEndpoints
 from morpheus_api.configuration.utils import MorpheusAPI
+from morpheus_api.helpers.api_logging import ApiLogger
 from morpheus_api.dataclasses.common_objects import APIResponse
 from morpheus_api.dataclasses.instance import InstanceSnapshotImport
 from morpheus_api.dataclasses.snapshot import (
@@ -15,6 +16,7 @@ INSTANCE_ENDPOINT = MorpheusAPIEndpoints.INSTANCES.value
 SNAPSHOT_ENDPOINT = MorpheusAPIEndpoints.SNAPSHOTS.value
 
 logger = logging.getLogger()
+api_logger = ApiLogger(logger)
 
 
 class SnapshotService(MorpheusAPI):
@@ -38,7 +40,7 @@ class SnapshotService(MorpheusAPI):
             APIResponse: The APIResponse from the API containing the snapshot deletion success / failure result.
         """
         response: Response = self._delete(f"{SNAPSHOT_ENDPOINT}/{snapshot_id}")
-        return APIResponse(**response.json())
+        return self._decode(response, APIResponse)
 
     def get_snapshot_by_id(self, snapshot_id: int) -> Snapshot:
         """Get a snapshot by its ID.
@@ -50,7 +52,7 @@ class SnapshotService(MorpheusAPI):
             Snapshot: The Snapshot object containing the snapshot.
         """
         response: Response = self._get(f"{SNAPSHOT_ENDPOINT}/{snapshot_id}")
-        return Snapshot(**response.json())
+        return self._decode(response, Snapshot)
 
     def list_instance_snapshots(self, instance_id: int) -> SnapshotsList:
         """
@@ -65,7 +67,7 @@ class SnapshotService(MorpheusAPI):
                 an assertion error is raised with the response status code and text.
         """
         response: Response = self._get(f"{INSTANCE_ENDPOINT}/{instance_id}/snapshots")
-        return SnapshotsList(**response.json())
+        return self._decode(response, SnapshotsList)
 
     def create_snapshot_of_an_instance(
         self, instance_id: int, snapshot_payload: CreateSnapshotData = None
@@ -87,7 +89,7 @@ class SnapshotService(MorpheusAPI):
         else:
             create_snapshot_payload = snapshot_payload.model_dump(by_alias=True, exclude_none=True)
             response: Response = self._put(f"{INSTANCE_ENDPOINT}/{instance_id}/snapshot", data=create_snapshot_payload)
-        return APIResponse(**response.json())
+        return self._decode(response, APIResponse)
 
     def delete_all_snapshots_of_an_instance(self, instance_id: int) -> APIResponse:
         """
@@ -101,7 +103,7 @@ class SnapshotService(MorpheusAPI):
                 an assertion error is raised with the response status code and text.
         """
         response: Response = self._delete(f"{INSTANCE_ENDPOINT}/{instance_id}/delete-all-snapshots")
-        return APIResponse(**response.json())
+        return self._decode(response, APIResponse)
 
     def import_snapshot_of_instance(
         self,
@@ -123,10 +125,10 @@ class SnapshotService(MorpheusAPI):
         """
         url: str = f"{INSTANCE_ENDPOINT}/{instance_id}/import-snapshot"
         payload = import_snapshot_payload.model_dump(by_alias=True, exclude_none=True)
-        logger.info(f"Import snapshot payload: {payload}")
+        api_logger.body(logging.INFO, "Importing snapshot", payload, instance_id=instance_id)
 
         response: Response = self._put(url, data=payload)
-        return APIResponse(**response.json())
+        return self._decode(response, APIResponse)
 
     def revert_instance_to_snapshot(self, instance_id: int, snapshot_id: int) -> APIResponse:
         """Revert an instance to a snapshot by its ID.
@@ -139,4 +141,4 @@ class SnapshotService(MorpheusAPI):
             APIResponse: The APIResponse from the API containing the instance revert to snapshot success / failure result.
         """
         response: Response = self._put(f"{INSTANCE_ENDPOINT}/{instance_id}/revert-snapshot/{snapshot_id}")
-        return APIResponse(**response.json())
+        return self._decode(response, APIResponse)
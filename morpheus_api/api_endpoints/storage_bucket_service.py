@@ -1,6 +1,8 @@
+from typing import Iterator
 from requests import Response
 from lib.common.enums.morpheus_api_endpoint_type import MorpheusAPIEndpoints
-from morpheus_api.configuration.utils import MorpheusAPI
+from morpheus_api.configuration.utils import DEFAULT_PAGE_SIZE, MorpheusAPI
+from morpheus_api.dataclasses.query import ListQuery, list_endpoint
 from morpheus_api.dataclasses.storage_bucket import (
     StorageBucketList,
     StorageBucket,
@@ -40,10 +42,41 @@ class StorageBucketService(MorpheusAPI):
         Returns:
             StorageBucketList: The StorageBucketList object containing the list of storage buckets.
         """
-        params: str = f"max={max}&offset={offset}&sort={sort}&direction={direction}&phrase={phrase}&name={name}"
+        query = ListQuery(max=max, offset=offset, sort=sort, direction=direction, phrase=phrase, name=name)
+        response: Response = self._get(list_endpoint(STORAGE_BUCKET_ENDPOINT, query))
+        return self._decode(response, StorageBucketList)
 
-        response: Response = self._get(f"{STORAGE_BUCKET_ENDPOINT}?{params}")
-        return StorageBucketList(**response.json())
+    def iter_storage_buckets(
+        self,
+        sort: str = "name",
+        direction: str = "asc",
+        phrase: str = "",
+        name: str = "",
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[StorageBucket]:
+        """
+        Lazily iterates over all storage buckets, fetching one page at a time.
+
+        Args:
+            sort (str, optional): The field by which to sort the storage buckets. Defaults to "name".
+            direction (str, optional): The direction in which to sort the storage buckets. Defaults to "asc".
+            phrase (str, optional): The phrase to search for in the storage buckets. Defaults to "".
+            name (str, optional): The name of the storage bucket to search for. Defaults to "".
+            page_size (int, optional): The number of storage buckets fetched per page. Defaults to DEFAULT_PAGE_SIZE.
+            prefetch (bool, optional): Fetch the next page in the background. Defaults to False.
+
+        Yields:
+            StorageBucket: Every storage bucket matching the filters.
+        """
+        return self.paginate(
+            lambda max, offset: self.list_storage_buckets(
+                max=max, offset=offset, sort=sort, direction=direction, phrase=phrase, name=name
+            ),
+            "storage_buckets",
+            page_size=page_size,
+            prefetch=prefetch,
+        )
 
     def get_storage_bucket_by_id(self, storage_bucket_id: int) -> StorageBucket:
         """
@@ -58,4 +91,4 @@ class StorageBucketService(MorpheusAPI):
         url: str = f"{STORAGE_BUCKET_ENDPOINT}/{storage_bucket_id}"
 
         response: Response = self._get(url)
-        return StorageBucket(**response.json())
+        return self._decode(response, StorageBucket)
@@ -25,4 +25,4 @@ class StorageVolumeService(MorpheusAPI):
             StorageVolumeList: The response object containing the list of storage volumes.
         """
         response: Response = self._get(STORAGE_VOLUME_ENDPOINT)
-        return StorageVolumeList(**response.json())
+        return self._decode(response, StorageVolumeList)
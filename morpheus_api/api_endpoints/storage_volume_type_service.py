@@ -1,6 +1,7 @@
 from requests import Response
 from lib.common.enums.morpheus_api_endpoint_type import MorpheusAPIEndpoints
 from morpheus_api.configuration.utils import MorpheusAPI
+from morpheus_api.dataclasses.query import ListQuery, list_endpoint
 from morpheus_api.dataclasses.storage_volume_type import StorageVolumeType, StorageVolumeTypeList
 
 STORAGE_VOLUME_TYPE_ENDPOINT = MorpheusAPIEndpoints.STORAGE_VOLUME_TYPES.value
@@ -40,12 +41,9 @@ class StorageVolumeTypeService(MorpheusAPI):
         Returns:
             StorageVolumeTypeList: The StorageVolumeTypeList object containing the list of storage volume types.
         """
-        params: str = (
-            f"max={max}&offset={offset}&sort={sort}&direction={direction}&name={name}&code={code}&phrase={phrase}"
-        )
-
-        response: Response = self._get(f"{STORAGE_VOLUME_TYPE_ENDPOINT}?{params}")
-        return StorageVolumeTypeList(**response.json())
+        query = ListQuery(max=max, offset=offset, sort=sort, direction=direction, name=name, code=code, phrase=phrase)
+        response: Response = self._get(list_endpoint(STORAGE_VOLUME_TYPE_ENDPOINT, query))
+        return self._decode(response, StorageVolumeTypeList)
 
     def get_storage_volume_by_id(self, storage_volume_id: int) -> StorageVolumeType:
         """
@@ -58,4 +56,4 @@ class StorageVolumeTypeService(MorpheusAPI):
             StorageVolumeType: An object containing the details of the storage volume type.
         """
         response: Response = self._get(f"{STORAGE_VOLUME_TYPE_ENDPOINT}/{storage_volume_id}")
-        return StorageVolumeType(**response.json())
+        return self._decode(response, StorageVolumeType)
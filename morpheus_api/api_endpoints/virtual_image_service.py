@@ -1,8 +1,22 @@
 import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Optional
 from requests import Response
 from lib.common.enums.morpheus_api_endpoint_type import MorpheusAPIEndpoints
-from morpheus_api.configuration.utils import MorpheusAPI
+from morpheus_api.configuration.utils import DEFAULT_PAGE_SIZE, DEFAULT_STREAM_PAGE_SIZE, MorpheusAPI
+from morpheus_api.helpers.api_logging import ApiLogger
 from morpheus_api.dataclasses.common_objects import APIResponse
+from morpheus_api.dataclasses.query import VirtualImageQuery, list_endpoint
+from morpheus_api.exceptions import MorpheusAPIError
+from morpheus_api.helpers.file_upload import (
+    DEFAULT_UPLOAD_CHUNK_SIZE,
+    DEFAULT_UPLOAD_WORKERS,
+    MappedFileBody,
+    UploadProgress,
+    UploadResult,
+)
 from morpheus_api.dataclasses.virtual_image import (
     VirtualImage,
     VirtualImageCreateData,
@@ -13,6 +27,7 @@ from morpheus_api.dataclasses.virtual_image import (
 VIRTUAL_IMAGE_ENDPOINT = MorpheusAPIEndpoints.VIRTUAL_IMAGES.value
 
 logger = logging.getLogger()
+api_logger = ApiLogger(logger)
 
 
 class VirtualImageService(MorpheusAPI):
@@ -42,9 +57,60 @@ class VirtualImageService(MorpheusAPI):
         Returns:
             VirtualImageList: The VirtualImageList object containing the list of virtual images.
         """
-        params: str = f"max={max}&offset={offset}&name={name}&filterType={filter_type}"
-        response: Response = self._get(f"{VIRTUAL_IMAGE_ENDPOINT}?{params}")
-        return VirtualImageList(**response.json())
+        query = VirtualImageQuery(max=max, offset=offset, name=name, filter_type=filter_type)
+        response: Response = self._get(list_endpoint(VIRTUAL_IMAGE_ENDPOINT, query))
+        return self._decode(response, VirtualImageList)
+
+    def iter_virtual_images(
+        self,
+        name: str = "",
+        filter_type: str = "User",
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[VirtualImage]:
+        """
+        Lazily iterates over all virtual images, fetching one page at a time.
+
+        Args:
+            name (str, optional): The name of the virtual image to filter by. Defaults to "".
+            filter_type (str, optional): The field by which to filters the virtual image by provided value. \
+                Defaults to "User".
+            page_size (int, optional): The number of virtual images fetched per page. Defaults to DEFAULT_PAGE_SIZE.
+            prefetch (bool, optional): Fetch the next page in the background. Defaults to False.
+
+        Yields:
+            VirtualImage: Every virtual image matching the filter.
+        """
+        return self.paginate(
+            lambda max, offset: self.list_virtual_images(max=max, offset=offset, name=name, filter_type=filter_type),
+            "virtual_images",
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
+    def stream_virtual_images(
+        self, name: str = "", filter_type: str = "User", page_size: int = DEFAULT_STREAM_PAGE_SIZE
+    ) -> Iterator[VirtualImage]:
+        """
+        Streams all virtual images, parsing and validating them one at a time as they are read from the socket.
+
+        Args:
+            name (str, optional): The name of the virtual image to filter by. Defaults to "".
+            filter_type (str, optional): The field by which to filters the virtual image by provided value. \
+                Defaults to "User".
+            page_size (int, optional): The number of virtual images requested per page. \
+                Defaults to DEFAULT_STREAM_PAGE_SIZE.
+
+        Yields:
+            VirtualImage: Every virtual image matching the filter.
+        """
+
+        query = VirtualImageQuery(name=name, filter_type=filter_type)
+
+        def build_endpoint(max: int, offset: int) -> str:
+            return list_endpoint(VIRTUAL_IMAGE_ENDPOINT, query, max=max, offset=offset)
+
+        return self.stream_list(build_endpoint, "virtualImages", VirtualImage, page_size=page_size)
 
     def get_virtual_image_by_id(self, virtual_image_id: int) -> VirtualImage:
         """
@@ -59,7 +125,7 @@ class VirtualImageService(MorpheusAPI):
         response: Response = self._get(f"{VIRTUAL_IMAGE_ENDPOINT}/{virtual_image_id}")
 
         # A single Virtual Image is returned in an object with field named 'virtual_image'
-        virtual_image_object = VirtualImageObject(**response.json())
+        virtual_image_object = self._decode(response, VirtualImageObject)
         return virtual_image_object.virtual_image
 
     def create_virtual_image(self, virtual_image_payload: VirtualImageCreateData) -> VirtualImage:
@@ -76,33 +142,129 @@ class VirtualImageService(MorpheusAPI):
             AssertionError: If the response status code is not 200 (OK).
         """
         virtual_image_payload_dict = virtual_image_payload.model_dump(by_alias=True, exclude_none=True)
-        logger.info(f"Create Virtual Image Payload Dict: {virtual_image_payload_dict}")
+        api_logger.body(logging.INFO, "Creating virtual image", virtual_image_payload_dict)
 
         response: Response = self._post(VIRTUAL_IMAGE_ENDPOINT, data=virtual_image_payload_dict)
 
         # A single Virtual Image is returned in an object with field named 'virtual_image'
-        virtual_image_object = VirtualImageObject(**response.json())
+        virtual_image_object = self._decode(response, VirtualImageObject)
         return virtual_image_object.virtual_image
 
-    def upload_virtual_image_file(self, virtual_image_id: int, file_path: str, file_name: str) -> APIResponse:
+    def upload_virtual_image_file(
+        self,
+        virtual_image_id: int,
+        file_path: str,
+        file_name: str,
+        chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+        progress_callback: Optional[Callable[[UploadProgress], None]] = None,
+        expected_checksum: Optional[str] = None,
+    ) -> APIResponse:
         """
         Upload a file to a virtual image.
 
+        The file is streamed in chunks from a memory map and hashed on the way; see upload_virtual_image_files.
+
         Args:
             virtual_image_id (int): The ID of the virtual image.
             file_path (str): The path to the file to be uploaded.
             file_name (str): The name of the file to be uploaded.
+            chunk_size (int, optional): The bytes sent at a time. Defaults to DEFAULT_UPLOAD_CHUNK_SIZE.
+            progress_callback (Optional[Callable[[UploadProgress], None]], optional): Called with the progress \
+                of the upload every few seconds. Defaults to None.
+            expected_checksum (Optional[str], optional): The published sha256 of the file, checked against the \
+                bytes sent. Defaults to None.
 
         Returns:
             APIResponse: The response object from the API.
 
         Raises:
             AssertionError: If the response status code is not 200 (OK).
+            MorpheusAPIError: If the checksum of the bytes sent differs from expected_checksum.
+        """
+        result = self._upload_file(
+            virtual_image_id, f"{file_path}{file_name}", chunk_size, progress_callback, expected_checksum
+        )
+        return result.response
+
+    def upload_virtual_image_files(
+        self,
+        uploads: list[tuple[int, str]],
+        max_workers: int = DEFAULT_UPLOAD_WORKERS,
+        chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+        progress_callback: Optional[Callable[[UploadProgress], None]] = None,
+        expected_checksums: Optional[dict[str, str]] = None,
+    ) -> list[UploadResult]:
         """
+        Upload several files to virtual images concurrently.
+
+        Each file is memory-mapped and sent in fixed-size chunks, hashed in the same pass, so the memory used does
+        not depend on the file size and the file is read once. The appliance has no ranged upload, so a transient
+        failure (dropped connection, 5xx) sends the file again from its first byte, as allowed by the retry policy.
+
+        Args:
+            uploads (list[tuple[int, str]]): The (virtual image ID, file path) pairs; the files keep their name.
+            max_workers (int, optional): The number of files uploaded at once. Defaults to DEFAULT_UPLOAD_WORKERS.
+            chunk_size (int, optional): The bytes sent at a time. Defaults to DEFAULT_UPLOAD_CHUNK_SIZE.
+            progress_callback (Optional[Callable[[UploadProgress], None]], optional): Called with the progress \
+                of each upload every few seconds, from the upload threads. Defaults to None.
+            expected_checksums (Optional[dict[str, str]], optional): The published sha256 per file path, checked \
+                against the bytes sent. Defaults to None.
+
+        Returns:
+            list[UploadResult]: The checksum, attempts, throughput and response of each upload, in order.
+
+        Raises:
+            AssertionError: If the response status code of an upload is not 200 (OK).
+            MorpheusAPIError: If the checksum of the bytes sent differs from the expected one.
+        """
+        expected_checksums = expected_checksums or {}
+
+        def upload(virtual_image_id: int, path: str) -> UploadResult:
+            return self._upload_file(
+                virtual_image_id, path, chunk_size, progress_callback, expected_checksums.get(path)
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="morpheus-upload") as executor:
+            futures = [executor.submit(upload, virtual_image_id, path) for virtual_image_id, path in uploads]
+            return [future.result() for future in futures]
+
+    def _upload_file(
+        self,
+        virtual_image_id: int,
+        path: str,
+        chunk_size: int,
+        progress_callback: Optional[Callable[[UploadProgress], None]],
+        expected_checksum: Optional[str],
+    ) -> UploadResult:
+        file_name = os.path.basename(path)
+        size = os.path.getsize(path)
+        progress = UploadProgress(file_name, size, callback=progress_callback)
+        body = MappedFileBody(path, chunk_size=chunk_size, progress=progress)
         url: str = f"{VIRTUAL_IMAGE_ENDPOINT}/{virtual_image_id}/upload?filename={file_name}"
-        with open(f"{file_path}{file_name}", "rb") as data:
-            response: Response = self._post_upload(endpoint=url, data=data)
-            return APIResponse(**response.json())
+
+        start = time.monotonic()
+        # Sending the same file under the same name again is safe, so the upload opts in to retries
+        response: Response = self._post_upload(endpoint=url, data=body, retry=True)
+        api_response = self._decode(response, APIResponse)
+        result = UploadResult(
+            file_name=file_name,
+            size=size,
+            checksum=body.hexdigest,
+            hash_algorithm=body.hash_algorithm,
+            elapsed=time.monotonic() - start,
+            attempts=progress.attempts,
+            response=api_response,
+        )
+        logger.info(
+            f"Uploaded '{file_name}' to virtual image {virtual_image_id}: {size} bytes in {result.elapsed:.1f}s "
+            f"({result.throughput / 1024 / 1024:.1f} MiB/s, {result.attempts} attempt(s)), "
+            f"{result.hash_algorithm} {result.checksum}"
+        )
+        if expected_checksum and expected_checksum.lower() != result.checksum:
+            raise MorpheusAPIError(
+                f"Checksum of the uploaded '{file_name}' is {result.checksum}, expected {expected_checksum}"
+            )
+        return result
 
     def remove_virtual_image_file(self, virtual_image_id: int, filename: str) -> APIResponse:
         """
@@ -120,7 +282,7 @@ class VirtualImageService(MorpheusAPI):
         """
         url: str = f"{VIRTUAL_IMAGE_ENDPOINT}/{virtual_image_id}/files?filename={filename}"
         response: Response = self._delete(url)
-        return APIResponse(**response.json())
+        return self._decode(response, APIResponse)
 
     def delete_virtual_image(self, virtual_image_id: int) -> APIResponse:
         """
@@ -137,4 +299,4 @@ class VirtualImageService(MorpheusAPI):
             an assertion error is raised with the response status code and text.
         """
         response: Response = self._delete(f"{VIRTUAL_IMAGE_ENDPOINT}/{virtual_image_id}")
-        return APIResponse(**response.json())
+        return self._decode(response, APIResponse)
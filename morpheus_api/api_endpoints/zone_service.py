@@ -1,6 +1,8 @@
+from typing import Optional
 from requests import Response
 from lib.common.enums.morpheus_api_endpoint_type import MorpheusAPIEndpoints
 from morpheus_api.configuration.utils import MorpheusAPI
+from morpheus_api.dataclasses.query import ListQuery, list_endpoint
 from morpheus_api.dataclasses.zone import Zone, ZoneList
 
 ZONE_ENDPOINT = MorpheusAPIEndpoints.ZONES.value
@@ -14,18 +16,22 @@ class ZoneService(MorpheusAPI):
     But all zone-related methods can be found in zone_steps.py file.
     """
 
-    def list_zones(self) -> ZoneList:
+    def list_zones(self, query: Optional[ListQuery] = None) -> ZoneList:
         """
         Retrieves a list of zones from the API.
 
+        Args:
+            query (Optional[ListQuery], optional): The server-side filters and paging, e.g. ListQuery(max=1). \
+                Defaults to None, which returns the default page of zones.
+
         Returns:
             ZoneList: An object containing the list of zones.
 
         Raises:
             AssertionError: If the response status code is not 200 (OK), an assertion error is raised.
         """
-        response: Response = self._get(ZONE_ENDPOINT)
-        return ZoneList(**response.json())
+        response: Response = self._get(list_endpoint(ZONE_ENDPOINT, query))
+        return self._decode(response, ZoneList)
 
     def get_zone(self, zone_id: int) -> Zone:
         """
@@ -42,4 +48,4 @@ class ZoneService(MorpheusAPI):
 
         """
         response: Response = self._get(f"{ZONE_ENDPOINT}/{zone_id}")
-        return Zone(**response.json())
+        return self._decode(response, Zone)
@@ -0,0 +1,72 @@
+import logging
+
+from lib.common.enums.morpheus_api_endpoint_type import MorpheusAPIEndpoints
+from morpheus_api.configuration.async_utils import AsyncMorpheusAPI, AsyncResponse
+from morpheus_api.helpers.api_logging import ApiLogger
+from morpheus_api.dataclasses.backup import BackupData, CreateBackup, CreateBackupPayload
+from morpheus_api.dataclasses.common_objects import APIResponse
+
+logger = logging.getLogger()
+api_logger = ApiLogger(logger)
+
+BACKUP_ENDPOINT = MorpheusAPIEndpoints.BACKUPS.value
+INSTANCE_ENDPOINT = MorpheusAPIEndpoints.INSTANCES.value
+
+
+class AsyncBackupService(AsyncMorpheusAPI):
+    """AsyncBackupService is the asyncio twin of BackupService.
+
+    It follows the /api/backups endpoint, plus the backup APIs under /api/instances, and returns the same
+    dataclasses as BackupService.
+    """
+
+    async def create_backup(self, create_backup_job_payload: CreateBackupPayload) -> APIResponse:
+        """Creates a backup job.
+
+        Args:
+            create_backup_job_payload (CreateBackupPayload): The payload for creating a backup job.
+
+        Returns:
+            APIResponse: The response from the create backup job request.
+        """
+        json_data = CreateBackup(backup=create_backup_job_payload).model_dump(by_alias=True, exclude_none=True)
+        api_logger.body(logging.INFO, "Creating backup job", json_data)
+
+        response: AsyncResponse = await self._post(BACKUP_ENDPOINT, data=json_data)
+        return self._decode(response, APIResponse)
+
+    async def delete_backup(self, backup_id: int) -> APIResponse:
+        """
+        Delete a backup by its ID.
+
+        Args:
+            backup_id (int): The ID of the backup to be deleted.
+        Returns:
+            APIResponse: The APIResponse from the API containing the backup deletion success / failure result.
+        """
+        response: AsyncResponse = await self._delete(f"{BACKUP_ENDPOINT}/{backup_id}")
+        return self._decode(response, APIResponse)
+
+    async def list_instance_backups(self, instance_id: int) -> BackupData:
+        """
+        Retrieve the list of backups for a given instance.
+
+        Args:
+            instance_id (int): The unique identifier of the instance.
+        Returns:
+            BackupData: An object containing the backup data.
+        """
+        response: AsyncResponse = await self._get(f"{INSTANCE_ENDPOINT}/{instance_id}/backups")
+        return self._decode(response, BackupData)
+
+    async def create_instance_backup(self, instance_id: int) -> APIResponse:
+        """
+        Initiates a backup for the specified instance.
+
+        Args:
+            instance_id (int): The unique identifier of the instance to back up.
+        Returns:
+            APIResponse: The APIResponse from the API containing the backup creation success / failure result.
+        """
+        response: AsyncResponse = await self._put(f"{INSTANCE_ENDPOINT}/{instance_id}/backup")
+        return self._decode(response, APIResponse)
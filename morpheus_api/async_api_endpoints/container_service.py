@@ -0,0 +1,39 @@
+from lib.common.enums.morpheus_api_endpoint_type import MorpheusAPIEndpoints
+from morpheus_api.configuration.async_utils import AsyncMorpheusAPI, AsyncResponse
+from morpheus_api.dataclasses.common_objects import APIResponse
+from morpheus_api.dataclasses.container import Container
+
+CONTAINERS_ENDPOINT = MorpheusAPIEndpoints.CONTAINERS.value
+
+
+class AsyncContainerService(AsyncMorpheusAPI):
+    """AsyncContainerService is the asyncio twin of ContainerService.
+
+    It follows the /api/containers endpoint and returns the same dataclasses as ContainerService.
+    """
+
+    async def get_container_by_id(self, container_id: int) -> Container:
+        """Retrieve a container by its ID.
+
+        Args:
+            container_id (int): The unique identifier of the container to retrieve
+
+        Returns:
+            Container: A Container object populated with the data from the response
+        """
+        response: AsyncResponse = await self._get(f"{CONTAINERS_ENDPOINT}/{container_id}")
+        return self._decode(response, Container)
+
+    async def remove_container(self, container_id: int) -> APIResponse:
+        """Remove node /computing server/container
+
+        Args:
+            container_id (int): ID of The unique identifier of the container
+
+        Returns:
+            APIResponse: The APIResponse from the API.
+        """
+        response: AsyncResponse = await self._put(
+            f"{CONTAINERS_ENDPOINT}/action?ids={container_id}&code=generic-remove-node"
+        )
+        return self._decode(response, APIResponse)
@@ -0,0 +1,212 @@
+import logging
+from typing import Union
+from urllib.parse import urlencode
+
+from lib.common.enums.morpheus_api_endpoint_type import MorpheusAPIEndpoints
+from morpheus_api.configuration.async_utils import AsyncMorpheusAPI, AsyncResponse
+from morpheus_api.helpers.api_logging import ApiLogger
+from morpheus_api.dataclasses.common_objects import APIResponse
+from morpheus_api.dataclasses.container import ContainerList
+from morpheus_api.dataclasses.instance import Instance, InstanceCreateData, InstanceList
+from morpheus_api.dataclasses.processes import ProcessList
+from morpheus_api.dataclasses.query import ListQuery, list_endpoint
+
+INSTANCE_ENDPOINT = MorpheusAPIEndpoints.INSTANCES.value
+
+logger = logging.getLogger()
+api_logger = ApiLogger(logger)
+
+
+class AsyncInstanceService(AsyncMorpheusAPI):
+    """AsyncInstanceService is the asyncio twin of InstanceService.
+
+    It follows the /api/instances endpoint and returns the same dataclasses as InstanceService, so status checks
+    across a fleet can be issued together with asyncio.gather.
+
+    Methods:
+        list_instances(max_results=100, filter: str = "") -> InstanceList:
+            Lists all instances with optional filtering and maximum results limit.
+        get_instance(instance_id) -> Instance:
+            Retrieves a specific instance by its ID.
+        create_instance(instance_payload) -> Instance:
+            Creates a new instance with the provided data.
+        delete_instance(instance_id, force="off", remove_volumes="on", expecting_error=False) -> APIResponse:
+            Deletes an instance by its ID.
+        stop_instance / start_instance / restart_instance / suspend_instance(instance_id, data=None, query_params=None):
+            Changes the power state of an instance by its ID.
+        get_instance_history(instance_id, ...) -> ProcessList:
+            Retrieves the process history of an instance.
+        get_containers_for_instance(instance_id) -> ContainerList:
+            Retrieves the containers running on an instance.
+    """
+
+    async def list_instances(self, max_results=100, filter: Union[str, ListQuery] = "") -> InstanceList:
+        """
+        Retrieves a list of instances from the API.
+
+        Args:
+            max_results (int, optional): The maximum number of results to return. Defaults to 100.
+            filter (Union[str, ListQuery], optional): The server-side filters of the instance list, e.g. \
+                ListQuery(name="web", status="running"). Defaults to "".
+        Returns:
+            InstanceList: An object containing the list of instances.
+        """
+        response: AsyncResponse = await self._get(list_endpoint(INSTANCE_ENDPOINT, filter, max=max_results))
+        return self._decode(response, InstanceList)
+
+    async def get_instance(self, instance_id: int) -> Instance:
+        """
+        Retrieve an instance by its ID.
+
+        Args:
+            instance_id (int): The unique identifier of the instance to retrieve.
+        Returns:
+            Instance: An Instance object populated with the data from the response.
+        """
+        response: AsyncResponse = await self._get(f"{INSTANCE_ENDPOINT}/{instance_id}")
+        return self._decode(response, Instance)
+
+    async def create_instance(self, instance_payload: InstanceCreateData) -> Instance:
+        """
+        Creates a new instance using the provided data.
+
+        Args:
+            instance_payload (InstanceCreateData): The data required to create a new instance.
+        Returns:
+            Instance: The instance object created from the API response.
+        """
+        instance_create_data = instance_payload.model_dump(
+            by_alias=True,
+            exclude_none=True,
+        )
+        api_logger.body(logging.INFO, "Creating instance", instance_create_data)
+
+        response: AsyncResponse = await self._post(INSTANCE_ENDPOINT, instance_create_data)
+        return self._decode(response, Instance)
+
+    async def delete_instance(
+        self,
+        instance_id: int,
+        force: str = "off",
+        remove_volumes: str = "on",
+        expecting_error: bool = False,
+    ) -> APIResponse:
+        """
+        Deletes an instance with the given instance ID.
+
+        Args:
+            instance_id (int): The ID of the instance to be deleted.
+            force (str, optional): Flag to indicate whether to force delete the instance. Defaults to "off".
+            remove_volumes (str, optional): Flag to indicate whether to remove volumes associated with the instance.
+                           Defaults to "on".
+            expecting_error (bool, optional): Flag to indicate if the API is expected to return an error. \
+                Defaults to False.
+        Returns:
+            APIResponse: The APIResponse from the API containing the delete instance success / failure result.
+        """
+        response: AsyncResponse = await self._delete(
+            endpoint=f"{INSTANCE_ENDPOINT}/{instance_id}?force={force}&removeVolumes={remove_volumes}",
+            expecting_error=expecting_error,
+        )
+        return self._decode(response, APIResponse)
+
+    async def _power_action(self, instance_id: int, action: str, data=None, query_params=None) -> APIResponse:
+        endpoint = f"{INSTANCE_ENDPOINT}/{instance_id}/{action}"
+        if query_params:
+            endpoint = f"{endpoint}?{query_params}"
+        response: AsyncResponse = await self._put(endpoint, data)
+        return self._decode(response, APIResponse)
+
+    async def stop_instance(self, instance_id: int, data=None, query_params=None) -> APIResponse:
+        """
+        Stops an instance with the given instance ID.
+
+        Args:
+            instance_id (int): The ID of the instance to stop.
+            data (dict, optional): The data to send in the request body. Defaults to None.
+            query_params (dict, optional): The query parameters to include in the request URL. Defaults to None.
+        Returns:
+            APIResponse: The APIResponse from the API containing the stop instance success / failure result.
+        """
+        return await self._power_action(instance_id, "stop", data, query_params)
+
+    async def start_instance(self, instance_id: int, data=None, query_params=None) -> APIResponse:
+        """
+        Start an instance with the given instance ID.
+
+        Args:
+            instance_id (int): The ID of the instance to start.
+            data (dict, optional): The data to send in the request body. Defaults to None.
+            query_params (dict, optional): The query parameters to include in the request URL. Defaults to None.
+        Returns:
+            APIResponse: The APIResponse from the API containing the start instance success / failure result.
+        """
+        return await self._power_action(instance_id, "start", data, query_params)
+
+    async def restart_instance(self, instance_id: int, data=None, query_params=None) -> APIResponse:
+        """
+        Restart an instance with the given instance ID.
+
+        Args:
+            instance_id (int): The ID of the instance to restart.
+            data (dict, optional): The data to send in the request body. Defaults to None.
+            query_params (dict, optional): The query parameters to include in the request URL. Defaults to None.
+        Returns:
+            APIResponse: The APIResponse from the API containing the restart instance success / failure result.
+        """
+        return await self._power_action(instance_id, "restart", data, query_params)
+
+    async def suspend_instance(self, instance_id: int, data=None, query_params=None) -> APIResponse:
+        """
+        Suspend an instance by its ID.
+
+        Args:
+            instance_id (int): The ID of the instance to suspend.
+            data (dict, optional): The data to send in the request body. Defaults to None.
+            query_params (dict, optional): The query parameters to include in the URL. Defaults to None.
+        Returns:
+            APIResponse: The APIResponse from the API containing the suspend instance success / failure result.
+        """
+        return await self._power_action(instance_id, "suspend", data, query_params)
+
+    async def get_instance_history(
+        self,
+        instance_id: int,
+        container_id: int = None,
+        server_id: int = None,
+        zone_id: int = None,
+    ) -> ProcessList:
+        """
+        Retrieves a list of an instance processes history.
+
+        Args:
+            instance_id (int): The ID of the instance.
+            container_id (int): The ID of the container.
+            server_id (int): The ID of the server.
+            zone_id (int): The ID of the zone.
+
+        Returns:
+            ProcessList: An object containing the list of process retrieved from the API.
+        """
+        query_params = {}
+        if container_id:
+            query_params["containerId"] = container_id
+        if server_id:
+            query_params["serverId"] = server_id
+        if zone_id:
+            query_params["zoneId"] = zone_id
+
+        query_string = f"?{urlencode(query_params)}" if query_params else ""
+        response: AsyncResponse = await self._get(f"{INSTANCE_ENDPOINT}/{instance_id}/history{query_string}")
+        return self._decode(response, ProcessList)
+
+    async def get_containers_for_instance(self, instance_id: int) -> ContainerList:
+        """This function provides details of the compute server(s) running on an instance
+
+        Args:
+            instance_id (int): ID of instance
+        Returns:
+            ContainerList: list of containers
+        """
+        response: AsyncResponse = await self._get(f"{INSTANCE_ENDPOINT}/{instance_id}/containers")
+        return self._decode(response, ContainerList)
@@ -0,0 +1,71 @@
+import logging
+from typing import Union
+
+from lib.common.enums.morpheus_api_endpoint_type import MorpheusAPIEndpoints
+from morpheus_api.configuration.async_utils import AsyncMorpheusAPI, AsyncResponse
+from morpheus_api.dataclasses.common_objects import APIResponse
+from morpheus_api.dataclasses.query import ServerQuery, list_endpoint
+from morpheus_api.dataclasses.server import Server, ServerList
+
+SERVER_ENDPOINT = MorpheusAPIEndpoints.SERVERS.value
+
+logger = logging.getLogger()
+
+
+class AsyncServerService(AsyncMorpheusAPI):
+    """AsyncServerService is the asyncio twin of ServerService.
+
+    It follows the /api/servers endpoint and returns the same dataclasses as ServerService.
+    """
+
+    async def list_servers(self, query_params: Union[str, ServerQuery] = None) -> ServerList:
+        """Retrieves a list of all servers.
+
+        Args:
+            query_params (Union[str, ServerQuery], optional): The server-side filters, e.g. \
+                ServerQuery(cluster_id=1) or "clusterId=1". Defaults to None.
+
+        Returns:
+            ServerList: The list of all servers.
+        """
+        response: AsyncResponse = await self._get(list_endpoint(SERVER_ENDPOINT, query_params))
+        return self._decode(response, ServerList)
+
+    async def get_a_specific_server(self, instance_server_id: int) -> Server:
+        """
+        Retrieves a specific server by its ID.
+
+        Args:
+            instance_server_id (int): The ID of the server to retrieve.
+
+        Returns:
+            Server: The server object representing the server.
+        """
+        response: AsyncResponse = await self._get(f"{SERVER_ENDPOINT}/{instance_server_id}")
+        return self._decode(response, Server)
+
+    async def start_a_server(self, instance_server_id: str) -> APIResponse:
+        """
+        Starts a server.
+
+        Args:
+            instance_server_id (str): The ID of the server to start.
+
+        Returns:
+            APIResponse: Success status of the operation.
+        """
+        response: AsyncResponse = await self._post(f"{SERVER_ENDPOINT}/{instance_server_id}/start")
+        return self._decode(response, APIResponse)
+
+    async def stop_a_server(self, instance_server_id: str) -> APIResponse:
+        """
+        Stops a server.
+
+        Args:
+            instance_server_id (str): The ID of the server to stop.
+
+        Returns:
+            APIResponse: Success status of the operation.
+        """
+        response: AsyncResponse = await self._post(f"{SERVER_ENDPOINT}/{instance_server_id}/stop")
+        return self._decode(response, APIResponse)
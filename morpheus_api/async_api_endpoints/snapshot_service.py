@@ -0,0 +1,97 @@
+import logging
+
+from lib.common.enums.morpheus_api_endpoint_type import MorpheusAPIEndpoints
+from morpheus_api.configuration.async_utils import AsyncMorpheusAPI, AsyncResponse
+from morpheus_api.dataclasses.common_objects import APIResponse
+from morpheus_api.dataclasses.snapshot import CreateSnapshotData, Snapshot, SnapshotsList
+
+INSTANCE_ENDPOINT = MorpheusAPIEndpoints.INSTANCES.value
+SNAPSHOT_ENDPOINT = MorpheusAPIEndpoints.SNAPSHOTS.value
+
+logger = logging.getLogger()
+
+
+class AsyncSnapshotService(AsyncMorpheusAPI):
+    """AsyncSnapshotService is the asyncio twin of SnapshotService.
+
+    It follows the /api/snapshots endpoint, plus the snapshot APIs under /api/instances, and returns the same
+    dataclasses as SnapshotService.
+    """
+
+    async def get_snapshot_by_id(self, snapshot_id: int) -> Snapshot:
+        """Get a snapshot by its ID.
+
+        Args:
+            snapshot_id (int): The ID of the snapshot to retrieve.
+
+        Returns:
+            Snapshot: The Snapshot object containing the snapshot.
+        """
+        response: AsyncResponse = await self._get(f"{SNAPSHOT_ENDPOINT}/{snapshot_id}")
+        return self._decode(response, Snapshot)
+
+    async def list_instance_snapshots(self, instance_id: int) -> SnapshotsList:
+        """
+        Retrieve a list of snapshots for a given instance.
+
+        Args:
+            instance_id (int): The unique identifier of the instance.
+        Returns:
+            SnapshotsList: An object containing the list of snapshots.
+        """
+        response: AsyncResponse = await self._get(f"{INSTANCE_ENDPOINT}/{instance_id}/snapshots")
+        return self._decode(response, SnapshotsList)
+
+    async def create_snapshot_of_an_instance(
+        self, instance_id: int, snapshot_payload: CreateSnapshotData = None
+    ) -> APIResponse:
+        """
+        Create a snapshot for a given instance.
+
+        Args:
+            instance_id (int): The ID of the instance for which the snapshot is to be created.
+            snapshot_payload (CreateSnapshotData, optional): The data containing the snapshot creation parameters.
+        Returns:
+            APIResponse: The APIResponse from the API containing the snapshot creation success / failure result.
+        """
+        data = snapshot_payload.model_dump(by_alias=True, exclude_none=True) if snapshot_payload else None
+        response: AsyncResponse = await self._put(f"{INSTANCE_ENDPOINT}/{instance_id}/snapshot", data=data)
+        return self._decode(response, APIResponse)
+
+    async def delete_snapshot_of_an_instance(self, snapshot_id: int) -> APIResponse:
+        """Delete a snapshot by its ID.
+
+        Args:
+            snapshot_id (int): The ID of the snapshot to delete.
+
+        Returns:
+            APIResponse: The APIResponse from the API containing the snapshot deletion success / failure result.
+        """
+        response: AsyncResponse = await self._delete(f"{SNAPSHOT_ENDPOINT}/{snapshot_id}")
+        return self._decode(response, APIResponse)
+
+    async def delete_all_snapshots_of_an_instance(self, instance_id: int) -> APIResponse:
+        """
+        Delete all snapshot of an Instance by its ID.
+
+        Args:
+            instance_id (int): The ID of the instance to have all its snapshots deleted.
+        Returns:
+            APIResponse: The APIResponse from the API containing the snapshot deletion success / failure result.
+        """
+        response: AsyncResponse = await self._delete(f"{INSTANCE_ENDPOINT}/{instance_id}/delete-all-snapshots")
+        return self._decode(response, APIResponse)
+
+    async def revert_instance_to_snapshot(self, instance_id: int, snapshot_id: int) -> APIResponse:
+        """Revert an instance to a snapshot by its ID.
+
+        Args:
+            instance_id (int): The ID of the instance to revert.
+            snapshot_id (int): The ID of the snapshot to revert to.
+
+        Returns:
+            APIResponse: The APIResponse from the API containing the instance revert to snapshot success / failure \
+                result.
+        """
+        response: AsyncResponse = await self._put(f"{INSTANCE_ENDPOINT}/{instance_id}/revert-snapshot/{snapshot_id}")
+        return self._decode(response, APIResponse)
@@ -0,0 +1,208 @@
+import json
+import time
+from typing import Any, Optional
+
+import aiohttp
+
+from lib.common.utils import handle_response
+from morpheus_api.configuration.request_metrics import REQUEST_METRICS, RequestMetrics
+from morpheus_api.configuration.utils import DEFAULT_POOL_MAXSIZE, T, decode_response
+
+
+def create_async_session(pool_maxsize: int = DEFAULT_POOL_MAXSIZE, keep_alive: bool = True) -> aiohttp.ClientSession:
+    """Creates an aiohttp ClientSession backed by a pooled TCPConnector.
+
+    NOTE: aiohttp requires the session to be created inside a running event loop.
+
+    Args:
+        pool_maxsize (int, optional): The maximum number of connections kept open per host. \
+            Defaults to DEFAULT_POOL_MAXSIZE.
+        keep_alive (bool, optional): Whether to keep connections alive between requests. Defaults to True.
+
+    Returns:
+        aiohttp.ClientSession: The pooled session.
+    """
+    connector = aiohttp.TCPConnector(limit_per_host=pool_maxsize, force_close=not keep_alive)
+    return aiohttp.ClientSession(connector=connector)
+
+
+class AsyncResponse:
+    """A fully read aiohttp response exposing the parts of requests.Response used by the services.
+
+    Attributes:
+        status_code (int): The HTTP status code.
+        headers (dict): The response headers.
+        content (bytes): The raw response body.
+        url (str): The requested URL.
+    """
+
+    def __init__(self, status_code: int, headers: dict, content: bytes, url: str):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+
+    @property
+    def ok(self) -> bool:
+        """True if status_code is less than 400."""
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        """The response body decoded as UTF-8."""
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """Decodes the response body as JSON.
+
+        Returns:
+            Any: The decoded body.
+        """
+        return json.loads(self.content)
+
+
+class AsyncMorpheusAPI:
+    def __init__(
+        self, base_url, api_token, session: aiohttp.ClientSession = None, request_metrics: RequestMetrics = None
+    ):
+        """Initializes the AsyncMorpheusAPI class.
+
+        Args:
+            base_url (_type_): The base URL of the Morpheus API.
+            api_token (_type_): The API token for the Morpheus API.
+            session (aiohttp.ClientSession, optional): The pooled session to send requests with. Pass the same \
+                session to every async service to share one connection pool. Defaults to a session created \
+                lazily by create_async_session() on the first request.
+            request_metrics (RequestMetrics, optional): The registry recording the latency, status and size of \
+                every request. Defaults to the process-wide REQUEST_METRICS.
+        """
+        self.base_url = base_url
+        self.api_token = api_token
+        self.headers = {
+            "Authorization": f"Bearer {self.api_token}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        self.session: Optional[aiohttp.ClientSession] = session
+        self.request_metrics = request_metrics if request_metrics is not None else REQUEST_METRICS
+
+    async def close(self):
+        """Closes the underlying session and releases the pooled connections."""
+        if self.session is not None:
+            await self.session.close()
+
+    def _decode(self, response: AsyncResponse, model: type[T]) -> T:
+        """Decodes the body of a response into a model.
+
+        Args:
+            response (AsyncResponse): The response from the Morpheus API.
+            model (type[T]): The pydantic model or type to validate the body as.
+
+        Returns:
+            T: The validated model.
+        """
+        return decode_response(response.content, model)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _request(self, method: str, endpoint: str, expecting_error: bool = False, **kwargs) -> AsyncResponse:
+        """Sends a request to the Morpheus API through the pooled session.
+
+        Args:
+            method (str): The HTTP method of the request.
+            endpoint (str): The endpoint to send the request to.
+            expecting_error (bool, optional): If the request is expected to return an error. Defaults to False.
+            **kwargs: Extra arguments passed to aiohttp.ClientSession.request (json, data, ...).
+
+        Returns:
+            AsyncResponse: The fully read response.
+        """
+        if self.session is None:
+            self.session = create_async_session()
+
+        url = f"{self.base_url}{endpoint}"
+        # Serialized here rather than by aiohttp, so the size of the body can be recorded
+        body = kwargs.pop("json", None)
+        if body is not None:
+            kwargs["data"] = json.dumps(body).encode()
+        data = kwargs.get("data")
+        start = time.perf_counter()
+        try:
+            async with self.session.request(method, url, headers=self.headers, **kwargs) as raw_response:
+                content = await raw_response.read()
+                response = AsyncResponse(raw_response.status, dict(raw_response.headers), content, url)
+        except Exception:
+            self.request_metrics.record(method, endpoint, None, time.perf_counter() - start)
+            raise
+        self.request_metrics.record(
+            method,
+            endpoint,
+            response.status_code,
+            time.perf_counter() - start,
+            bytes_out=len(data) if isinstance(data, (bytes, str)) else 0,
+            bytes_in=len(content),
+        )
+
+        if expecting_error:
+            return response
+        else:
+            handle_response(response)
+        return response
+
+    async def _get(self, endpoint, verify=False, expecting_error: bool = False) -> AsyncResponse:
+        """GET request to the Morpheus API.
+
+        Args:
+            endpoint (str): The endpoint to send the GET request to.
+            verify (bool, optional): The verification of the GET request. Defaults to False.
+            expecting_error (bool, optional): If the GET request is expected to return an error. Defaults to False.
+
+        Returns:
+            AsyncResponse: The response from the GET request.
+        """
+        return await self._request("GET", endpoint, expecting_error=expecting_error, ssl=verify)
+
+    async def _post(self, endpoint, data=None, verify=False, expecting_error: bool = False) -> AsyncResponse:
+        """The POST request to the Morpheus API.
+
+        Args:
+            endpoint (str): The endpoint to send the POST request to.
+            data (_type_, optional): The data to send with the POST request. Defaults to None.
+            verify (bool, optional): The verification of the POST request. Defaults to False.
+            expecting_error (bool, optional): If the POST request is expected to return an error. Defaults to False.
+
+        Returns:
+            AsyncResponse: The response from the POST request.
+        """
+        return await self._request("POST", endpoint, expecting_error=expecting_error, json=data, ssl=verify)
+
+    async def _put(self, endpoint, data=None, verify=False, expecting_error: bool = False) -> AsyncResponse:
+        """The PUT request to the Morpheus API.
+
+        Args:
+            endpoint (str): The endpoint to send the PUT request to.
+            data (_type_, optional): The data to send with the PUT request. Defaults to None.
+            verify (bool, optional): The verification of the PUT request. Defaults to False.
+            expecting_error (bool, optional): If the PUT request is expected to return an error. Defaults to False.
+
+        Returns:
+            AsyncResponse: The response from the PUT request.
+        """
+        return await self._request("PUT", endpoint, expecting_error=expecting_error, json=data, ssl=verify)
+
+    async def _delete(self, endpoint, verify=False, expecting_error: bool = False) -> AsyncResponse:
+        """The DELETE request to the Morpheus API.
+
+        Args:
+            endpoint (str): The endpoint to send the DELETE request to.
+            verify (bool, optional): The verification of the DELETE request. Defaults to False.
+            expecting_error (bool, optional): If the DELETE request is expected to return an error. Defaults to False.
+
+        Returns:
+            AsyncResponse: The response from the DELETE request.
+        """
+        return await self._request("DELETE", endpoint, expecting_error=expecting_error, ssl=verify)
@@ -0,0 +1,203 @@
+import logging
+import threading
+
+from collections import Counter
+from datetime import timedelta
+from typing import Any, Iterator, Optional, Union
+
+import requests
+
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from morpheus_api.configuration.utils import DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE, create_session
+
+try:
+    import h2  # noqa: F401 (httpx only negotiates HTTP/2 when h2 is installed)
+    import httpx
+except ImportError:
+    httpx = None
+
+logger = logging.getLogger()
+
+# httpx logs every request at INFO, the services already log what they send
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+
+def http2_available() -> bool:
+    """Returns whether the optional HTTP/2 dependencies (`pip install httpx[http2]`) are installed."""
+    return httpx is not None
+
+
+class HTTP2StreamedBody:
+    """The `raw` attribute of a streamed response, reading the body of an httpx response as it arrives.
+
+    Exposes the parts of urllib3.HTTPResponse used by requests.Response.iter_content and Response.close.
+    """
+
+    def __init__(self, response: "httpx.Response"):
+        self._response = response
+        self._chunks: Optional[Iterator[bytes]] = None
+
+    def stream(self, amt: int = 65536, decode_content: bool = True) -> Iterator[bytes]:
+        yield from self._response.iter_bytes(amt)
+
+    def read(self, amt: int = 65536) -> bytes:
+        if self._chunks is None:
+            self._chunks = self._response.iter_bytes(amt)
+        return next(self._chunks, b"")
+
+    def close(self):
+        self._response.close()
+
+
+class HTTP2Session:
+    """A drop-in replacement of requests.Session multiplexing concurrent requests over one HTTP/2 connection.
+
+    Requests are prepared by requests (headers, JSON and form encoding, Content-Length of streamed bodies) and sent
+    through a thread-safe httpx.Client, so concurrent calls from a thread pool become concurrent streams of a single
+    connection instead of one connection each. The protocol is negotiated per connection with ALPN: an appliance
+    or proxy that does not speak HTTP/2 is served over pooled HTTP/1.1 connections by the same client. The
+    responses are returned as requests.Response objects, so the services, the retry policy and the metrics are
+    unaware of the transport.
+
+    Proxies are read from the environment (HTTPS_PROXY, NO_PROXY...) like requests does. TLS verification is
+    decided once for the client; the per-request `verify` argument is accepted and ignored.
+
+    Usage:
+        session = HTTP2Session()
+        service = InstanceService(base_url, api_token, session=session)
+        session.http_versions  # Counter({"HTTP/2": 120})
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        keep_alive: bool = True,
+        verify: bool = False,
+        http1: bool = True,
+    ):
+        """Initializes the HTTP2Session class.
+
+        Args:
+            pool_maxsize (int, optional): The maximum number of idle connections kept open when the protocol falls \
+                back to HTTP/1.1. Defaults to DEFAULT_POOL_MAXSIZE.
+            keep_alive (bool, optional): Whether to keep connections alive between requests. Defaults to True.
+            verify (bool, optional): Whether to verify the TLS certificate of the appliance. Defaults to False.
+            http1 (bool, optional): Whether HTTP/1.1 may be negotiated. False speaks HTTP/2 with prior knowledge, \
+                which is also the only way to use HTTP/2 over plain http:// URLs. Defaults to True.
+
+        Raises:
+            RuntimeError: If httpx[http2] is not installed.
+        """
+        if httpx is None:
+            raise RuntimeError("The HTTP/2 transport requires httpx[http2], install it or use create_session()")
+        limits = httpx.Limits(max_connections=None, max_keepalive_connections=pool_maxsize if keep_alive else 0)
+        self.client = httpx.Client(http1=http1, http2=True, verify=verify, limits=limits, timeout=None)
+        self.headers: dict[str, str] = {}
+        self.http_versions: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[dict] = None,
+        json: Any = None,
+        data: Any = None,
+        verify: Any = None,
+        stream: bool = False,
+        timeout: Union[float, tuple, None] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """Sends a request, with the arguments of requests.Session.request used by MorpheusAPI.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL.
+            headers (Optional[dict], optional): The request headers. Defaults to None.
+            json (Any, optional): A body serialized as JSON. Defaults to None.
+            data (Any, optional): A raw, form or streamed body. Defaults to None.
+            verify (Any, optional): Ignored, the TLS verification is set on the client. Defaults to None.
+            stream (bool, optional): Return before the body is read, to consume it with iter_content. \
+                Defaults to False.
+            timeout (Union[float, tuple, None], optional): The timeout in seconds, or a (connect, read) tuple. \
+                Defaults to None, which waits forever like requests does.
+            **kwargs: Other requests arguments, which the transport does not support.
+
+        Returns:
+            requests.Response: The response.
+
+        Raises:
+            requests.exceptions.Timeout: If the request timed out.
+            requests.exceptions.ConnectionError: If the connection failed or was reset.
+        """
+        if kwargs:
+            raise TypeError(f"Unsupported arguments for the HTTP/2 transport: {', '.join(kwargs)}")
+        prepared = requests.Request(
+            method, url, headers={**self.headers, **(headers or {})}, json=json, data=data
+        ).prepare()
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+        request = self.client.build_request(
+            prepared.method, prepared.url, headers=dict(prepared.headers), content=prepared.body, timeout=timeout
+        )
+        try:
+            response = self.client.send(request, stream=stream)
+        except httpx.TimeoutException as error:
+            raise requests.exceptions.Timeout(str(error), request=prepared) from error
+        except httpx.TransportError as error:
+            raise requests.exceptions.ConnectionError(str(error), request=prepared) from error
+        with self._lock:
+            self.http_versions[response.http_version] += 1
+        return self._to_response(prepared, response, stream)
+
+    def close(self):
+        """Closes the client and its connections."""
+        self.client.close()
+
+    @staticmethod
+    def _to_response(prepared: requests.PreparedRequest, response: "httpx.Response", stream: bool) -> requests.Response:
+        converted = requests.Response()
+        converted.status_code = response.status_code
+        converted.headers = CaseInsensitiveDict(response.headers)
+        converted.encoding = get_encoding_from_headers(converted.headers)
+        converted.reason = response.reason_phrase
+        converted.url = str(response.url)
+        converted.request = prepared
+        if stream:
+            # The elapsed time of httpx is only known once the body is read
+            converted.raw = HTTP2StreamedBody(response)
+            converted.elapsed = timedelta(0)
+        else:
+            # send() already read the body, the content is decoded like requests does
+            converted._content = response.content
+            converted._content_consumed = True
+            converted.elapsed = response.elapsed
+        return converted
+
+
+def create_http2_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    keep_alive: bool = True,
+) -> Union[HTTP2Session, requests.Session]:
+    """Creates a session multiplexing requests over HTTP/2, falling back to the pooled HTTP/1.1 session.
+
+    Takes the arguments of create_session, so the two factories are interchangeable.
+
+    Args:
+        pool_connections (int, optional): The number of host pools of the HTTP/1.1 fallback session. \
+            Defaults to DEFAULT_POOL_CONNECTIONS.
+        pool_maxsize (int, optional): The maximum number of HTTP/1.1 connections kept open per host. \
+            Defaults to DEFAULT_POOL_MAXSIZE.
+        keep_alive (bool, optional): Whether to keep connections alive between requests. Defaults to True.
+
+    Returns:
+        Union[HTTP2Session, requests.Session]: The HTTP/2 session, or the session from create_session() when \
+            httpx[http2] is not installed.
+    """
+    if not http2_available():
+        logger.warning("httpx[http2] is not installed, using the pooled HTTP/1.1 session")
+        return create_session(pool_connections=pool_connections, pool_maxsize=pool_maxsize, keep_alive=keep_alive)
+    return HTTP2Session(pool_maxsize=pool_maxsize, keep_alive=keep_alive)
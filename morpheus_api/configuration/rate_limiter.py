@@ -0,0 +1,265 @@
+import json
+import logging
+import os
+import threading
+import time
+
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows, only the in-process buckets are available
+    fcntl = None
+
+logger = logging.getLogger()
+
+# Request classes sharing one budget; GET/HEAD/OPTIONS are reads, everything else changes the appliance state
+READ = "read"
+MUTATION = "mutation"
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+DEFAULT_READ_RATE = 20.0
+DEFAULT_MUTATION_RATE = 5.0
+DEFAULT_BURST = 10
+
+
+def take_token(tokens: float, updated: float, now: float, rate: float, burst: float) -> tuple[float, float]:
+    """Refills a token bucket up to `now` and takes one token from it, going into debt if it is empty.
+
+    Taking the token right away and returning the wait reserves the caller's place in line, so concurrent callers
+    are served in order and never wake up together to race for the same token.
+
+    Args:
+        tokens (float): The number of tokens at `updated`; negative while callers are queued.
+        updated (float): The time of the last update, in seconds.
+        now (float): The current time, in seconds.
+        rate (float): The number of tokens added per second.
+        burst (float): The capacity of the bucket.
+
+    Returns:
+        tuple[float, float]: The number of tokens left and the number of seconds to wait before sending.
+    """
+    tokens = min(burst, tokens + (now - updated) * rate) - 1
+    return tokens, max(0.0, -tokens / rate)
+
+
+class TokenBucket:
+    """A token bucket shared by the threads of one process.
+
+    Usage:
+        bucket = TokenBucket(rate=5, burst=10)
+        time.sleep(bucket.reserve())
+    """
+
+    def __init__(self, rate: float, burst: float = DEFAULT_BURST):
+        """Initializes the TokenBucket class.
+
+        Args:
+            rate (float): The sustained number of requests per second.
+            burst (float, optional): The number of requests that can be sent at once after an idle period. \
+                Defaults to DEFAULT_BURST.
+        """
+        self.rate = rate
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Takes one token.
+
+        Returns:
+            float: The number of seconds to wait before sending the request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens, wait = take_token(self._tokens, self._updated, now, self.rate, self.burst)
+            self._updated = now
+            return wait
+
+
+class FileTokenBucket(TokenBucket):
+    """A token bucket shared by every process on the host through a small JSON state file.
+
+    Each reservation locks the file with flock, reads the bucket, takes a token and writes it back, so pytest-xdist
+    workers and helper processes draw from the same budget. Wall-clock time is used since it is common to all
+    processes.
+    """
+
+    def __init__(self, path: str, rate: float, burst: float = DEFAULT_BURST):
+        """Initializes the FileTokenBucket class.
+
+        Args:
+            path (str): The state file; created when missing.
+            rate (float): The sustained number of requests per second.
+            burst (float, optional): The number of requests that can be sent at once after an idle period. \
+                Defaults to DEFAULT_BURST.
+
+        Raises:
+            RuntimeError: If the platform has no fcntl (Windows).
+        """
+        if fcntl is None:
+            raise RuntimeError("Cross-process rate limiting requires fcntl, use TokenBucket on this platform")
+        super().__init__(rate, burst)
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def reserve(self) -> float:
+        with self._lock, open(self.path, "a+") as state_file:
+            fcntl.flock(state_file, fcntl.LOCK_EX)
+            try:
+                state_file.seek(0)
+                try:
+                    state = json.loads(state_file.read())
+                    tokens, updated = float(state["tokens"]), float(state["updated"])
+                except (ValueError, KeyError, TypeError):
+                    tokens, updated = float(self.burst), time.time()
+                now = time.time()
+                tokens, wait = take_token(tokens, updated, now, self.rate, self.burst)
+                state_file.seek(0)
+                state_file.truncate()
+                state_file.write(json.dumps({"tokens": tokens, "updated": now}))
+                state_file.flush()
+                return wait
+            finally:
+                fcntl.flock(state_file, fcntl.LOCK_UN)
+
+
+class RateLimitStats:
+    """Thread-safe counters of the queueing delay added by the rate limiter, per request class.
+
+    The queueing delay is the time a request waited for a token before being sent. A mean delay close to zero
+    means the budget is never reached; a growing one means the tests offer more load than the budget allows.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests: dict[str, int] = {}
+        self._delayed: dict[str, int] = {}
+        self._total_delay: dict[str, float] = {}
+        self._max_delay: dict[str, float] = {}
+
+    def record(self, request_class: str, delay: float):
+        """Records the queueing delay of one request.
+
+        Args:
+            request_class (str): READ or MUTATION.
+            delay (float): The number of seconds the request waited for a token.
+        """
+        with self._lock:
+            self._requests[request_class] = self._requests.get(request_class, 0) + 1
+            if delay > 0:
+                self._delayed[request_class] = self._delayed.get(request_class, 0) + 1
+                self._total_delay[request_class] = self._total_delay.get(request_class, 0.0) + delay
+                self._max_delay[request_class] = max(self._max_delay.get(request_class, 0.0), delay)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Returns a snapshot of the queueing delay of each request class.
+
+        Returns:
+            dict[str, dict[str, float]]: Per request class, the number of requests and of delayed requests, and
+                the total, mean and max queueing delay in seconds.
+        """
+        with self._lock:
+            return {
+                request_class: {
+                    "requests": requests,
+                    "delayed": self._delayed.get(request_class, 0),
+                    "total_delay": self._total_delay.get(request_class, 0.0),
+                    "mean_delay": self._total_delay.get(request_class, 0.0) / requests,
+                    "max_delay": self._max_delay.get(request_class, 0.0),
+                }
+                for request_class, requests in self._requests.items()
+            }
+
+    def reset(self):
+        """Clears every counter."""
+        with self._lock:
+            self._requests.clear()
+            self._delayed.clear()
+            self._total_delay.clear()
+            self._max_delay.clear()
+
+
+class RateLimiter:
+    """Client-side rate limiting of the Morpheus API requests, with separate budgets for reads and mutations.
+
+    Every attempt of a request, retries included, takes a token from the bucket of its class and waits for it when
+    the bucket is empty. The buckets are shared by the threads of the process; with a `state_dir` they are backed
+    by files in that directory, so every process pointing to it (e.g. all pytest-xdist workers) shares them.
+
+    Usage:
+        limiter = RateLimiter(read_rate=20, mutation_rate=5, state_dir="/tmp/morpheus-rate-limit")
+        instance_service = InstanceService(base_url, api_token, rate_limiter=limiter)
+        limiter.stats.summary()  # {"read": {"requests": 120, "mean_delay": 0.02, ...}, ...}
+    """
+
+    def __init__(
+        self,
+        read_rate: float = DEFAULT_READ_RATE,
+        mutation_rate: float = DEFAULT_MUTATION_RATE,
+        burst: float = DEFAULT_BURST,
+        state_dir: Optional[str] = None,
+        stats: RateLimitStats = None,
+    ):
+        """Initializes the RateLimiter class.
+
+        Args:
+            read_rate (float, optional): The sustained number of GET/HEAD/OPTIONS requests per second. \
+                Defaults to DEFAULT_READ_RATE.
+            mutation_rate (float, optional): The sustained number of POST/PUT/PATCH/DELETE requests per second. \
+                Defaults to DEFAULT_MUTATION_RATE.
+            burst (float, optional): The number of requests of each class that can be sent at once after an idle \
+                period. Defaults to DEFAULT_BURST.
+            state_dir (Optional[str], optional): The directory of the state files shared between processes. \
+                Defaults to None, which shares the buckets between the threads of this process only.
+            stats (RateLimitStats, optional): The counters to record queueing delays in. \
+                Defaults to a new RateLimitStats.
+        """
+        if state_dir:
+            self.buckets = {
+                READ: FileTokenBucket(os.path.join(state_dir, f"{READ}.json"), read_rate, burst),
+                MUTATION: FileTokenBucket(os.path.join(state_dir, f"{MUTATION}.json"), mutation_rate, burst),
+            }
+        else:
+            self.buckets = {READ: TokenBucket(read_rate, burst), MUTATION: TokenBucket(mutation_rate, burst)}
+        self.stats = stats if stats is not None else RateLimitStats()
+
+    @staticmethod
+    def request_class(method: str) -> str:
+        """Returns the budget a request is charged to.
+
+        Args:
+            method (str): The HTTP method of the request.
+
+        Returns:
+            str: READ or MUTATION.
+        """
+        return READ if method.upper() in READ_METHODS else MUTATION
+
+    def acquire(self, method: str) -> float:
+        """Waits until a request with the given method may be sent.
+
+        Args:
+            method (str): The HTTP method of the request.
+
+        Returns:
+            float: The number of seconds waited.
+        """
+        request_class = self.request_class(method)
+        delay = self.buckets[request_class].reserve()
+        self.stats.record(request_class, delay)
+        if delay > 0:
+            logger.debug(f"Rate limited {request_class} request, waiting {delay:.3f}s")
+            self.sleep(delay)
+        return delay
+
+    def sleep(self, seconds: float):
+        """Waits for a token. Split out so tests can skip the wait.
+
+        Args:
+            seconds (float): The number of seconds to wait.
+        """
+        time.sleep(seconds)
@@ -0,0 +1,337 @@
+import json
+import logging
+import os
+import re
+import threading
+import time
+
+from collections import Counter
+from typing import Any, Optional
+
+logger = logging.getLogger()
+
+# Path segments replaced by {id} in the endpoint templates: numbers and UUIDs
+ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})$")
+
+# Mantissa bits of the histogram buckets: every bucket is at most 1/2**7 (< 1%) of its value wide
+SIGNIFICANT_BITS = 7
+
+# Upper bounds, in seconds, of the cumulative buckets exported in the OpenMetrics text
+EXPORT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+# Quantiles reported in the JSON dump
+QUANTILES = (0.5, 0.9, 0.95, 0.99, 0.999)
+
+METRIC_PREFIX = "morpheus_api"
+
+
+def normalize_endpoint(endpoint: str) -> str:
+    """Turns an endpoint into the template its requests are aggregated under.
+
+    Usage:
+        normalize_endpoint("/api/instances/42/snapshots?max=10")  # "/api/instances/{id}/snapshots"
+
+    Args:
+        endpoint (str): The endpoint, with or without its query string.
+
+    Returns:
+        str: The path with the query string dropped and the ID segments replaced by {id}.
+    """
+    path = endpoint.split("?", 1)[0]
+    return "/".join("{id}" if ID_SEGMENT.match(segment) else segment for segment in path.split("/"))
+
+
+class LatencyHistogram:
+    """An HDR-style log-linear histogram of latencies, recorded in microseconds.
+
+    A value is counted in a bucket keeping its SIGNIFICANT_BITS most significant bits, so the relative error of
+    any quantile is below 1% from microseconds to hours, with a few hundred buckets at most. Not thread-safe, the
+    RequestMetrics lock protects it.
+    """
+
+    def __init__(self):
+        self.counts: Counter = Counter()
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    @staticmethod
+    def bucket_of(microseconds: int) -> int:
+        """Returns the lower bound of the bucket holding a value.
+
+        Args:
+            microseconds (int): The value.
+
+        Returns:
+            int: The value with the bits below its SIGNIFICANT_BITS most significant bits cleared.
+        """
+        shift = max(0, microseconds.bit_length() - SIGNIFICANT_BITS)
+        return (microseconds >> shift) << shift
+
+    @staticmethod
+    def bucket_width(lower: int) -> int:
+        return 1 << max(0, lower.bit_length() - SIGNIFICANT_BITS)
+
+    def record(self, seconds: float):
+        """Counts one latency.
+
+        Args:
+            seconds (float): The latency in seconds.
+        """
+        self.counts[self.bucket_of(int(seconds * 1_000_000))] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+
+    def merge(self, other: "LatencyHistogram"):
+        """Adds the counts of another histogram to this one.
+
+        Args:
+            other (LatencyHistogram): The histogram to add.
+        """
+        self.counts.update(other.counts)
+        self.count += other.count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, quantile: float) -> Optional[float]:
+        """Returns the latency below which the given fraction of the values fall.
+
+        Args:
+            quantile (float): The fraction, e.g. 0.99.
+
+        Returns:
+            Optional[float]: The latency in seconds (the middle of its bucket), or None when empty.
+        """
+        if not self.count:
+            return None
+        rank = max(1, quantile * self.count)
+        seen = 0
+        for lower in sorted(self.counts):
+            seen += self.counts[lower]
+            if seen >= rank:
+                middle = (lower + self.bucket_width(lower) / 2) / 1_000_000
+                return min(max(middle, self.min), self.max)
+        return self.max
+
+    def cumulative_counts(self, upper_bounds: tuple[float, ...]) -> list[int]:
+        """Returns the number of values at or below each upper bound.
+
+        Args:
+            upper_bounds (tuple[float, ...]): The ascending upper bounds in seconds.
+
+        Returns:
+            list[int]: The cumulative count of each bound; a bucket is counted once its whole range fits.
+        """
+        cumulative = []
+        for bound in upper_bounds:
+            limit = bound * 1_000_000
+            cumulative.append(
+                sum(count for lower, count in self.counts.items() if lower + self.bucket_width(lower) <= limit)
+            )
+        return cumulative
+
+
+class EndpointMetrics:
+    """The aggregated metrics of one (method, endpoint template).
+
+    Attributes:
+        latency (LatencyHistogram): The latency of the calls, retries and backoff included.
+        status_codes (Counter): The number of calls per final status code; "error" when no response was received.
+        bytes_out (int): The total size of the request bodies.
+        bytes_in (int): The total size of the response bodies.
+        retries (int): The total number of retries.
+    """
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.status_codes: Counter = Counter()
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.retries = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.latency.count,
+            "status_codes": {str(status): count for status, count in sorted(self.status_codes.items(), key=str)},
+            "bytes_out": self.bytes_out,
+            "bytes_in": self.bytes_in,
+            "retries": self.retries,
+            "latency_seconds": {
+                "sum": self.latency.total,
+                "min": self.latency.min,
+                "max": self.latency.max,
+                "mean": self.latency.total / self.latency.count if self.latency.count else None,
+                **{f"p{quantile * 100:g}": self.latency.quantile(quantile) for quantile in QUANTILES},
+            },
+        }
+
+
+class RequestMetrics:
+    """Thread-safe per-endpoint metrics of the requests sent to the Morpheus API.
+
+    Every request is keyed by its method and normalized endpoint template (e.g. "GET /api/instances/{id}"), and
+    its latency, final status code, bytes in and out and retry count are aggregated. The metrics can be dumped as
+    JSON (with latency quantiles) and as OpenMetrics text, e.g. at the end of a test session.
+
+    Usage:
+        metrics = RequestMetrics()
+        instance_service = InstanceService(base_url, api_token, request_metrics=metrics)
+        ...
+        metrics.dump("logs/metrics")
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: dict[tuple[str, str], EndpointMetrics] = {}
+
+    def record(
+        self,
+        method: str,
+        endpoint: str,
+        status_code: Optional[int],
+        elapsed: float,
+        bytes_out: int = 0,
+        bytes_in: int = 0,
+        retries: int = 0,
+    ):
+        """Records one request.
+
+        Args:
+            method (str): The HTTP method.
+            endpoint (str): The endpoint, normalized into its template.
+            status_code (Optional[int]): The final status code, or None when no response was received.
+            elapsed (float): The latency in seconds, retries and backoff included.
+            bytes_out (int, optional): The size of the request body. Defaults to 0.
+            bytes_in (int, optional): The size of the response body. Defaults to 0.
+            retries (int, optional): The number of retries. Defaults to 0.
+        """
+        key = (method.upper(), normalize_endpoint(endpoint))
+        with self._lock:
+            metrics = self._endpoints.get(key)
+            if metrics is None:
+                metrics = self._endpoints[key] = EndpointMetrics()
+            metrics.latency.record(elapsed)
+            metrics.status_codes[status_code if status_code is not None else "error"] += 1
+            metrics.bytes_out += bytes_out
+            metrics.bytes_in += bytes_in
+            metrics.retries += retries
+
+    def endpoints(self) -> list[tuple[str, str]]:
+        """Returns the recorded (method, endpoint template) keys.
+
+        Returns:
+            list[tuple[str, str]]: The keys, sorted.
+        """
+        with self._lock:
+            return sorted(self._endpoints)
+
+    def histogram(self, method: str, endpoint: str) -> LatencyHistogram:
+        """Returns a copy of the latency histogram of an endpoint.
+
+        Args:
+            method (str): The HTTP method.
+            endpoint (str): The endpoint or endpoint template.
+
+        Returns:
+            LatencyHistogram: The histogram, empty if the endpoint was never called.
+        """
+        histogram = LatencyHistogram()
+        with self._lock:
+            metrics = self._endpoints.get((method.upper(), normalize_endpoint(endpoint)))
+            if metrics is not None:
+                histogram.merge(metrics.latency)
+        return histogram
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        """Returns the metrics of every endpoint, slowest total time first.
+
+        Returns:
+            dict[str, dict[str, Any]]: The metrics keyed by "<METHOD> <endpoint template>".
+        """
+        with self._lock:
+            items = sorted(self._endpoints.items(), key=lambda item: -item[1].latency.total)
+            return {f"{method} {endpoint}": metrics.to_dict() for (method, endpoint), metrics in items}
+
+    def to_json(self) -> str:
+        """Serializes the metrics as JSON.
+
+        Returns:
+            str: The JSON document.
+        """
+        return json.dumps({"generated_at": time.time(), "endpoints": self.to_dict()}, indent=2)
+
+    def to_openmetrics(self) -> str:
+        """Serializes the metrics in the OpenMetrics text format.
+
+        Returns:
+            str: The exposition, terminated by "# EOF".
+        """
+        name = f"{METRIC_PREFIX}_request_duration_seconds"
+        lines = [
+            f"# TYPE {name} histogram",
+            f"# UNIT {name} seconds",
+            f"# HELP {name} Latency of the Morpheus API requests, retries included.",
+        ]
+        counters = {
+            "requests": ("Morpheus API requests by final status code.", []),
+            "request_bytes": ("Bytes sent in the request bodies.", []),
+            "response_bytes": ("Bytes received in the response bodies.", []),
+            "retries": ("Retries of the Morpheus API requests.", []),
+        }
+        with self._lock:
+            for (method, endpoint), metrics in sorted(self._endpoints.items()):
+                labels = f'method="{method}",endpoint="{endpoint}"'
+                cumulative = metrics.latency.cumulative_counts(EXPORT_BUCKETS)
+                for bound, count in zip(EXPORT_BUCKETS, cumulative):
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {metrics.latency.count}')
+                lines.append(f"{name}_count{{{labels}}} {metrics.latency.count}")
+                lines.append(f"{name}_sum{{{labels}}} {metrics.latency.total}")
+                for status, count in sorted(metrics.status_codes.items(), key=str):
+                    counters["requests"][1].append(f'{{{labels},status="{status}"}} {count}')
+                counters["request_bytes"][1].append(f"{{{labels}}} {metrics.bytes_out}")
+                counters["response_bytes"][1].append(f"{{{labels}}} {metrics.bytes_in}")
+                counters["retries"][1].append(f"{{{labels}}} {metrics.retries}")
+
+        for counter, (help_text, samples) in counters.items():
+            counter_name = f"{METRIC_PREFIX}_{counter}"
+            lines.append(f"# TYPE {counter_name} counter")
+            lines.append(f"# HELP {counter_name} {help_text}")
+            lines.extend(f"{counter_name}_total{sample}" for sample in samples)
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, directory: str, name: str = "request_metrics") -> tuple[str, str]:
+        """Writes the metrics to <name>.json and <name>.txt (OpenMetrics) in a directory.
+
+        Args:
+            directory (str): The output directory; created when missing.
+            name (str, optional): The base name of the files. Defaults to "request_metrics".
+
+        Returns:
+            tuple[str, str]: The paths of the JSON and OpenMetrics files.
+        """
+        os.makedirs(directory, exist_ok=True)
+        json_path = os.path.join(directory, f"{name}.json")
+        openmetrics_path = os.path.join(directory, f"{name}.txt")
+        with open(json_path, "w") as json_file:
+            json_file.write(self.to_json())
+        with open(openmetrics_path, "w") as openmetrics_file:
+            openmetrics_file.write(self.to_openmetrics())
+        logger.info(f"Request metrics of {len(self.endpoints())} endpoints written to {json_path}")
+        return json_path, openmetrics_path
+
+    def reset(self):
+        """Drops every recorded request."""
+        with self._lock:
+            self._endpoints.clear()
+
+
+# Registry every service records in unless it is given its own, so a test session sees all its API calls
+REQUEST_METRICS = RequestMetrics()
@@ -0,0 +1,287 @@
+import logging
+import threading
+import time
+
+from collections import Counter, OrderedDict
+from typing import Optional
+
+from requests import Response
+
+from lib.common.enums.morpheus_api_endpoint_type import MorpheusAPIEndpoints
+
+logger = logging.getLogger()
+
+# Endpoints returning near-static data, with the number of seconds a cached response is served without asking the
+# appliance. Every other endpoint is never cached, so status polling always sees the live state; virtual images are
+# left out as their status is polled while they upload and import
+DEFAULT_CACHE_TTLS = {
+    MorpheusAPIEndpoints.SERVICE_PLANS.value: 600,
+    MorpheusAPIEndpoints.PROVISION_TYPES.value: 600,
+    MorpheusAPIEndpoints.CLUSTERS.value: 60,
+    MorpheusAPIEndpoints.LIBRARY.value: 600,
+    MorpheusAPIEndpoints.ZONES.value: 300,
+    MorpheusAPIEndpoints.INSTANCE_TYPES.value: 600,
+}
+
+DEFAULT_CACHE_MAX_ENTRIES = 512
+
+# Methods whose requests change the resource they target
+MUTATING_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+class CacheEntry:
+    """A cached GET response and the validators used to revalidate it.
+
+    Attributes:
+        response (Response): The cached response, with its body already read.
+        expires_at (float): The time.monotonic() deadline until which the response is served without revalidation.
+        etag (Optional[str]): The ETag header of the response, if any.
+        last_modified (Optional[str]): The Last-Modified header of the response, if any.
+    """
+
+    def __init__(self, response: Response, ttl: float):
+        self.response = response
+        self.expires_at = time.monotonic() + ttl
+        self.etag: Optional[str] = response.headers.get("ETag")
+        self.last_modified: Optional[str] = response.headers.get("Last-Modified")
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Returns the headers asking the appliance to answer 304 if the response did not change.
+
+        Returns:
+            dict[str, str]: The If-None-Match and If-Modified-Since headers, empty without validators.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class CacheStats:
+    """Thread-safe counters of the response cache, per endpoint.
+
+    Endpoints are keyed as "<METHOD> <path>" with the query string stripped, e.g. "GET /api/zones/1".
+    A hit is a response served without a request, a revalidation a 304 answer to a conditional request, and a
+    miss a full response fetched from the appliance.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hits: Counter = Counter()
+        self._misses: Counter = Counter()
+        self._revalidations: Counter = Counter()
+        self.invalidations = 0
+
+    def record_hit(self, endpoint_key: str):
+        """Records one response served from the cache.
+
+        Args:
+            endpoint_key (str): The "<METHOD> <path>" key of the endpoint.
+        """
+        with self._lock:
+            self._hits[endpoint_key] += 1
+
+    def record_miss(self, endpoint_key: str):
+        """Records one full response fetched from the appliance.
+
+        Args:
+            endpoint_key (str): The "<METHOD> <path>" key of the endpoint.
+        """
+        with self._lock:
+            self._misses[endpoint_key] += 1
+
+    def record_revalidation(self, endpoint_key: str):
+        """Records one cached response confirmed by a 304 answer.
+
+        Args:
+            endpoint_key (str): The "<METHOD> <path>" key of the endpoint.
+        """
+        with self._lock:
+            self._revalidations[endpoint_key] += 1
+
+    def record_invalidations(self, count: int):
+        """Records cached responses dropped after a mutating request.
+
+        Args:
+            count (int): The number of dropped responses.
+        """
+        with self._lock:
+            self.invalidations += count
+
+    def hits(self) -> dict[str, int]:
+        """Returns a snapshot of the hit counters.
+
+        Returns:
+            dict[str, int]: The number of responses served from the cache per endpoint key.
+        """
+        with self._lock:
+            return dict(self._hits)
+
+    def misses(self) -> dict[str, int]:
+        """Returns a snapshot of the miss counters.
+
+        Returns:
+            dict[str, int]: The number of full responses fetched per endpoint key.
+        """
+        with self._lock:
+            return dict(self._misses)
+
+    def revalidations(self) -> dict[str, int]:
+        """Returns a snapshot of the revalidation counters.
+
+        Returns:
+            dict[str, int]: The number of 304 answers per endpoint key.
+        """
+        with self._lock:
+            return dict(self._revalidations)
+
+    @property
+    def hit_ratio(self) -> float:
+        with self._lock:
+            served = sum(self._hits.values()) + sum(self._revalidations.values())
+            total = served + sum(self._misses.values())
+        return served / total if total else 0.0
+
+    def reset(self):
+        """Clears every counter."""
+        with self._lock:
+            self._hits.clear()
+            self._misses.clear()
+            self._revalidations.clear()
+            self.invalidations = 0
+
+
+class ResponseCache:
+    """An opt-in LRU cache of the GET responses of near-static read endpoints.
+
+    Each endpoint path prefix has its own TTL; GET requests on paths without a TTL are never cached. A fresh entry
+    is served without a request. Once expired, an entry with an ETag or Last-Modified header is revalidated with a
+    conditional request, and kept for another TTL when the appliance answers 304. Any mutating request (POST, PUT,
+    PATCH, DELETE) drops the cached responses of the resource it targets and of its collection, e.g. a PUT to
+    /api/virtual-images/7/upload drops /api/virtual-images/7 and every cached /api/virtual-images list.
+
+    Usage:
+        cache = ResponseCache(ttls={"/api/zones": 300})
+        zone_service = ZoneService(base_url, api_token, response_cache=cache)
+        zone_service.get_zone(1)  # fetched
+        zone_service.get_zone(1)  # served from the cache
+        cache.stats.hits()  # {"GET /api/zones/1": 1}
+    """
+
+    def __init__(
+        self,
+        ttls: dict[str, float] = None,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        stats: CacheStats = None,
+    ):
+        """Initializes the ResponseCache class.
+
+        Args:
+            ttls (dict[str, float], optional): The TTL in seconds of each endpoint path prefix; the longest \
+                matching prefix wins and 0 disables caching. Defaults to DEFAULT_CACHE_TTLS.
+            max_entries (int, optional): The maximum number of cached responses; the least recently used ones are \
+                evicted first. Defaults to DEFAULT_CACHE_MAX_ENTRIES.
+            stats (CacheStats, optional): The counters to record hits and misses in. Defaults to a new CacheStats.
+        """
+        self.ttls = dict(DEFAULT_CACHE_TTLS if ttls is None else ttls)
+        self.max_entries = max_entries
+        self.stats = stats if stats is not None else CacheStats()
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Returns the TTL of an endpoint.
+
+        Args:
+            endpoint (str): The endpoint, with or without its query string.
+
+        Returns:
+            float: The TTL in seconds of the longest matching path prefix, 0 if the endpoint is not cached.
+        """
+        path = endpoint.split("?", 1)[0]
+        matches = [prefix for prefix in self.ttls if path == prefix or path.startswith(f"{prefix}/")]
+        return self.ttls[max(matches, key=len)] if matches else 0
+
+    def get(self, endpoint: str) -> Optional[CacheEntry]:
+        """Returns the cached entry of an endpoint and marks it as recently used.
+
+        Args:
+            endpoint (str): The endpoint including its query string.
+
+        Returns:
+            Optional[CacheEntry]: The entry, fresh or not, or None if the endpoint is not cached.
+        """
+        with self._lock:
+            entry = self._entries.get(endpoint)
+            if entry is not None:
+                self._entries.move_to_end(endpoint)
+            return entry
+
+    def store(self, endpoint: str, response: Response):
+        """Caches a successful GET response if its endpoint has a TTL.
+
+        Args:
+            endpoint (str): The endpoint including its query string.
+            response (Response): The 200 response from the Morpheus API.
+        """
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0 or response.status_code != 200:
+            return
+        response.content  # read the body now, the cached response is shared between threads
+        with self._lock:
+            self._entries[endpoint] = CacheEntry(response, ttl)
+            self._entries.move_to_end(endpoint)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def refresh(self, endpoint: str, entry: CacheEntry):
+        """Keeps serving a revalidated entry for another TTL.
+
+        Args:
+            endpoint (str): The endpoint including its query string.
+            entry (CacheEntry): The entry the appliance confirmed with a 304.
+        """
+        entry.expires_at = time.monotonic() + self.ttl_for(endpoint)
+
+    def invalidate(self, endpoint: str) -> int:
+        """Drops the cached responses of the resource targeted by a mutating request, and of its collection.
+
+        Args:
+            endpoint (str): The endpoint of the mutating request, e.g. /api/instances/42/stop.
+
+        Returns:
+            int: The number of dropped entries.
+        """
+        segments = endpoint.split("?", 1)[0].rstrip("/").split("/")
+        # "/api/<collection>" and "/api/<collection>/<id>"
+        collection = "/".join(segments[:3])
+        resource = "/".join(segments[:4])
+        with self._lock:
+            dropped = [
+                key
+                for key in self._entries
+                if key.split("?", 1)[0] == collection
+                or key == resource
+                or key.startswith((f"{resource}/", f"{resource}?"))
+            ]
+            for key in dropped:
+                del self._entries[key]
+        if dropped:
+            self.stats.record_invalidations(len(dropped))
+            logger.debug(f"Dropped {len(dropped)} cached responses after a change to {resource}")
+        return len(dropped)
+
+    def clear(self):
+        """Drops every cached response."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,221 @@
+import logging
+import random
+import threading
+import time
+
+from collections import Counter
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import requests
+from requests import Response
+
+logger = logging.getLogger()
+
+# Status codes that signal a transient appliance or load balancer failure
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Methods retried by default; the appliance treats these as idempotent. POST is opt-in per policy or per call
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "DELETE"})
+
+# Connection level failures that are safe to retry for an idempotent request
+RETRYABLE_EXCEPTIONS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_MAX_BACKOFF = 30.0
+
+
+class RetryStats:
+    """Thread-safe counters of the retries issued per endpoint.
+
+    Endpoints are keyed as "<METHOD> <path>" with the query string stripped, e.g. "GET /api/instances/42".
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._retries: Counter = Counter()
+        self._exhausted: Counter = Counter()
+
+    def record_retry(self, endpoint_key: str):
+        """Records one retry of the given endpoint.
+
+        Args:
+            endpoint_key (str): The "<METHOD> <path>" key of the endpoint.
+        """
+        with self._lock:
+            self._retries[endpoint_key] += 1
+
+    def record_exhausted(self, endpoint_key: str):
+        """Records a request that still failed after the last retry.
+
+        Args:
+            endpoint_key (str): The "<METHOD> <path>" key of the endpoint.
+        """
+        with self._lock:
+            self._exhausted[endpoint_key] += 1
+
+    def retries(self) -> dict[str, int]:
+        """Returns a snapshot of the retry counters.
+
+        Returns:
+            dict[str, int]: The number of retries per endpoint key.
+        """
+        with self._lock:
+            return dict(self._retries)
+
+    def exhausted(self) -> dict[str, int]:
+        """Returns a snapshot of the exhausted-retry counters.
+
+        Returns:
+            dict[str, int]: The number of requests per endpoint key that failed after every retry.
+        """
+        with self._lock:
+            return dict(self._exhausted)
+
+    @property
+    def total_retries(self) -> int:
+        with self._lock:
+            return sum(self._retries.values())
+
+    def reset(self):
+        """Clears every counter."""
+        with self._lock:
+            self._retries.clear()
+            self._exhausted.clear()
+
+
+class RetryPolicy:
+    """Decides whether a failed Morpheus API request is retried and how long to wait before the next attempt.
+
+    The wait is an exponential backoff with full jitter (a random delay between 0 and
+    min(max_backoff, backoff_factor * 2 ** attempt)). A `Retry-After` header on a 429/503 response takes precedence
+    over the computed backoff. Only idempotent methods are retried unless POST is enabled with `retry_post` or the
+    caller opts in for a single request.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        jitter: bool = True,
+        retry_post: bool = False,
+        retryable_status_codes: frozenset[int] = RETRYABLE_STATUS_CODES,
+        stats: RetryStats = None,
+    ):
+        """Initializes the RetryPolicy class.
+
+        Args:
+            max_retries (int, optional): The maximum number of retries after the first attempt. \
+                Defaults to DEFAULT_MAX_RETRIES.
+            backoff_factor (float, optional): The base delay in seconds of the exponential backoff. \
+                Defaults to DEFAULT_BACKOFF_FACTOR.
+            max_backoff (float, optional): The upper bound in seconds of a single wait, including Retry-After. \
+                Defaults to DEFAULT_MAX_BACKOFF.
+            jitter (bool, optional): Randomize the wait to spread retries from parallel workers. Defaults to True.
+            retry_post (bool, optional): Retry POST requests as well. Defaults to False.
+            retryable_status_codes (frozenset[int], optional): The status codes that are retried. \
+                Defaults to RETRYABLE_STATUS_CODES.
+            stats (RetryStats, optional): The counters to record retries in. Defaults to a new RetryStats.
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_methods = IDEMPOTENT_METHODS | {"POST"} if retry_post else IDEMPOTENT_METHODS
+        self.retryable_status_codes = retryable_status_codes
+        self.stats = stats if stats is not None else RetryStats()
+
+    def allows_method(self, method: str, retry: Optional[bool] = None) -> bool:
+        """Checks whether requests with the given method may be retried.
+
+        Args:
+            method (str): The HTTP method of the request.
+            retry (Optional[bool], optional): A per-request override; True opts in, False opts out. \
+                Defaults to None, which follows the policy.
+
+        Returns:
+            bool: True if the request may be retried, False otherwise.
+        """
+        if retry is not None:
+            return retry
+        return method.upper() in self.retry_methods
+
+    def is_retryable_response(self, response: Response) -> bool:
+        """Checks whether the response status signals a transient failure.
+
+        Args:
+            response (Response): The response from the Morpheus API.
+
+        Returns:
+            bool: True if the status code is retryable, False otherwise.
+        """
+        return response.status_code in self.retryable_status_codes
+
+    def is_retryable_exception(self, error: Exception) -> bool:
+        """Checks whether the exception is a transient connection failure.
+
+        Args:
+            error (Exception): The exception raised while sending the request.
+
+        Returns:
+            bool: True if the exception is retryable, False otherwise.
+        """
+        return isinstance(error, RETRYABLE_EXCEPTIONS)
+
+    def get_backoff(self, attempt: int, response: Response = None) -> float:
+        """Computes the wait before the next attempt.
+
+        Args:
+            attempt (int): The zero-based number of the attempt that just failed.
+            response (Response, optional): The failed response, used for its Retry-After header. Defaults to None.
+
+        Returns:
+            float: The number of seconds to wait.
+        """
+        retry_after = self.parse_retry_after(response) if response is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+
+        backoff = min(self.max_backoff, self.backoff_factor * (2**attempt))
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+    @staticmethod
+    def parse_retry_after(response: Response) -> Optional[float]:
+        """Parses the Retry-After header, given either as delay seconds or as an HTTP date.
+
+        Args:
+            response (Response): The response from the Morpheus API.
+
+        Returns:
+            Optional[float]: The number of seconds to wait, or None if the header is missing or invalid.
+        """
+        retry_after = response.headers.get("Retry-After")
+        if not retry_after:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring invalid Retry-After header: {retry_after}")
+            return None
+
+    def sleep(self, seconds: float):
+        """Waits before the next attempt. Split out so tests can skip the wait.
+
+        Args:
+            seconds (float): The number of seconds to wait.
+        """
+        time.sleep(seconds)
+
+
+# Policy that sends every request exactly once, matching the behaviour before retries were introduced
+NO_RETRY = RetryPolicy(max_retries=0)
@@ -1,26 +1,134 @@
+import logging
 import requests
+import time
 import warnings
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Iterator, TypeVar
+from pydantic import TypeAdapter
 from requests import Response
+from requests.adapters import HTTPAdapter
 from lib.common.utils import handle_response
+from morpheus_api.configuration.rate_limiter import RateLimiter
+from morpheus_api.configuration.request_metrics import REQUEST_METRICS, RequestMetrics
+from morpheus_api.configuration.response_cache import MUTATING_METHODS, ResponseCache
+from morpheus_api.configuration.retry_policy import RetryPolicy
+from morpheus_api.helpers.json_stream import iter_json_array
 
 warnings.filterwarnings("ignore")
 
+logger = logging.getLogger()
+
 # NOTE; If proxies below are not working, attempt to use "http://hpeproxy.its.hpecorp.net:443"
 proxies = {
     "http": "http://web-proxy.corp.hpecorp.net:8080",
     "https": "http://web-proxy.corp.hpecorp.net:8080",
 }
 
+# Connection pool defaults, overridden from APISettings when services are built by MorpheusAPIService
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 20
+
+# Page size used by the paginating iterators when the caller does not pick one
+DEFAULT_PAGE_SIZE = 100
+
+# Page size of the streaming list methods; items are parsed one at a time, so pages can be much larger
+DEFAULT_STREAM_PAGE_SIZE = 1000
+
+# Number of bytes read from the socket at a time by the streaming list methods
+DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024
+
+T = TypeVar("T")
+
+
+def create_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    keep_alive: bool = True,
+) -> requests.Session:
+    """Creates a requests Session backed by a pooled HTTPAdapter.
+
+    The session keeps TCP + TLS connections to the Morpheus appliance open between calls, so polling loops
+    do not pay a fresh handshake for every request. A single session can be shared by all service classes.
+
+    Args:
+        pool_connections (int, optional): The number of host pools to cache. Defaults to DEFAULT_POOL_CONNECTIONS.
+        pool_maxsize (int, optional): The maximum number of connections kept open per host. \
+            Defaults to DEFAULT_POOL_MAXSIZE.
+        keep_alive (bool, optional): Whether to keep connections alive between requests. Defaults to True.
+
+    Returns:
+        requests.Session: The pooled session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=False)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    return session
+
+
+@lru_cache(maxsize=None)
+def get_type_adapter(model: Any) -> TypeAdapter:
+    """Returns the TypeAdapter of a model or type, building it only once per type.
+
+    Args:
+        model (Any): The pydantic model or type, e.g. InstanceList or list[Snapshot].
+
+    Returns:
+        TypeAdapter: The cached adapter.
+    """
+    return TypeAdapter(model)
+
+
+def decode_response(content: bytes, model: type[T]) -> T:
+    """Validates a raw JSON response body straight into a model.
+
+    The bytes are parsed and validated in one pass by pydantic-core, without building the intermediate dicts
+    of `Model(**json.loads(content))`.
+
+    Args:
+        content (bytes): The raw JSON body.
+        model (type[T]): The pydantic model or type to validate the body as.
+
+    Returns:
+        T: The validated model.
+    """
+    return get_type_adapter(model).validate_json(content)
+
 
 class MorpheusAPI:
-    def __init__(self, base_url, api_token, proxies=proxies):
+    def __init__(
+        self,
+        base_url,
+        api_token,
+        proxies=proxies,
+        session: requests.Session = None,
+        retry_policy: RetryPolicy = None,
+        response_cache: ResponseCache = None,
+        rate_limiter: RateLimiter = None,
+        request_metrics: RequestMetrics = None,
+    ):
         """Initializes the MorpheusAPI class.
 
         Args:
             base_url (_type_): The base URL of the Morpheus API.
             api_token (_type_): The API token for the Morpheus API.
             proxies (_type_, optional): The proxies to use for the Morpheus API. Defaults to proxies.
+            session (requests.Session, optional): The pooled session to send requests with. Pass the same session \
+                to every service to share one connection pool. Defaults to a new session from create_session().
+            retry_policy (RetryPolicy, optional): The policy deciding which failed requests are retried. Pass the \
+                same policy to every service to aggregate its retry counters. Defaults to a new RetryPolicy().
+            response_cache (ResponseCache, optional): The cache of near-static GET responses. Pass the same cache \
+                to every service so a change made through one service invalidates the responses cached by another. \
+                Defaults to None, which disables caching.
+            rate_limiter (RateLimiter, optional): The read and mutation budgets every request attempt is charged \
+                to. Pass the same limiter to every service to share the budgets. Defaults to None, which sends \
+                requests unthrottled.
+            request_metrics (RequestMetrics, optional): The registry recording the latency, status, size and \
+                retries of every request. Defaults to the process-wide REQUEST_METRICS.
         """
         self.base_url = base_url
         self.api_token = api_token
@@ -30,65 +138,307 @@ class MorpheusAPI:
             "Accept": "application/json",
         }
         self.proxies = proxies
+        self.session = session if session is not None else create_session()
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.response_cache = response_cache
+        self.rate_limiter = rate_limiter
+        self.request_metrics = request_metrics if request_metrics is not None else REQUEST_METRICS
 
-    def _get(self, endpoint, verify=False, expecting_error: bool = False) -> Response:
-        """GET request to the Morpheus API.
+    def close(self):
+        """Closes the underlying session and releases the pooled connections."""
+        self.session.close()
+
+    def stream_list(
+        self,
+        build_endpoint: Callable[[int, int], str],
+        items_field: str,
+        model: type[T],
+        page_size: int = DEFAULT_STREAM_PAGE_SIZE,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> Iterator[T]:
+        """Streams the items of a list endpoint, validating and yielding them one at a time.
+
+        Each page is read from the socket in chunks and its items array is parsed incrementally, so neither the
+        whole body nor the whole list of models is ever held in memory. Paging stops at the first page with fewer
+        than page_size items. The first request is only sent when iteration starts.
+
+        Usage:
+            for instance in self.stream_list(
+                lambda max, offset: f"{INSTANCE_ENDPOINT}?max={max}&offset={offset}", "instances", InstanceDetails
+            ):
+                ...
 
         Args:
-            endpoint (str): The endpoint to send the GET request to.
-            verify (bool, optional): The verification of the GET request. Defaults to False.
-            expecting_error (bool, optional): If the GET request is expected to return an error. Defaults to False.
+            build_endpoint (Callable[[int, int], str]): Builds the endpoint of one page given (max, offset).
+            items_field (str): The JSON name of the items array, e.g. "virtualImages".
+            model (type[T]): The pydantic model of one item.
+            page_size (int, optional): The number of items requested per page. Defaults to DEFAULT_STREAM_PAGE_SIZE.
+            chunk_size (int, optional): The number of bytes read at a time. Defaults to DEFAULT_STREAM_CHUNK_SIZE.
+
+        Yields:
+            T: The validated items of every page, in order.
+        """
+        adapter = get_type_adapter(model)
+        offset = 0
+        while True:
+            response = self._request("GET", build_endpoint(page_size, offset), verify=False, stream=True)
+            count = 0
+            try:
+                for item in iter_json_array(response.iter_content(chunk_size=chunk_size), items_field):
+                    yield adapter.validate_python(item)
+                    count += 1
+            finally:
+                response.close()
+            if count < page_size:
+                return
+            offset += count
+
+    def _decode(self, response: Response, model: type[T]) -> T:
+        """Decodes the body of a response into a model.
+
+        Args:
+            response (Response): The response from the Morpheus API.
+            model (type[T]): The pydantic model or type to validate the body as.
 
         Returns:
-            Response: The response from the GET request.
+            T: The validated model.
+        """
+        return decode_response(response.content, model)
+
+    def paginate(
+        self,
+        fetch_page: Callable[[int, int], Any],
+        items_field: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[Any]:
+        """Lazily yields every item of a paginated list endpoint, one page at a time.
+
+        The next offset is driven by the `meta` object of each page (offset + size, stopping at meta.total).
+        List responses without `meta` stop at the first page shorter than page_size. At most two pages are held
+        in memory, so large tenants can be scanned in bounded memory.
+
+        Usage:
+            for instance in self.paginate(
+                lambda max, offset: self.list_instances(max_results=max, offset=offset), "instances"
+            ):
+                ...
+
+        Args:
+            fetch_page (Callable[[int, int], Any]): Fetches one page given (max, offset) and returns the list object.
+            items_field (str): The attribute of the list object holding the items, e.g. "instances".
+            page_size (int, optional): The number of items requested per page. Defaults to DEFAULT_PAGE_SIZE.
+            prefetch (bool, optional): Fetch the next page in a background thread while the current page is being \
+                consumed. Defaults to False.
+
+        Yields:
+            Any: The items of every page, in order.
+        """
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            offset = 0
+            page = fetch_page(page_size, offset)
+            while True:
+                items = getattr(page, items_field)
+                meta = getattr(page, "meta", None)
+
+                if meta is not None:
+                    offset = meta.offset + meta.size
+                    has_next_page = meta.size > 0 and offset < meta.total
+                else:
+                    offset += len(items)
+                    has_next_page = len(items) >= page_size
+
+                next_page: Future = None
+                if has_next_page and executor:
+                    next_page = executor.submit(fetch_page, page_size, offset)
+
+                yield from items
+
+                if not has_next_page:
+                    return
+                page = next_page.result() if next_page else fetch_page(page_size, offset)
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def _request(
+        self, method: str, endpoint: str, expecting_error: bool = False, retry: bool = None, **kwargs
+    ) -> Response:
+        """Sends a request to the Morpheus API through the pooled session.
+
+        Transient failures (connection resets, timeouts and the retryable 5xx/429 statuses) are retried according
+        to the retry policy. Requests that expect an error are never retried on their status code. With a response
+        cache, GET requests of cached endpoints are served or revalidated through it and mutating requests
+        invalidate the responses cached for their resource. With a rate limiter, every attempt first waits for a
+        token of its read or mutation budget.
+
+        Args:
+            method (str): The HTTP method of the request.
+            endpoint (str): The endpoint to send the request to.
+            expecting_error (bool, optional): If the request is expected to return an error. Defaults to False.
+            retry (bool, optional): Overrides the retry policy for this request; True opts a non-idempotent \
+                request in, False opts out. Defaults to None, which follows the policy.
+            **kwargs: Extra arguments passed to requests.Session.request (json, data, verify, ...).
+
+        Returns:
+            Response: The response from the request.
         """
         url = f"{self.base_url}{endpoint}"
-        response = requests.get(url, headers=self.headers, verify=verify)
+        policy = self.retry_policy
+        retry_allowed = policy.allows_method(method, retry)
+        endpoint_key = f"{method} {endpoint.split('?', 1)[0]}"
+        headers = self.headers
+
+        cache = self.response_cache
+        cacheable = (
+            cache is not None
+            and method == "GET"
+            and not expecting_error
+            and not kwargs.get("stream")
+            and cache.ttl_for(endpoint) > 0
+        )
+        cached = None
+        if cache is not None:
+            if method in MUTATING_METHODS:
+                cache.invalidate(endpoint)
+            elif cacheable:
+                cached = cache.get(endpoint)
+                if cached is not None and cached.fresh:
+                    cache.stats.record_hit(endpoint_key)
+                    return cached.response
+                if cached is not None:
+                    headers = {**self.headers, **cached.conditional_headers()}
+
+        attempt = 0
+        start = time.perf_counter()
+        try:
+            while True:
+                response = None
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire(method)
+                try:
+                    response = self.session.request(method, url, headers=headers, **kwargs)
+                except Exception as error:
+                    if not (retry_allowed and policy.is_retryable_exception(error)):
+                        raise
+                    if attempt >= policy.max_retries:
+                        if policy.max_retries:
+                            policy.stats.record_exhausted(endpoint_key)
+                        raise
+                    backoff = policy.get_backoff(attempt)
+                    logger.warning(f"{endpoint_key} failed with {error!r}, retrying in {backoff:.2f}s")
+                else:
+                    if expecting_error or not (retry_allowed and policy.is_retryable_response(response)):
+                        break
+                    if attempt >= policy.max_retries:
+                        if policy.max_retries:
+                            policy.stats.record_exhausted(endpoint_key)
+                        break
+                    backoff = policy.get_backoff(attempt, response)
+                    logger.warning(f"{endpoint_key} returned {response.status_code}, retrying in {backoff:.2f}s")
+                    response.close()
+                policy.stats.record_retry(endpoint_key)
+                policy.sleep(backoff)
+                attempt += 1
+        finally:
+            self._record_metrics(method, endpoint, response, time.perf_counter() - start, attempt, kwargs)
+
+        if cache is not None and method in MUTATING_METHODS:
+            # Again once the change is applied, in case a concurrent GET cached the previous state meanwhile
+            cache.invalidate(endpoint)
+
         if expecting_error:
             return response
         else:
             handle_response(response)
+
+        if cached is not None and response.status_code == 304:
+            cache.refresh(endpoint, cached)
+            cache.stats.record_revalidation(endpoint_key)
+            return cached.response
+        if cacheable:
+            cache.stats.record_miss(endpoint_key)
+            cache.store(endpoint, response)
         return response
 
-    def _post(self, endpoint, data, verify=False, expecting_error: bool = False) -> Response:
+    def _record_metrics(
+        self, method: str, endpoint: str, response: Response, elapsed: float, retries: int, request_kwargs: dict
+    ):
+        """Records a finished request in the request metrics.
+
+        Args:
+            method (str): The HTTP method of the request.
+            endpoint (str): The endpoint the request was sent to.
+            response (Response): The final response, or None if the last attempt raised.
+            elapsed (float): The time spent in the request, retries and backoff included, in seconds.
+            retries (int): The number of retries.
+            request_kwargs (dict): The arguments passed to requests.Session.request.
+        """
+        if response is None:
+            self.request_metrics.record(method, endpoint, None, elapsed, retries=retries)
+            return
+        body = response.request.body if response.request is not None else None
+        if request_kwargs.get("stream"):
+            # Reading the content would defeat streaming, rely on the announced size instead
+            bytes_in = int(response.headers.get("Content-Length") or 0)
+        else:
+            bytes_in = len(response.content)
+        self.request_metrics.record(
+            method,
+            endpoint,
+            response.status_code,
+            elapsed,
+            bytes_out=len(body) if hasattr(body, "__len__") else 0,
+            bytes_in=bytes_in,
+            retries=retries,
+        )
+
+    def _get(self, endpoint, verify=False, expecting_error: bool = False) -> Response:
+        """GET request to the Morpheus API.
+
+        Args:
+            endpoint (str): The endpoint to send the GET request to.
+            verify (bool, optional): The verification of the GET request. Defaults to False.
+            expecting_error (bool, optional): If the GET request is expected to return an error. Defaults to False.
+
+        Returns:
+            Response: The response from the GET request.
+        """
+        return self._request("GET", endpoint, expecting_error=expecting_error, verify=verify)
+
+    def _post(self, endpoint, data=None, verify=False, expecting_error: bool = False, retry: bool = None) -> Response:
         """The POST request to the Morpheus API.
 
         Args:
             endpoint (str): The endpoint to send the POST request to.
-            data (_type_): The data to send with the POST request.
+            data (_type_, optional): The data to send with the POST request. Defaults to None.
             verify (bool, optional): The verification of the POST request. Defaults to False.
             expecting_error (bool, optional): If the POST request is expected to return an error. Defaults to False.
+            retry (bool, optional): Opt this POST in to (or out of) retries on transient failures. \
+                Defaults to None, which follows the retry policy.
 
         Returns:
             Response: The response from the POST request.
         """
-        url = f"{self.base_url}{endpoint}"
-        response = requests.post(url, headers=self.headers, json=data, verify=verify)
-        if expecting_error:
-            return response
-        else:
-            handle_response(response)
-        return response
+        return self._request("POST", endpoint, expecting_error=expecting_error, retry=retry, json=data, verify=verify)
 
-    def _post_upload(self, endpoint, data, verify=False, expecting_error: bool = False) -> Response:
+    def _post_upload(self, endpoint, data, verify=False, expecting_error: bool = False, retry: bool = None) -> Response:
         """The POST request to the Morpheus API for uploading files.
 
         Args:
             endpoint (str): The endpoint to send the POST request to.
-            data (_type_): The data to send with the POST request.
+            data (_type_): The data to send with the POST request; an iterable body is sent again from its start \
+                on a retry, a file handle is not.
             verify (bool, optional): The verification of the POST request. Defaults to False.
             expecting_error (bool, optional): If the POST request is expected to return an error. Defaults to False.
+            retry (bool, optional): Opt this POST in to (or out of) retries on transient failures. \
+                Defaults to None, which follows the retry policy.
 
         Returns:
             Response: The response from the POST request.
         """
-        url = f"{self.base_url}{endpoint}"
-        response = requests.post(url, headers=self.headers, data=data, verify=verify)
-        if expecting_error:
-            return response
-        else:
-            handle_response(response)
-        return response
+        return self._request("POST", endpoint, expecting_error=expecting_error, retry=retry, data=data, verify=verify)
 
     def _put(self, endpoint, data=None, verify=False, expecting_error: bool = False) -> Response:
         """The PUT request to the Morpheus API.
@@ -102,13 +452,7 @@ class MorpheusAPI:
         Returns:
             Response: The response from the PUT request.
         """
-        url = f"{self.base_url}{endpoint}"
-        response = requests.put(url, headers=self.headers, json=data, verify=verify)
-        if expecting_error:
-            return response
-        else:
-            handle_response(response)
-        return response
+        return self._request("PUT", endpoint, expecting_error=expecting_error, json=data, verify=verify)
 
     def _delete(self, endpoint, verify=False, expecting_error: bool = False) -> Response:
         """The DELETE request to the Morpheus API.
@@ -120,10 +464,4 @@ class MorpheusAPI:
         Returns:
             Response: The response from the DELETE request.
         """
-        url = f"{self.base_url}{endpoint}"
-        response = requests.delete(url, headers=self.headers, verify=verify)
-        if expecting_error:
-            return response
-        else:
-            handle_response(response)
-        return response
+        return self._request("DELETE", endpoint, expecting_error=expecting_error, verify=verify)
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, ConfigDict
 from pydantic.alias_generators import to_camel
+from pydantic.dataclasses import dataclass
 
 
 # All dataclasses must extend from this object for conversion from snake_case to camelCase
@@ -9,3 +10,11 @@ class BaseObject(BaseModel):
         populate_by_name=True,
         from_attributes=True,
     )
+
+
+# Projections of a full object keeping only the fields read on hot paths (e.g. status polling). They are slotted
+# dataclasses: the fields that are not declared are ignored instead of validated, and no per-object __dict__ is built
+projection = dataclass(
+    slots=True,
+    config=ConfigDict(alias_generator=to_camel, populate_by_name=True),
+)
@@ -1,7 +1,7 @@
 from typing import Any, Optional
 from pydantic import field_validator
 
-from morpheus_api.dataclasses.base_object import BaseObject
+from morpheus_api.dataclasses.base_object import BaseObject, projection
 from morpheus_api.dataclasses.common_objects import ID, Code, IDCode, IDName, Meta, NameValue
 from morpheus_api.dataclasses.volume import Volume
 from morpheus_api.dataclasses.network import Interface, NetworkInterface
@@ -93,6 +93,24 @@ class Instance(BaseObject):
 
 class InstanceList(BaseObject):
     instances: list[InstanceDetails]
+    meta: Optional[Meta] = None
+
+
+@projection
+class InstanceStatusView:
+    id: int
+    status: str
+    locked: bool = False
+
+
+@projection
+class InstanceStatusResponse:
+    instance: InstanceStatusView
+
+
+@projection
+class InstanceStatusList:
+    instances: list[InstanceStatusView]
 
 
 class InstanceType(BaseObject):
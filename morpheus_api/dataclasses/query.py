@@ -0,0 +1,112 @@
+from enum import Enum
+from typing import Any, Optional, Union
+from urllib.parse import urlencode
+
+from pydantic import Field
+
+from morpheus_api.dataclasses.base_object import BaseObject
+
+
+class ListQuery(BaseObject):
+    """The query string of a Morpheus list endpoint.
+
+    Fields left to None (or "") are not sent, lists are sent as repeated parameters (`id=1&id=2`), booleans as
+    true/false and every value is URL encoded. Parameters specific to one endpoint go in a subclass, or in `extra`
+    when they have no typed field yet. Morpheus has no generic field selection on its list endpoints, so the way
+    to shrink a response is to filter it server-side (name, ids, status...) and to ask for no more rows than
+    needed with `max`.
+
+    Usage:
+        ListQuery(name="web 01", max=1)  # "max=1&name=web+01"
+        ListQuery(ids=[1, 2], max=2)  # "max=2&id=1&id=2"
+    """
+
+    max: Optional[int] = None
+    offset: Optional[int] = None
+    sort: Optional[str] = None
+    direction: Optional[str] = None
+    name: Optional[str] = None
+    phrase: Optional[str] = None
+    code: Optional[str] = None
+    status: Optional[str] = None
+    ids: Optional[list[int]] = Field(default=None, alias="id")
+    details: Optional[bool] = None
+    extra: dict[str, Any] = Field(default_factory=dict, exclude=True)
+
+    def page(self, max: Optional[int] = None, offset: Optional[int] = None) -> "ListQuery":
+        """Returns a copy of the query for one page.
+
+        Args:
+            max (Optional[int], optional): The page size. Defaults to None, which keeps the current one.
+            offset (Optional[int], optional): The offset of the page. Defaults to None, which keeps the current one.
+
+        Returns:
+            ListQuery: The query with the paging parameters replaced.
+        """
+        update = {field: value for field, value in (("max", max), ("offset", offset)) if value is not None}
+        return self.model_copy(update=update) if update else self
+
+    def params(self) -> list[tuple[str, Any]]:
+        """Returns the parameters sent by the query.
+
+        Returns:
+            list[tuple[str, Any]]: The (name, value) pairs, one per value of the list parameters.
+        """
+        params = []
+        for key, value in {**self.model_dump(by_alias=True, exclude_none=True), **self.extra}.items():
+            for item in value if isinstance(value, (list, tuple, set)) else [value]:
+                if isinstance(item, Enum):
+                    item = item.value
+                if item is None or item == "":
+                    continue
+                params.append((key, str(item).lower() if isinstance(item, bool) else item))
+        return params
+
+    def to_query_string(self) -> str:
+        """Encodes the query.
+
+        Returns:
+            str: The URL encoded query string, without the leading "?".
+        """
+        return urlencode(self.params())
+
+    def __str__(self) -> str:
+        return self.to_query_string()
+
+
+class ServerQuery(ListQuery):
+    """The query string of the /api/servers list endpoint."""
+
+    cluster_id: Optional[int] = None
+    zone_id: Optional[int] = None
+
+
+class VirtualImageQuery(ListQuery):
+    """The query string of the /api/virtual-images list endpoint."""
+
+    filter_type: Optional[str] = None
+
+
+def list_endpoint(
+    endpoint: str, query: Union[ListQuery, str, None] = None, max: Optional[int] = None, offset: Optional[int] = None
+) -> str:
+    """Builds the URL of one page of a list endpoint.
+
+    Usage:
+        list_endpoint("/api/instances", ListQuery(name="web"), max=100, offset=0)  # "/api/instances?max=100&..."
+
+    Args:
+        endpoint (str): The list endpoint.
+        query (Union[ListQuery, str, None], optional): The typed query, or a query string built by the caller \
+            (appended as is). Defaults to None.
+        max (Optional[int], optional): The page size, overriding the one of the query. Defaults to None.
+        offset (Optional[int], optional): The offset, overriding the one of the query. Defaults to None.
+
+    Returns:
+        str: The endpoint followed by its query string, if any.
+    """
+    if isinstance(query, ListQuery):
+        query_string = query.page(max, offset).to_query_string()
+    else:
+        query_string = "&".join(part for part in (ListQuery(max=max, offset=offset).to_query_string(), query) if part)
+    return f"{endpoint}?{query_string}" if query_string else endpoint
@@ -1,8 +1,9 @@
 from typing import Optional
-from morpheus_api.dataclasses.base_object import BaseObject
+from morpheus_api.dataclasses.base_object import BaseObject, projection
 from morpheus_api.dataclasses.common_objects import (
     IDName,
     ID,
+    Meta,
 )
 
 
@@ -55,6 +56,24 @@ class Server(BaseObject):
 
 class ServerList(BaseObject):
     servers: list[ServerDetails]
+    meta: Optional[Meta] = None
+
+
+@projection
+class ServerStatusView:
+    id: int
+    status: str
+    power_state: str
+
+
+@projection
+class ServerStatusResponse:
+    server: ServerStatusView
+
+
+@projection
+class ServerStatusList:
+    servers: list[ServerStatusView]
 
 
 class ServerPlacementServerData(BaseObject):
@@ -0,0 +1,237 @@
+import copy
+import json
+import logging
+import queue
+import threading
+import time
+
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+logger = logging.getLogger()
+
+# Characters of a request or response body kept in a log line, the rest is replaced by a "(+N chars)" marker
+DEFAULT_MAX_BODY_LENGTH = 2000
+
+# Seconds during which repeated poll logs with the same key are suppressed after one is emitted
+DEFAULT_SAMPLE_INTERVAL = 60.0
+
+
+def truncate(text: str, max_length: int) -> str:
+    """Cuts a text to a maximum length, telling how much was dropped.
+
+    Args:
+        text (str): The text.
+        max_length (int): The number of characters kept; 0 or less keeps everything.
+
+    Returns:
+        str: The text, or its first max_length characters followed by "...(+N chars)".
+    """
+    if max_length <= 0 or len(text) <= max_length:
+        return text
+    return f"{text[:max_length]}...(+{len(text) - max_length} chars)"
+
+
+class LazyBody:
+    """A request or response body that is only serialized and truncated when the log record is formatted.
+
+    Responses are decoded from their raw bytes without parsing the JSON, and only the bytes that can end up in the
+    log line are decoded. Pydantic models are serialized with their aliases, like the payloads sent to the API.
+    """
+
+    def __init__(self, body: Any, max_length: int = DEFAULT_MAX_BODY_LENGTH):
+        self.body = body
+        self.max_length = max_length
+
+    def __str__(self) -> str:
+        body = self.body
+        if hasattr(body, "content") and hasattr(body, "status_code"):  # requests.Response or AsyncResponse
+            body = body.content
+        if isinstance(body, bytes):
+            if self.max_length <= 0:
+                return body.decode("utf-8", errors="replace")
+            # UTF-8 uses at most 4 bytes per character, decode no more than can be shown
+            head = body[: self.max_length * 4].decode("utf-8", errors="ignore")
+            if len(body) <= self.max_length * 4:
+                return truncate(head, self.max_length)
+            head = head[: self.max_length]
+            return f"{head}...(+{len(body) - len(head.encode())} bytes)"
+        if isinstance(body, BaseModel):
+            return truncate(body.model_dump_json(by_alias=True, exclude_none=True), self.max_length)
+        if isinstance(body, (dict, list)):
+            return truncate(json.dumps(body, default=str), self.max_length)
+        return truncate(str(body), self.max_length)
+
+
+class LazyMessage:
+    """A structured log message, rendered as "<message> key=value ..." when the record is formatted."""
+
+    def __init__(self, message: str, fields: dict[str, Any]):
+        self.message = message
+        self.fields = fields
+
+    def __str__(self) -> str:
+        if not self.fields:
+            return self.message
+        return " ".join([self.message, *(f"{key}={value}" for key, value in self.fields.items())])
+
+
+class ApiLogger:
+    """Structured logging of the API layer: lazily formatted, size-capped and sampled.
+
+    Nothing is serialized unless the level is enabled, and then only when a handler formats the record (in the
+    listener thread once start_queue_logging() is active). Bodies are truncated to max_body_length characters.
+    Logs passed a `sample_key` (e.g. the ones of a polled endpoint) are emitted at most once per sample_interval
+    per key, the next one telling how many were suppressed. The fields are also attached to the record as
+    `record.api_fields` for structured handlers.
+
+    Usage:
+        api_logger = ApiLogger(logger)
+        api_logger.body(logging.INFO, "Creating instance", instance_create_data, endpoint=INSTANCE_ENDPOINT)
+        api_logger.body(logging.DEBUG, "Server", response, sample_key=f"server:{server_id}")
+    """
+
+    # Defaults shared by every ApiLogger, set from APISettings by configure_api_logging()
+    max_body_length: int = DEFAULT_MAX_BODY_LENGTH
+    sample_interval: float = DEFAULT_SAMPLE_INTERVAL
+
+    def __init__(self, logger: logging.Logger = logger):
+        """Initializes the ApiLogger class.
+
+        Args:
+            logger (logging.Logger, optional): The logger to emit to. Defaults to the root logger.
+        """
+        self.logger = logger
+        self._lock = threading.Lock()
+        self._last_emitted: dict[str, float] = {}
+        self._suppressed: dict[str, int] = {}
+
+    def log(self, level: int, message: str, sample_key: Optional[str] = None, **fields: Any):
+        """Logs a structured message.
+
+        Args:
+            level (int): The logging level.
+            message (str): The message.
+            sample_key (Optional[str], optional): The key of a repeated log to sample. Defaults to None, which \
+                emits every log.
+            **fields (Any): The fields appended to the message as key=value.
+        """
+        if self.logger.isEnabledFor(level):
+            self._emit(level, message, sample_key, fields)
+
+    def body(self, level: int, message: str, body: Any, sample_key: Optional[str] = None, **fields: Any):
+        """Logs a message with a request or response body, serialized and truncated lazily.
+
+        Args:
+            level (int): The logging level.
+            message (str): The message.
+            body (Any): A pydantic model, dict, list, bytes or response.
+            sample_key (Optional[str], optional): The key of a repeated log to sample. Defaults to None, which \
+                emits every log.
+            **fields (Any): The fields appended to the message as key=value, before the body.
+        """
+        if self.logger.isEnabledFor(level):
+            self._emit(level, message, sample_key, {**fields, "body": LazyBody(body, self.max_body_length)})
+
+    def _emit(self, level: int, message: str, sample_key: Optional[str], fields: dict[str, Any]):
+        if sample_key is not None:
+            suppressed = self._sample(sample_key)
+            if suppressed is None:
+                return
+            if suppressed:
+                fields = {"suppressed": suppressed, **fields}
+        # stacklevel 3 reports the line of the service calling log() or body()
+        self.logger.log(level, LazyMessage(message, fields), extra={"api_fields": fields}, stacklevel=3)
+
+    def _sample(self, sample_key: str) -> Optional[int]:
+        # Returns None to suppress the log, or the number of logs suppressed since the last emitted one
+        now = time.monotonic()
+        with self._lock:
+            last = self._last_emitted.get(sample_key)
+            if last is not None and now - last < self.sample_interval:
+                self._suppressed[sample_key] = self._suppressed.get(sample_key, 0) + 1
+                return None
+            self._last_emitted[sample_key] = now
+            return self._suppressed.pop(sample_key, 0)
+
+
+def configure_api_logging(max_body_length: int = None, sample_interval: float = None):
+    """Sets the body size cap and the sampling interval of every ApiLogger.
+
+    Args:
+        max_body_length (int, optional): The characters of a body kept in a log line, 0 keeps everything. \
+            Defaults to None, which keeps the current value.
+        sample_interval (float, optional): The seconds between two emitted logs of the same sample key. \
+            Defaults to None, which keeps the current value.
+    """
+    if max_body_length is not None:
+        ApiLogger.max_body_length = max_body_length
+    if sample_interval is not None:
+        ApiLogger.sample_interval = sample_interval
+
+
+class DeferredQueueHandler(QueueHandler):
+    """A QueueHandler that leaves the formatting of the records to the listener thread.
+
+    The stock QueueHandler formats the message before enqueueing it, which would serialize the lazy bodies on the
+    thread that logged them. Only exception tracebacks are rendered right away, while the frames still exist.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+
+_queue_listener: Optional[QueueListener] = None
+_queued_handlers: list[logging.Handler] = []
+
+
+def start_queue_logging(target: logging.Logger = None) -> QueueListener:
+    """Moves the handlers of a logger behind a queue served by a background thread.
+
+    The logging threads only enqueue the records, so hot polling loops never block on disk or console I/O. The
+    handlers attached afterwards (e.g. pytest's capture handlers) keep running in the logging threads.
+
+    Args:
+        target (logging.Logger, optional): The logger whose handlers are moved. Defaults to the root logger.
+
+    Returns:
+        QueueListener: The started listener.
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        return _queue_listener
+    target = target if target is not None else logging.getLogger()
+    _queued_handlers[:] = list(target.handlers)
+    records = queue.SimpleQueue()
+    _queue_listener = QueueListener(records, *_queued_handlers, respect_handler_level=True)
+    for handler in _queued_handlers:
+        target.removeHandler(handler)
+    target.addHandler(DeferredQueueHandler(records))
+    _queue_listener.start()
+    return _queue_listener
+
+
+def stop_queue_logging(target: logging.Logger = None):
+    """Flushes the queued records and gives the handlers back to the logger.
+
+    Args:
+        target (logging.Logger, optional): The logger passed to start_queue_logging(). Defaults to the root logger.
+    """
+    global _queue_listener
+    if _queue_listener is None:
+        return
+    target = target if target is not None else logging.getLogger()
+    _queue_listener.stop()
+    for handler in list(target.handlers):
+        if isinstance(handler, DeferredQueueHandler):
+            target.removeHandler(handler)
+    for handler in _queued_handlers:
+        target.addHandler(handler)
+    _queued_handlers.clear()
+    _queue_listener = None
@@ -0,0 +1,183 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger()
+
+# Default location of the on-disk cache, relative to the working directory the tests are started from
+DEFAULT_DISCOVERY_CACHE_PATH = ".cache/morpheus_discovery_cache.json"
+
+# Appliance lookups (clusters, zones, plans, ...) rarely change within a working day
+DEFAULT_DISCOVERY_CACHE_TTL = 3600
+
+# Bumped whenever the layout of the cached values changes, so stale files are ignored instead of misread
+CACHE_FORMAT_VERSION = 2
+
+
+def discovery_cache_scope(base_url: str, api_token: str) -> str:
+    """Returns the cache scope of an appliance as seen with one API token.
+
+    Lookups depend on the tenant and permissions of the token, so two tokens never share cached IDs. Only a hash of
+    the token is used, the cache file holds no credentials.
+
+    Args:
+        base_url (str): The base URL of the appliance.
+        api_token (str): The API token the lookups are made with.
+
+    Returns:
+        str: The base URL followed by a short hash of the token.
+    """
+    token_hash = hashlib.sha256((api_token or "").encode()).hexdigest()[:16]
+    return f"{base_url}#{token_hash}"
+
+
+class DiscoveryCache:
+    """
+    A TTL cache of appliance discovery lookups, keyed by scope (appliance and API token) and query, backed by a JSON
+    file.
+
+    Lookups such as "the first cluster" or "the KVM service plan" are resolved once and shared by every test module
+    of a session and by the following sessions until their TTL expires. Entries are JSON values (usually IDs and
+    codes); lookups that found nothing (None) are never cached. The cache is thread-safe and the file is replaced
+    atomically, so parallel sessions never read a partial file.
+
+    Usage:
+        scope = discovery_cache_scope(base_url, api_token)
+        cluster = cache.get_or_fetch(scope, "clusters?first", lambda: {"id": ..., "name": ...})
+        cache.invalidate(scope)  # forget everything known about one appliance and token
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_DISCOVERY_CACHE_PATH, ttl: float = DEFAULT_DISCOVERY_CACHE_TTL):
+        """Initializes the DiscoveryCache class.
+
+        Args:
+            path (Optional[str], optional): The JSON file backing the cache, or None to keep it in memory only. \
+                Defaults to DEFAULT_DISCOVERY_CACHE_PATH.
+            ttl (float, optional): The time an entry stays valid, in seconds. 0 disables the cache. \
+                Defaults to DEFAULT_DISCOVERY_CACHE_TTL.
+        """
+        self.path = path
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock()
+        self._entries: dict[str, dict[str, dict[str, Any]]] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def get(self, scope: str, query: str) -> Optional[Any]:
+        """Returns the cached value of a lookup.
+
+        Args:
+            scope (str): The appliance and token the lookup belongs to, see discovery_cache_scope.
+            query (str): The lookup key, e.g. "storage_buckets?name=bucket-1".
+
+        Returns:
+            Optional[Any]: The cached value, or None if it is missing or expired.
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._load().get(scope, {}).get(query)
+            if entry is None or time.time() - entry["cached_at"] > self.ttl:
+                return None
+            return entry["value"]
+
+    def set(self, scope: str, query: str, value: Any):
+        """Caches the value of a lookup and writes the cache file.
+
+        Args:
+            scope (str): The appliance and token the lookup belongs to, see discovery_cache_scope.
+            query (str): The lookup key.
+            value (Any): The JSON serializable value. None is not cached.
+        """
+        if not self.enabled or value is None:
+            return
+        with self._lock:
+            self._load().setdefault(scope, {})[query] = {"value": value, "cached_at": time.time()}
+            self._save()
+
+    def get_or_fetch(self, scope: str, query: str, fetch: Callable[[], Any]) -> Any:
+        """Returns the cached value of a lookup, fetching and caching it on a miss.
+
+        Args:
+            scope (str): The appliance and token the lookup belongs to, see discovery_cache_scope.
+            query (str): The lookup key.
+            fetch (Callable[[], Any]): Resolves the lookup against the appliance.
+
+        Returns:
+            Any: The cached or freshly fetched value.
+        """
+        value = self.get(scope, query)
+        if value is not None:
+            with self._lock:
+                self.hits += 1
+            logger.debug(f"Discovery cache hit: {query}")
+            return value
+
+        with self._lock:
+            self.misses += 1
+        value = fetch()
+        self.set(scope, query, value)
+        return value
+
+    def invalidate(self, scope: str = None, query: str = None) -> int:
+        """Removes cached lookups.
+
+        Args:
+            scope (str, optional): Only remove the lookups of this scope. Defaults to None (every scope).
+            query (str, optional): Only remove this lookup, or every lookup starting with it when it ends with "*". \
+                Defaults to None (every lookup).
+
+        Returns:
+            int: The number of removed entries.
+        """
+        with self._lock:
+            entries = self._load()
+            removed = 0
+            for cached_scope in [scope] if scope is not None else list(entries):
+                queries = entries.get(cached_scope, {})
+                for key in list(queries):
+                    if query is None or key == query or (query.endswith("*") and key.startswith(query[:-1])):
+                        del queries[key]
+                        removed += 1
+                if cached_scope in entries and not queries:
+                    del entries[cached_scope]
+            if removed:
+                self._save()
+            logger.info(f"Invalidated {removed} discovery cache entries")
+            return removed
+
+    def _load(self) -> dict[str, dict[str, dict[str, Any]]]:
+        if self._entries is not None:
+            return self._entries
+        self._entries = {}
+        if self.path and os.path.exists(self.path):
+            try:
+                with open(self.path) as cache_file:
+                    content = json.load(cache_file)
+                if content.get("version") == CACHE_FORMAT_VERSION:
+                    self._entries = content.get("entries", {})
+            except (OSError, ValueError) as error:
+                logger.warning(f"Ignoring unreadable discovery cache {self.path}: {error}")
+        return self._entries
+
+    def _save(self):
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, "w") as cache_file:
+                json.dump({"version": CACHE_FORMAT_VERSION, "entries": self._entries}, cache_file, indent=2)
+            os.replace(temp_path, self.path)
+        except OSError as error:
+            logger.warning(f"Unable to write the discovery cache {self.path}: {error}")
@@ -0,0 +1,193 @@
+import hashlib
+import logging
+import mmap
+import os
+import time
+
+from typing import Callable, Iterator, Optional
+
+from morpheus_api.dataclasses.common_objects import APIResponse
+
+logger = logging.getLogger()
+
+# Bytes read from the memory map, hashed and sent at a time
+DEFAULT_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Files uploaded at once by the concurrent uploads
+DEFAULT_UPLOAD_WORKERS = 4
+
+# Seconds between two progress reports of an upload
+DEFAULT_PROGRESS_INTERVAL = 5.0
+
+DEFAULT_HASH_ALGORITHM = "sha256"
+
+
+class UploadProgress:
+    """The progress of one file upload, reported to a callback every `interval` seconds and once at the end.
+
+    Attributes:
+        file_name (str): The name of the uploaded file.
+        total (int): The size of the file in bytes.
+        bytes_sent (int): The bytes handed to the connection in the current attempt.
+        attempts (int): The number of times the upload started from the first byte.
+        started (float): The time.monotonic() of the first attempt.
+    """
+
+    def __init__(
+        self,
+        file_name: str,
+        total: int,
+        callback: Optional[Callable[["UploadProgress"], None]] = None,
+        interval: float = DEFAULT_PROGRESS_INTERVAL,
+    ):
+        """Initializes the UploadProgress class.
+
+        Args:
+            file_name (str): The name of the uploaded file.
+            total (int): The size of the file in bytes.
+            callback (Optional[Callable[[UploadProgress], None]], optional): Called with the progress on every \
+                report. Defaults to None, which logs the reports at DEBUG level only.
+            interval (float, optional): The seconds between two reports. Defaults to DEFAULT_PROGRESS_INTERVAL.
+        """
+        self.file_name = file_name
+        self.total = total
+        self.callback = callback
+        self.interval = interval
+        self.bytes_sent = 0
+        self.attempts = 0
+        self.started: Optional[float] = None
+        self._attempt_started = 0.0
+        self._last_report = 0.0
+
+    @property
+    def fraction(self) -> float:
+        """The fraction of the file sent in the current attempt, between 0 and 1."""
+        return self.bytes_sent / self.total if self.total else 1.0
+
+    @property
+    def throughput(self) -> float:
+        """The bytes sent per second in the current attempt."""
+        elapsed = time.monotonic() - self._attempt_started
+        return self.bytes_sent / elapsed if elapsed > 0 else 0.0
+
+    def restart(self):
+        """Starts a new attempt from the first byte."""
+        now = time.monotonic()
+        if self.started is None:
+            self.started = now
+        self.attempts += 1
+        self.bytes_sent = 0
+        self._attempt_started = self._last_report = now
+
+    def advance(self, count: int):
+        """Counts bytes handed to the connection, reporting the progress when the interval has elapsed.
+
+        Args:
+            count (int): The number of bytes.
+        """
+        self.bytes_sent += count
+        now = time.monotonic()
+        if self.bytes_sent >= self.total or now - self._last_report >= self.interval:
+            self._last_report = now
+            self.report()
+
+    def report(self):
+        logger.debug(
+            f"Upload of '{self.file_name}': {self.fraction:.0%} of {self.total} bytes, "
+            f"{self.throughput / 1024 / 1024:.1f} MiB/s, attempt {self.attempts}"
+        )
+        if self.callback is not None:
+            self.callback(self)
+
+
+class MappedFileBody:
+    """A file sent as a request body in fixed-size chunks read from a read-only memory map.
+
+    The chunks are hashed in the same pass that sends them, so the file is read once per attempt. Every iteration
+    starts a new pass from the first byte, which lets the retry loop of MorpheusAPI._request send the body again
+    after a dropped connection. The body has a length, so requests announces it with a Content-Length header
+    instead of a chunked transfer encoding.
+
+    Usage:
+        body = MappedFileBody("/images/ubuntu.qcow2")
+        session.post(url, data=body)
+        body.hexdigest  # sha256 of the bytes sent by the last complete pass
+    """
+
+    def __init__(
+        self,
+        path: str,
+        chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+        progress: Optional[UploadProgress] = None,
+        hash_algorithm: str = DEFAULT_HASH_ALGORITHM,
+    ):
+        """Initializes the MappedFileBody class.
+
+        Args:
+            path (str): The path of the file.
+            chunk_size (int, optional): The bytes sent at a time. Defaults to DEFAULT_UPLOAD_CHUNK_SIZE.
+            progress (Optional[UploadProgress], optional): The progress to advance. Defaults to a new one \
+                without callback.
+            hash_algorithm (str, optional): A hashlib algorithm name. Defaults to DEFAULT_HASH_ALGORITHM.
+        """
+        self.path = path
+        self.size = os.path.getsize(path)
+        self.chunk_size = chunk_size
+        self.progress = progress if progress is not None else UploadProgress(os.path.basename(path), self.size)
+        self.hash_algorithm = hash_algorithm
+        self.hexdigest: Optional[str] = None
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[bytes]:
+        self.hexdigest = None
+        digest = hashlib.new(self.hash_algorithm)
+        self.progress.restart()
+        with open(self.path, "rb") as file:
+            if self.size:
+                with mmap.mmap(file.fileno(), self.size, access=mmap.ACCESS_READ) as mapped:
+                    for start in range(0, self.size, self.chunk_size):
+                        end = start + self.chunk_size
+                        chunk = mapped[start:end]
+                        digest.update(chunk)
+                        self.progress.advance(len(chunk))
+                        yield chunk
+        self.hexdigest = digest.hexdigest()
+
+
+class UploadResult:
+    """The outcome of one file upload.
+
+    Attributes:
+        file_name (str): The name of the uploaded file.
+        size (int): The size of the file in bytes.
+        checksum (str): The hex digest of the bytes sent.
+        hash_algorithm (str): The algorithm of the checksum.
+        elapsed (float): The seconds spent uploading, retries included.
+        attempts (int): The number of times the file was sent.
+        response (APIResponse): The response of the appliance.
+    """
+
+    def __init__(
+        self,
+        file_name: str,
+        size: int,
+        checksum: str,
+        hash_algorithm: str,
+        elapsed: float,
+        attempts: int,
+        response: APIResponse,
+    ):
+        self.file_name = file_name
+        self.size = size
+        self.checksum = checksum
+        self.hash_algorithm = hash_algorithm
+        self.elapsed = elapsed
+        self.attempts = attempts
+        self.response = response
+
+    @property
+    def throughput(self) -> float:
+        """The bytes per second of the whole upload, retries included."""
+        return self.size / self.elapsed if self.elapsed > 0 else 0.0
@@ -0,0 +1,84 @@
+from typing import Any, Optional, Union
+
+from morpheus_api.dataclasses.processes import Event, Process
+
+HistoryRecord = Union[Process, Event]
+
+
+class InstanceHistoryCursor:
+    """The last seen state of the history of one instance.
+
+    The cursor remembers the `lastUpdated` of every process and event already returned. Each page of history is
+    decoded to plain dicts and compared to the cursor, and only the new or changed records are validated into
+    Process and Event models, so polling a long, mostly unchanged history costs little more than reading it.
+
+    Usage:
+        cursor = InstanceHistoryCursor(instance_id)
+        for record in cursor.advance(response.json()["processes"]):
+            ...
+
+    Attributes:
+        instance_id (int): The ID of the instance.
+        processes (dict[int, str]): The `lastUpdated` of every process seen, by process ID.
+        events (dict[int, str]): The `lastUpdated` of every event seen, by event ID.
+        last_updated (Optional[str]): The newest `lastUpdated` seen, None before the first record.
+    """
+
+    def __init__(self, instance_id: int):
+        self.instance_id = instance_id
+        self.processes: dict[int, str] = {}
+        self.events: dict[int, str] = {}
+        self.last_updated: Optional[str] = None
+
+    def advance(self, processes: list[dict[str, Any]]) -> list[HistoryRecord]:
+        """Moves the cursor past a page of history.
+
+        Args:
+            processes (list[dict[str, Any]]): The raw processes of the page, newest first as the API returns them.
+
+        Returns:
+            list[HistoryRecord]: The new or changed processes and events, oldest process first, each changed \
+                process followed by its new or changed events.
+        """
+        records: list[HistoryRecord] = []
+        for raw_process in reversed(processes):
+            if self._changed(self.processes, raw_process):
+                process = Process.model_validate(raw_process)
+                self._seen(self.processes, process.id, process.last_updated)
+                records.append(process)
+            for raw_event in raw_process.get("events") or []:
+                if self._changed(self.events, raw_event):
+                    event = Event.model_validate(raw_event)
+                    self._seen(self.events, event.id, event.last_updated)
+                    records.append(event)
+        return records
+
+    def reset(self):
+        """Forgets the history seen, the next poll returns the whole history again."""
+        self.processes.clear()
+        self.events.clear()
+        self.last_updated = None
+
+    @staticmethod
+    def _changed(seen: dict[int, str], raw_record: dict[str, Any]) -> bool:
+        return seen.get(raw_record.get("id")) != raw_record.get("lastUpdated")
+
+    def _seen(self, seen: dict[int, str], record_id: int, last_updated: str):
+        seen[record_id] = last_updated
+        # ISO 8601 timestamps of one appliance share a format, so they order as strings
+        if self.last_updated is None or last_updated > self.last_updated:
+            self.last_updated = last_updated
+
+
+def history_record_matches(record: HistoryRecord, process_type: str, status: str) -> bool:
+    """Returns whether a process or event has the given type and status.
+
+    Args:
+        record (HistoryRecord): The process or event.
+        process_type (str): The process type name, e.g. "startup".
+        status (str): The status, e.g. "complete".
+
+    Returns:
+        bool: True if both match.
+    """
+    return record.process_type.name == process_type and record.status == status
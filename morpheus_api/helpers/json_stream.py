@@ -0,0 +1,157 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+# Characters JSON allows between tokens
+JSON_WHITESPACE = " \t\n\r"
+
+
+class JSONStreamReader:
+    """
+    Reads JSON values one at a time from a stream of byte chunks.
+
+    Consumed values are dropped from the buffer whenever more input is read, so memory stays proportional to the
+    chunk size and the largest single value instead of the whole document. Values are decoded with
+    json.JSONDecoder.raw_decode, retrying with more input when a value is cut at the end of the buffer.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        """Initializes the JSONStreamReader class.
+
+        Args:
+            chunks (Iterable[bytes]): The raw UTF-8 chunks of the document, e.g. Response.iter_content().
+        """
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._exhausted = False
+
+    def peek(self) -> str:
+        """Returns the next non-whitespace character without consuming it.
+
+        Raises:
+            ValueError: If the document ends.
+
+        Returns:
+            str: The next character.
+        """
+        while True:
+            while self._position < len(self._buffer) and self._buffer[self._position] in JSON_WHITESPACE:
+                self._position += 1
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read_more():
+                raise ValueError("Unexpected end of the JSON document")
+
+    def next_char(self) -> str:
+        """Consumes and returns the next non-whitespace character.
+
+        Returns:
+            str: The consumed character.
+        """
+        char = self.peek()
+        self._position += 1
+        return char
+
+    def expect(self, expected: str):
+        """Consumes the next non-whitespace character, which must be the expected one.
+
+        Args:
+            expected (str): The expected character, e.g. "{" or ":".
+
+        Raises:
+            ValueError: If another character is found.
+        """
+        char = self.next_char()
+        if char != expected:
+            raise ValueError(f"Expected '{expected}' in the JSON document, found '{char}'")
+
+    def decode_value(self) -> Any:
+        """Consumes and decodes the next JSON value.
+
+        Raises:
+            ValueError: If the value is invalid or the document ends in the middle of it.
+
+        Returns:
+            Any: The decoded value.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if not self._read_more():
+                    raise
+                continue
+            # A number at the very end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and self._read_more():
+                continue
+            self._position = end
+            return value
+
+    def _read_more(self) -> bool:
+        if self._exhausted:
+            return False
+        for chunk in self._chunks:
+            text = self._utf8.decode(chunk)
+            if text:
+                self._append(text)
+                return True
+        self._exhausted = True
+        text = self._utf8.decode(b"", final=True)
+        self._append(text)
+        return bool(text)
+
+    def _append(self, text: str):
+        # Drop the consumed values while appending, so the buffer only holds the value being decoded
+        position = self._position
+        self._buffer = self._buffer[position:] + text
+        self._position = 0
+
+
+def iter_json_array(chunks: Iterable[bytes], field: str) -> Iterator[Any]:
+    """
+    Yields the items of an array member of a JSON object while the document is still being received.
+
+    The other members of the object (e.g. `meta`) are skipped, and reading stops at the end of the array. Each item
+    is yielded as soon as it is complete, so a list of thousands of objects is never held in memory at once.
+
+    Usage:
+        for instance in iter_json_array(response.iter_content(chunk_size=65536), "instances"):
+            ...
+
+    Args:
+        chunks (Iterable[bytes]): The raw UTF-8 chunks of the document.
+        field (str): The name of the array member, e.g. "instances".
+
+    Raises:
+        ValueError: If the document is not an object containing the array.
+
+    Yields:
+        Any: The decoded items of the array, in order.
+    """
+    reader = JSONStreamReader(chunks)
+    reader.expect("{")
+    while reader.peek() != "}":
+        key = reader.decode_value()
+        reader.expect(":")
+        if key == field:
+            break
+        reader.decode_value()
+        if reader.peek() == ",":
+            reader.next_char()
+    else:
+        raise ValueError(f"The JSON document has no '{field}' array")
+
+    reader.expect("[")
+    if reader.peek() == "]":
+        return
+    while True:
+        yield reader.decode_value()
+        separator = reader.next_char()
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError(f"Expected ',' or ']' in the '{field}' array, found '{separator}'")
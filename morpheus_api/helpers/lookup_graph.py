@@ -0,0 +1,132 @@
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable
+
+logger = logging.getLogger()
+
+DEFAULT_MAX_WORKERS = 8
+
+
+class LookupGraph:
+    """
+    Runs a small dependency graph of API lookups on a thread pool.
+
+    Every lookup starts as soon as the lookups it depends on have finished, so the total latency is the critical
+    path of the graph instead of the sum of all lookups. A lookup receives the results of its dependencies as
+    keyword arguments named after them. After run(), `timings` holds the start/end of every lookup relative to the
+    start of the run and `critical_path` the chain of lookups that determined the total latency.
+
+    Usage:
+        graph = LookupGraph()
+        graph.add("zone", lambda: lookup_zone())
+        graph.add("provision_type", lambda: lookup_provision_type())
+        graph.add("network", lambda zone, provision_type: lookup_network(zone, provision_type),
+                  depends_on=["zone", "provision_type"])
+        results = graph.run()
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        """Initializes the LookupGraph class.
+
+        Args:
+            max_workers (int, optional): The number of lookups run at the same time. Defaults to DEFAULT_MAX_WORKERS.
+        """
+        self.max_workers = max_workers
+        self.timings: dict[str, tuple[float, float]] = {}
+        self.critical_path: list[str] = []
+        self._lookups: dict[str, tuple[Callable[..., Any], list[str]]] = {}
+
+    def add(self, name: str, lookup: Callable[..., Any], depends_on: list[str] = None):
+        """Adds a lookup to the graph.
+
+        Args:
+            name (str): The unique name of the lookup; its result is passed to dependents under this name.
+            lookup (Callable[..., Any]): The lookup, called with the results of its dependencies as keyword arguments.
+            depends_on (list[str], optional): The names of the lookups that must finish first. Defaults to None.
+        """
+        depends_on = depends_on or []
+        missing = [dependency for dependency in depends_on if dependency not in self._lookups]
+        if missing:
+            # Dependencies must be added first, which also rules out cycles
+            raise ValueError(f"Lookup '{name}' depends on unknown lookups: {missing}")
+        self._lookups[name] = (lookup, depends_on)
+
+    def run(self) -> dict[str, Any]:
+        """Runs every lookup, each as soon as its dependencies are resolved.
+
+        Raises:
+            Exception: The first exception raised by a lookup, after the running lookups have finished.
+
+        Returns:
+            dict[str, Any]: The result of every lookup by name.
+        """
+        results: dict[str, Any] = {}
+        self.timings = {}
+        start = time.perf_counter()
+        pending = dict(self._lookups)
+        running: dict[Future, str] = {}
+        error: Exception = None
+
+        def timed(name: str, lookup: Callable[..., Any], kwargs: dict[str, Any]) -> Any:
+            lookup_start = time.perf_counter() - start
+            try:
+                return lookup(**kwargs)
+            finally:
+                self.timings[name] = (lookup_start, time.perf_counter() - start)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="morpheus-lookup") as executor:
+            while pending or running:
+                if error is None:
+                    for name, (lookup, depends_on) in list(pending.items()):
+                        if all(dependency in results for dependency in depends_on):
+                            kwargs = {dependency: results[dependency] for dependency in depends_on}
+                            running[executor.submit(timed, name, lookup, kwargs)] = name
+                            del pending[name]
+                elif not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception as lookup_error:
+                        logger.error(f"Lookup '{name}' failed: {lookup_error}")
+                        error = error or lookup_error
+
+        self.critical_path = self._find_critical_path()
+        self.log_timings(time.perf_counter() - start)
+        if error is not None:
+            raise error
+        return results
+
+    def log_timings(self, total: float):
+        """Logs the duration of every lookup and the critical path.
+
+        Args:
+            total (float): The wall-clock duration of the run, in seconds.
+        """
+        for name, (lookup_start, lookup_end) in sorted(self.timings.items(), key=lambda item: item[1][0]):
+            logger.info(
+                f"Lookup '{name}': {(lookup_end - lookup_start) * 1000:.1f} ms "
+                f"(started at +{lookup_start * 1000:.1f} ms)"
+            )
+        sequential = sum(lookup_end - lookup_start for lookup_start, lookup_end in self.timings.values())
+        logger.info(
+            f"{len(self.timings)} lookups took {total * 1000:.1f} ms (sequential: {sequential * 1000:.1f} ms), "
+            f"critical path: {' -> '.join(self.critical_path)}"
+        )
+
+    def _find_critical_path(self) -> list[str]:
+        # Walk back from the last lookup to finish, always through the dependency that finished last
+        if not self.timings:
+            return []
+        name = max(self.timings, key=lambda lookup_name: self.timings[lookup_name][1])
+        path = [name]
+        while True:
+            dependencies = [dependency for dependency in self._lookups[name][1] if dependency in self.timings]
+            if not dependencies:
+                return list(reversed(path))
+            name = max(dependencies, key=lambda dependency: self.timings[dependency][1])
+            path.append(name)
@@ -4,6 +4,11 @@ from dotenv import dotenv_values
 from pydantic_settings import BaseSettings
 from typing import Any, ClassVar
 from morpheus_api.api_endpoints.backup_service import BackupService
+from morpheus_api.async_api_endpoints.backup_service import AsyncBackupService
+from morpheus_api.async_api_endpoints.container_service import AsyncContainerService
+from morpheus_api.async_api_endpoints.instance_service import AsyncInstanceService
+from morpheus_api.async_api_endpoints.server_service import AsyncServerService
+from morpheus_api.async_api_endpoints.snapshot_service import AsyncSnapshotService
 from morpheus_api.api_endpoints.container_service import ContainerService
 from morpheus_api.api_endpoints.library_service import LibraryService
 from morpheus_api.api_endpoints.cluster_service import ClusterService
@@ -23,6 +28,29 @@ from morpheus_api.api_endpoints.storage_volume_type_service import StorageVolume
 from morpheus_api.api_endpoints.virtual_image_service import VirtualImageService
 from morpheus_api.api_endpoints.storage_volume_service import StorageVolumeService
 from morpheus_api.api_endpoints.zone_service import ZoneService
+from morpheus_api.configuration.async_utils import create_async_session
+from morpheus_api.configuration.http2_transport import create_http2_session
+from morpheus_api.configuration.rate_limiter import (
+    DEFAULT_BURST,
+    DEFAULT_MUTATION_RATE,
+    DEFAULT_READ_RATE,
+    RateLimiter,
+)
+from morpheus_api.configuration.response_cache import DEFAULT_CACHE_MAX_ENTRIES, ResponseCache
+from morpheus_api.configuration.retry_policy import (
+    DEFAULT_BACKOFF_FACTOR,
+    DEFAULT_MAX_BACKOFF,
+    DEFAULT_MAX_RETRIES,
+    RetryPolicy,
+)
+from morpheus_api.configuration.utils import DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE, create_session
+from morpheus_api.helpers.api_logging import DEFAULT_MAX_BODY_LENGTH, DEFAULT_SAMPLE_INTERVAL, configure_api_logging
+from morpheus_api.helpers.discovery_cache import (
+    DEFAULT_DISCOVERY_CACHE_PATH,
+    DEFAULT_DISCOVERY_CACHE_TTL,
+    DiscoveryCache,
+    discovery_cache_scope,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -118,6 +146,28 @@ class APISettings(ConfigSettings):
 
     base_url: str = "https://morpheus8"  # Default base URL
     api_token: str = "YOUR-API-TOKEN"  # Default API token
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS  # Number of host pools cached by the shared session
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE  # Max connections kept open per host
+    keep_alive: bool = True  # Reuse connections between API calls
+    http2: bool = False  # Multiplex concurrent calls over one HTTP/2 connection (needs httpx[http2])
+    max_retries: int = DEFAULT_MAX_RETRIES  # Retries of a transient failure, 0 disables retrying
+    retry_backoff_factor: float = DEFAULT_BACKOFF_FACTOR  # Base delay in seconds of the exponential backoff
+    retry_max_backoff: float = DEFAULT_MAX_BACKOFF  # Upper bound in seconds of a single retry wait
+    retry_post: bool = False  # Also retry POST requests, which are not idempotent
+    discovery_cache_path: str = DEFAULT_DISCOVERY_CACHE_PATH  # JSON file caching get_required_data lookups
+    discovery_cache_ttl: int = DEFAULT_DISCOVERY_CACHE_TTL  # Seconds a cached lookup stays valid, 0 disables it
+    response_cache: bool = False  # Cache the GET responses of near-static read endpoints (plans, zones, clusters...)
+    response_cache_max_entries: int = DEFAULT_CACHE_MAX_ENTRIES  # LRU bound of the response cache
+    rate_limit: bool = False  # Throttle the requests sent to the appliance with token buckets
+    rate_limit_reads: float = DEFAULT_READ_RATE  # Sustained GET requests per second
+    rate_limit_mutations: float = DEFAULT_MUTATION_RATE  # Sustained POST/PUT/DELETE requests per second
+    rate_limit_burst: int = DEFAULT_BURST  # Requests of each class sent at once after an idle period
+    rate_limit_state_dir: str = ""  # Directory sharing the budgets between processes (e.g. xdist workers)
+    metrics_dir: str = "logs/metrics"  # Directory the request metrics are dumped to at the end of a session
+    appliance_build: str = ""  # Label of the appliance build in the lifecycle timeline report
+    log_body_max_length: int = DEFAULT_MAX_BODY_LENGTH  # Characters of a payload or response kept in a log line
+    log_sample_interval: float = DEFAULT_SAMPLE_INTERVAL  # Seconds between two logs of the same polled resource
+    async_logging: bool = False  # Format and write the log records in a background thread
 
 
 # Instance Related Settings
@@ -217,65 +267,168 @@ class ProxySettings(ConfigSettings):
     https_proxy: str
 
 
+# Appliance Benchmark Settings
+class BenchmarkSettings(ConfigSettings):
+    """
+    Settings of the appliance operation benchmark suite (tests/benchmarks).
+    These values will be overridden from .env file.
+    """
+
+    benchmark_target: str = "simulated"  # "simulated" (local SimulatedAppliance) or "appliance" (APISettings.base_url)
+    benchmark_concurrency: list[int] = [1, 4, 16]  # Concurrency levels, one benchmark run each
+    benchmark_cycles: int = 1  # Lifecycles (create ... delete) run per worker at each level
+    benchmark_operations: list[str] = ["create", "stop", "start", "snapshot", "clone", "resize", "delete"]
+    benchmark_results_dir: str = "logs/benchmarks"  # Directory the JSON results are written to, ignored by git
+    benchmark_operation_time: float = 0.5  # Seconds a simulated operation takes once started
+    benchmark_capacity: int = 8  # Operations the simulated appliance runs at once
+    benchmark_failure_rate: float = 0.0  # Share of the simulated instance operations ending failed
+    load_rates_per_minute: list[float] = [30, 60]  # Offered arrival rates, one sustained load run each
+    load_arrival_process: str = "poisson"  # "poisson" (exponential gaps) or "constant" (even gaps)
+    load_duration: float = 10  # Seconds arrivals are offered for at each rate
+    load_operation_mix: dict[str, float] = {"create": 3.0, "snapshot": 3.0, "backup": 1.0, "delete": 3.0}
+    load_max_live_instances: int = 10  # Instances alive at once, the creates beyond are rejected
+    load_max_in_flight: int = 32  # Client slots, the arrivals beyond queue for one
+    load_window: float = 10  # Seconds per window of the load report
+    load_poll_interval: float = 1  # Seconds between two status polls of the pending operations
+
+
 class MorpheusAPIService:
     """
     A service class to interact with the Morpheus API.
 
     This class initializes and configures the necessary services to interact with the Morpheus API using the provided
-    API settings.
+    API settings. All services share one pooled keep-alive session, so connections to the appliance are reused
+    across every service. With APISettings.http2 the session multiplexes the concurrent calls over one HTTP/2
+    connection, falling back to pooled HTTP/1.1 where the appliance or the environment does not support it.
 
     Attributes:
+        session (requests.Session): The pooled session shared by all services, an HTTP2Session with
+            APISettings.http2.
+        retry_policy (RetryPolicy): The retry policy shared by all services; its stats hold the per-endpoint
+            retry counters.
+        discovery_cache (DiscoveryCache): The cache of appliance discovery lookups used by get_required_data.
+        discovery_cache_scope (str): The key of this appliance and API token in the discovery cache.
+        response_cache (Optional[ResponseCache]): The response cache shared by all services, None unless enabled
+            with APISettings.response_cache; its stats hold the per-endpoint hit and miss counters.
+        rate_limiter (Optional[RateLimiter]): The request budgets shared by all services, None unless enabled with
+            APISettings.rate_limit; its stats hold the queueing delays.
         instance_service (InstanceService): An instance of the InstanceService class configured with the provided
             API settings.
     Methods:
         __init__(api_settings: APISettings):
             api_settings (APISettings): The settings required to configure the API service, including base URL and
-
+        close():
+            Closes the shared session.
     """
 
     # Add other services as we make progress
     def __init__(self, api_settings: APISettings):
-        self.instance_service = InstanceService(base_url=api_settings.base_url, api_token=api_settings.api_token)
-        self.instance_type_service = InstanceTypeService(
-            base_url=api_settings.base_url,
-            api_token=api_settings.api_token,
-        )
-        self.backup_service = BackupService(base_url=api_settings.base_url, api_token=api_settings.api_token)
-        self.cluster_service = ClusterService(base_url=api_settings.base_url, api_token=api_settings.api_token)
-        self.library_service = LibraryService(
-            base_url=api_settings.base_url,
-            api_token=api_settings.api_token,
+        self.base_url = api_settings.base_url
+        self.discovery_cache = DiscoveryCache(
+            path=api_settings.discovery_cache_path, ttl=api_settings.discovery_cache_ttl
         )
-        self.group_service = GroupService(base_url=api_settings.base_url, api_token=api_settings.api_token)
-        self.server_service = ServerService(base_url=api_settings.base_url, api_token=api_settings.api_token)
-        self.image_build_service = ImageBuildService(base_url=api_settings.base_url, api_token=api_settings.api_token)
-        self.network_service = NetworkService(base_url=api_settings.base_url, api_token=api_settings.api_token)
-        self.network_type_service = NetworkTypeService(base_url=api_settings.base_url, api_token=api_settings.api_token)
-        self.option_service = OptionService(base_url=api_settings.base_url, api_token=api_settings.api_token)
-        self.provision_type_service = ProvisionTypeService(
-            base_url=api_settings.base_url,
-            api_token=api_settings.api_token,
+        self.discovery_cache_scope = discovery_cache_scope(api_settings.base_url, api_settings.api_token)
+        session_factory = create_http2_session if api_settings.http2 else create_session
+        self.session = session_factory(
+            pool_connections=api_settings.pool_connections,
+            pool_maxsize=api_settings.pool_maxsize,
+            keep_alive=api_settings.keep_alive,
         )
-        self.option_service = OptionService(base_url=api_settings.base_url, api_token=api_settings.api_token)
-        self.snapshot_service = SnapshotService(base_url=api_settings.base_url, api_token=api_settings.api_token)
-        self.storage_bucket_service = StorageBucketService(
-            base_url=api_settings.base_url,
-            api_token=api_settings.api_token,
+        self.retry_policy = RetryPolicy(
+            max_retries=api_settings.max_retries,
+            backoff_factor=api_settings.retry_backoff_factor,
+            max_backoff=api_settings.retry_max_backoff,
+            retry_post=api_settings.retry_post,
         )
-        self.service_plan_service = ServicePlanService(base_url=api_settings.base_url, api_token=api_settings.api_token)
-        self.storage_volume_type_service = StorageVolumeTypeService(
-            base_url=api_settings.base_url,
-            api_token=api_settings.api_token,
+        configure_api_logging(
+            max_body_length=api_settings.log_body_max_length, sample_interval=api_settings.log_sample_interval
         )
-        self.storage_volume_service = StorageVolumeService(
-            base_url=api_settings.base_url, api_token=api_settings.api_token
+        self.response_cache = (
+            ResponseCache(max_entries=api_settings.response_cache_max_entries) if api_settings.response_cache else None
         )
-        self.virtual_image_service = VirtualImageService(
-            base_url=api_settings.base_url,
-            api_token=api_settings.api_token,
+        self.rate_limiter = (
+            RateLimiter(
+                read_rate=api_settings.rate_limit_reads,
+                mutation_rate=api_settings.rate_limit_mutations,
+                burst=api_settings.rate_limit_burst,
+                state_dir=api_settings.rate_limit_state_dir or None,
+            )
+            if api_settings.rate_limit
+            else None
         )
-        self.zone_service = ZoneService(base_url=api_settings.base_url, api_token=api_settings.api_token)
-        self.container_service = ContainerService(base_url=api_settings.base_url, api_token=api_settings.api_token)
+        service_kwargs = {
+            "base_url": api_settings.base_url,
+            "api_token": api_settings.api_token,
+            "session": self.session,
+            "retry_policy": self.retry_policy,
+            "response_cache": self.response_cache,
+            "rate_limiter": self.rate_limiter,
+        }
+        self.instance_service = InstanceService(**service_kwargs)
+        self.instance_type_service = InstanceTypeService(**service_kwargs)
+        self.backup_service = BackupService(**service_kwargs)
+        self.cluster_service = ClusterService(**service_kwargs)
+        self.library_service = LibraryService(**service_kwargs)
+        self.group_service = GroupService(**service_kwargs)
+        self.server_service = ServerService(**service_kwargs)
+        self.image_build_service = ImageBuildService(**service_kwargs)
+        self.network_service = NetworkService(**service_kwargs)
+        self.network_type_service = NetworkTypeService(**service_kwargs)
+        self.option_service = OptionService(**service_kwargs)
+        self.provision_type_service = ProvisionTypeService(**service_kwargs)
+        self.snapshot_service = SnapshotService(**service_kwargs)
+        self.storage_bucket_service = StorageBucketService(**service_kwargs)
+        self.service_plan_service = ServicePlanService(**service_kwargs)
+        self.storage_volume_type_service = StorageVolumeTypeService(**service_kwargs)
+        self.storage_volume_service = StorageVolumeService(**service_kwargs)
+        self.virtual_image_service = VirtualImageService(**service_kwargs)
+        self.zone_service = ZoneService(**service_kwargs)
+        self.container_service = ContainerService(**service_kwargs)
+
+    def close(self):
+        """Closes the shared session and releases the pooled connections."""
+        self.session.close()
+
+
+class AsyncMorpheusAPIService:
+    """
+    The asyncio counterpart of MorpheusAPIService.
+
+    All async services share one pooled aiohttp session, so fleet-wide status checks can be issued together with
+    asyncio.gather. The session is bound to the running event loop, so this class must be created inside a
+    coroutine and closed before the loop ends; it can also be used as an async context manager.
+
+    Attributes:
+        session (aiohttp.ClientSession): The pooled session shared by all async services.
+        instance_service (AsyncInstanceService): The async /api/instances service.
+        server_service (AsyncServerService): The async /api/servers service.
+        snapshot_service (AsyncSnapshotService): The async /api/snapshots service.
+        backup_service (AsyncBackupService): The async /api/backups service.
+        container_service (AsyncContainerService): The async /api/containers service.
+    """
+
+    def __init__(self, api_settings: APISettings):
+        self.session = create_async_session(pool_maxsize=api_settings.pool_maxsize, keep_alive=api_settings.keep_alive)
+        service_kwargs = {
+            "base_url": api_settings.base_url,
+            "api_token": api_settings.api_token,
+            "session": self.session,
+        }
+        self.instance_service = AsyncInstanceService(**service_kwargs)
+        self.server_service = AsyncServerService(**service_kwargs)
+        self.snapshot_service = AsyncSnapshotService(**service_kwargs)
+        self.backup_service = AsyncBackupService(**service_kwargs)
+        self.container_service = AsyncContainerService(**service_kwargs)
+
+    async def close(self):
+        """Closes the shared session and releases the pooled connections."""
+        await self.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
 
 
 # Final combined settings
@@ -292,6 +445,7 @@ class MorpheusSettings(ConfigSettings):
         dmcore_settings (DMCoreSettings): Settings for DMCore.
         proxy_settings (ProxySettings): Proxy settings initialized with HTTP and HTTPS proxies from common settings.
         vdbench_settings (VDBenchSettings): VDBench settings initialized with various parameters from common settings.
+        benchmark_settings (BenchmarkSettings): Settings of the appliance operation benchmark suite.
     """
 
     common_settings: CommonSettings = CommonSettings()
@@ -324,3 +478,4 @@ class MorpheusSettings(ConfigSettings):
         fwd=common_settings.fwd,
         frd=common_settings.frd,
     )
+    benchmark_settings: BenchmarkSettings = BenchmarkSettings()
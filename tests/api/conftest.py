@@ -0,0 +1,77 @@
+import logging
+import os
+import time
+
+from pytest import Session, fixture
+
+from morpheus_api.configuration.request_metrics import REQUEST_METRICS
+from morpheus_api.helpers.api_logging import start_queue_logging, stop_queue_logging
+from morpheus_api.settings import MorpheusAPIService, MorpheusSettings
+from tests.steps.morpheus.lifecycle_timeline import LIFECYCLE_TIMELINE
+from tests.steps.morpheus.teardown_steps import TeardownEngine
+
+settings = MorpheusSettings()
+
+logger = logging.getLogger()
+
+
+@fixture(scope="session")
+def teardown_engine():
+    """
+    Fixture to provide the TeardownEngine collecting the resources created during the session.
+
+    Tests register the instances, snapshots, backups and virtual images they create, and everything is deleted
+    in dependency order once the session ends.
+
+    Yields:
+        TeardownEngine: The session's teardown engine.
+    Cleanup:
+        - Deletes every tracked resource and logs the leftovers.
+    """
+    morpheus_api_service = MorpheusAPIService(api_settings=settings.api_settings)
+    engine = TeardownEngine(morpheus_api_service, force="on")
+
+    yield engine
+
+    logger.info(f"\n{'Session Teardown Start'.center(40, '*')}")
+    leftovers = engine.teardown()
+    if leftovers:
+        logger.error(f"Resources left on the appliance after the session: {leftovers}")
+    morpheus_api_service.close()
+    logger.info(f"\n{'Session Teardown Complete'.center(40, '*')}")
+
+
+@fixture(scope="session", autouse=True)
+def queue_logging():
+    """
+    Fixture moving the log handlers behind a background queue when APISettings.async_logging is set.
+
+    The test threads then only enqueue their records, and the lazily built API log messages are formatted and
+    written by the listener thread. A fixture rather than a pytest_sessionstart hook, as pytest only calls that hook
+    for the conftest files of the paths it was started on. The queue is flushed by pytest_sessionfinish.
+    """
+    if settings.api_settings.async_logging:
+        start_queue_logging()
+    yield
+
+
+def pytest_sessionfinish(session: Session):
+    """
+    Dumps the latency histograms of every Morpheus API endpoint called during the session.
+
+    The metrics are written as JSON and OpenMetrics text to APISettings.metrics_dir, one pair of files per run
+    (and per pytest-xdist worker), so the slowest endpoints can be compared across runs. The lifecycle timeline,
+    when a decorated step ran, is written next to them and labelled with APISettings.appliance_build. The queued
+    log records, if any, are flushed first.
+    """
+    stop_queue_logging()
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    suffix = time.strftime("%Y%m%d_%H%M%S") + (f"_{worker}" if worker else "")
+    if LIFECYCLE_TIMELINE.spans():
+        LIFECYCLE_TIMELINE.dump(
+            settings.api_settings.metrics_dir,
+            name=f"lifecycle_timeline_{suffix}",
+            build=settings.api_settings.appliance_build,
+        )
+    if REQUEST_METRICS.endpoints():
+        REQUEST_METRICS.dump(settings.api_settings.metrics_dir, name=f"request_metrics_{suffix}")
@@ -8,10 +8,8 @@ from lib.common.enums.service_plan_name import ServicePlanName
 from morpheus_api.dataclasses.common_objects import CommonRequiredData
 from morpheus_api.settings import MorpheusAPIService, MorpheusSettings
 from tests.steps.morpheus.common_steps import get_required_data
-from tests.steps.morpheus.instance_steps import (
-    create_instance_from_template,
-    delete_instance,
-)
+from tests.steps.morpheus.instance_steps import create_instance_from_template
+from tests.steps.morpheus.teardown_steps import TeardownEngine
 from morpheus_api.dataclasses.instance import Instance
 
 CREATED_INSTANCE_NAME: str = f"HPE-BMaaS-Instance-{str(uuid.uuid4())[:5]}"
@@ -31,12 +29,10 @@ def morpheus_api_service():
     Fixture to provide a MorpheusAPIService instance for testing.
 
     This fixture initializes a MorpheusAPIService instance using the provided API settings.
-    After the test, it ensures that created Instance and virtual image is deleted and verifies its deletion.
+    The created instance is deleted by the session's teardown_engine.
 
     Yields:
         MorpheusAPIService: An instance of MorpheusAPIService for API interactions.
-    Cleanup:
-        - Deletes the created instances.
     """
     global COMMON_REQUIRED_DATA, VIRTUAL_IMAGE_ID
 
@@ -52,36 +48,29 @@ def morpheus_api_service():
     )
 
     logger.info("Fetching virtual images")
-    virtual_image_list = morpheus_api_service.virtual_image_service.list_virtual_images()
-    VIRTUAL_IMAGE_ID = [
+    VIRTUAL_IMAGE_ID = next(
         virtual_image
-        for virtual_image in virtual_image_list.virtual_images
+        for virtual_image in morpheus_api_service.virtual_image_service.iter_virtual_images()
         if VIRTUAL_IMAGE_NAME == virtual_image.name and virtual_image.image_type == VirtualImageType.ISO.value
-    ][0].id
+    ).id
     logger.info(f"Virtual Image ID = {VIRTUAL_IMAGE_ID}")
 
     logger.info(f"\n{'Setup Complete'.center(40, '*')}")
 
     yield morpheus_api_service
 
-    logger.info(f"\n{'Teardown Start'.center(40, '*')}")
-
-    if CREATED_INSTANCE:
-        logger.info(f"Deleting instance {CREATED_INSTANCE.instance.name} . . .")
-        delete_instance(morpheus_api_service, CREATED_INSTANCE.instance.id, force="on")
-        logger.info(f"Instance {CREATED_INSTANCE.instance.name} deleted successfully")
-
-    logger.info(f"\n{'Teardown Complete'.center(40, '*')}")
+    morpheus_api_service.close()
 
 
 
 @mark.regression
 @mark.filterwarnings("ignore::urllib3.exceptions.InsecureRequestWarning")
-def test_create_instance(morpheus_api_service: MorpheusAPIService):
+def test_create_instance(morpheus_api_service: MorpheusAPIService, teardown_engine: TeardownEngine):
     """
     Test to add and remove network interfaces from an instance.
     Args:
         morpheus_api_service (MorpheusAPIService): An instance of MorpheusAPIService for API interactions.
+        teardown_engine (TeardownEngine): Deletes the created instance at the end of the session.
     Raises:
         MorpheusAPIError: If there is an error during the API call for deleting the virtual image.
 
@@ -108,6 +97,7 @@ def test_create_instance(morpheus_api_service: MorpheusAPIService):
         num_volumes=1,
         wait_for_creation=True,
     )
+    teardown_engine.track_instance(CREATED_INSTANCE.instance.id)
     assert create_status, f"Failed to create {VIRTUAL_IMAGE_NAME} instance"
     logger.info(f"Instance '{CREATED_INSTANCE_NAME}' created successfully")
 
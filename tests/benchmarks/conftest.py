@@ -0,0 +1,111 @@
+import logging
+
+from pytest import fixture
+
+from lib.common.enums.service_plan_name import ServicePlanName
+from morpheus_api.settings import APISettings, MorpheusAPIService, MorpheusSettings
+from tests.steps.morpheus.common_steps import get_required_data
+from tests.stubs.morpheus_stub_server import MorpheusStubServer
+from tests.stubs.simulated_appliance import SimulatedAppliance
+
+settings = MorpheusSettings()
+
+logger = logging.getLogger()
+
+
+class BenchmarkTarget:
+    """
+    What the benchmark runs against: the service to call, and the arguments to create and resize the instances with.
+
+    Attributes:
+        name (str): "simulated" or "appliance".
+        morpheus_api_service (MorpheusAPIService): The service to interact with the target.
+        create_arguments (dict): The arguments of create_instance_from_template besides the service and the name.
+        resize_plan_id (int): The plan the instances are resized to.
+        appliance (SimulatedAppliance): The simulated appliance, None against a real appliance.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        morpheus_api_service: MorpheusAPIService,
+        create_arguments: dict,
+        resize_plan_id: int,
+        appliance: SimulatedAppliance = None,
+    ):
+        self.name = name
+        self.morpheus_api_service = morpheus_api_service
+        self.create_arguments = create_arguments
+        self.resize_plan_id = resize_plan_id
+        self.appliance = appliance
+
+
+@fixture(scope="session")
+def benchmark_target(tmp_path_factory):
+    """
+    Fixture to provide the target of the benchmark, selected by BenchmarkSettings.benchmark_target.
+
+    With "appliance" the benchmark runs against APISettings.base_url, creating instances from the configured image
+    with the discovered zone, network, layout and plan, and resizing them to the next plan up. Otherwise a
+    SimulatedAppliance is served locally with the configured operation time, capacity and failure rate.
+
+    Yields:
+        BenchmarkTarget: The target of the benchmark.
+    """
+    benchmark_settings = settings.benchmark_settings
+    pool_maxsize = max(
+        settings.api_settings.pool_maxsize,
+        benchmark_settings.load_max_in_flight,
+        *benchmark_settings.benchmark_concurrency,
+    )
+
+    if benchmark_settings.benchmark_target == "appliance":
+        morpheus_api_service = MorpheusAPIService(
+            settings.api_settings.model_copy(update={"pool_maxsize": pool_maxsize})
+        )
+        required_data = get_required_data(morpheus_api_service, service_plan_name=ServicePlanName.CPU_1_MEMORY_1_GB)
+        resize_data = get_required_data(morpheus_api_service, service_plan_name=ServicePlanName.CPU_1_MEMORY_2_GB)
+        create_arguments = {
+            "template_id": settings.instance_settings.config["imageId"],
+            "storage_volume_type_id": required_data.storage_volume_type_id,
+            "datastore_id": settings.instance_settings.volumes[0]["datastore_id"],
+            # The network options name networks "network-<id>", the create payload takes the bare ID
+            "network_id": str(required_data.network_id).removeprefix("network-"),
+            "layout_id": required_data.layout_id,
+            "layout_code": required_data.layout_code,
+            "plan_id": required_data.plan_id,
+            "plan_code": required_data.plan_code,
+            "zone_id": required_data.zone_id,
+        }
+        yield BenchmarkTarget("appliance", morpheus_api_service, create_arguments, resize_data.plan_id)
+        morpheus_api_service.close()
+        return
+
+    appliance = SimulatedAppliance(
+        operation_time=benchmark_settings.benchmark_operation_time,
+        capacity=benchmark_settings.benchmark_capacity,
+        failure_rate=benchmark_settings.benchmark_failure_rate,
+    )
+    with MorpheusStubServer() as stub_server:
+        appliance.register(stub_server)
+        morpheus_api_service = MorpheusAPIService(
+            APISettings(
+                base_url=stub_server.base_url,
+                api_token="token",
+                pool_maxsize=pool_maxsize,
+                discovery_cache_path=str(tmp_path_factory.mktemp("benchmark") / "discovery_cache.json"),
+            )
+        )
+        create_arguments = {
+            "template_id": 1,
+            "storage_volume_type_id": 1,
+            "datastore_id": None,
+            "network_id": "1",
+            "layout_id": 1,
+            "layout_code": "simulated-layout",
+            "plan_id": 152,
+            "plan_code": "kvm-vm-1024",
+            "zone_id": 1,
+        }
+        yield BenchmarkTarget("simulated", morpheus_api_service, create_arguments, 153, appliance)
+        morpheus_api_service.close()
@@ -0,0 +1,55 @@
+import logging
+
+from pytest import mark
+
+from morpheus_api.settings import MorpheusSettings
+from tests.benchmarks.conftest import BenchmarkTarget
+from tests.steps.morpheus.appliance_benchmark import ApplianceBenchmark
+
+settings = MorpheusSettings()
+
+logger = logging.getLogger()
+
+
+@mark.benchmark
+def test_appliance_operations_at_each_concurrency_level(benchmark_target: BenchmarkTarget):
+    """
+    Benchmark the instance lifecycle operations at every configured concurrency level.
+
+    This function performs the following steps:
+    1. At every level of BenchmarkSettings.benchmark_concurrency, drive that many workers through create, stop,
+       start, snapshot, clone, resize and delete with the step functions.
+    2. Write the throughput, latency percentiles and error rate of every level and operation as JSON to
+       BenchmarkSettings.benchmark_results_dir, labelled with the target and APISettings.appliance_build.
+    3. Verify that every level ran every operation, and that the simulated appliance, unless told to fail
+       operations, completed them all.
+    """
+    benchmark_settings = settings.benchmark_settings
+    benchmark = ApplianceBenchmark(
+        benchmark_target.morpheus_api_service,
+        benchmark_target.create_arguments,
+        resize_plan_id=benchmark_target.resize_plan_id,
+        operations=tuple(benchmark_settings.benchmark_operations),
+        cycles=benchmark_settings.benchmark_cycles,
+    )
+    benchmark.run(levels=tuple(benchmark_settings.benchmark_concurrency))
+    benchmark.dump(
+        benchmark_settings.benchmark_results_dir,
+        target=benchmark_target.name,
+        build=settings.api_settings.appliance_build,
+    )
+
+    for level in benchmark.to_dict()["levels"]:
+        logger.info(
+            f"Concurrency {level['concurrency']}: {level['throughput_per_minute']:.1f} ops/min, "
+            f"error rate {level['error_rate']:.2%}, "
+            + ", ".join(f"{operation} p95 {stats['p95']}s" for operation, stats in level["operations"].items())
+        )
+        calls = {
+            operation: stats["count"] + stats["failures"] + stats["skipped"]
+            for operation, stats in level["operations"].items()
+        }
+        assert set(calls) == set(benchmark.operations), f"Operations missing at concurrency {level['concurrency']}"
+        assert all(count == level["concurrency"] * benchmark.cycles for count in calls.values()), calls
+        if benchmark_target.appliance is not None and not benchmark_settings.benchmark_failure_rate:
+            assert level["operations_failed"] == 0, f"Simulated operations failed at concurrency {level['concurrency']}"
@@ -0,0 +1,63 @@
+import logging
+
+from pytest import mark
+
+from morpheus_api.settings import MorpheusSettings
+from tests.benchmarks.conftest import BenchmarkTarget
+from tests.steps.morpheus.instance_steps import template_instance_payload
+from tests.steps.morpheus.load_generator import LoadGenerator, find_throughput_knee
+
+settings = MorpheusSettings()
+
+logger = logging.getLogger()
+
+
+@mark.benchmark
+def test_sustained_load_at_each_rate(benchmark_target: BenchmarkTarget):
+    """
+    Offer a steady mix of lifecycle operations at increasing rates and find the rate the target stops keeping up at.
+
+    This function performs the following steps:
+    1. At every rate of BenchmarkSettings.load_rates_per_minute, offer creates, snapshots, backups and deletes for
+       BenchmarkSettings.load_duration seconds, whatever the pace of the target.
+    2. Write the queueing delay, completion latency and throughput per time window of every rate as JSON to
+       BenchmarkSettings.benchmark_results_dir.
+    3. Log the throughput knee, and verify that every arrival has an outcome and no instance was left behind on the
+       simulated appliance.
+    """
+    benchmark_settings = settings.benchmark_settings
+    reports = []
+    for rate_per_minute in benchmark_settings.load_rates_per_minute:
+        generator = LoadGenerator(
+            benchmark_target.morpheus_api_service,
+            lambda name: template_instance_payload(instance_name=name, **benchmark_target.create_arguments),
+            rate_per_minute=rate_per_minute,
+            duration=benchmark_settings.load_duration,
+            arrival_process=benchmark_settings.load_arrival_process,
+            operation_mix=benchmark_settings.load_operation_mix,
+            max_live_instances=benchmark_settings.load_max_live_instances,
+            max_in_flight=benchmark_settings.load_max_in_flight,
+            window=benchmark_settings.load_window,
+            poll_interval=benchmark_settings.load_poll_interval,
+        )
+        report = generator.run()
+        report.dump(
+            benchmark_settings.benchmark_results_dir,
+            target=benchmark_target.name,
+            build=settings.api_settings.appliance_build,
+        )
+        reports.append(report)
+
+        summary = report.summary()
+        logger.info(
+            f"{rate_per_minute:g}/min offered: {summary['accepted_rate_per_minute']:.1f}/min accepted, "
+            f"{summary['throughput_per_minute']:.1f}/min completed, "
+            f"p95 queueing delay {summary['queueing_delay']['p95']}s, "
+            f"p95 completion latency {summary['completion_latency']['p95']}s"
+        )
+        assert all(operation.outcome is not None for operation in report.operations)
+        assert summary["completed"] + summary["failed"] + summary["rejected"] == summary["arrivals"]
+
+    logger.info(f"Throughput knee: {find_throughput_knee(reports)}/min")
+    if benchmark_target.appliance is not None:
+        assert all(instance.removed for instance in benchmark_target.appliance.instances.values())
@@ -0,0 +1,15 @@
+from pytest import fixture
+
+from tests.stubs.morpheus_stub_server import MorpheusStubServer
+
+
+@fixture
+def stub_server():
+    """
+    Fixture to provide a running local Morpheus API stub server.
+
+    Yields:
+        MorpheusStubServer: The started stub server. It is stopped after the test.
+    """
+    with MorpheusStubServer() as server:
+        yield server
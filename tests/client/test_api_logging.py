@@ -0,0 +1,138 @@
+import logging
+import threading
+import time
+
+from morpheus_api.api_endpoints.server_service import ServerService
+from morpheus_api.helpers.api_logging import ApiLogger, LazyBody, start_queue_logging, stop_queue_logging
+from tests.stubs.morpheus_stub_server import MorpheusStubServer
+from tests.stubs.payloads import server_payload
+
+SAMPLE_INTERVAL = 0.2
+
+
+class RecordingHandler(logging.Handler):
+    """
+    Keeps the formatted messages and the thread that formatted each of them.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.messages: list[str] = []
+        self.threads: list[str] = []
+
+    def emit(self, record: logging.LogRecord):
+        self.messages.append(self.format(record))
+        self.threads.append(threading.current_thread().name)
+
+
+class CountingBody:
+    """
+    A body counting how many times it was serialized.
+    """
+
+    def __init__(self):
+        self.serialized = 0
+
+    def __str__(self) -> str:
+        self.serialized += 1
+        return "payload"
+
+
+def _logger(name: str, level: int) -> tuple[logging.Logger, RecordingHandler]:
+    test_logger = logging.getLogger(name)
+    test_logger.setLevel(level)
+    test_logger.propagate = False
+    handler = RecordingHandler()
+    test_logger.handlers = [handler]
+    return test_logger, handler
+
+
+def test_bodies_are_serialized_only_when_formatted():
+    """
+    Test that a disabled level never serializes the body, and an enabled one serializes it once when formatted.
+    """
+    test_logger, handler = _logger("test_api_logging.lazy", logging.INFO)
+    api_logger = ApiLogger(test_logger)
+    body = CountingBody()
+
+    api_logger.body(logging.DEBUG, "Server", body)
+    assert body.serialized == 0 and handler.messages == []
+
+    api_logger.body(logging.INFO, "Creating instance", body, instance_id=3)
+    assert body.serialized == 1
+    assert handler.messages == ["Creating instance instance_id=3 body=payload"]
+
+
+def test_bodies_are_truncated():
+    """
+    Test that payloads and raw response bodies are cut to the maximum length with the size of the rest.
+    """
+    payload = {"instance": {"name": "x" * 100}}
+    assert str(LazyBody(payload, max_length=20)) == '{"instance": {"name"...(+106 chars)'
+    assert str(LazyBody(payload, max_length=0)) == '{"instance": {"name": "' + "x" * 100 + '"}}'
+
+    content = b'{"servers": [' + b'"\xc3\xa9",' * 1000 + b"]}"
+    truncated = str(LazyBody(content, max_length=16))
+    assert truncated == '{"servers": ["é"...(+' + str(len(content) - len('{"servers": ["é"'.encode())) + " bytes)"
+
+
+def test_repeated_poll_logs_are_sampled():
+    """
+    Test that logs sharing a sample key are emitted once per interval, the next one counting the suppressed ones.
+    """
+    test_logger, handler = _logger("test_api_logging.sampled", logging.DEBUG)
+    api_logger = ApiLogger(test_logger)
+    api_logger.sample_interval = SAMPLE_INTERVAL
+
+    for _ in range(5):
+        api_logger.log(logging.DEBUG, "Server", sample_key="server:1", status="provisioning")
+    api_logger.log(logging.DEBUG, "Server", sample_key="server:2", status="running")
+    time.sleep(SAMPLE_INTERVAL * 1.5)
+    api_logger.log(logging.DEBUG, "Server", sample_key="server:1", status="running")
+
+    assert handler.messages == [
+        "Server status=provisioning",
+        "Server status=running",
+        "Server suppressed=4 status=running",
+    ]
+
+
+def test_queue_logging_formats_in_the_listener_thread():
+    """
+    Test that with the queue handler the records are formatted by the listener thread, not the logging one.
+    """
+    test_logger, handler = _logger("test_api_logging.queued", logging.INFO)
+    api_logger = ApiLogger(test_logger)
+    body = CountingBody()
+
+    start_queue_logging(test_logger)
+    try:
+        api_logger.body(logging.INFO, "Creating backup job", body)
+        assert handler not in test_logger.handlers
+    finally:
+        stop_queue_logging(test_logger)
+
+    assert test_logger.handlers == [handler]
+    assert handler.messages == ["Creating backup job body=payload"]
+    assert handler.threads != [threading.current_thread().name]
+    assert body.serialized == 1
+
+
+def test_server_responses_are_logged_at_debug_only(stub_server: MorpheusStubServer, caplog):
+    """
+    Test that the server endpoints no longer log whole responses at INFO, and sample them at DEBUG.
+    """
+    stub_server.add_route("GET", "/api/servers/{id}", {"server": server_payload(9051)})
+    service = ServerService(base_url=stub_server.base_url, api_token="token")
+
+    with caplog.at_level(logging.INFO):
+        service.get_a_specific_server(9051)
+    assert not [record for record in caplog.records if record.getMessage().startswith("Server")]
+
+    with caplog.at_level(logging.DEBUG):
+        for _ in range(3):
+            service.get_a_specific_server(9051)
+    server_logs = [record for record in caplog.records if record.getMessage().startswith("Server body=")]
+    assert len(server_logs) == 1
+    assert server_logs[0].api_fields["body"].body.status_code == 200
+    service.close()
@@ -0,0 +1,97 @@
+import json
+
+from pytest import approx, raises
+
+from morpheus_api.settings import APISettings, MorpheusAPIService
+from tests.steps.morpheus.appliance_benchmark import ApplianceBenchmark, compare_benchmark_reports
+from tests.stubs.morpheus_stub_server import MorpheusStubServer
+from tests.stubs.simulated_appliance import SimulatedAppliance
+
+CREATE_ARGUMENTS = {
+    "template_id": 1,
+    "storage_volume_type_id": 1,
+    "datastore_id": None,
+    "network_id": "1",
+    "layout_id": 1,
+    "layout_code": "simulated-layout",
+    "plan_id": 152,
+    "plan_code": "kvm-vm-1024",
+    "zone_id": 1,
+}
+
+
+def _build_service(stub_server: MorpheusStubServer, tmp_path) -> MorpheusAPIService:
+    return MorpheusAPIService(
+        APISettings(
+            base_url=stub_server.base_url,
+            api_token="token",
+            max_retries=0,
+            discovery_cache_path=str(tmp_path / "discovery_cache.json"),
+        )
+    )
+
+
+def test_levels_report_throughput_latency_and_errors(stub_server: MorpheusStubServer, tmp_path):
+    """
+    Test that every level runs a cycle per worker, reports its percentiles, and counts the failed and skipped calls.
+
+    This function performs the following steps:
+    1. Run create, stop and delete at concurrency 1 and 4 against a simulated appliance running 2 operations at
+       once, where half the instance operations fail.
+    2. Dump the report and read it back.
+    3. Verify that every cycle is accounted for, the failed cycles were cleaned up, and the operations queued
+       on the appliance at concurrency 4.
+    """
+    appliance = SimulatedAppliance(operation_time=0.05, capacity=2, failure_rate=0.5, seed=3)
+    appliance.register(stub_server)
+    morpheus_api_service = _build_service(stub_server, tmp_path)
+    benchmark = ApplianceBenchmark(morpheus_api_service, CREATE_ARGUMENTS, operations=("stop", "delete", "create"))
+
+    benchmark.run(levels=(1, 4))
+    with open(benchmark.dump(str(tmp_path), name="benchmark", target="simulated", build="8.0.1")) as report_file:
+        report = json.load(report_file)
+    morpheus_api_service.close()
+
+    assert (report["target"], report["build"], report["operations"]) == (
+        "simulated",
+        "8.0.1",
+        ["create", "stop", "delete"],
+    )
+    assert [level["concurrency"] for level in report["levels"]] == [1, 4]
+    for level in report["levels"]:
+        create, stop, delete = (level["operations"][operation] for operation in ("create", "stop", "delete"))
+        assert create["count"] + create["failures"] == level["concurrency"]
+        assert stop["count"] + stop["failures"] + stop["skipped"] == level["concurrency"]
+        assert delete["count"] + delete["skipped"] == level["concurrency"]
+        assert delete["failures"] == 0
+        assert level["operations_completed"] == create["count"] + stop["count"] + delete["count"]
+        assert level["throughput_per_minute"] == approx(level["operations_completed"] / level["duration"] * 60)
+        assert create["count"] == 0 or create["p50"] <= create["p95"] <= create["p99"]
+    failed = sum(level["operations_failed"] for level in report["levels"])
+    assert failed > 0
+    assert sum(level["error_rate"] > 0 for level in report["levels"]) >= 1
+    assert all(instance.removed for instance in appliance.instances.values())
+    assert appliance.max_queue_delay > 0
+
+
+def test_reports_are_compared_level_by_level():
+    """
+    Test that two reports compare throughput and percentiles per concurrency level and operation.
+    """
+
+    def report(throughput: float, p95: float) -> dict:
+        stats = {"throughput_per_minute": throughput, "p50": 1.0, "p95": p95, "p99": p95}
+        return {"levels": [{"concurrency": 4, "operations": {"create": stats}}]}
+
+    ratios = compare_benchmark_reports(report(100.0, 2.0), report(50.0, 3.0))
+
+    assert ratios == {"4/create": {"throughput_per_minute": 0.5, "p50": 1.0, "p95": 1.5, "p99": 1.5}}
+    assert compare_benchmark_reports(report(100.0, 2.0), {"levels": [{"concurrency": 16, "operations": {}}]}) == {}
+
+
+def test_unknown_operations_are_rejected():
+    """
+    Test that a typo in the configured operations fails before anything is created.
+    """
+    with raises(ValueError, match="snapshots"):
+        ApplianceBenchmark(None, CREATE_ARGUMENTS, operations=("create", "snapshots"))
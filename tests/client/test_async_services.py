@@ -0,0 +1,80 @@
+import asyncio
+import time
+
+from aiohttp import web
+from pytest import raises
+
+from lib.common.exceptions import APIError
+from morpheus_api.dataclasses.instance import Instance
+from morpheus_api.dataclasses.snapshot import SnapshotsList
+from morpheus_api.settings import APISettings, AsyncMorpheusAPIService
+from tests.stubs.aiohttp_stub_server import AiohttpStubServer
+from tests.stubs.payloads import instance_payload
+
+NUMBER_OF_INSTANCES = 50
+STUB_LATENCY = 0.05
+
+
+async def _get_instance(request: web.Request) -> web.Response:
+    instance_id = int(request.match_info["id"])
+    if instance_id > NUMBER_OF_INSTANCES:
+        return web.json_response({"success": False, "msg": "Not Found"}, status=404)
+    return web.json_response({"instance": instance_payload(instance_id)})
+
+
+def _build_stub_server() -> AiohttpStubServer:
+    server = AiohttpStubServer(latency=STUB_LATENCY)
+    server.add_route("GET", "/api/instances/{id}", _get_instance)
+    server.add_route("GET", "/api/instances/{id}/snapshots", {"snapshots": []})
+    return server
+
+
+def test_gather_fleet_status_checks():
+    """
+    Test that async instance status checks across a fleet run concurrently and return the sync dataclasses.
+
+    This function performs the following steps:
+    1. Start an aiohttp stub that answers each GET after STUB_LATENCY seconds.
+    2. Gather get_instance() for NUMBER_OF_INSTANCES instances over one shared session.
+    3. Verify the results are Instance objects and the calls overlapped instead of running back to back.
+    """
+
+    async def run() -> tuple[list[Instance], float, int]:
+        async with _build_stub_server() as server:
+            api_settings = APISettings(base_url=server.base_url, api_token="token")
+            async with AsyncMorpheusAPIService(api_settings) as morpheus_api_service:
+                start = time.perf_counter()
+                instances = await asyncio.gather(
+                    *[
+                        morpheus_api_service.instance_service.get_instance(instance_id)
+                        for instance_id in range(1, NUMBER_OF_INSTANCES + 1)
+                    ]
+                )
+                return instances, time.perf_counter() - start, server.max_in_flight
+
+    instances, elapsed, max_in_flight = asyncio.run(run())
+
+    assert all(isinstance(instance, Instance) for instance in instances)
+    assert [instance.instance.id for instance in instances] == list(range(1, NUMBER_OF_INSTANCES + 1))
+    assert max_in_flight > 1
+    assert elapsed < NUMBER_OF_INSTANCES * STUB_LATENCY / 2
+
+
+def test_async_services_share_session_and_raise_api_errors():
+    """
+    Test that async services share one session and surface API errors through handle_response.
+    """
+
+    async def run():
+        async with _build_stub_server() as server:
+            api_settings = APISettings(base_url=server.base_url, api_token="token")
+            async with AsyncMorpheusAPIService(api_settings) as morpheus_api_service:
+                assert morpheus_api_service.instance_service.session is morpheus_api_service.snapshot_service.session
+
+                snapshots = await morpheus_api_service.snapshot_service.list_instance_snapshots(1)
+                assert isinstance(snapshots, SnapshotsList)
+
+                with raises(APIError, match="Not Found"):
+                    await morpheus_api_service.instance_service.get_instance(NUMBER_OF_INSTANCES + 1)
+
+    asyncio.run(run())
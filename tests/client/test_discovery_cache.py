@@ -0,0 +1,112 @@
+import json
+import time
+
+from morpheus_api.helpers.discovery_cache import DiscoveryCache, discovery_cache_scope
+
+BASE_URL = "https://morpheus.example"
+OTHER_BASE_URL = "https://other-morpheus.example"
+
+
+class CountingLookup:
+    """A lookup that records how many times it hit the appliance."""
+
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+def test_repeated_lookups_are_served_from_cache(tmp_path):
+    """
+    Test that a lookup is fetched once and then served from memory and from disk by a new cache instance.
+
+    This function performs the following steps:
+    1. Resolve the same lookup twice through one cache.
+    2. Resolve it again through a new cache reading the same file, as a following session would.
+    3. Verify that the appliance was queried once.
+    """
+    path = str(tmp_path / "discovery.json")
+    cluster_lookup = CountingLookup({"id": 1, "name": "cluster-1"})
+
+    cache = DiscoveryCache(path=path, ttl=60)
+    assert cache.get_or_fetch(BASE_URL, "clusters?first", cluster_lookup) == {"id": 1, "name": "cluster-1"}
+    assert cache.get_or_fetch(BASE_URL, "clusters?first", cluster_lookup) == {"id": 1, "name": "cluster-1"}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    next_session_cache = DiscoveryCache(path=path, ttl=60)
+    assert next_session_cache.get_or_fetch(BASE_URL, "clusters?first", cluster_lookup)["id"] == 1
+    assert cluster_lookup.calls == 1
+    assert next_session_cache.get(OTHER_BASE_URL, "clusters?first") is None
+
+
+def test_expired_and_missing_lookups_are_fetched(tmp_path):
+    """
+    Test that expired entries are fetched again and lookups that found nothing are not cached.
+    """
+    path = tmp_path / "discovery.json"
+    cache = DiscoveryCache(path=str(path), ttl=60)
+    cache.set(BASE_URL, "zones?first", {"id": 3, "name": "zone"})
+
+    content = json.loads(path.read_text())
+    content["entries"][BASE_URL]["zones?first"]["cached_at"] = time.time() - 120
+    path.write_text(json.dumps(content))
+
+    zone_lookup = CountingLookup({"id": 4, "name": "zone"})
+    assert DiscoveryCache(path=str(path), ttl=60).get_or_fetch(BASE_URL, "zones?first", zone_lookup)["id"] == 4
+
+    network_lookup = CountingLookup(None)
+    cache.get_or_fetch(BASE_URL, "network_options?zone_id=4", network_lookup)
+    cache.get_or_fetch(BASE_URL, "network_options?zone_id=4", network_lookup)
+    assert network_lookup.calls == 2
+
+
+def test_invalidate(tmp_path):
+    """
+    Test that invalidate removes single lookups, prefixes and whole appliances.
+    """
+    cache = DiscoveryCache(path=str(tmp_path / "discovery.json"), ttl=60)
+    for base_url in (BASE_URL, OTHER_BASE_URL):
+        cache.set(base_url, "service_plans?name=plan-1", {"id": 1})
+        cache.set(base_url, "service_plans?name=plan-2", {"id": 2})
+        cache.set(base_url, "clusters?first", {"id": 3})
+
+    assert cache.invalidate(BASE_URL, "clusters?first") == 1
+    assert cache.invalidate(BASE_URL, "service_plans*") == 2
+    assert cache.get(BASE_URL, "service_plans?name=plan-1") is None
+    assert cache.get(OTHER_BASE_URL, "service_plans?name=plan-1") == {"id": 1}
+    assert cache.invalidate() == 3
+    assert DiscoveryCache(path=str(tmp_path / "discovery.json"), ttl=60).get(OTHER_BASE_URL, "clusters?first") is None
+
+
+def test_zero_ttl_disables_cache(tmp_path):
+    """
+    Test that a TTL of 0 sends every lookup to the appliance and writes nothing to disk.
+    """
+    path = tmp_path / "discovery.json"
+    cache = DiscoveryCache(path=str(path), ttl=0)
+    lookup = CountingLookup({"id": 1})
+    cache.get_or_fetch(BASE_URL, "clusters?first", lookup)
+    cache.get_or_fetch(BASE_URL, "clusters?first", lookup)
+    assert lookup.calls == 2
+    assert not path.exists()
+
+
+def test_tokens_of_one_appliance_do_not_share_lookups(tmp_path):
+    """
+    Test that the lookups of two API tokens on the same appliance are cached apart, and the file holds no token.
+    """
+    path = tmp_path / "discovery.json"
+    cache = DiscoveryCache(path=str(path), ttl=60)
+    tenant_scope = discovery_cache_scope(BASE_URL, "tenant-token")
+    admin_scope = discovery_cache_scope(BASE_URL, "admin-token")
+
+    cache.set(tenant_scope, "clusters?first", {"id": 1})
+
+    assert tenant_scope != admin_scope and tenant_scope.startswith(BASE_URL)
+    assert cache.get(tenant_scope, "clusters?first") == {"id": 1}
+    assert cache.get(admin_scope, "clusters?first") is None
+    assert cache.invalidate(admin_scope) == 0
+    assert "tenant-token" not in path.read_text()
@@ -0,0 +1,158 @@
+import hashlib
+import logging
+import os
+import time
+
+from pytest import mark, raises
+
+from morpheus_api.api_endpoints.virtual_image_service import VirtualImageService
+from morpheus_api.configuration.retry_policy import RetryPolicy
+from morpheus_api.exceptions import MorpheusAPIError
+from morpheus_api.helpers.file_upload import UploadProgress
+from tests.stubs.morpheus_stub_server import MorpheusStubServer, StubRequest, StubResponse
+
+CHUNK_SIZE = 256 * 1024
+FILE_SIZE = 3 * CHUNK_SIZE + 1234
+NUMBER_OF_FILES = 4
+BENCHMARK_FILE_SIZE = 16 * 1024 * 1024
+APPLIANCE_LATENCY = 0.25
+
+logger = logging.getLogger()
+
+
+class UploadAppliance:
+    """
+    Receives virtual image files and keeps the sha256 and headers of each one. The first `failures` uploads are
+    answered with 503, as a load balancer dropping the upload would.
+    """
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.checksums: dict[tuple[int, str], str] = {}
+        self.headers: list[dict[str, str]] = []
+
+    def register(self, stub_server: MorpheusStubServer):
+        stub_server.add_route("POST", "/api/virtual-images/{id}/upload", self.upload)
+
+    def upload(self, request: StubRequest) -> StubResponse:
+        self.headers.append(request.headers)
+        if self.failures:
+            self.failures -= 1
+            return StubResponse(status=503)
+        key = (int(request.path_params["id"]), request.query["filename"][0])
+        self.checksums[key] = hashlib.sha256(request.body).hexdigest()
+        return StubResponse(body={"success": True})
+
+
+def _write_file(path: str, size: int) -> str:
+    with open(path, "wb") as file:
+        file.write(os.urandom(size))
+    return path
+
+
+def test_file_is_streamed_in_chunks_and_hashed(stub_server: MorpheusStubServer, tmp_path):
+    """
+    Test that a file is sent in chunks with a Content-Length, its checksum matches the bytes received and the
+    progress is reported up to 100%.
+    """
+    appliance = UploadAppliance()
+    appliance.register(stub_server)
+    path = _write_file(str(tmp_path / "ubuntu.qcow2"), FILE_SIZE)
+    reports: list[tuple[int, float]] = []
+
+    def on_progress(progress: UploadProgress):
+        reports.append((progress.bytes_sent, progress.fraction))
+
+    service = VirtualImageService(base_url=stub_server.base_url, api_token="token")
+    with open(path, "rb") as file:
+        expected = hashlib.sha256(file.read()).hexdigest()
+    response = service.upload_virtual_image_file(
+        7, f"{tmp_path}/", "ubuntu.qcow2", chunk_size=CHUNK_SIZE, progress_callback=on_progress
+    )
+    service.close()
+
+    assert response.success is True
+    assert appliance.checksums == {(7, "ubuntu.qcow2"): expected}
+    assert appliance.headers[0]["Content-Length"] == str(FILE_SIZE)
+    assert "Transfer-Encoding" not in appliance.headers[0]
+    assert reports[-1] == (FILE_SIZE, 1.0)
+
+
+def test_failed_upload_is_sent_again(stub_server: MorpheusStubServer, tmp_path):
+    """
+    Test that an upload answered with a transient error is sent again from its first byte.
+    """
+    appliance = UploadAppliance(failures=1)
+    appliance.register(stub_server)
+    path = _write_file(str(tmp_path / "rocky.qcow2"), FILE_SIZE)
+    policy = RetryPolicy(max_retries=2, jitter=False)
+    policy.sleep = lambda seconds: None
+    service = VirtualImageService(base_url=stub_server.base_url, api_token="token", retry_policy=policy)
+
+    [result] = service.upload_virtual_image_files([(8, path)], chunk_size=CHUNK_SIZE)
+    service.close()
+
+    assert result.attempts == 2
+    assert result.checksum == appliance.checksums[(8, "rocky.qcow2")]
+    assert len(appliance.headers) == 2
+
+
+def test_checksum_mismatch_is_raised(stub_server: MorpheusStubServer, tmp_path):
+    """
+    Test that an upload whose bytes do not match the published checksum raises.
+    """
+    UploadAppliance().register(stub_server)
+    path = _write_file(str(tmp_path / "debian.qcow2"), FILE_SIZE)
+    service = VirtualImageService(base_url=stub_server.base_url, api_token="token")
+
+    with raises(MorpheusAPIError, match="Checksum"):
+        service.upload_virtual_image_files([(9, path)], expected_checksums={path: "0" * 64})
+    service.close()
+
+
+@mark.benchmark
+def test_concurrent_uploads_benchmark(tmp_path):
+    """
+    Benchmark the upload of NUMBER_OF_FILES image files through an open file handle, through the chunked upload one
+    file at a time and through the chunked upload running concurrently.
+
+    This function performs the following steps:
+    1. Serve uploads from a stub taking APPLIANCE_LATENCY seconds to store each file.
+    2. Time the three upload modes and log their throughput.
+    3. Verify that every file was received intact and the concurrent uploads overlapped.
+    """
+    paths = [
+        _write_file(str(tmp_path / f"image-{index}.qcow2"), BENCHMARK_FILE_SIZE) for index in range(NUMBER_OF_FILES)
+    ]
+    uploads = [(index + 1, path) for index, path in enumerate(paths)]
+    total_mib = NUMBER_OF_FILES * BENCHMARK_FILE_SIZE / 1024 / 1024
+
+    with MorpheusStubServer(latency=APPLIANCE_LATENCY) as stub_server:
+        appliance = UploadAppliance()
+        appliance.register(stub_server)
+        service = VirtualImageService(base_url=stub_server.base_url, api_token="token")
+
+        start = time.perf_counter()
+        for virtual_image_id, path in uploads:
+            with open(path, "rb") as file:
+                service._post_upload(f"/api/virtual-images/{virtual_image_id}/upload?filename=handle", file)
+        file_handle = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sequential_results = service.upload_virtual_image_files(uploads, max_workers=1)
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        concurrent_results = service.upload_virtual_image_files(uploads, max_workers=NUMBER_OF_FILES)
+        concurrent = time.perf_counter() - start
+        service.close()
+
+    logger.info(
+        f"Upload of {NUMBER_OF_FILES} x {BENCHMARK_FILE_SIZE // 1024 // 1024} MiB: "
+        f"file handle {total_mib / file_handle:.0f} MiB/s, chunked sequential {total_mib / sequential:.0f} MiB/s, "
+        f"chunked concurrent {total_mib / concurrent:.0f} MiB/s"
+    )
+    for results in (sequential_results, concurrent_results):
+        for (virtual_image_id, path), result in zip(uploads, results):
+            assert appliance.checksums[(virtual_image_id, os.path.basename(path))] == result.checksum
+    assert concurrent < sequential - (NUMBER_OF_FILES - 2) * APPLIANCE_LATENCY
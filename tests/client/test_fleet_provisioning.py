@@ -0,0 +1,169 @@
+import threading
+
+from lib.common.enums.instance_status import InstanceStatus
+from morpheus_api.dataclasses.common_objects import ID, Code, IDCode
+from morpheus_api.dataclasses.instance import InstanceCreateData, InstanceData
+from morpheus_api.dataclasses.volume import Volume
+from morpheus_api.settings import APISettings, MorpheusAPIService
+from tests.steps.morpheus.fleet_steps import provision_fleet
+from tests.stubs.morpheus_stub_server import MorpheusStubServer, StubRequest, StubResponse
+from tests.stubs.payloads import instance_payload
+
+FLEET_SIZE = 12
+MAX_IN_FLIGHT = 4
+SLEEP_TIME = 0.05
+MAX_WAIT_TIME = 10
+
+
+class ProvisioningAppliance:
+    """
+    Creates instances that reach their final status after `ticks_to_finish` list calls.
+
+    Instances named "*-fail" end up failed, the first create of an instance named "*-throttled" is rejected with 429.
+    An instance is in flight from its create until a list call reported its final status.
+    """
+
+    def __init__(self, ticks_to_finish: int = 2):
+        self.ticks_to_finish = ticks_to_finish
+        self.instances: dict[int, dict] = {}
+        self.deleted: list[int] = []
+        self.throttled: set[str] = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def create_instance(self, request: StubRequest) -> StubResponse:
+        name = request.json()["instance"]["name"]
+        with self._lock:
+            if name.endswith("-throttled") and name not in self.throttled:
+                self.throttled.add(name)
+                return StubResponse(status=429, body={"success": False, "msg": "Too Many Requests"})
+            instance_id = len(self.instances) + 1
+            final_status = InstanceStatus.FAILED.value if name.endswith("-fail") else InstanceStatus.RUNNING.value
+            self.instances[instance_id] = {"name": name, "final_status": final_status, "ticks": 0, "reported": False}
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        return StubResponse(body={"instance": instance_payload(instance_id, "provisioning", name)})
+
+    def list_instances(self, request: StubRequest) -> StubResponse:
+        payloads = []
+        with self._lock:
+            for instance_id in (int(instance_id) for instance_id in request.query.get("id", [])):
+                instance = self.instances[instance_id]
+                instance["ticks"] += 1
+                status = self._status(instance)
+                if status != "provisioning" and not instance["reported"]:
+                    instance["reported"] = True
+                    self.in_flight -= 1
+                payloads.append(instance_payload(instance_id, status, instance["name"]))
+        return StubResponse(body={"instances": payloads})
+
+    def get_instance(self, request: StubRequest) -> StubResponse:
+        instance_id = int(request.path_params["id"])
+        instance = self.instances[instance_id]
+        return StubResponse(body={"instance": instance_payload(instance_id, self._status(instance), instance["name"])})
+
+    def delete_instance(self, request: StubRequest) -> StubResponse:
+        with self._lock:
+            self.deleted.append(int(request.path_params["id"]))
+        return StubResponse(body={"success": True})
+
+    def _status(self, instance: dict) -> str:
+        return instance["final_status"] if instance["ticks"] > self.ticks_to_finish else "provisioning"
+
+    def register(self, stub_server: MorpheusStubServer):
+        stub_server.add_route("POST", "/api/instances", self.create_instance)
+        stub_server.add_route("GET", "/api/instances", self.list_instances)
+        stub_server.add_route("GET", "/api/instances/{id}", self.get_instance)
+        stub_server.add_route("DELETE", "/api/instances/{id}", self.delete_instance)
+
+
+def _payload(instance_name: str) -> InstanceCreateData:
+    return InstanceCreateData(
+        instance=InstanceData(
+            site=ID(id=1),
+            type="mvm",
+            instanceType=Code(code="mvm"),
+            layout=IDCode(id=1, code="mvm-layout"),
+            plan=IDCode(id=152, code="kvm-vm-1024"),
+            name=instance_name,
+        ),
+        copies=1,
+        layout_size=1,
+        config={},
+        zone_id=1,
+        volumes=[Volume(id=-1, root_volume=True, name="root", size=10, storage_type=1)],
+    )
+
+
+def _build_service(stub_server: MorpheusStubServer) -> MorpheusAPIService:
+    return MorpheusAPIService(
+        APISettings(base_url=stub_server.base_url, api_token="token", max_retries=0, retry_backoff_factor=0.01)
+    )
+
+
+def test_fleet_respects_in_flight_cap_and_reports_failures(stub_server: MorpheusStubServer):
+    """
+    Test that a fleet is provisioned with a bounded number of instances in flight and partial failures are cleaned up.
+
+    This function performs the following steps:
+    1. Provision FLEET_SIZE instances, MAX_IN_FLIGHT at a time; two of them fail and one is throttled once.
+    2. Stream the results as the instances finish.
+    3. Verify that the appliance never had more than MAX_IN_FLIGHT instances provisioning, the throttled create
+       was resubmitted, and only the failed instances were reported and deleted.
+    """
+    appliance = ProvisioningAppliance()
+    appliance.register(stub_server)
+    morpheus_api_service = _build_service(stub_server)
+    names = [f"fleet-{index}" for index in range(FLEET_SIZE)]
+    names[3] += "-fail"
+    names[8] += "-fail"
+    names[5] += "-throttled"
+
+    with provision_fleet(
+        morpheus_api_service,
+        [_payload(name) for name in names],
+        max_in_flight=MAX_IN_FLIGHT,
+        max_wait_time=MAX_WAIT_TIME,
+        sleep_time=SLEEP_TIME,
+    ) as fleet:
+        streamed = [result.instance_name for result in fleet]
+
+    assert sorted(streamed) == sorted(names)
+    assert 1 < appliance.max_in_flight <= MAX_IN_FLIGHT
+    assert appliance.throttled == {"fleet-5-throttled"}
+    assert [result.instance_name for result in fleet.failed] == ["fleet-3-fail", "fleet-8-fail"]
+    assert all(result.cleaned_up and result.status == "failed" for result in fleet.failed)
+    assert len(fleet.succeeded) == FLEET_SIZE - 2
+    assert sorted(appliance.deleted) == sorted(result.instance_ids[0] for result in fleet.failed)
+    assert "10/12 fleet instances running, 2 failed" in fleet.summary()
+    morpheus_api_service.close()
+
+
+def test_create_failure_is_reported_without_cleanup(stub_server: MorpheusStubServer):
+    """
+    Test that a rejected create is reported as a failure of its own instance without affecting the rest of the fleet.
+    """
+    appliance = ProvisioningAppliance(ticks_to_finish=0)
+    appliance.register(stub_server)
+    stub_server.add_route(
+        "POST",
+        "/api/instances",
+        lambda request: (
+            StubResponse(status=400, body={"success": False, "msg": "Invalid plan"})
+            if request.json()["instance"]["name"] == "bad"
+            else appliance.create_instance(request)
+        ),
+    )
+    morpheus_api_service = _build_service(stub_server)
+
+    with provision_fleet(
+        morpheus_api_service, [_payload("good"), _payload("bad")], max_wait_time=MAX_WAIT_TIME, sleep_time=SLEEP_TIME
+    ) as fleet:
+        results = fleet.wait()
+
+    assert [result.success for result in results] == [True, False]
+    assert results[1].error.startswith("create failed: Bad Request")
+    assert results[1].instance_ids == [] and not results[1].cleaned_up
+    assert appliance.deleted == []
+    morpheus_api_service.close()
@@ -0,0 +1,135 @@
+import threading
+import time
+
+from pytest import raises
+
+from morpheus_api.settings import APISettings, MorpheusAPIService
+from tests.steps.morpheus.group_snapshot_steps import SnapshotEngine, create_group_snapshot
+from tests.steps.morpheus.snapshot_steps import create_snapshots_of_multiple_instances
+from tests.stubs.morpheus_stub_server import MorpheusStubServer, StubRequest, StubResponse
+from tests.stubs.simulated_appliance import SimulatedAppliance, SimulatedInstance
+
+SLEEP_TIME = 0.05
+
+
+def _appliance(stub_server: MorpheusStubServer, instance_count: int, **kwargs) -> SimulatedAppliance:
+    appliance = SimulatedAppliance(**kwargs)
+    for instance_id in range(1, instance_count + 1):
+        appliance.instances[instance_id] = SimulatedInstance(instance_id, f"vm-{instance_id}")
+    appliance.register(stub_server)
+    return appliance
+
+
+def _build_service(stub_server: MorpheusStubServer) -> MorpheusAPIService:
+    return MorpheusAPIService(APISettings(base_url=stub_server.base_url, api_token="token", max_retries=0))
+
+
+def test_group_snapshot_behind_a_barrier(stub_server: MorpheusStubServer):
+    """
+    Test that the snapshots of a group are requested together and tracked to completion with per-instance latency.
+
+    This function performs the following steps:
+    1. Snapshot 4 instances of a simulated appliance, one of which already has a snapshot, behind a start barrier.
+    2. Verify that every snapshot request was in flight at the same time as the others, and that the requests of
+       the group were sent within a short skew.
+    3. Verify that every instance reports its new snapshots only, complete, with a latency of at least the
+       snapshot time.
+    """
+    appliance = _appliance(stub_server, 4, operation_time=0.2, capacity=8)
+    appliance.instances[2].snapshots.append((99, "complete", 0.0))
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def create_snapshot(request: StubRequest):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.1)
+        with lock:
+            in_flight -= 1
+        return appliance.create_snapshot(request)
+
+    stub_server.add_route("PUT", "/api/instances/{id}/snapshot", create_snapshot)
+    morpheus_api_service = _build_service(stub_server)
+
+    group = create_group_snapshot(morpheus_api_service, [1, 2, 3, 4], sleep_time=SLEEP_TIME)
+    morpheus_api_service.close()
+
+    assert not group.failed, group.summary()
+    assert group.barrier
+    assert max_in_flight == 4
+    assert group.request_skew < 0.1
+    assert group.completion_skew is not None and group.duration >= 0.2
+    for result in group.instances:
+        assert len(result.snapshots) == 1 and result.snapshots[0].status == "complete"
+        assert result.latency >= 0.2
+        assert result.acknowledged_at >= result.requested_at
+    assert [result.requested[0].name for result in group.instances] == [
+        "1-Snapshot-1",
+        "2-Snapshot-2",
+        "3-Snapshot-1",
+        "4-Snapshot-1",
+    ]
+    assert len(group.snapshots) == 4 and 99 not in {snapshot.id for snapshot in group.snapshots}
+
+
+def test_snapshots_of_multiple_instances_wait_for_every_count(stub_server: MorpheusStubServer):
+    """
+    Test that the step waits for the snapshot count of every instance, not the count of the last one.
+    """
+    appliance = _appliance(stub_server, 3, operation_time=0.05, capacity=2)
+    morpheus_api_service = _build_service(stub_server)
+
+    snapshots = create_snapshots_of_multiple_instances(morpheus_api_service, [1, 2, 3], [3, 2, 1])
+    morpheus_api_service.close()
+
+    expected_ids = [
+        snapshot_id for instance_id in (1, 2, 3) for snapshot_id, _, _ in appliance.instances[instance_id].snapshots
+    ]
+    assert [snapshot.id for snapshot in snapshots] == expected_ids
+    assert [len(appliance.instances[instance_id].snapshots) for instance_id in (1, 2, 3)] == [3, 2, 1]
+    assert {snapshot.status for snapshot in snapshots} == {"complete"}
+
+
+def test_failed_instances_do_not_hold_up_the_group(stub_server: MorpheusStubServer):
+    """
+    Test that an instance whose snapshot cannot be requested or does not complete is reported as failed, while the
+    rest of the group completes.
+    """
+    appliance = _appliance(stub_server, 3, operation_time=0.05)
+    morpheus_api_service = _build_service(stub_server)
+    engine = SnapshotEngine(morpheus_api_service, barrier=True, max_wait_time=0.5, sleep_time=SLEEP_TIME)
+
+    original_create = appliance.create_snapshot
+
+    def create_snapshot(request: StubRequest):
+        if request.path_params["id"] == "2":
+            # The snapshot is accepted but never shows up
+            return StubResponse(body={"success": True})
+        return original_create(request)
+
+    stub_server.add_route("PUT", "/api/instances/{id}/snapshot", create_snapshot)
+    group = engine.snapshot([1, 2, 3])
+    morpheus_api_service.close()
+
+    assert [result.instance_id for result in group.succeeded] == [1, 3]
+    [failed] = group.failed
+    assert failed.instance_id == 2 and failed.latency is None
+    assert "0/1 snapshots listed" in failed.error
+    assert "2/3 instances snapshotted behind a start barrier" in group.summary()
+
+
+def test_invalid_groups_are_rejected():
+    """
+    Test that mismatched snapshot counts or a repeated instance fail before any call.
+    """
+    engine = SnapshotEngine(None)
+
+    with raises(ValueError, match="2 snapshot counts for 3 instances"):
+        engine.snapshot([1, 2, 3], [1, 1])
+    with raises(ValueError, match="more than once"):
+        engine.snapshot([1, 2, 1])
+    with raises(ValueError, match="max_in_flight"):
+        SnapshotEngine(None, max_in_flight=0)
@@ -0,0 +1,158 @@
+import logging
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from pytest import fixture, importorskip, mark, raises
+
+from morpheus_api.api_endpoints.instance_service import InstanceService
+from morpheus_api.configuration import http2_transport
+from morpheus_api.configuration.http2_transport import HTTP2Session, create_http2_session
+from morpheus_api.configuration.request_metrics import RequestMetrics
+from morpheus_api.configuration.utils import create_session
+from tests.stubs.morpheus_stub_server import MorpheusStubServer, StubRequest, StubResponse
+from tests.stubs.payloads import instance_list_payload, instance_payload
+
+NUMBER_OF_CHECKS = 64
+ROUNDS = 3
+APPLIANCE_LATENCY = 0.05
+CONNECT_LATENCY = 0.1
+
+logger = logging.getLogger()
+
+
+@fixture
+def h2_stub_server():
+    """
+    Fixture to provide a running HTTP/2 stub server, skipping the test when httpx[http2] is not installed.
+
+    Yields:
+        MorpheusH2StubServer: The started stub server. It is stopped after the test.
+    """
+    importorskip("httpx")
+    h2_stub_server_module = importorskip("tests.stubs.h2_stub_server")
+    with h2_stub_server_module.MorpheusH2StubServer() as server:
+        yield server
+
+
+def _check_statuses(service: InstanceService, instance_ids: list[int]) -> list[str]:
+    with ThreadPoolExecutor(max_workers=len(instance_ids)) as executor:
+        return [view.status for view in executor.map(service.get_instance_status, instance_ids)]
+
+
+def test_concurrent_requests_share_one_connection(h2_stub_server):
+    """
+    Test that concurrent calls are multiplexed as streams of one HTTP/2 connection and bodies are sent intact.
+    """
+    h2_stub_server.add_route("GET", "/api/instances/{id}", _instance_route)
+    h2_stub_server.add_route("PUT", "/api/instances/{id}/stop", {"success": True})
+    session = HTTP2Session(http1=False)
+    metrics = RequestMetrics()
+    service = InstanceService(
+        base_url=h2_stub_server.base_url, api_token="token", session=session, request_metrics=metrics
+    )
+
+    assert _check_statuses(service, list(range(1, 17))) == ["running"] * 16
+    assert service.stop_instance(3, data={"muteMonitoring": True}).success is True
+    service.close()
+
+    stop_request = h2_stub_server.requests[-1]
+    assert stop_request.json() == {"muteMonitoring": True}
+    assert stop_request.headers["authorization"] == "Bearer token"
+    assert h2_stub_server.connection_count == 1
+    assert session.http_versions == {"HTTP/2": 17}
+    assert metrics.to_dict()["PUT /api/instances/{id}/stop"]["bytes_out"] == len(stop_request.body)
+
+
+def test_falls_back_to_pooled_http1(stub_server: MorpheusStubServer):
+    """
+    Test that against an HTTP/1.1 appliance the session negotiates HTTP/1.1, including the streamed lists.
+    """
+    importorskip("httpx")
+    stub_server.add_route(
+        "GET",
+        "/api/instances",
+        lambda request: StubResponse(
+            body=instance_list_payload(int(request.query["max"][0]) // 2, offset=int(request.query["offset"][0]))
+        ),
+    )
+    session = HTTP2Session()
+    service = InstanceService(base_url=stub_server.base_url, api_token="token", session=session)
+
+    instances = list(service.stream_instances(page_size=10))
+    service.close()
+
+    assert len(instances) == 5
+    assert session.http_versions == {"HTTP/1.1": 1}
+
+
+def test_transport_errors_are_raised_as_requests_errors():
+    """
+    Test that connection failures surface as the requests exceptions the retry policy knows about.
+    """
+    importorskip("httpx")
+    with socket.socket() as unused:
+        unused.bind(("127.0.0.1", 0))
+        port = unused.getsockname()[1]
+    session = HTTP2Session()
+
+    with raises(requests.exceptions.ConnectionError):
+        session.request("GET", f"http://127.0.0.1:{port}/api/instances")
+    session.close()
+
+
+def test_missing_dependency_falls_back_to_requests(monkeypatch):
+    """
+    Test that the HTTP/2 factory returns the pooled requests session when httpx[http2] is not installed.
+    """
+    monkeypatch.setattr(http2_transport, "httpx", None)
+
+    session = create_http2_session(pool_maxsize=5)
+
+    assert isinstance(session, requests.Session)
+    assert session.get_adapter("https://morpheus8")._pool_maxsize == 5
+    with raises(RuntimeError, match="httpx"):
+        HTTP2Session()
+
+
+@mark.benchmark
+def test_http2_against_pooled_http1_benchmark():
+    """
+    Benchmark fleet-wide status checks over pooled HTTP/1.1 connections against one multiplexed HTTP/2 connection.
+
+    This function performs the following steps:
+    1. Serve the instances from stubs taking CONNECT_LATENCY seconds to set up a connection, as a proxy CONNECT and
+       a TLS handshake would, and APPLIANCE_LATENCY seconds to answer.
+    2. Run ROUNDS rounds of NUMBER_OF_CHECKS concurrent status checks with each transport.
+    3. Log the time and connections of both and verify that HTTP/2 needed a single connection.
+    """
+    importorskip("httpx")
+    h2_stub_server_module = importorskip("tests.stubs.h2_stub_server")
+    instance_ids = list(range(1, NUMBER_OF_CHECKS + 1))
+    results = {}
+    for name, server_class, session in (
+        ("HTTP/1.1", MorpheusStubServer, create_session()),
+        ("HTTP/2", h2_stub_server_module.MorpheusH2StubServer, HTTP2Session(http1=False)),
+    ):
+        with server_class(latency=APPLIANCE_LATENCY, connect_latency=CONNECT_LATENCY) as server:
+            server.add_route("GET", "/api/instances/{id}", _instance_route)
+            service = InstanceService(base_url=server.base_url, api_token="token", session=session)
+            start = time.perf_counter()
+            for _ in range(ROUNDS):
+                assert _check_statuses(service, instance_ids) == ["running"] * NUMBER_OF_CHECKS
+            results[name] = (time.perf_counter() - start, server.connection_count)
+            service.close()
+
+    logger.info(
+        f"{ROUNDS} x {NUMBER_OF_CHECKS} concurrent status checks: "
+        + ", ".join(
+            f"{name} {elapsed:.2f}s over {connections} connections" for name, (elapsed, connections) in results.items()
+        )
+    )
+    assert results["HTTP/2"][1] == 1
+    assert results["HTTP/2"][0] < results["HTTP/1.1"][0]
+
+
+def _instance_route(request: StubRequest) -> StubResponse:
+    return StubResponse(body={"instance": instance_payload(int(request.path_params["id"]))})
@@ -0,0 +1,153 @@
+from lib.common.enums.process_status import ProcessStatus
+from lib.common.enums.process_type import ProcessType
+from morpheus_api.api_endpoints.instance_service import InstanceService
+from morpheus_api.helpers.instance_history import InstanceHistoryCursor, history_record_matches
+from morpheus_api.settings import APISettings, MorpheusAPIService
+from tests.steps.morpheus.instance_steps import wait_for_instance_history_process_status_update
+from tests.stubs.morpheus_stub_server import MorpheusStubServer, StubRequest, StubResponse
+from tests.stubs.payloads import event_payload, process_payload
+
+INSTANCE_ID = 42
+
+
+class InstanceHistory:
+    """
+    The process history of one instance, served newest first and paged by max and offset like the appliance does.
+    """
+
+    def __init__(self, processes: list[dict]):
+        self.processes = processes
+
+    def register(self, stub_server: MorpheusStubServer):
+        stub_server.add_route("GET", "/api/instances/{id}/history", self.history)
+
+    def history(self, request: StubRequest) -> StubResponse:
+        max = int(request.query["max"][0])
+        offset = int(request.query["offset"][0])
+        end = offset + max
+        page = self.processes[offset:end]
+        meta = {"offset": offset, "max": max, "size": len(page), "total": len(self.processes)}
+        return StubResponse(body={"processes": page, "meta": meta})
+
+
+def _describe(records: list) -> list[tuple[str, int, str]]:
+    return [(type(record).__name__, record.id, record.status) for record in records]
+
+
+def test_only_new_or_changed_records_are_yielded(stub_server: MorpheusStubServer):
+    """
+    Test that the tail yields the whole history once, then only the processes and events added or updated since.
+    """
+    history = InstanceHistory(
+        [
+            process_payload(2, INSTANCE_ID, events=[event_payload(20, 2, INSTANCE_ID)]),
+            process_payload(1, INSTANCE_ID, "provision", "complete"),
+        ]
+    )
+    history.register(stub_server)
+    service = InstanceService(base_url=stub_server.base_url, api_token="token")
+
+    first = list(service.tail_instance_history(INSTANCE_ID))
+    history.processes = [
+        process_payload(3, INSTANCE_ID, "postProvision", last_updated="2024-01-01T00:02:00Z"),
+        process_payload(
+            2,
+            INSTANCE_ID,
+            status="complete",
+            last_updated="2024-01-01T00:01:00Z",
+            events=[
+                event_payload(20, 2, INSTANCE_ID),
+                event_payload(21, 2, INSTANCE_ID, "finalize", "complete", "2024-01-01T00:01:00Z"),
+            ],
+        ),
+        *history.processes[1:],
+    ]
+    second = list(service.tail_instance_history(INSTANCE_ID))
+    stub_server.reset_counters()
+    third = list(service.tail_instance_history(INSTANCE_ID))
+    service.close()
+
+    assert _describe(first) == [("Process", 1, "complete"), ("Process", 2, "running"), ("Event", 20, "running")]
+    assert _describe(second) == [("Process", 2, "complete"), ("Event", 21, "complete"), ("Process", 3, "running")]
+    assert third == []
+    assert stub_server.request_count == 1
+    assert service.history_cursors[INSTANCE_ID].last_updated == "2024-01-01T00:02:00Z"
+
+
+def test_paging_stops_at_the_first_unchanged_page(stub_server: MorpheusStubServer):
+    """
+    Test that a long history is read page by page once, and later polls stop after the first page without changes.
+    """
+    history = InstanceHistory([process_payload(process_id, INSTANCE_ID) for process_id in range(7, 0, -1)])
+    history.register(stub_server)
+    service = InstanceService(base_url=stub_server.base_url, api_token="token")
+    cursor = InstanceHistoryCursor(INSTANCE_ID)
+
+    first = [record.id for record in service.tail_instance_history(INSTANCE_ID, cursor, page_size=3)]
+    history.processes[0] = process_payload(7, INSTANCE_ID, status="complete", last_updated="2024-01-01T00:05:00Z")
+    stub_server.reset_counters()
+    records = list(service.tail_instance_history(INSTANCE_ID, cursor, page_size=3))
+    service.close()
+
+    assert first == [5, 6, 7, 2, 3, 4, 1]
+    assert _describe(records) == [("Process", 7, "complete")]
+    assert stub_server.request_count == 2
+    assert INSTANCE_ID not in service.history_cursors
+
+
+def test_waiters_match_processes_behind_newer_ones(stub_server: MorpheusStubServer):
+    """
+    Test that a process reaching its status is matched even when a newer process already sits on top of the history.
+    """
+    history = InstanceHistory([process_payload(1, INSTANCE_ID, "startup")])
+    history.register(stub_server)
+    service = InstanceService(base_url=stub_server.base_url, api_token="token")
+
+    assert not any(
+        history_record_matches(record, "startup", "complete") for record in service.tail_instance_history(INSTANCE_ID)
+    )
+    history.processes = [
+        process_payload(2, INSTANCE_ID, "postProvision", last_updated="2024-01-01T00:02:00Z"),
+        process_payload(1, INSTANCE_ID, "startup", "complete", last_updated="2024-01-01T00:01:00Z"),
+    ]
+    matches = [
+        record
+        for record in service.tail_instance_history(INSTANCE_ID)
+        if history_record_matches(record, "startup", "complete")
+    ]
+    service.close()
+
+    assert _describe(matches) == [("Process", 1, "complete")]
+
+
+def test_wait_ignores_processes_completed_before_the_call(stub_server: MorpheusStubServer):
+    """
+    Test that the history wait does not return on an older completed process or on a completed event, and returns
+    once the newest process at call time completes.
+    """
+    running = process_payload(
+        5, INSTANCE_ID, "startup", events=[event_payload(50, 5, INSTANCE_ID, "startup", "complete")]
+    )
+    history = InstanceHistory([running, process_payload(1, INSTANCE_ID, "startup", "complete")])
+    history.register(stub_server)
+    morpheus_api_service = MorpheusAPIService(APISettings(base_url=stub_server.base_url, api_token="token"))
+
+    def complete_after_two_polls(request: StubRequest) -> StubResponse:
+        if stub_server.request_count > 2:
+            history.processes[0] = process_payload(
+                5, INSTANCE_ID, "startup", "complete", last_updated="2024-01-01T00:01:00Z"
+            )
+        return history.history(request)
+
+    stub_server.add_route("GET", "/api/instances/{id}/history", complete_after_two_polls)
+    wait_for_instance_history_process_status_update(
+        morpheus_api_service,
+        INSTANCE_ID,
+        status=ProcessStatus.COMPLETE,
+        process_type=ProcessType.STARTUP,
+        max_wait_time=10,
+        sleep_time=1,
+    )
+    morpheus_api_service.close()
+
+    assert stub_server.request_count == 3
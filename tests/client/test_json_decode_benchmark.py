@@ -0,0 +1,78 @@
+import json
+import logging
+import timeit
+
+from pytest import mark
+
+from morpheus_api.configuration.utils import decode_response
+from morpheus_api.dataclasses.instance import InstanceList
+from morpheus_api.dataclasses.server import ServerList
+from morpheus_api.dataclasses.snapshot import SnapshotsList
+from morpheus_api.dataclasses.virtual_image import VirtualImageList
+from tests.stubs.payloads import (
+    instance_list_payload,
+    server_payload,
+    snapshot_payload,
+    virtual_image_payload,
+)
+
+NUMBER_OF_ITEMS = 500
+NUMBER_OF_DECODES = 10
+NUMBER_OF_ROUNDS = 5
+
+logger = logging.getLogger()
+
+# Response bodies of the list endpoints polled the most, at the size of a large tenant
+PAYLOADS = {
+    "instances": (InstanceList, instance_list_payload(NUMBER_OF_ITEMS)),
+    "servers": (ServerList, {"servers": [server_payload(i + 1) for i in range(NUMBER_OF_ITEMS)]}),
+    "snapshots": (SnapshotsList, {"snapshots": [snapshot_payload(i + 1) for i in range(NUMBER_OF_ITEMS)]}),
+    "virtual_images": (
+        VirtualImageList,
+        {
+            "virtualImages": [virtual_image_payload(i + 1) for i in range(NUMBER_OF_ITEMS)],
+            "meta": {"offset": 0, "max": NUMBER_OF_ITEMS, "size": NUMBER_OF_ITEMS, "total": NUMBER_OF_ITEMS},
+        },
+    ),
+}
+
+
+def _best_time(decode) -> float:
+    return min(timeit.repeat(decode, number=NUMBER_OF_DECODES, repeat=NUMBER_OF_ROUNDS)) / NUMBER_OF_DECODES
+
+
+@mark.parametrize("payload_name", PAYLOADS)
+def test_fast_path_matches_kwargs_path(payload_name: str):
+    """
+    Test that decoding the raw bytes builds the same model as Model(**response.json()).
+    """
+    model, body = PAYLOADS[payload_name]
+    content = json.dumps(body).encode()
+    assert decode_response(content, model) == model(**json.loads(content))
+
+
+@mark.benchmark
+def test_json_decode_fast_path():
+    """
+    Benchmark decoding list payloads with Model(**json.loads()) against decode_response().
+
+    This function performs the following steps:
+    1. Encode every payload of PAYLOADS as the raw bytes of a response body.
+    2. Time the best of NUMBER_OF_ROUNDS rounds of both decode paths for every payload.
+    3. Verify that the fast path takes less time over all payloads.
+    """
+    total_kwargs = 0.0
+    total_fast_path = 0.0
+    for payload_name, (model, body) in PAYLOADS.items():
+        content = json.dumps(body).encode()
+        kwargs_time = _best_time(lambda: model(**json.loads(content)))
+        fast_path_time = _best_time(lambda: decode_response(content, model))
+        total_kwargs += kwargs_time
+        total_fast_path += fast_path_time
+        logger.info(
+            f"{payload_name} ({len(content) / 1024:.0f} KiB): Model(**json()) {kwargs_time * 1000:.2f} ms, "
+            f"decode_response {fast_path_time * 1000:.2f} ms ({kwargs_time / fast_path_time:.2f}x)"
+        )
+
+    logger.info(f"All payloads: {total_kwargs / total_fast_path:.2f}x faster with decode_response")
+    assert total_fast_path < total_kwargs
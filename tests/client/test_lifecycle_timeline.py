@@ -0,0 +1,127 @@
+import json
+
+from pytest import raises
+
+from morpheus_api.settings import APISettings, MorpheusAPIService
+from tests.steps.morpheus.lifecycle_timeline import (
+    TOTAL_PHASE,
+    LifecycleTimeline,
+    PhaseSpan,
+    compare_timeline_reports,
+    timeline_operation,
+)
+from tests.stubs.morpheus_stub_server import MorpheusStubServer
+from tests.stubs.payloads import event_payload, process_payload
+
+INSTANCE_ID = 42
+
+
+def _finished_event(event_id: int, phase: str, seconds: int, status: str = "complete") -> dict:
+    return {
+        **event_payload(event_id, 1, INSTANCE_ID, phase, status),
+        "startDate": "2024-01-01T00:00:00Z",
+        "endDate": f"2024-01-01T00:00:{seconds:02d}Z",
+        "duration": seconds * 1000,
+    }
+
+
+def _serve_history(stub_server: MorpheusStubServer, events: list[dict]):
+    process = process_payload(1, INSTANCE_ID, "provision", "complete", events=events)
+    meta = {"offset": 0, "max": 100, "size": 1, "total": 1}
+    stub_server.add_route("GET", "/api/instances/{id}/history", {"processes": [process], "meta": meta})
+
+
+def test_steps_record_their_span_and_the_history_phases(stub_server: MorpheusStubServer):
+    """
+    Test that a decorated step records its total span, then one span per finished history event, each event once.
+    """
+    timeline = LifecycleTimeline()
+    running = event_payload(12, 1, INSTANCE_ID, "startup", "running")
+    _serve_history(stub_server, [_finished_event(10, "provisionImage", 30), _finished_event(11, "agentInstall", 5)])
+    morpheus_api_service = MorpheusAPIService(APISettings(base_url=stub_server.base_url, api_token="token"))
+
+    @timeline_operation("create_instance", instance_id=lambda arguments, result: result[1], timeline=timeline)
+    def create(morpheus_api_service: MorpheusAPIService, name: str) -> tuple[bool, int]:
+        return True, INSTANCE_ID
+
+    @timeline_operation("reconfigure_instance", timeline=timeline)
+    def reconfigure(morpheus_api_service: MorpheusAPIService, instance_id: int) -> tuple[bool, None]:
+        return False, None
+
+    assert create(morpheus_api_service, "web") == (True, INSTANCE_ID)
+    _serve_history(
+        stub_server,
+        [_finished_event(10, "provisionImage", 30), _finished_event(11, "agentInstall", 5), running],
+    )
+    reconfigure(morpheus_api_service, instance_id=INSTANCE_ID)
+    morpheus_api_service.close()
+
+    spans = [(span.operation, span.phase, span.duration, span.failed) for span in timeline.spans(INSTANCE_ID)]
+    assert sorted(spans[:2]) == [
+        ("create_instance", "agentInstall", 5.0, False),
+        ("create_instance", "provisionImage", 30.0, False),
+    ]
+    assert [(operation, phase, failed) for operation, phase, _, failed in spans[2:]] == [
+        ("create_instance", TOTAL_PHASE, False),
+        ("reconfigure_instance", TOTAL_PHASE, True),
+    ]
+    operations = timeline.to_dict()["operations"]
+    assert operations["create_instance"]["provisionImage"]["p50"] == 30.0
+    assert operations["reconfigure_instance"][TOTAL_PHASE]["failures"] == 1
+    assert set(operations["create_instance"][TOTAL_PHASE]) >= {"count", "p50", "p95", "p99"}
+
+
+def test_existing_history_is_not_credited_to_the_first_operation(stub_server: MorpheusStubServer):
+    """
+    Test that the events an instance finished before the first decorated step are left out of its phases.
+    """
+    timeline = LifecycleTimeline()
+    earlier_events = [_finished_event(10, "provisionImage", 30), _finished_event(11, "agentInstall", 5)]
+    _serve_history(stub_server, earlier_events)
+    morpheus_api_service = MorpheusAPIService(APISettings(base_url=stub_server.base_url, api_token="token"))
+
+    @timeline_operation("revert_to_snapshot", timeline=timeline)
+    def revert(morpheus_api_service: MorpheusAPIService, instance_id: int) -> bool:
+        _serve_history(stub_server, [*earlier_events, _finished_event(12, "startup", 8)])
+        return True
+
+    assert revert(morpheus_api_service, instance_id=INSTANCE_ID)
+    morpheus_api_service.close()
+
+    spans = [(span.operation, span.phase) for span in timeline.spans(INSTANCE_ID)]
+    assert sorted(spans) == [("revert_to_snapshot", "startup"), ("revert_to_snapshot", TOTAL_PHASE)]
+
+
+def test_raising_steps_are_recorded_as_failed():
+    """
+    Test that a step raising is recorded as a failed span and the error reaches the caller.
+    """
+    timeline = LifecycleTimeline()
+
+    @timeline_operation("backup", timeline=timeline)
+    def wait_for_backup(morpheus_api_service, instance_id: int):
+        assert False, "Max wait time exceeded"
+
+    with raises(AssertionError):
+        wait_for_backup(None, INSTANCE_ID)
+
+    [span] = timeline.spans()
+    assert (span.operation, span.instance_id, span.failed) == ("backup", INSTANCE_ID, True)
+
+
+def test_reports_are_compared_across_builds(tmp_path):
+    """
+    Test that the dumped reports carry their build and that two reports compare percentile by percentile.
+    """
+    reports = []
+    for build, seconds in (("8.0.1", 10.0), ("8.0.2", 15.0)):
+        timeline = LifecycleTimeline()
+        timeline.record(PhaseSpan("revert_to_snapshot", TOTAL_PHASE, INSTANCE_ID, start=0.0, end=seconds))
+        with open(timeline.dump(str(tmp_path), name=f"timeline_{build}", build=build)) as report_file:
+            reports.append(json.load(report_file))
+
+    assert [report["build"] for report in reports] == ["8.0.1", "8.0.2"]
+    assert reports[0]["instances"][str(INSTANCE_ID)][0]["operation"] == "revert_to_snapshot"
+    ratios = compare_timeline_reports(*reports)[f"revert_to_snapshot/{TOTAL_PHASE}"]
+    assert set(ratios) == {"p50", "p95", "p99"}
+    assert all(1.45 < ratio < 1.55 for ratio in ratios.values())
@@ -0,0 +1,67 @@
+from pytest import mark
+
+from lib.common.enums.service_plan_name import ServicePlanName
+from morpheus_api.api_endpoints.instance_service import InstanceService
+from morpheus_api.api_endpoints.server_service import ServerService
+from morpheus_api.api_endpoints.service_plan_service import ServicePlanService
+from morpheus_api.dataclasses.query import ListQuery, ServerQuery, VirtualImageQuery, list_endpoint
+from tests.stubs.morpheus_stub_server import MorpheusStubServer
+from tests.stubs.payloads import instance_list_payload, server_payload
+
+
+@mark.parametrize(
+    "query, query_string",
+    [
+        (ListQuery(name="web 01 & co", max=1), "max=1&name=web+01+%26+co"),
+        (ListQuery(ids=[3, 1, 2], max=3), "max=3&id=3&id=1&id=2"),
+        (ListQuery(phrase="", name=None, sort="name", direction="asc"), "sort=name&direction=asc"),
+        (
+            ListQuery(details=False, extra={"hideInactive": True, "showDeleted": None}),
+            "details=false&hideInactive=true",
+        ),
+        (ServerQuery(cluster_id=4, zone_id=2), "clusterId=4&zoneId=2"),
+        (VirtualImageQuery(name="ubuntu", filter_type="User"), "name=ubuntu&filterType=User"),
+        (ListQuery(name=ServicePlanName.CPU_1_MEMORY_1_GB), "name=1+CPU%2C+1GB+Memory"),
+    ],
+)
+def test_queries_are_encoded(query: ListQuery, query_string: str):
+    """
+    Test that empty parameters are dropped, lists repeated, booleans lowercased and every value URL encoded.
+    """
+    assert query.to_query_string() == query_string
+
+
+def test_list_endpoint_applies_the_page():
+    """
+    Test that the page overrides the paging of a typed query and is prepended to a raw query string.
+    """
+    assert list_endpoint("/api/instances") == "/api/instances"
+    assert list_endpoint("/api/instances", ListQuery(max=5, status="running"), offset=10) == (
+        "/api/instances?max=5&offset=10&status=running"
+    )
+    assert list_endpoint("/api/instances", "name=web", max=1, offset=0) == "/api/instances?max=1&offset=0&name=web"
+
+
+def test_services_send_the_typed_queries(stub_server: MorpheusStubServer):
+    """
+    Test that the list endpoints send the typed queries as decoded by the appliance.
+    """
+    stub_server.add_route("GET", "/api/instances", instance_list_payload(1))
+
+    meta = {"offset": 0, "max": 1, "size": 1, "total": 1}
+    stub_server.add_route("GET", "/api/servers", {"servers": [server_payload(5)], "meta": meta})
+    stub_server.add_route("GET", "/api/service-plans", {"servicePlans": [], "meta": {**meta, "size": 0, "total": 0}})
+    instance_service = InstanceService(base_url=stub_server.base_url, api_token="token")
+    server_service = ServerService(base_url=stub_server.base_url, api_token="token")
+    service_plan_service = ServicePlanService(base_url=stub_server.base_url, api_token="token")
+
+    instance_service.list_instances(max_results=1, filter=ListQuery(name="web & db"))
+    list(server_service.iter_servers(query_params=ServerQuery(cluster_id=4), page_size=1))
+    service_plan_service.list_service_plans()
+
+    instance_query, server_query, service_plan_query = (request.query for request in stub_server.requests)
+    assert instance_query == {"max": ["1"], "offset": ["0"], "name": ["web & db"]}
+    assert server_query == {"max": ["1"], "offset": ["0"], "clusterId": ["4"]}
+    assert service_plan_query["name"] == [ServicePlanName.CPU_1_MEMORY_1_GB.value]
+    for service in (instance_service, server_service, service_plan_service):
+        service.close()
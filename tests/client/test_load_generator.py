@@ -0,0 +1,162 @@
+import json
+
+from pytest import raises
+
+from morpheus_api.settings import APISettings, MorpheusAPIService
+from tests.steps.morpheus.instance_steps import template_instance_payload
+from tests.steps.morpheus.load_generator import (
+    COMPLETED,
+    REJECTED,
+    LoadGenerator,
+    LoadOperation,
+    LoadReport,
+    find_throughput_knee,
+)
+from tests.stubs.morpheus_stub_server import MorpheusStubServer
+from tests.stubs.payloads import backup_payload, backup_result_payload, snapshot_payload
+from tests.stubs.simulated_appliance import SimulatedAppliance
+
+CREATE_ARGUMENTS = {
+    "template_id": 1,
+    "storage_volume_type_id": 1,
+    "datastore_id": None,
+    "network_id": "1",
+    "layout_id": 1,
+    "layout_code": "simulated-layout",
+    "plan_id": 152,
+    "plan_code": "kvm-vm-1024",
+    "zone_id": 1,
+}
+
+
+def _instance_payload(name: str):
+    return template_instance_payload(instance_name=name, **CREATE_ARGUMENTS)
+
+
+def _report(rate_per_minute: float, completed: int, arrivals: int, queueing_delay: float = 0.0) -> LoadReport:
+    operations = []
+    for index in range(arrivals):
+        operation = LoadOperation("create", arrival=index * 60 / rate_per_minute)
+        operation.started = operation.arrival + queueing_delay
+        operation.finished = operation.started + 1.0
+        operation.outcome = COMPLETED if index < completed else "failed"
+        operations.append(operation)
+    return LoadReport(rate_per_minute, "constant", duration=60, makespan=60, window=10, operations=operations)
+
+
+def test_open_loop_load_reports_every_arrival(stub_server: MorpheusStubServer, tmp_path):
+    """
+    Test that the arrivals are offered on schedule, run on the live set, and are reported per window.
+
+    This function performs the following steps:
+    1. Offer creates, snapshots, backups and deletes at 600/min for 3 seconds to a simulated appliance running
+       2 operations at once, through 4 client slots.
+    2. Dump the report and read it back.
+    3. Verify that every arrival has an outcome, the windows add up to the totals, the live set bound held, the
+       arrivals queued for a client slot, and no instance was left behind.
+    """
+    appliance = SimulatedAppliance(operation_time=0.05, capacity=2, seed=1)
+    appliance.register(stub_server)
+    morpheus_api_service = MorpheusAPIService(
+        APISettings(base_url=stub_server.base_url, api_token="token", max_retries=0, pool_maxsize=4)
+    )
+    generator = LoadGenerator(
+        morpheus_api_service,
+        _instance_payload,
+        rate_per_minute=600,
+        duration=3,
+        operation_mix={"create": 2.0, "snapshot": 1.0, "backup": 1.0, "delete": 1.0},
+        max_live_instances=3,
+        max_in_flight=4,
+        window=1,
+        poll_interval=0.05,
+        seed=7,
+    )
+
+    report = generator.run()
+    with open(report.dump(str(tmp_path), name="load", target="simulated")) as report_file:
+        dumped = json.load(report_file)
+    morpheus_api_service.close()
+
+    summary = dumped["summary"]
+    assert dumped["target"] == "simulated"
+    assert summary["arrivals"] == len(report.operations) > 0
+    assert summary["completed"] + summary["failed"] + summary["rejected"] == summary["arrivals"]
+    assert summary["completed"] > 0 and summary["failed"] == 0
+    assert set(summary["operations"]) <= {"create", "snapshot", "backup", "delete"}
+    assert summary["operations"]["create"]["completed"] > 0
+    assert 0 < summary["peak_live_instances"] <= 3
+    assert summary["queueing_delay"]["max"] > 0
+    assert sum(window["arrivals"] for window in dumped["windows"]) == summary["arrivals"]
+    assert sum(window["completed"] for window in dumped["windows"]) == summary["completed"]
+    assert dumped["windows"][0]["start"] == 0 and dumped["windows"][1]["start"] == 1
+    for operation in report.operations:
+        assert operation.outcome == REJECTED or operation.queueing_delay >= 0
+        assert operation.outcome != COMPLETED or operation.completion_latency > 0
+    assert all(instance.removed for instance in appliance.instances.values())
+
+
+def test_arrival_schedules():
+    """
+    Test that constant arrivals are evenly spaced and Poisson arrivals average the offered rate.
+    """
+    constant = LoadGenerator(None, _instance_payload, rate_per_minute=120, duration=5, arrival_process="constant")
+    poisson = LoadGenerator(None, _instance_payload, rate_per_minute=600, duration=600, seed=5)
+
+    assert [arrival for arrival, _ in constant.arrivals()] == [0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5]
+    schedule = poisson.arrivals()
+    assert 5400 < len(schedule) < 6600
+    assert {operation for _, operation in schedule} == {"create", "snapshot", "backup", "delete"}
+
+
+def test_throughput_knee_is_the_last_rate_kept_up_with():
+    """
+    Test that the knee is the highest rate before the first one falling behind, on throughput or queueing delay.
+    """
+    reports = [_report(60, 60, 60), _report(240, 200, 240), _report(120, 118, 120, queueing_delay=5.0)]
+
+    assert find_throughput_knee(reports) == 120
+    assert find_throughput_knee(reports, max_queueing_delay=1.0) == 60
+    assert find_throughput_knee([_report(60, 10, 60)]) is None
+
+
+def test_status_fetchers_read_the_newest_snapshot_and_backup_execution(stub_server: MorpheusStubServer):
+    """
+    Test that the load waits read the newest snapshot and backup execution, whatever the earlier ones and the order.
+
+    This function performs the following steps:
+    1. List a failed snapshot before a complete one, and a backup without executions before one with an execution.
+    2. Fetch the statuses once both requested snapshots and the requested execution are listed.
+    3. Verify that the newest snapshot and execution are reported.
+    """
+    stub_server.add_route(
+        "GET", "/api/instances/{id}/snapshots", {"snapshots": [snapshot_payload(1, "failed"), snapshot_payload(2)]}
+    )
+    stub_server.add_route(
+        "GET",
+        "/api/instances/{id}/backups",
+        {
+            "instance": {"id": 1},
+            "backups": [backup_payload(1, 1), backup_payload(2, 1, [backup_result_payload(5, 1, "inProgress")])],
+        },
+    )
+    morpheus_api_service = MorpheusAPIService(APISettings(base_url=stub_server.base_url, api_token="token"))
+    generator = LoadGenerator(morpheus_api_service, _instance_payload, rate_per_minute=60, duration=1)
+    generator._expected_snapshots[1] = 2
+    generator._expected_backups[1] = 1
+
+    assert generator._fetch_snapshot_statuses([1]) == {1: "complete"}
+    assert generator._fetch_backup_statuses([1]) == {1: "inprogress"}
+    morpheus_api_service.close()
+
+
+def test_invalid_load_is_rejected():
+    """
+    Test that an unknown arrival process or operation, or a non-positive rate, fails before any call.
+    """
+    with raises(ValueError, match="bursty"):
+        LoadGenerator(None, _instance_payload, rate_per_minute=60, duration=1, arrival_process="bursty")
+    with raises(ValueError, match="restore"):
+        LoadGenerator(None, _instance_payload, rate_per_minute=60, duration=1, operation_mix={"restore": 1.0})
+    with raises(ValueError, match="positive"):
+        LoadGenerator(None, _instance_payload, rate_per_minute=0, duration=1)
@@ -0,0 +1,68 @@
+import time
+
+from pytest import raises
+
+from morpheus_api.helpers.lookup_graph import LookupGraph
+
+LOOKUP_LATENCY = 0.1
+
+
+def _slow(value):
+    def lookup(**dependencies):
+        time.sleep(LOOKUP_LATENCY)
+        return value
+
+    return lookup
+
+
+def test_independent_lookups_run_in_parallel():
+    """
+    Test that the graph latency is its critical path rather than the sum of its lookups.
+
+    This function performs the following steps:
+    1. Build the get_required_data shape: seven independent lookups, network after zone and provision type,
+       layout after instance type.
+    2. Run the graph with lookups taking LOOKUP_LATENCY seconds each.
+    3. Verify the results, that the run took about two lookups instead of nine, and the reported critical path.
+    """
+    graph = LookupGraph()
+    for name in ("storage_bucket", "storage_volume_type", "cluster", "provision_type", "zone", "instance_type"):
+        graph.add(name, _slow({"id": name}))
+    graph.add(
+        "network",
+        lambda zone, provision_type: (time.sleep(LOOKUP_LATENCY * 1.5), {"id": (zone["id"], provision_type["id"])})[1],
+        depends_on=["zone", "provision_type"],
+    )
+    graph.add("layout", lambda instance_type: {"id": instance_type["id"]}, depends_on=["instance_type"])
+    graph.add("service_plan", _slow({"id": "service_plan"}))
+
+    start = time.perf_counter()
+    results = graph.run()
+    elapsed = time.perf_counter() - start
+
+    assert results["network"] == {"id": ("zone", "provision_type")}
+    assert results["layout"] == {"id": "instance_type"}
+    assert elapsed < LOOKUP_LATENCY * 4
+    assert graph.critical_path[-1] == "network"
+    assert graph.critical_path[0] in ("zone", "provision_type")
+    assert set(graph.timings) == set(results)
+
+
+def test_failed_lookup_skips_dependents():
+    """
+    Test that a failing lookup raises its error and its dependents never run.
+    """
+    calls = []
+
+    def failing_zone():
+        raise RuntimeError("zone lookup failed")
+
+    graph = LookupGraph()
+    graph.add("zone", failing_zone)
+    graph.add("network", lambda zone: calls.append("network"), depends_on=["zone"])
+    with raises(RuntimeError, match="zone lookup failed"):
+        graph.run()
+    assert calls == []
+
+    with raises(ValueError):
+        graph.add("layout", lambda instance_type: None, depends_on=["instance_type"])
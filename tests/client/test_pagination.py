@@ -0,0 +1,74 @@
+from morpheus_api.api_endpoints.instance_service import InstanceService
+from morpheus_api.api_endpoints.server_service import ServerService
+from morpheus_api.configuration.utils import create_session
+from tests.stubs.morpheus_stub_server import MorpheusStubServer, StubRequest, StubResponse
+from tests.stubs.payloads import instance_list_payload, server_payload
+
+TOTAL_ITEMS = 250
+PAGE_SIZE = 100
+
+
+def _page_bounds(request: StubRequest) -> tuple[int, int]:
+    page_size = int(request.query["max"][0])
+    offset = int(request.query["offset"][0])
+    return offset, max(0, min(page_size, TOTAL_ITEMS - offset))
+
+
+def _paged_instances(request: StubRequest) -> StubResponse:
+    offset, count = _page_bounds(request)
+    return StubResponse(body=instance_list_payload(count, offset=offset, total=TOTAL_ITEMS))
+
+
+def _paged_servers_without_meta(request: StubRequest) -> StubResponse:
+    offset, count = _page_bounds(request)
+    return StubResponse(body={"servers": [server_payload(offset + i + 1) for i in range(count)]})
+
+
+def test_iter_instances_follows_meta(stub_server: MorpheusStubServer):
+    """
+    Test that iter_instances walks every page using the `meta` offsets, with and without prefetching.
+
+    This function performs the following steps:
+    1. Serve TOTAL_ITEMS instances in pages of at most `max` items.
+    2. Iterate all instances with and without prefetch.
+    3. Verify that every instance is yielded once, in order, using ceil(TOTAL_ITEMS / PAGE_SIZE) requests.
+    """
+    stub_server.add_route("GET", "/api/instances", _paged_instances)
+    instance_service = InstanceService(base_url=stub_server.base_url, api_token="token", session=create_session())
+
+    for prefetch in (False, True):
+        stub_server.reset_counters()
+        instance_ids = [
+            instance.id for instance in instance_service.iter_instances(page_size=PAGE_SIZE, prefetch=prefetch)
+        ]
+        assert instance_ids == list(range(1, TOTAL_ITEMS + 1))
+        assert stub_server.request_count == 3
+
+    instance_service.close()
+
+
+def test_iter_instances_is_lazy(stub_server: MorpheusStubServer):
+    """
+    Test that iter_instances only fetches the pages that are consumed.
+    """
+    stub_server.add_route("GET", "/api/instances", _paged_instances)
+    instance_service = InstanceService(base_url=stub_server.base_url, api_token="token", session=create_session())
+
+    first_instance = next(instance_service.iter_instances(page_size=PAGE_SIZE))
+    assert first_instance.id == 1
+    assert stub_server.request_count == 1
+    instance_service.close()
+
+
+def test_iter_servers_stops_on_short_page(stub_server: MorpheusStubServer):
+    """
+    Test that iter_servers stops at the first short page when the response carries no `meta`.
+    """
+    stub_server.add_route("GET", "/api/servers", _paged_servers_without_meta)
+    server_service = ServerService(base_url=stub_server.base_url, api_token="token", session=create_session())
+
+    server_ids = [server.id for server in server_service.iter_servers(query_params="clusterId=1", page_size=PAGE_SIZE)]
+    assert server_ids == list(range(1, TOTAL_ITEMS + 1))
+    assert stub_server.request_count == 3
+    assert all(request.query["clusterId"] == ["1"] for request in stub_server.requests)
+    server_service.close()
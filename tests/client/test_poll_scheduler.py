@@ -0,0 +1,93 @@
+import logging
+
+from pytest import mark
+
+from lib.common.poll_scheduler import AdaptivePollScheduler
+
+FIXED_SLEEP_TIME = 10
+MAX_WAIT_TIME = 3600
+LONG_OPERATION_TIME = 600
+
+logger = logging.getLogger()
+
+
+def _simulate_wait(completes_after: float, next_interval) -> tuple[int, float]:
+    """Simulates polling an operation that completes after `completes_after` seconds.
+
+    Returns:
+        tuple[int, float]: The number of status checks and the time between completion and its detection.
+    """
+    now = 0.0
+    checks = 0
+    while now <= MAX_WAIT_TIME:
+        checks += 1
+        if now >= completes_after:
+            return checks, now - completes_after
+        now += next_interval(completes_after - now)
+    return checks, float("inf")
+
+
+def test_geometric_ramp_is_capped():
+    """
+    Test that the interval ramps geometrically from the initial interval and is capped at the max interval.
+    """
+    poll_scheduler = AdaptivePollScheduler(initial_interval=1, max_interval=5, backoff_factor=2)
+    assert [poll_scheduler.next_interval() for _ in range(5)] == [1, 2, 4, 5, 5]
+    poll_scheduler.reset()
+    assert poll_scheduler.next_interval() == 1
+    assert poll_scheduler.next_interval(remaining=0.5) == 0.5
+
+
+def test_eta_hint_schedules_near_completion():
+    """
+    Test that an ETA hint schedules the next check just before the predicted completion and restarts the ramp.
+    """
+    poll_scheduler = AdaptivePollScheduler(initial_interval=1, max_interval=60, eta_lead=0.9)
+    for _ in range(4):
+        poll_scheduler.next_interval()
+    assert poll_scheduler.next_interval(eta=20) == 18
+    assert poll_scheduler.next_interval() == 1
+    assert poll_scheduler.next_interval(eta=600) == 60
+
+
+def test_estimate_eta():
+    """
+    Test that the ETA prefers the reported ETA and otherwise extrapolates from the progress percentage.
+    """
+    assert AdaptivePollScheduler.estimate_eta(percent=50, status_eta=30, elapsed=100) == 30
+    assert AdaptivePollScheduler.estimate_eta(percent=25, status_eta=0, elapsed=60) == 180
+    assert AdaptivePollScheduler.estimate_eta(percent=0, status_eta=0, elapsed=60) is None
+    assert AdaptivePollScheduler.estimate_eta() is None
+
+
+@mark.benchmark
+@mark.parametrize("completes_after", [3.3, 47.5, 1803.7])
+def test_adaptive_polling_against_fixed_interval(completes_after: float):
+    """
+    Compare the number of checks and the detection lag of fixed-interval and adaptive polling.
+
+    This function performs the following steps:
+    1. Simulate a wait with a fixed FIXED_SLEEP_TIME interval.
+    2. Simulate the same wait with the adaptive scheduler, with and without an exact ETA hint.
+    3. Verify that short waits are detected sooner, long waits cost fewer checks, and ETA hints never detect later.
+    """
+    fixed_checks, fixed_lag = _simulate_wait(completes_after, lambda eta: FIXED_SLEEP_TIME)
+
+    ramp = AdaptivePollScheduler.for_wait(MAX_WAIT_TIME, min_max_interval=FIXED_SLEEP_TIME)
+    ramp_checks, ramp_lag = _simulate_wait(completes_after, lambda eta: ramp.next_interval())
+
+    hinted = AdaptivePollScheduler.for_wait(MAX_WAIT_TIME, min_max_interval=FIXED_SLEEP_TIME)
+    hinted_checks, hinted_lag = _simulate_wait(
+        completes_after, lambda eta: hinted.next_interval(eta=eta if eta > 0 else None)
+    )
+
+    logger.info(
+        f"completes after {completes_after}s: fixed {fixed_checks} checks / {fixed_lag:.1f}s lag, "
+        f"ramp {ramp_checks} checks / {ramp_lag:.1f}s lag, ETA hinted {hinted_checks} checks / {hinted_lag:.1f}s lag"
+    )
+    assert hinted_lag <= fixed_lag
+    if completes_after < FIXED_SLEEP_TIME:
+        assert ramp_lag < fixed_lag
+    if completes_after > LONG_OPERATION_TIME:
+        assert ramp_checks < fixed_checks
+        assert hinted_checks < fixed_checks
@@ -0,0 +1,86 @@
+import time
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from pytest import approx
+
+from morpheus_api.api_endpoints.instance_service import InstanceService
+from morpheus_api.configuration.rate_limiter import MUTATION, READ, FileTokenBucket, RateLimiter, TokenBucket
+from tests.stubs.morpheus_stub_server import MorpheusStubServer
+from tests.stubs.payloads import instance_payload
+
+RATE = 50.0
+BURST = 5
+NUMBER_OF_THREADS = 8
+CALLS_PER_THREAD = 5
+RESERVATIONS_PER_PROCESS = 10
+
+
+def test_bucket_serves_the_burst_then_spaces_requests():
+    """
+    Test that a bucket lets BURST requests through at once and then queues each request 1/RATE after the previous.
+    """
+    bucket = TokenBucket(rate=RATE, burst=BURST)
+    waits = [bucket.reserve() for _ in range(BURST + 3)]
+
+    assert waits[:BURST] == [0.0] * BURST
+    assert waits[BURST:] == approx([1 / RATE, 2 / RATE, 3 / RATE], abs=0.005)
+
+
+def test_threads_share_the_read_budget(stub_server: MorpheusStubServer):
+    """
+    Test that concurrent threads draw from one read budget and their queueing delay is recorded.
+
+    This function performs the following steps:
+    1. Send NUMBER_OF_THREADS x CALLS_PER_THREAD GET requests from a thread pool through one RateLimiter.
+    2. Verify that the calls took at least the time the budget allows and every request was recorded.
+    """
+    stub_server.add_route("GET", "/api/instances/{id}", {"instance": instance_payload(1)})
+    limiter = RateLimiter(read_rate=RATE, burst=BURST)
+    service = InstanceService(base_url=stub_server.base_url, api_token="token", rate_limiter=limiter)
+    total_calls = NUMBER_OF_THREADS * CALLS_PER_THREAD
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=NUMBER_OF_THREADS) as executor:
+        list(executor.map(lambda _: service.get_instance_status(1), range(total_calls)))
+    elapsed = time.monotonic() - start
+
+    summary = limiter.stats.summary()[READ]
+    assert elapsed >= (total_calls - BURST) / RATE * 0.95
+    assert summary["requests"] == total_calls
+    assert summary["delayed"] > 0
+    # A thread waits for its own token only, so at most NUMBER_OF_THREADS requests queue at once
+    assert 0 < summary["max_delay"] <= NUMBER_OF_THREADS / RATE + 0.05
+    service.close()
+
+
+def test_mutations_have_their_own_budget():
+    """
+    Test that an exhausted read budget does not delay mutations.
+    """
+    limiter = RateLimiter(read_rate=1, mutation_rate=1, burst=1)
+    limiter.sleep = lambda seconds: None
+
+    assert limiter.acquire("GET") == 0
+    assert limiter.acquire("GET") > 0
+    assert limiter.acquire("DELETE") == 0
+    assert limiter.stats.summary()[MUTATION]["delayed"] == 0
+
+
+def _reserve_from_file(path: str) -> list[float]:
+    bucket = FileTokenBucket(path, rate=RATE, burst=BURST)
+    return [bucket.reserve() for _ in range(RESERVATIONS_PER_PROCESS)]
+
+
+def test_processes_share_a_file_backed_bucket(tmp_path):
+    """
+    Test that processes using the same state file draw from one budget, as pytest-xdist workers would.
+    """
+    path = str(tmp_path / "read.json")
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        waits = sorted(
+            wait for process_waits in executor.map(_reserve_from_file, [path, path]) for wait in process_waits
+        )
+
+    assert waits[:BURST] == [0.0] * BURST
+    assert waits[-1] == approx((2 * RESERVATIONS_PER_PROCESS - BURST) / RATE, abs=0.05)
@@ -0,0 +1,106 @@
+import json
+import random
+
+from pytest import approx, mark, raises
+
+from lib.common.exceptions import APIError
+from morpheus_api.api_endpoints.instance_service import InstanceService
+from morpheus_api.configuration.request_metrics import LatencyHistogram, RequestMetrics, normalize_endpoint
+from morpheus_api.configuration.retry_policy import RetryPolicy
+from tests.stubs.morpheus_stub_server import MorpheusStubServer, StubRequest, StubResponse
+from tests.stubs.payloads import instance_payload
+
+NUMBER_OF_SAMPLES = 20000
+
+
+@mark.parametrize(
+    "endpoint, template",
+    [
+        ("/api/instances/42", "/api/instances/{id}"),
+        ("/api/instances/42/snapshots?max=10", "/api/instances/{id}/snapshots"),
+        ("/api/instances?max=100&offset=0&id=1&id=2", "/api/instances"),
+        ("/api/library/cluster-layouts/7", "/api/library/cluster-layouts/{id}"),
+        ("/api/backups/3f2504e0-4f89-11d3-9a0c-0305e82c3301/execute", "/api/backups/{id}/execute"),
+    ],
+)
+def test_endpoints_are_normalized(endpoint: str, template: str):
+    """
+    Test that IDs and query strings are folded into the endpoint template.
+    """
+    assert normalize_endpoint(endpoint) == template
+
+
+def test_histogram_quantiles_are_within_one_percent():
+    """
+    Test that the quantiles of the log-linear histogram are within 1% of the exact quantiles of the samples.
+    """
+    generator = random.Random(7)
+    samples = sorted(generator.lognormvariate(-3, 1.5) for _ in range(NUMBER_OF_SAMPLES))
+    histogram = LatencyHistogram()
+    for sample in samples:
+        histogram.record(sample)
+
+    for quantile in (0.5, 0.9, 0.99, 0.999):
+        exact = samples[int(quantile * NUMBER_OF_SAMPLES) - 1]
+        assert histogram.quantile(quantile) == approx(exact, rel=0.01)
+    assert histogram.count == NUMBER_OF_SAMPLES
+    assert (histogram.min, histogram.max) == (samples[0], samples[-1])
+    assert len(histogram.counts) < 1500
+
+
+def test_requests_are_recorded_per_endpoint_template(stub_server: MorpheusStubServer, tmp_path):
+    """
+    Test that every request is recorded with its status, sizes and retries, and dumped as JSON and OpenMetrics.
+
+    This function performs the following steps:
+    1. Get two instances, the first one after a retried 503, get a missing instance and stop an instance.
+    2. Verify the counters of the GET and PUT endpoint templates.
+    3. Dump the metrics and verify both files.
+    """
+    attempts = {"count": 0}
+
+    def get_instance(request: StubRequest) -> StubResponse:
+        attempts["count"] += 1
+        if attempts["count"] == 1:
+            return StubResponse(status=503)
+        if request.path_params["id"] == "404":
+            return StubResponse(status=404)
+        return StubResponse(body={"instance": instance_payload(int(request.path_params["id"]))})
+
+    stub_server.add_route("GET", "/api/instances/{id}", get_instance)
+    stub_server.add_route("PUT", "/api/instances/{id}/stop", {"success": True})
+    metrics = RequestMetrics()
+    policy = RetryPolicy(max_retries=1, jitter=False)
+    policy.sleep = lambda seconds: None
+    service = InstanceService(
+        base_url=stub_server.base_url, api_token="token", retry_policy=policy, request_metrics=metrics
+    )
+
+    service.get_instance(1)
+    service.get_instance(2)
+    with raises(APIError):
+        service.get_instance(404)
+    service.stop_instance(1, data={"muteMonitoring": True})
+
+    summary = metrics.to_dict()
+    get_metrics = summary["GET /api/instances/{id}"]
+    assert get_metrics["count"] == 3
+    assert get_metrics["status_codes"] == {"200": 2, "404": 1}
+    assert get_metrics["retries"] == 1
+    assert get_metrics["bytes_in"] > 0 and get_metrics["bytes_out"] == 0
+    assert get_metrics["latency_seconds"]["p99"] <= get_metrics["latency_seconds"]["max"]
+    assert summary["PUT /api/instances/{id}/stop"]["bytes_out"] == len('{"muteMonitoring": true}')
+    assert metrics.histogram("GET", "/api/instances/5").count == 3
+
+    json_path, openmetrics_path = metrics.dump(str(tmp_path), name="run")
+    with open(json_path) as json_file:
+        assert json.load(json_file)["endpoints"]["GET /api/instances/{id}"]["count"] == 3
+    with open(openmetrics_path) as openmetrics_file:
+        openmetrics = openmetrics_file.read().splitlines()
+    labels = 'method="GET",endpoint="/api/instances/{id}"'
+    assert f'morpheus_api_request_duration_seconds_bucket{{{labels},le="+Inf"}} 3' in openmetrics
+    assert f"morpheus_api_request_duration_seconds_count{{{labels}}} 3" in openmetrics
+    assert f'morpheus_api_requests_total{{{labels},status="404"}} 1' in openmetrics
+    assert f"morpheus_api_retries_total{{{labels}}} 1" in openmetrics
+    assert openmetrics[-1] == "# EOF"
+    service.close()
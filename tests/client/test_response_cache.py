@@ -0,0 +1,156 @@
+import time
+
+from morpheus_api.api_endpoints.instance_service import InstanceService
+from morpheus_api.api_endpoints.virtual_image_service import VirtualImageService
+from morpheus_api.configuration.response_cache import ResponseCache
+from morpheus_api.settings import APISettings, MorpheusAPIService
+from tests.stubs.morpheus_stub_server import MorpheusStubServer, StubRequest, StubResponse
+from tests.stubs.payloads import instance_payload, virtual_image_payload
+
+SHORT_TTL = 0.2
+
+# Virtual images are not cached by default, the tests opt them in
+VIRTUAL_IMAGE_TTLS = {"/api/virtual-images": 60}
+
+
+class VirtualImageAppliance:
+    """
+    Serves virtual images whose status can be changed by the test. Responses carry an ETag (the status) and a
+    Last-Modified header, and conditional requests matching the current ETag are answered with 304.
+    """
+
+    def __init__(self):
+        self.statuses = {7: "Active", 8: "Active"}
+
+    def register(self, stub_server: MorpheusStubServer):
+        stub_server.add_route("GET", "/api/virtual-images/{id}", self.get_virtual_image)
+        stub_server.add_route("DELETE", "/api/virtual-images/{id}/files", self.remove_file)
+
+    def get_virtual_image(self, request: StubRequest) -> StubResponse:
+        virtual_image_id = int(request.path_params["id"])
+        etag = f'"{virtual_image_id}-{self.statuses[virtual_image_id]}"'
+        if request.headers.get("If-None-Match") == etag:
+            return StubResponse(status=304, headers={"ETag": etag})
+        return StubResponse(
+            body={"virtualImage": virtual_image_payload(virtual_image_id, status=self.statuses[virtual_image_id])},
+            headers={"ETag": etag, "Last-Modified": "Wed, 14 Oct 2026 10:00:00 GMT"},
+        )
+
+    def remove_file(self, request: StubRequest) -> StubResponse:
+        self.statuses[int(request.path_params["id"])] = "Saving"
+        return StubResponse(body={"success": True})
+
+
+def test_fresh_responses_are_served_from_the_cache(stub_server: MorpheusStubServer):
+    """
+    Test that a cached endpoint is fetched once within its TTL, while endpoints without a TTL are always fetched.
+    """
+    VirtualImageAppliance().register(stub_server)
+    stub_server.add_route("GET", "/api/instances/{id}", {"instance": instance_payload(1)})
+    cache = ResponseCache(ttls=VIRTUAL_IMAGE_TTLS)
+    virtual_image_service = VirtualImageService(base_url=stub_server.base_url, api_token="token", response_cache=cache)
+    instance_service = InstanceService(base_url=stub_server.base_url, api_token="token", response_cache=cache)
+
+    for _ in range(3):
+        assert virtual_image_service.get_virtual_image_by_id(7).status == "Active"
+        instance_service.get_instance_status(1)
+
+    assert cache.stats.misses() == {"GET /api/virtual-images/7": 1}
+    assert cache.stats.hits() == {"GET /api/virtual-images/7": 2}
+    assert [request.path for request in stub_server.requests].count("/api/instances/1") == 3
+    assert len(cache) == 1
+    virtual_image_service.close()
+    instance_service.close()
+
+
+def test_expired_responses_are_revalidated_with_the_etag(stub_server: MorpheusStubServer):
+    """
+    Test that an expired entry is revalidated with a conditional request and reused on 304.
+
+    This function performs the following steps:
+    1. Fetch a virtual image with a cache TTL of SHORT_TTL.
+    2. Let the entry expire and fetch it again.
+    3. Verify that the second request carried the ETag and Last-Modified validators and the 304 was answered
+       from the cache.
+    """
+    VirtualImageAppliance().register(stub_server)
+    cache = ResponseCache(ttls={"/api/virtual-images": SHORT_TTL})
+    service = VirtualImageService(base_url=stub_server.base_url, api_token="token", response_cache=cache)
+
+    first = service.get_virtual_image_by_id(7)
+    time.sleep(SHORT_TTL)
+    second = service.get_virtual_image_by_id(7)
+
+    assert first == second
+    assert stub_server.requests[1].headers["If-None-Match"] == '"7-Active"'
+    assert stub_server.requests[1].headers["If-Modified-Since"] == "Wed, 14 Oct 2026 10:00:00 GMT"
+    assert cache.stats.revalidations() == {"GET /api/virtual-images/7": 1}
+    assert cache.stats.hit_ratio == 0.5
+    service.close()
+
+
+def test_mutations_invalidate_the_resource(stub_server: MorpheusStubServer):
+    """
+    Test that a mutating request drops the cached responses of its resource only.
+    """
+    VirtualImageAppliance().register(stub_server)
+    cache = ResponseCache(ttls=VIRTUAL_IMAGE_TTLS)
+    service = VirtualImageService(base_url=stub_server.base_url, api_token="token", response_cache=cache)
+    service.get_virtual_image_by_id(7)
+    service.get_virtual_image_by_id(8)
+
+    assert service.remove_virtual_image_file(7, "image.qcow2").success
+
+    assert service.get_virtual_image_by_id(7).status == "Saving"
+    assert service.get_virtual_image_by_id(8).status == "Active"
+    assert cache.stats.invalidations == 1
+    assert cache.stats.misses() == {"GET /api/virtual-images/7": 2, "GET /api/virtual-images/8": 1}
+    service.close()
+
+
+def test_least_recently_used_entries_are_evicted(stub_server: MorpheusStubServer):
+    """
+    Test that the cache holds at most max_entries responses and evicts the least recently used one first.
+    """
+    VirtualImageAppliance().register(stub_server)
+    cache = ResponseCache(ttls=VIRTUAL_IMAGE_TTLS, max_entries=1)
+    service = VirtualImageService(base_url=stub_server.base_url, api_token="token", response_cache=cache)
+
+    for virtual_image_id in (7, 8, 7):
+        service.get_virtual_image_by_id(virtual_image_id)
+
+    assert len(cache) == 1
+    assert cache.stats.misses() == {"GET /api/virtual-images/7": 2, "GET /api/virtual-images/8": 1}
+    assert cache.stats.hits() == {}
+    service.close()
+
+
+def test_services_share_the_cache_from_settings(stub_server: MorpheusStubServer):
+    """
+    Test that the cache is disabled by default and shared by every service when enabled in the settings.
+    """
+    settings = APISettings(base_url=stub_server.base_url, api_token="token")
+    assert MorpheusAPIService(settings).instance_service.response_cache is None
+
+    settings.response_cache = True
+    morpheus_api_service = MorpheusAPIService(settings)
+    assert morpheus_api_service.response_cache is not None
+    assert morpheus_api_service.zone_service.response_cache is morpheus_api_service.response_cache
+    assert morpheus_api_service.virtual_image_service.response_cache is morpheus_api_service.response_cache
+    morpheus_api_service.close()
+
+
+def test_polled_virtual_images_are_not_cached_by_default(stub_server: MorpheusStubServer):
+    """
+    Test that the default cache always fetches virtual images, so waiting on their status sees every change.
+    """
+    appliance = VirtualImageAppliance()
+    appliance.register(stub_server)
+    cache = ResponseCache()
+    service = VirtualImageService(base_url=stub_server.base_url, api_token="token", response_cache=cache)
+
+    assert service.get_virtual_image_by_id(7).status == "Active"
+    appliance.statuses[7] = "Saving"
+    assert service.get_virtual_image_by_id(7).status == "Saving"
+    assert len(cache) == 0
+    service.close()
@@ -0,0 +1,118 @@
+import socket
+
+import requests
+from pytest import raises
+
+from lib.common.exceptions import APIError
+from morpheus_api.api_endpoints.instance_service import InstanceService
+from morpheus_api.configuration.retry_policy import RetryPolicy
+from morpheus_api.configuration.utils import MorpheusAPI, create_session
+from tests.stubs.morpheus_stub_server import MorpheusStubServer, StubRequest, StubResponse
+from tests.stubs.payloads import instance_payload
+
+
+class RecordingRetryPolicy(RetryPolicy):
+    """RetryPolicy that records the waits instead of sleeping."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.waits: list[float] = []
+
+    def sleep(self, seconds: float):
+        self.waits.append(seconds)
+
+
+def _failing_then_ok(failures: int, status: int = 503, headers: dict = None, body: dict = None):
+    calls = {"count": 0}
+
+    def handler(request: StubRequest) -> StubResponse:
+        calls["count"] += 1
+        if calls["count"] <= failures:
+            return StubResponse(status=status, body={"success": False}, headers=headers)
+        return StubResponse(body=body if body is not None else {"success": True})
+
+    return handler
+
+
+def test_get_is_retried_until_success(stub_server: MorpheusStubServer):
+    """
+    Test that an idempotent GET is retried on 503 with exponential backoff and the retries are counted.
+    """
+    stub_server.add_route("GET", "/api/instances/{id}", _failing_then_ok(2, body={"instance": instance_payload(1)}))
+    policy = RecordingRetryPolicy(max_retries=3, backoff_factor=0.5, jitter=False)
+    instance_service = InstanceService(
+        base_url=stub_server.base_url, api_token="token", session=create_session(), retry_policy=policy
+    )
+
+    instance = instance_service.get_instance(1)
+
+    assert instance.instance.id == 1
+    assert stub_server.request_count == 3
+    assert policy.waits == [0.5, 1.0]
+    assert policy.stats.retries() == {"GET /api/instances/1": 2}
+    assert policy.stats.exhausted() == {}
+    instance_service.close()
+
+
+def test_retries_are_exhausted(stub_server: MorpheusStubServer):
+    """
+    Test that a GET failing on every attempt raises APIError after max_retries and honours Retry-After.
+    """
+    stub_server.add_route("GET", "/api/instances/{id}", _failing_then_ok(10, status=429, headers={"Retry-After": "2"}))
+    policy = RecordingRetryPolicy(max_retries=2)
+    morpheus_api = MorpheusAPI(base_url=stub_server.base_url, api_token="token", retry_policy=policy)
+
+    with raises(APIError):
+        morpheus_api._get("/api/instances/1")
+
+    assert stub_server.request_count == 3
+    assert policy.waits == [2.0, 2.0]
+    assert policy.stats.exhausted() == {"GET /api/instances/1": 1}
+    morpheus_api.close()
+
+
+def test_post_is_opt_in(stub_server: MorpheusStubServer):
+    """
+    Test that POST is not retried by default but is retried when the caller opts in.
+    """
+    stub_server.add_route("POST", "/api/instances", _failing_then_ok(1))
+    policy = RecordingRetryPolicy(max_retries=3)
+    morpheus_api = MorpheusAPI(base_url=stub_server.base_url, api_token="token", retry_policy=policy)
+
+    with raises(APIError):
+        morpheus_api._post("/api/instances", data={})
+    assert stub_server.request_count == 1
+
+    stub_server.add_route("POST", "/api/instances", _failing_then_ok(1))
+    stub_server.reset_counters()
+    assert morpheus_api._post("/api/instances", data={}, retry=True).ok
+    assert stub_server.request_count == 2
+    morpheus_api.close()
+
+
+def test_connection_errors_are_retried():
+    """
+    Test that connection failures are retried and re-raised once the retries are exhausted.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    policy = RecordingRetryPolicy(max_retries=2)
+    morpheus_api = MorpheusAPI(base_url=f"http://127.0.0.1:{port}", api_token="token", retry_policy=policy)
+
+    with raises(requests.exceptions.ConnectionError):
+        morpheus_api._delete("/api/instances/1?force=true")
+
+    assert len(policy.waits) == 2
+    assert policy.stats.retries() == {"DELETE /api/instances/1": 2}
+    assert policy.stats.exhausted() == {"DELETE /api/instances/1": 1}
+    morpheus_api.close()
+
+
+def test_backoff_is_bounded():
+    """
+    Test that the jittered backoff never exceeds the exponential bound or max_backoff.
+    """
+    policy = RetryPolicy(backoff_factor=1.0, max_backoff=5.0)
+    for attempt in range(6):
+        assert 0 <= policy.get_backoff(attempt) <= min(5.0, 2**attempt)
@@ -0,0 +1,76 @@
+import logging
+import statistics
+import time
+
+import requests
+from pytest import mark
+
+from morpheus_api.api_endpoints.container_service import ContainerService
+from morpheus_api.api_endpoints.instance_service import InstanceService
+from morpheus_api.configuration.utils import create_session
+from tests.stubs.morpheus_stub_server import MorpheusStubServer
+from tests.stubs.payloads import instance_payload
+
+NUMBER_OF_CALLS = 200
+
+logger = logging.getLogger()
+
+
+def _time_calls(call) -> list[float]:
+    latencies: list[float] = []
+    for _ in range(NUMBER_OF_CALLS):
+        start = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+@mark.benchmark
+def test_pooled_session_reuses_connections(stub_server: MorpheusStubServer):
+    """
+    Benchmark per-call latency of the pooled keep-alive session against module-level requests.get().
+
+    This function performs the following steps:
+    1. Time NUMBER_OF_CALLS GETs with requests.get(), which opens a new connection per call.
+    2. Time NUMBER_OF_CALLS InstanceService.get_instance() calls sharing one pooled session.
+    3. Verify that the pooled session served every call over a single connection.
+    """
+    stub_server.add_route("GET", "/api/instances/{id}", {"instance": instance_payload(1)})
+    url = f"{stub_server.base_url}/api/instances/1"
+
+    unpooled = _time_calls(lambda: requests.get(url, verify=False))
+    unpooled_connections = stub_server.connection_count
+
+    stub_server.reset_counters()
+    instance_service = InstanceService(base_url=stub_server.base_url, api_token="token", session=create_session())
+    pooled = _time_calls(lambda: instance_service.get_instance(1))
+    pooled_connections = stub_server.connection_count
+    instance_service.close()
+
+    logger.info(
+        f"requests.get: {unpooled_connections} connections, mean {statistics.mean(unpooled) * 1000:.3f} ms/call; "
+        f"pooled session: {pooled_connections} connections, mean {statistics.mean(pooled) * 1000:.3f} ms/call"
+    )
+    assert unpooled_connections == NUMBER_OF_CALLS
+    assert pooled_connections == 1
+
+
+def test_services_share_one_pool(stub_server: MorpheusStubServer):
+    """
+    Test that services built on the same session share its connection pool.
+    """
+    stub_server.add_route("GET", "/api/instances/{id}", {"instance": instance_payload(1)})
+    stub_server.add_route(
+        "GET",
+        "/api/containers/{id}",
+        {"container": {"id": 1, "name": "stub-container", "uuid": "uuid", "accountId": 1, "status": "running"}},
+    )
+    session = create_session()
+    instance_service = InstanceService(base_url=stub_server.base_url, api_token="token", session=session)
+    container_service = ContainerService(base_url=stub_server.base_url, api_token="token", session=session)
+    for _ in range(10):
+        instance_service.get_instance(1)
+        container_service.get_container_by_id(1)
+    session.close()
+
+    assert stub_server.connection_count == 1
@@ -0,0 +1,89 @@
+import json
+import logging
+import timeit
+import tracemalloc
+
+from pytest import mark
+
+from morpheus_api.api_endpoints.instance_service import InstanceService
+from morpheus_api.api_endpoints.server_service import ServerService
+from morpheus_api.configuration.utils import decode_response
+from morpheus_api.dataclasses.instance import Instance, InstanceStatusResponse
+from morpheus_api.dataclasses.server import Server, ServerStatusResponse
+from tests.stubs.morpheus_stub_server import MorpheusStubServer
+from tests.stubs.payloads import instance_list_payload, instance_payload, server_payload
+
+NUMBER_OF_DECODES = 2000
+NUMBER_OF_ROUNDS = 5
+
+logger = logging.getLogger()
+
+# Bodies of the single-object GET endpoints the status waiters poll on every tick
+PAYLOADS = {
+    "instance": (Instance, InstanceStatusResponse, {"instance": instance_payload(1, status="provisioning")}),
+    "server": (Server, ServerStatusResponse, {"server": server_payload(1, status="provisioned", power_state="off")}),
+}
+
+
+def test_status_views_are_projections(stub_server: MorpheusStubServer):
+    """
+    Test that the status methods return the same status fields as the full models, without the other fields.
+    """
+    stub_server.add_route("GET", "/api/instances/{id}", {"instance": instance_payload(1, status="stopped")})
+    stub_server.add_route("GET", "/api/instances", instance_list_payload(3))
+    stub_server.add_route("GET", "/api/servers/{id}", {"server": server_payload(1, power_state="off")})
+    stub_server.add_route("GET", "/api/servers", {"servers": [server_payload(i + 1) for i in range(3)]})
+    instance_service = InstanceService(base_url=stub_server.base_url, api_token="token")
+    server_service = ServerService(base_url=stub_server.base_url, api_token="token")
+
+    instance = instance_service.get_instance(1).instance
+    instance_status = instance_service.get_instance_status(1)
+    assert (instance_status.id, instance_status.status, instance_status.locked) == (1, "stopped", instance.locked)
+    assert not hasattr(instance_status, "volumes") and not hasattr(instance_status, "__dict__")
+    assert [view.id for view in instance_service.list_instance_statuses(filter="id=1&id=2&id=3").instances] == [1, 2, 3]
+
+    server = server_service.get_a_specific_server(1).server
+    server_status = server_service.get_server_status(1)
+    assert (server_status.status, server_status.power_state) == (server.status, "off")
+    assert [view.power_state for view in server_service.list_server_statuses("max=3").servers] == ["on"] * 3
+    instance_service.close()
+    server_service.close()
+
+
+def _best_time(decode) -> float:
+    return min(timeit.repeat(decode, number=NUMBER_OF_DECODES, repeat=NUMBER_OF_ROUNDS)) / NUMBER_OF_DECODES
+
+
+def _allocated(decode) -> int:
+    tracemalloc.start()
+    try:
+        decode()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@mark.benchmark
+def test_status_view_benchmark():
+    """
+    Benchmark the per-poll CPU time and allocations of decoding the full models against the status projections.
+
+    This function performs the following steps:
+    1. Encode the instance and server bodies returned by the GET endpoints polled by the status waiters.
+    2. Time the best of NUMBER_OF_ROUNDS rounds and trace the peak allocations of one decode with both models.
+    3. Verify that the projections are faster and allocate less for every body.
+    """
+    for payload_name, (full_model, view_model, body) in PAYLOADS.items():
+        content = json.dumps(body).encode()
+        full_time = _best_time(lambda: decode_response(content, full_model))
+        view_time = _best_time(lambda: decode_response(content, view_model))
+        full_allocated = _allocated(lambda: decode_response(content, full_model))
+        view_allocated = _allocated(lambda: decode_response(content, view_model))
+        logger.info(
+            f"{payload_name} poll: {full_model.__name__} {full_time * 1e6:.1f} us / {full_allocated} B, "
+            f"{view_model.__name__} {view_time * 1e6:.1f} us / {view_allocated} B "
+            f"({full_time / view_time:.2f}x faster, {full_allocated / view_allocated:.2f}x less memory)"
+        )
+
+        assert view_time < full_time
+        assert view_allocated < full_allocated
@@ -0,0 +1,123 @@
+from pytest import raises
+
+from lib.common.enums.instance_status import InstanceStatus
+from lib.common.enums.resource_type import ResourceType
+from morpheus_api.settings import APISettings, MorpheusAPIService
+from tests.steps.morpheus.status_watcher import StatusWatcher
+from tests.stubs.morpheus_stub_server import MorpheusStubServer, StubRequest, StubResponse
+from tests.stubs.payloads import instance_payload
+
+NUMBER_OF_INSTANCES = 50
+SLEEP_TIME = 0.05
+
+
+class InstanceFleet:
+    """Instances whose status moves to `final_status` after `ticks_to_finish` list calls."""
+
+    def __init__(self, ticks_to_finish: int, final_status: dict[int, str]):
+        self.ticks_to_finish = ticks_to_finish
+        self.final_status = final_status
+        self.list_calls = 0
+
+    def list_instances(self, request: StubRequest) -> StubResponse:
+        self.list_calls += 1
+        instance_ids = [int(instance_id) for instance_id in request.query.get("id", [])]
+        instances = [
+            instance_payload(
+                instance_id,
+                status=(
+                    self.final_status[instance_id]
+                    if self.list_calls > self.ticks_to_finish
+                    else InstanceStatus.PROVISIONING.value
+                ),
+            )
+            for instance_id in instance_ids
+            if instance_id in self.final_status
+        ]
+        return StubResponse(body={"instances": instances})
+
+
+def _build_service(stub_server: MorpheusStubServer) -> MorpheusAPIService:
+    return MorpheusAPIService(APISettings(base_url=stub_server.base_url, api_token="token", max_retries=0))
+
+
+def test_fleet_wait_costs_one_call_per_tick(stub_server: MorpheusStubServer):
+    """
+    Test that waiting on a fleet of instances issues one batched list call per tick.
+
+    This function performs the following steps:
+    1. Serve NUMBER_OF_INSTANCES instances that become running on the third list call.
+    2. Subscribe to every instance reaching running.
+    3. Verify that every subscription succeeded after three list calls and no per-instance GET.
+    """
+    fleet = InstanceFleet(2, {instance_id: "running" for instance_id in range(1, NUMBER_OF_INSTANCES + 1)})
+    stub_server.add_route("GET", "/api/instances", fleet.list_instances)
+    morpheus_api_service = _build_service(stub_server)
+
+    with StatusWatcher(morpheus_api_service, sleep_time=SLEEP_TIME) as watcher:
+        futures = [
+            watcher.subscribe(ResourceType.INSTANCE, instance_id, InstanceStatus.RUNNING, max_wait_time=10)
+            for instance_id in range(1, NUMBER_OF_INSTANCES + 1)
+        ]
+        assert watcher.wait_all(futures)
+
+    assert fleet.list_calls == 3
+    assert stub_server.request_count == 3
+    morpheus_api_service.close()
+
+
+def test_failure_status_and_timeout(stub_server: MorpheusStubServer):
+    """
+    Test that a failure status and an exceeded max wait time resolve their subscriptions with False.
+    """
+    fleet = InstanceFleet(0, {1: "running", 2: "failed"})
+    stub_server.add_route("GET", "/api/instances", fleet.list_instances)
+    morpheus_api_service = _build_service(stub_server)
+
+    with StatusWatcher(morpheus_api_service, sleep_time=SLEEP_TIME) as watcher:
+        running = watcher.subscribe(ResourceType.INSTANCE, 1, InstanceStatus.RUNNING)
+        failed = watcher.subscribe(
+            ResourceType.INSTANCE, 2, InstanceStatus.RUNNING, failure_statuses=[InstanceStatus.FAILED]
+        )
+        missing = watcher.subscribe(ResourceType.INSTANCE, 3, InstanceStatus.RUNNING, max_wait_time=0.2)
+        assert not watcher.wait_all([running, failed, missing])
+
+    assert running.result() is True
+    assert failed.result() is False
+    assert missing.result() is False
+    morpheus_api_service.close()
+
+
+def test_unexpected_errors_do_not_leave_waiters_blocked():
+    """
+    Test that a raising fetcher or ETA provider only costs its tick, and that an error stopping the polling thread
+    resolves the pending subscriptions with it.
+    """
+
+    def broken_fetcher(resource_ids: list[int]) -> dict[int, str]:
+        raise ValueError("undecodable status")
+
+    def broken_eta(pending) -> float:
+        raise KeyError("eta")
+
+    with StatusWatcher(None, sleep_time=SLEEP_TIME, eta_provider=broken_eta) as watcher:
+        watcher.register_fetcher(ResourceType.INSTANCE, broken_fetcher)
+        future = watcher.subscribe(ResourceType.INSTANCE, 1, InstanceStatus.RUNNING, max_wait_time=0.3)
+        assert future.result(timeout=5) is False
+        assert watcher.tick_count > 1
+
+    class BrokenScheduler:
+        def reset(self):
+            pass
+
+        def next_interval(self, eta=None, remaining=None) -> float:
+            raise IndexError("no interval")
+
+    watcher = StatusWatcher(None, sleep_time=SLEEP_TIME, poll_scheduler=BrokenScheduler())
+    watcher.register_fetcher(ResourceType.INSTANCE, lambda resource_ids: {})
+    future = watcher.subscribe(ResourceType.INSTANCE, 1, InstanceStatus.RUNNING, max_wait_time=10)
+    with raises(IndexError):
+        future.result(timeout=5)
+    with raises(RuntimeError, match="closed"):
+        watcher.subscribe(ResourceType.INSTANCE, 2, InstanceStatus.RUNNING)
+    watcher.close()
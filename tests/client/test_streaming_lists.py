@@ -0,0 +1,139 @@
+import json
+import logging
+import tracemalloc
+
+from pytest import mark, raises
+
+from morpheus_api.api_endpoints.instance_service import InstanceService
+from morpheus_api.api_endpoints.virtual_image_service import VirtualImageService
+from morpheus_api.dataclasses.instance import InstanceDetails
+from morpheus_api.helpers.json_stream import iter_json_array
+from tests.stubs.morpheus_stub_server import MorpheusStubServer, StubRequest, StubResponse
+from tests.stubs.payloads import instance_list_payload, virtual_image_payload
+
+NUMBER_OF_INSTANCES = 5000
+PAGE_SIZE = 40
+
+logger = logging.getLogger()
+
+
+def _chunked(content: bytes, chunk_size: int) -> list[bytes]:
+    chunks = []
+    for start in range(0, len(content), chunk_size):
+        end = start + chunk_size
+        chunks.append(content[start:end])
+    return chunks
+
+
+@mark.parametrize("chunk_size", [1, 7, 4096])
+def test_items_are_parsed_across_chunk_boundaries(chunk_size: int):
+    """
+    Test that the items are the same whatever the chunk boundaries, including multibyte characters, escaped quotes
+    and brackets inside strings, and numbers split between two chunks.
+    """
+    body = {
+        "meta": {"total": 3, "note": 'a "quoted" ] and } inside'},
+        "instances": [{"id": 1, "name": "café-ünïcode-☃"}, {"id": 22, "tags": ["[x]", "{y}"]}, 123456789, None],
+        "trailing": {"ignored": True},
+    }
+    content = json.dumps(body, ensure_ascii=False).encode()
+    assert list(iter_json_array(_chunked(content, chunk_size), "instances")) == body["instances"]
+
+
+def test_empty_and_missing_arrays():
+    """
+    Test that an empty array yields nothing and a missing array raises a ValueError.
+    """
+    assert list(iter_json_array([b'{"instances": [ ], "meta": {}}'], "instances")) == []
+    with raises(ValueError):
+        list(iter_json_array([b'{"servers": []}'], "instances"))
+    with raises(ValueError):
+        list(iter_json_array([b'{"instances": [{"id": 1}'], "instances"))
+
+
+def test_stream_instances_follows_pages(stub_server: MorpheusStubServer):
+    """
+    Test that stream_instances validates every instance of every page and stops at the first short page.
+
+    This function performs the following steps:
+    1. Serve 2.5 pages of instances, honoring the max and offset query parameters.
+    2. Stream the instances with a page size of PAGE_SIZE.
+    3. Verify that every instance is yielded once, in order, and that exactly three pages were requested.
+    """
+    total = PAGE_SIZE * 2 + PAGE_SIZE // 2
+
+    def list_instances(request: StubRequest) -> StubResponse:
+        max_results, offset = int(request.query["max"][0]), int(request.query["offset"][0])
+        count = max(0, min(max_results, total - offset))
+        return StubResponse(body=instance_list_payload(count, offset=offset, total=total))
+
+    stub_server.add_route("GET", "/api/instances", list_instances)
+    service = InstanceService(base_url=stub_server.base_url, api_token="token")
+
+    instances = list(service.stream_instances(filter="status=running", page_size=PAGE_SIZE))
+
+    assert [instance.id for instance in instances] == list(range(1, total + 1))
+    assert all(isinstance(instance, InstanceDetails) for instance in instances)
+    assert [request.query["offset"] for request in stub_server.requests] == [["0"], ["40"], ["80"]]
+    assert all(request.query["status"] == ["running"] for request in stub_server.requests)
+    service.close()
+
+
+def test_stream_virtual_images(stub_server: MorpheusStubServer):
+    """
+    Test that stream_virtual_images yields the virtual images of a single short page.
+    """
+    stub_server.add_route(
+        "GET",
+        "/api/virtual-images",
+        {"virtualImages": [virtual_image_payload(i) for i in (7, 8)], "meta": {"offset": 0, "size": 2, "total": 2}},
+    )
+    service = VirtualImageService(base_url=stub_server.base_url, api_token="token")
+
+    assert [virtual_image.id for virtual_image in service.stream_virtual_images(name="image")] == [7, 8]
+    assert stub_server.requests[0].query["name"] == ["image"]
+    service.close()
+
+
+def _peak_memory(scan) -> int:
+    tracemalloc.start()
+    try:
+        scan()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@mark.benchmark
+def test_streaming_memory_benchmark(stub_server: MorpheusStubServer):
+    """
+    Benchmark the peak memory of scanning NUMBER_OF_INSTANCES instances with list_instances and stream_instances.
+
+    This function performs the following steps:
+    1. Pre-encode one page holding every instance, so the stub allocates nothing while memory is traced.
+    2. Trace the peak memory of counting the running instances with both methods.
+    3. Verify that both methods count the same instances and streaming peaks at a fraction of the list call.
+    """
+    content = json.dumps(instance_list_payload(NUMBER_OF_INSTANCES)).encode()
+    stub_server.add_route("GET", "/api/instances", lambda request: StubResponse(body=content))
+    service = InstanceService(base_url=stub_server.base_url, api_token="token")
+    counts = {}
+
+    def scan_list():
+        instances = service.list_instances(max_results=NUMBER_OF_INSTANCES).instances
+        counts["list"] = sum(instance.status == "running" for instance in instances)
+
+    def scan_stream():
+        instances = service.stream_instances(page_size=NUMBER_OF_INSTANCES + 1)
+        counts["stream"] = sum(instance.status == "running" for instance in instances)
+
+    list_peak = _peak_memory(scan_list)
+    stream_peak = _peak_memory(scan_stream)
+    logger.info(
+        f"{NUMBER_OF_INSTANCES} instances ({len(content) / 1024 / 1024:.1f} MiB): list_instances peak "
+        f"{list_peak / 1024 / 1024:.1f} MiB, stream_instances peak {stream_peak / 1024 / 1024:.1f} MiB"
+    )
+
+    assert counts["list"] == counts["stream"] == NUMBER_OF_INSTANCES
+    assert stream_peak * 4 < list_peak
+    service.close()
@@ -0,0 +1,190 @@
+import threading
+
+from lib.common.enums.resource_type import ResourceType
+from morpheus_api.settings import APISettings, MorpheusAPIService
+from tests.steps.morpheus.teardown_steps import TeardownEngine
+from tests.stubs.morpheus_stub_server import MorpheusStubServer, StubRequest, StubResponse
+from tests.stubs.payloads import backup_payload, instance_payload, snapshot_payload, virtual_image_payload
+
+SLEEP_TIME = 0.05
+MAX_WAIT_TIME = 5
+NUMBER_OF_INSTANCES = 6
+
+
+class TeardownAppliance:
+    """
+    Serves instances, snapshots, backups and virtual images. A deleted resource is still listed once and is gone
+    from the following list calls. The DELETE calls are recorded in order; deleting the resources in
+    `failing_deletes` returns 500, and deleting the resources in `malformed_deletes` returns an undecodable body.
+    """
+
+    def __init__(self, instance_ids: list[int]):
+        self.instances = set(instance_ids)
+        self.snapshots = {instance_id * 10 + i: instance_id for instance_id in instance_ids for i in range(2)}
+        self.backups = {instance_id * 100: instance_id for instance_id in instance_ids}
+        self.virtual_images = {7, 8}
+        self.removing: dict[ResourceType, set[int]] = {resource_type: set() for resource_type in ResourceType}
+        self.failing_deletes: set[tuple[ResourceType, int]] = set()
+        self.malformed_deletes: set[tuple[ResourceType, int]] = set()
+        self.deletes: list[tuple[ResourceType, int]] = []
+        self._lock = threading.Lock()
+
+    def register(self, stub_server: MorpheusStubServer):
+        for path, resource_type in (
+            ("/api/snapshots/{id}", ResourceType.SNAPSHOT),
+            ("/api/backups/{id}", ResourceType.BACKUP),
+            ("/api/instances/{id}", ResourceType.INSTANCE),
+            ("/api/virtual-images/{id}", ResourceType.VIRTUAL_IMAGE),
+        ):
+            stub_server.add_route("DELETE", path, self._delete_handler(resource_type))
+        stub_server.add_route("GET", "/api/instances", self.list_instances)
+        stub_server.add_route("GET", "/api/instances/{id}/snapshots", self.list_snapshots)
+        stub_server.add_route("GET", "/api/instances/{id}/backups", self.list_backups)
+        stub_server.add_route("GET", "/api/virtual-images", self.list_virtual_images)
+
+    def list_instances(self, request: StubRequest) -> StubResponse:
+        requested = {int(instance_id) for instance_id in request.query.get("id", [])}
+        existing = self._list(ResourceType.INSTANCE, self.instances)
+        return StubResponse(body={"instances": [instance_payload(i) for i in sorted(existing & requested)]})
+
+    def list_snapshots(self, request: StubRequest) -> StubResponse:
+        instance_id = int(request.path_params["id"])
+        existing = self._list(ResourceType.SNAPSHOT, self.snapshots, instance_id)
+        return StubResponse(body={"snapshots": [snapshot_payload(snapshot_id) for snapshot_id in sorted(existing)]})
+
+    def list_backups(self, request: StubRequest) -> StubResponse:
+        instance_id = int(request.path_params["id"])
+        existing = self._list(ResourceType.BACKUP, self.backups, instance_id)
+        return StubResponse(
+            body={
+                "instance": {"id": instance_id},
+                "backups": [backup_payload(backup_id, instance_id) for backup_id in sorted(existing)],
+            }
+        )
+
+    def list_virtual_images(self, request: StubRequest) -> StubResponse:
+        existing = self._list(ResourceType.VIRTUAL_IMAGE, self.virtual_images)
+        return StubResponse(
+            body={
+                "virtualImages": [virtual_image_payload(virtual_image_id) for virtual_image_id in sorted(existing)],
+                "meta": {"offset": 0, "max": 100, "size": len(existing), "total": len(existing)},
+            }
+        )
+
+    def _delete_handler(self, resource_type: ResourceType):
+        def delete(request: StubRequest) -> StubResponse:
+            resource_id = int(request.path_params["id"])
+            with self._lock:
+                self.deletes.append((resource_type, resource_id))
+                if (resource_type, resource_id) in self.failing_deletes:
+                    return StubResponse(status=500, body={"success": False})
+                if (resource_type, resource_id) in self.malformed_deletes:
+                    return StubResponse(body=["unexpected"])
+                self.removing[resource_type].add(resource_id)
+            return StubResponse(body={"success": True})
+
+        return delete
+
+    def _list(self, resource_type: ResourceType, resources, owner: int = None) -> set[int]:
+        # Resources being removed are listed one last time, then they are gone
+        with self._lock:
+            if owner is None:
+                existing = set(resources)
+            else:
+                existing = {resource_id for resource_id, instance_id in resources.items() if instance_id == owner}
+            removed = existing & self.removing[resource_type]
+            self.removing[resource_type] -= removed
+            for resource_id in removed:
+                if isinstance(resources, set):
+                    resources.discard(resource_id)
+                else:
+                    del resources[resource_id]
+            return existing
+
+
+def _build_service(stub_server: MorpheusStubServer) -> MorpheusAPIService:
+    return MorpheusAPIService(APISettings(base_url=stub_server.base_url, api_token="token", max_retries=0))
+
+
+def test_teardown_deletes_in_dependency_order(stub_server: MorpheusStubServer):
+    """
+    Test that the tracked resources are deleted phase by phase and the deletions are confirmed with list queries.
+
+    This function performs the following steps:
+    1. Track the snapshots, backups and instances of NUMBER_OF_INSTANCES instances and two virtual images.
+    2. Run the teardown.
+    3. Verify that every resource is gone, snapshots were deleted before backups, backups before instances and
+       instances before images, and no resource was polled individually.
+    """
+    instance_ids = list(range(1, NUMBER_OF_INSTANCES + 1))
+    appliance = TeardownAppliance(instance_ids)
+    appliance.register(stub_server)
+    morpheus_api_service = _build_service(stub_server)
+
+    engine = TeardownEngine(morpheus_api_service, max_wait_time=MAX_WAIT_TIME, sleep_time=SLEEP_TIME)
+    for virtual_image_id in appliance.virtual_images:
+        engine.track_virtual_image(virtual_image_id)
+    for instance_id in instance_ids:
+        engine.track_instance(instance_id)
+    for backup_id, instance_id in appliance.backups.items():
+        engine.track_backup(backup_id, instance_id)
+    for snapshot_id, instance_id in appliance.snapshots.items():
+        engine.track_snapshot(snapshot_id, instance_id=instance_id)
+
+    assert engine.teardown() == {}
+    assert engine.tracked() == {}
+    assert not (appliance.instances or appliance.snapshots or appliance.backups or appliance.virtual_images)
+
+    phases = [resource_type for resource_type, _ in appliance.deletes]
+    assert phases == sorted(
+        phases,
+        key=[ResourceType.SNAPSHOT, ResourceType.BACKUP, ResourceType.INSTANCE, ResourceType.VIRTUAL_IMAGE].index,
+    )
+    assert len(appliance.deletes) == 2 * NUMBER_OF_INSTANCES + NUMBER_OF_INSTANCES + NUMBER_OF_INSTANCES + 2
+    assert not any(
+        request.method == "GET" and request.path.startswith(("/api/snapshots/", "/api/virtual-images/"))
+        for request in stub_server.requests
+    )
+    morpheus_api_service.close()
+
+
+def test_failed_delete_is_reported_and_later_phases_run(stub_server: MorpheusStubServer):
+    """
+    Test that a failed delete is returned as a leftover, stays tracked, and does not stop the following phases.
+    """
+    appliance = TeardownAppliance([1, 2])
+    appliance.failing_deletes.add((ResourceType.SNAPSHOT, 11))
+    appliance.register(stub_server)
+    morpheus_api_service = _build_service(stub_server)
+
+    engine = TeardownEngine(morpheus_api_service, max_wait_time=MAX_WAIT_TIME, sleep_time=SLEEP_TIME)
+    engine.track_snapshot(10, instance_id=1)
+    engine.track_snapshot(11, instance_id=1)
+    engine.track_instance(1)
+    engine.track_instance(2)
+    engine.track_instance(3)  # already gone, the list query confirms it right away
+
+    assert engine.teardown() == {ResourceType.SNAPSHOT: [11]}
+    assert engine.tracked() == {ResourceType.SNAPSHOT: [11]}
+    assert appliance.instances == set()
+    morpheus_api_service.close()
+
+
+def test_unexpected_delete_error_does_not_abort_the_teardown(stub_server: MorpheusStubServer):
+    """
+    Test that a delete raising an unexpected error is reported as a leftover while the rest of the teardown runs.
+    """
+    appliance = TeardownAppliance([1, 2])
+    appliance.malformed_deletes.add((ResourceType.SNAPSHOT, 10))
+    appliance.register(stub_server)
+    morpheus_api_service = _build_service(stub_server)
+
+    engine = TeardownEngine(morpheus_api_service, max_wait_time=MAX_WAIT_TIME, sleep_time=SLEEP_TIME)
+    engine.track_snapshot(10, instance_id=1)
+    engine.track_snapshot(11, instance_id=1)
+    engine.track_instance(1)
+    engine.track_instance(2)
+
+    assert engine.teardown() == {ResourceType.SNAPSHOT: [10]}
+    assert appliance.instances == set()
+    morpheus_api_service.close()
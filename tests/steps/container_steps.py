@@ -1,8 +1,9 @@
 import time
 import logging
 from lib.common.enums.instance_status import InstanceStatus
-from morpheus_api.dataclasses.container import Container
+from lib.common.enums.resource_type import ResourceType
 from morpheus_api.settings import MorpheusAPIService
+from tests.steps.morpheus.status_watcher import StatusWatcher
 
 logger = logging.getLogger()
 
@@ -26,22 +27,12 @@ def wait_for_container_status_update(
         status (InstanceStatus): The desired status to wait for.
         max_wait_time (int, optional): The maximum time to wait for the container to reach the desired status, \
             in seconds. Defaults to 3600 seconds (60 minutes).
-        sleep_time (int, optional): The time to wait between status checks, in seconds. Defaults to 10 seconds.
+        sleep_time (int, optional): The longest time to wait between status checks, in seconds. Defaults to 10 seconds.
     Return:
         bool: True if container is running state, false if max time for status update is exceeded
     """
-    start_time = time.time()
-    while time.time() - start_time <= max_wait_time:
-        container: Container = morpheus_api_service.container_service.get_container_by_id(container_id)
-        if container.container.status == status.value:
-            return True
-        else:
-            logger.info(f"Waiting for container status to be '{status.value}'...")
-            time.sleep(sleep_time)
-
-    else:
-        logger.error(f"Max wait time exceeded for instance status '{status.value}' update.")
-        return False
+    with StatusWatcher.for_wait(morpheus_api_service, max_wait_time, sleep_time=sleep_time) as watcher:
+        return watcher.subscribe(ResourceType.CONTAINER, container_id, status, max_wait_time=max_wait_time).result()
 
 
 def wait_for_container_deletion(
@@ -0,0 +1,370 @@
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+from morpheus_api.configuration.request_metrics import LatencyHistogram
+from morpheus_api.settings import MorpheusAPIService
+from tests.steps.morpheus.instance_steps import (
+    create_instance_from_template,
+    delete_instance,
+    reconfigure_instance,
+    start_instances,
+    stop_instances,
+    wait_for_instance_cloning,
+)
+from tests.steps.morpheus.snapshot_steps import create_multiple_snapshots_of_an_instance
+
+logger = logging.getLogger()
+
+"""This module contains the ApplianceBenchmark, which measures the lifecycle operations at several concurrencies.
+
+At every concurrency level, that many workers each drive instances through create, stop, start, snapshot, clone,
+resize and delete with the step functions used by the functional tests. The latency of every operation is recorded
+per level, together with the throughput and the error rate, and the results are dumped as a JSON report labelled
+with the target and the appliance build, so runs against a real appliance or the local simulation can be compared
+release to release with compare_benchmark_reports.
+"""
+
+# Operations of one lifecycle, in the order a worker runs them
+BENCHMARK_OPERATIONS = ("create", "stop", "start", "snapshot", "clone", "resize", "delete")
+
+# Number of concurrent workers of every benchmark level
+CONCURRENCY_LEVELS = (1, 4, 16, 64)
+
+# Quantiles reported per level and operation
+BENCHMARK_QUANTILES = (0.5, 0.95, 0.99)
+
+
+class OperationCycle:
+    """The lifecycle of one benchmark instance, one method per operation.
+
+    Every operation returns whether it succeeded. The instance and its clone are deleted by cleanup when the cycle
+    stops early or does not include the delete operation.
+
+    Attributes:
+        morpheus_api_service (MorpheusAPIService): The service to interact with the Morpheus API.
+        instance_name (str): The name of the instance; its clone is named "<instance_name>-clone".
+        create_arguments (dict[str, Any]): The arguments of create_instance_from_template besides the service and \
+            the name: template, volume type, datastore, network, layout, plan and zone.
+        resize_plan_id (Optional[int]): The plan the instance is resized to.
+        instance_id (Optional[int]): The ID of the instance, None until it is created and after it is deleted.
+        clone_id (Optional[int]): The ID of the clone, None until it is found.
+    """
+
+    def __init__(
+        self,
+        morpheus_api_service: MorpheusAPIService,
+        instance_name: str,
+        create_arguments: dict[str, Any],
+        resize_plan_id: Optional[int] = None,
+    ):
+        self.morpheus_api_service = morpheus_api_service
+        self.instance_name = instance_name
+        self.create_arguments = create_arguments
+        self.resize_plan_id = resize_plan_id
+        self.instance_id: Optional[int] = None
+        self.clone_id: Optional[int] = None
+
+    def create(self) -> bool:
+        result, instance = create_instance_from_template(
+            self.morpheus_api_service, instance_name=self.instance_name, **self.create_arguments
+        )
+        self.instance_id = instance.instance.id
+        return result
+
+    def stop(self) -> bool:
+        return stop_instances(self.morpheus_api_service, [self.instance_id])
+
+    def start(self) -> bool:
+        return start_instances(self.morpheus_api_service, [self.instance_id])
+
+    def snapshot(self) -> bool:
+        return len(create_multiple_snapshots_of_an_instance(self.morpheus_api_service, self.instance_id)) == 1
+
+    def clone(self) -> bool:
+        clone_name = f"{self.instance_name}-clone"
+        self.morpheus_api_service.instance_service.clone_instance(self.instance_id, clone_name)
+        result, cloned_instance = wait_for_instance_cloning(self.morpheus_api_service, clone_name)
+        if cloned_instance is not None:
+            self.clone_id = cloned_instance.id
+        return result
+
+    def resize(self) -> bool:
+        result, _ = reconfigure_instance(self.morpheus_api_service, self.instance_id, plan_id=self.resize_plan_id)
+        return result
+
+    def delete(self) -> bool:
+        delete_instance(self.morpheus_api_service, self.instance_id)
+        self.instance_id = None
+        return True
+
+    def cleanup(self):
+        """Deletes the clone and the instance left by the cycle; errors are logged, not raised."""
+        for instance_id in (self.clone_id, self.instance_id):
+            if instance_id is None:
+                continue
+            try:
+                delete_instance(self.morpheus_api_service, instance_id, force="on")
+            except Exception as error:
+                logger.error(f"Unable to delete benchmark instance {instance_id}: {error!r}")
+        self.clone_id = None
+        self.instance_id = None
+
+
+class BenchmarkLevel:
+    """Thread-safe results of the benchmark at one concurrency level.
+
+    Attributes:
+        concurrency (int): The number of concurrent workers.
+        duration (float): The wall time of the level, in seconds.
+        histograms (dict[str, LatencyHistogram]): The latency of the successful calls, by operation.
+        failures (dict[str, int]): The number of failed calls, by operation.
+        skipped (dict[str, int]): The number of calls not made because an earlier operation failed, by operation.
+    """
+
+    def __init__(self, concurrency: int):
+        self.concurrency = concurrency
+        self.duration = 0.0
+        self.histograms: dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self.failures: dict[str, int] = defaultdict(int)
+        self.skipped: dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def record(self, operation: str, seconds: float, failed: bool):
+        """Records one operation call.
+
+        Args:
+            operation (str): The operation.
+            seconds (float): The latency of the call.
+            failed (bool): Whether the call raised or returned False.
+        """
+        with self._lock:
+            if failed:
+                self.failures[operation] += 1
+            else:
+                self.histograms[operation].record(seconds)
+
+    def skip(self, operation: str):
+        with self._lock:
+            self.skipped[operation] += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the results of the level.
+
+        Returns:
+            dict[str, Any]: The throughput in successful operations per minute, the error rate and, per operation, \
+                the count, failures, throughput, mean, max and latency percentiles in seconds.
+        """
+        minutes = self.duration / 60 if self.duration else None
+        with self._lock:
+            operations = {}
+            for operation in sorted(set(self.histograms) | set(self.failures) | set(self.skipped)):
+                histogram = self.histograms[operation]
+                failures = self.failures[operation]
+                calls = histogram.count + failures
+                operations[operation] = {
+                    "count": histogram.count,
+                    "failures": failures,
+                    "skipped": self.skipped[operation],
+                    "error_rate": failures / calls if calls else None,
+                    "throughput_per_minute": histogram.count / minutes if minutes else None,
+                    "mean": histogram.total / histogram.count if histogram.count else None,
+                    "max": histogram.max,
+                    **{f"p{quantile * 100:g}": histogram.quantile(quantile) for quantile in BENCHMARK_QUANTILES},
+                }
+        completed = sum(stats["count"] for stats in operations.values())
+        failed = sum(stats["failures"] for stats in operations.values())
+        return {
+            "concurrency": self.concurrency,
+            "duration": self.duration,
+            "operations_completed": completed,
+            "operations_failed": failed,
+            "throughput_per_minute": completed / minutes if minutes else None,
+            "error_rate": failed / (completed + failed) if completed + failed else None,
+            "operations": operations,
+        }
+
+
+class ApplianceBenchmark:
+    """Runs the instance lifecycle operations at increasing concurrency and reports every level.
+
+    A level with concurrency N runs N workers; each drives `cycles` instances, one after the other, through the
+    operations in order. An operation failing (raising or returning False) skips the rest of its cycle, whose
+    instances are then deleted. The benchmark only uses the step functions, so it runs unchanged against a real
+    appliance or a SimulatedAppliance served by the stub server.
+
+    Usage:
+        benchmark = ApplianceBenchmark(morpheus_api_service, create_arguments, resize_plan_id=plan_id)
+        benchmark.run(levels=(1, 4, 16, 64))
+        benchmark.dump("logs/benchmarks", target="appliance", build="8.0.1")
+    """
+
+    def __init__(
+        self,
+        morpheus_api_service: MorpheusAPIService,
+        create_arguments: dict[str, Any],
+        resize_plan_id: Optional[int] = None,
+        operations: tuple[str, ...] = BENCHMARK_OPERATIONS,
+        cycles: int = 1,
+        name_prefix: str = "HPE-BMaaS-Bench",
+    ):
+        """Initializes the benchmark.
+
+        Args:
+            morpheus_api_service (MorpheusAPIService): The service to interact with the Morpheus API, shared by \
+                the workers; size APISettings.pool_maxsize for the highest level.
+            create_arguments (dict[str, Any]): The arguments of create_instance_from_template besides the service \
+                and the instance name.
+            resize_plan_id (Optional[int], optional): The plan the instances are resized to. Defaults to None.
+            operations (tuple[str, ...], optional): The operations of a cycle, a subset of BENCHMARK_OPERATIONS \
+                in that order; "create" is always run first. Defaults to BENCHMARK_OPERATIONS.
+            cycles (int, optional): The number of cycles of every worker. Defaults to 1.
+            name_prefix (str, optional): The prefix of the instance names. Defaults to "HPE-BMaaS-Bench".
+
+        Raises:
+            ValueError: If an operation is unknown.
+        """
+        unknown = set(operations) - set(BENCHMARK_OPERATIONS)
+        if unknown:
+            raise ValueError(f"Unknown benchmark operations {sorted(unknown)}, expected {BENCHMARK_OPERATIONS}")
+        self.morpheus_api_service = morpheus_api_service
+        self.create_arguments = create_arguments
+        self.resize_plan_id = resize_plan_id
+        self.operations = ("create",) + tuple(
+            operation for operation in BENCHMARK_OPERATIONS if operation in operations and operation != "create"
+        )
+        self.cycles = cycles
+        self.name_prefix = name_prefix
+        self.levels: list[BenchmarkLevel] = []
+
+    def run(self, levels: tuple[int, ...] = CONCURRENCY_LEVELS) -> list[BenchmarkLevel]:
+        """Runs every concurrency level, one after the other.
+
+        Args:
+            levels (tuple[int, ...], optional): The concurrency levels. Defaults to CONCURRENCY_LEVELS.
+
+        Returns:
+            list[BenchmarkLevel]: The results of the levels, also kept in `levels`.
+        """
+        return [self.run_level(concurrency) for concurrency in levels]
+
+    def run_level(self, concurrency: int) -> BenchmarkLevel:
+        """Runs one concurrency level.
+
+        Args:
+            concurrency (int): The number of concurrent workers.
+
+        Returns:
+            BenchmarkLevel: The results of the level, also appended to `levels`.
+        """
+        level = BenchmarkLevel(concurrency)
+        run_id = str(uuid.uuid4())[:5]
+        logger.info(f"Benchmarking {'/'.join(self.operations)} with {concurrency} workers")
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="benchmark") as executor:
+            for future in [
+                executor.submit(self._run_cycle, level, f"{self.name_prefix}-{run_id}-{concurrency}-{index}")
+                for index in range(concurrency * self.cycles)
+            ]:
+                future.result()
+        level.duration = time.perf_counter() - start
+        summary = level.to_dict()
+        logger.info(
+            f"Concurrency {concurrency}: {summary['operations_completed']} operations in {level.duration:.1f}s, "
+            f"{summary['throughput_per_minute']:.1f} ops/min, {summary['operations_failed']} failed"
+        )
+        self.levels.append(level)
+        return level
+
+    def _run_cycle(self, level: BenchmarkLevel, instance_name: str):
+        cycle = OperationCycle(self.morpheus_api_service, instance_name, self.create_arguments, self.resize_plan_id)
+        try:
+            for index, operation in enumerate(self.operations):
+                start = time.perf_counter()
+                try:
+                    failed = getattr(cycle, operation)() is False
+                except Exception as error:
+                    logger.error(f"Benchmark {operation} of {instance_name} raised: {error!r}")
+                    failed = True
+                level.record(operation, time.perf_counter() - start, failed)
+                if failed:
+                    remaining = index + 1
+                    for skipped in self.operations[remaining:]:
+                        level.skip(skipped)
+                    return
+        finally:
+            cycle.cleanup()
+
+    def to_dict(self, target: str = "", build: str = "") -> dict[str, Any]:
+        """Returns the benchmark report.
+
+        Args:
+            target (str, optional): What the benchmark ran against, e.g. "simulated" or "appliance". Defaults to "".
+            build (str, optional): The label of the appliance build. Defaults to "".
+
+        Returns:
+            dict[str, Any]: The target, build, operations, cycles and the results of every level.
+        """
+        return {
+            "target": target,
+            "build": build,
+            "generated_at": time.time(),
+            "operations": list(self.operations),
+            "cycles": self.cycles,
+            "levels": [level.to_dict() for level in self.levels],
+        }
+
+    def dump(self, directory: str, name: str = None, target: str = "", build: str = "") -> str:
+        """Writes the benchmark report to <name>.json in a directory.
+
+        Args:
+            directory (str): The output directory; created when missing.
+            name (str, optional): The base name of the file. Defaults to "appliance_benchmark_<timestamp>".
+            target (str, optional): What the benchmark ran against. Defaults to "".
+            build (str, optional): The label of the appliance build. Defaults to "".
+
+        Returns:
+            str: The path of the report.
+        """
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{name or 'appliance_benchmark_' + time.strftime('%Y%m%d_%H%M%S')}.json")
+        with open(path, "w") as report_file:
+            json.dump(self.to_dict(target=target, build=build), report_file, indent=2)
+        logger.info(f"Appliance benchmark of {len(self.levels)} concurrency levels written to {path}")
+        return path
+
+
+def compare_benchmark_reports(baseline: dict[str, Any], current: dict[str, Any]) -> dict[str, dict[str, float]]:
+    """Compares two benchmark reports, e.g. of two appliance builds.
+
+    Args:
+        baseline (dict[str, Any]): The reference report, as written by ApplianceBenchmark.dump.
+        current (dict[str, Any]): The report to compare.
+
+    Returns:
+        dict[str, dict[str, float]]: The current / baseline ratio of the throughput and of every latency \
+            percentile, keyed by "<concurrency>/<operation>", for the levels and operations found in both reports. \
+            A throughput ratio below 1 or a percentile ratio above 1 is a slowdown.
+    """
+    reference_levels = {level["concurrency"]: level for level in baseline.get("levels", [])}
+    comparison = {}
+    for level in current.get("levels", []):
+        reference_level = reference_levels.get(level["concurrency"])
+        if reference_level is None:
+            continue
+        for operation, stats in level["operations"].items():
+            reference = reference_level["operations"].get(operation)
+            if reference is None:
+                continue
+            ratios = {}
+            for key in ("throughput_per_minute", *(f"p{quantile * 100:g}" for quantile in BENCHMARK_QUANTILES)):
+                if reference.get(key) and stats.get(key) is not None:
+                    ratios[key] = stats[key] / reference[key]
+            comparison[f"{level['concurrency']}/{operation}"] = ratios
+    return comparison
@@ -2,6 +2,7 @@ import json
 import logging
 import time
 import re
+from typing import Callable, Optional
 from lib.common.enums.linux_filesystem_types import LinuxFilesystemTypes
 from lib.common.enums.windows_filesystem_types import WindowsFilesystemTypes
 from lib.common.enums.service_plan_name import ServicePlanName
@@ -10,7 +11,9 @@ from lib.platform.io_manager import IOManager
 from lib.platform.remote_ssh_manager import RemoteConnect
 from morpheus_api.dataclasses.common_objects import CommonRequiredData
 from morpheus_api.dataclasses.network import NetworkID, NetworkInterface
+from morpheus_api.dataclasses.query import ListQuery
 from morpheus_api.dataclasses.volume import Volume
+from morpheus_api.helpers.lookup_graph import LookupGraph
 from morpheus_api.settings import ProxySettings, VDBenchSettings, MorpheusAPIService, MorpheusSettings
 from lib.common.enums.ip_mode import IPMode
 
@@ -156,10 +159,82 @@ def write_and_validate_data_vdbench(
     return io_manager.run_vdbench(validate=validate, custom_config_file_name=custom_config_file_name)
 
 
+def _lookup_storage_bucket(morpheus_api_service: MorpheusAPIService, name: str) -> Optional[dict]:
+    storage_bucket_list = morpheus_api_service.storage_bucket_service.list_storage_buckets(max=1, name=name)
+    if storage_bucket_list.meta.total:
+        return {"id": storage_bucket_list.storage_buckets[0].id}
+    return None
+
+
+def _lookup_storage_volume_type(morpheus_api_service: MorpheusAPIService, code: str) -> Optional[dict]:
+    storage_volume_type_list = morpheus_api_service.storage_volume_type_service.list_storage_volumes(max=1, code=code)
+    if storage_volume_type_list.meta.total:
+        return {"id": storage_volume_type_list.storage_volume_types[0].id}
+    return None
+
+
+def _lookup_cluster(morpheus_api_service: MorpheusAPIService) -> Optional[dict]:
+    cluster_list = morpheus_api_service.cluster_service.list_clusters(max=1)
+    if cluster_list.meta.total:
+        return {"id": cluster_list.clusters[0].id, "name": cluster_list.clusters[0].name}
+    return None
+
+
+def _lookup_provision_type(morpheus_api_service: MorpheusAPIService) -> Optional[dict]:
+    provision_type_list = morpheus_api_service.provision_type_service.list_provision_types(max=1)
+    if provision_type_list.meta.total:
+        return {"id": provision_type_list.provision_types[0].id}
+    return None
+
+
+def _lookup_zone(morpheus_api_service: MorpheusAPIService) -> Optional[dict]:
+    zone_list = morpheus_api_service.zone_service.list_zones(ListQuery(max=1))
+    if zone_list.meta.total:
+        return {"id": zone_list.zones[0].id, "name": zone_list.zones[0].name}
+    return None
+
+
+def _lookup_network(morpheus_api_service: MorpheusAPIService, zone_id: int, provision_type_id: int) -> Optional[dict]:
+    option_types = morpheus_api_service.option_service.get_network_options_for_cloud(
+        zone_id=zone_id,
+        provision_type_id=provision_type_id,
+    )
+    if option_types.data.networks:
+        return {"id": option_types.data.networks[0].id}
+    return None
+
+
+def _lookup_instance_type(morpheus_api_service: MorpheusAPIService) -> Optional[dict]:
+    instance_type_list = morpheus_api_service.instance_type_service.get_all_instance_types(max=1)
+    if instance_type_list.meta.total:
+        return {"id": instance_type_list.instance_types[0].id}
+    return None
+
+
+def _lookup_layout(morpheus_api_service: MorpheusAPIService, instance_type_id: int) -> Optional[dict]:
+    layout_list = morpheus_api_service.instance_type_service.get_instance_type_layouts(
+        instance_type_id=instance_type_id
+    )
+    if len(layout_list):
+        return {"id": layout_list[0].id, "code": layout_list[0].code}
+    return None
+
+
+def _lookup_service_plan(
+    morpheus_api_service: MorpheusAPIService, service_plan_name: ServicePlanName
+) -> Optional[dict]:
+    service_plans = morpheus_api_service.service_plan_service.iter_service_plans(name=service_plan_name)
+    service_plan = next((service_plan for service_plan in service_plans if "kvm" in service_plan.code), None)
+    if service_plan:
+        return {"id": service_plan.id, "code": service_plan.code}
+    return None
+
+
 def get_required_data(
     morpheus_api_service: MorpheusAPIService,
     storage_volume_type: StorageVolumeType = StorageVolumeType.STANDARD,
     service_plan_name: ServicePlanName = ServicePlanName.CPU_1_MEMORY_1_GB,
+    use_cache: bool = True,
 ) -> CommonRequiredData:
     """
     Fetch required data for instance and virtual images creation
@@ -168,6 +243,8 @@ def get_required_data(
         morpheus_api_service (MorpheusAPIService): An instance of MorpheusAPIService for API interactions.
         storage_volume_type (StorageVolumeType): The type of storage volume to fetch for STORAGE_VOLUME_TYPE_ID. Defaults to StorageVolumeType.STANDARD.
         service_plan_name (ServicePlanName): The name of the service plan to fetch for PLAN_ID and PLAN_CODE. Defaults to ServicePlanName.CPU_1_MEMORY_1_GB.
+        use_cache (bool): Resolve the lookups through morpheus_api_service.discovery_cache, so repeated calls within \
+            its TTL make no API calls. Defaults to True.
 
     This function obtains the required data for creating instances and virtual images:
         - used when creating virtual image (import as image)
@@ -192,36 +269,98 @@ def get_required_data(
         - used in fetching layouts
         INSTANCE_TYPE_ID
 
+    The lookups run as a dependency graph on a thread pool (see LookupGraph), so the setup latency is the critical
+    path (zone/provision type -> network, instance type -> layout) rather than the sum of all lookups. The duration
+    of every lookup and the critical path are logged.
+
     Returns:
         CommonRequiredData: An object containing the required data for instance and virtual images creation
     """
     required_data = CommonRequiredData()
+    storage_bucket_name = settings.instance_settings.storage_bucket_name
+
+    def lookup(query: str, fetch: Callable[[], Optional[dict]]) -> dict:
+        if use_cache:
+            result = morpheus_api_service.discovery_cache.get_or_fetch(
+                morpheus_api_service.discovery_cache_scope, query, fetch
+            )
+        else:
+            result = fetch()
+        return result or {}
+
+    # Only the network options (zone, provision type) and the layouts (instance type) depend on other lookups,
+    # everything else is resolved in parallel
+    graph = LookupGraph()
+    graph.add(
+        "storage_bucket",
+        lambda: lookup(
+            f"storage_buckets?name={storage_bucket_name}",
+            lambda: _lookup_storage_bucket(morpheus_api_service, storage_bucket_name),
+        ),
+    )
+    graph.add(
+        "storage_volume_type",
+        lambda: lookup(
+            f"storage_volume_types?code={storage_volume_type.value}",
+            lambda: _lookup_storage_volume_type(morpheus_api_service, storage_volume_type.value),
+        ),
+    )
+    graph.add("cluster", lambda: lookup("clusters?first", lambda: _lookup_cluster(morpheus_api_service)))
+    graph.add(
+        "provision_type", lambda: lookup("provision_types?first", lambda: _lookup_provision_type(morpheus_api_service))
+    )
+    graph.add("zone", lambda: lookup("zones?first", lambda: _lookup_zone(morpheus_api_service)))
+    graph.add(
+        "network",
+        lambda zone, provision_type: lookup(
+            f"network_options?zone_id={zone.get('id')}&provision_type_id={provision_type.get('id')}",
+            lambda: _lookup_network(morpheus_api_service, zone.get("id"), provision_type.get("id")),
+        ),
+        depends_on=["zone", "provision_type"],
+    )
+    graph.add(
+        "instance_type", lambda: lookup("instance_types?first", lambda: _lookup_instance_type(morpheus_api_service))
+    )
+    graph.add(
+        "layout",
+        lambda instance_type: lookup(
+            f"instance_type_layouts?instance_type_id={instance_type.get('id')}",
+            lambda: _lookup_layout(morpheus_api_service, instance_type.get("id")),
+        ),
+        depends_on=["instance_type"],
+    )
+    graph.add(
+        "service_plan",
+        lambda: lookup(
+            f"service_plans?name={service_plan_name.value}&code=kvm",
+            lambda: _lookup_service_plan(morpheus_api_service, service_plan_name),
+        ),
+    )
 
-    logger.info(f"Fetching storage bucket: {settings.instance_settings.storage_bucket_name}")
-    storage_bucket_list = morpheus_api_service.storage_bucket_service.list_storage_buckets(
-        name=settings.instance_settings.storage_bucket_name
+    logger.info(
+        f"Fetching storage bucket '{storage_bucket_name}', storage volume type '{storage_volume_type.value}', "
+        f"cluster, provision type, zone, network, instance type, layout and service plan '{service_plan_name.value}'"
     )
-    if storage_bucket_list.meta.total:
-        required_data.storage_bucket_id = storage_bucket_list.storage_buckets[0].id
+    lookups = graph.run()
+
+    storage_bucket = lookups["storage_bucket"]
+    if storage_bucket:
+        required_data.storage_bucket_id = storage_bucket["id"]
         logger.info(f"Storage bucket ID: {required_data.storage_bucket_id}")
     else:
-        logger.info(f"Storage bucket {settings.instance_settings.storage_bucket_name} not found")
+        logger.info(f"Storage bucket {storage_bucket_name} not found")
 
-    logger.info(f"Fetching storage volume type: {storage_volume_type.value}")
-    storage_volume_type_list = morpheus_api_service.storage_volume_type_service.list_storage_volumes(
-        code=storage_volume_type.value
-    )
-    if storage_volume_type_list.meta.total:
-        required_data.storage_volume_type_id = storage_volume_type_list.storage_volume_types[0].id
+    volume_type = lookups["storage_volume_type"]
+    if volume_type:
+        required_data.storage_volume_type_id = volume_type["id"]
         logger.info(f"Storage volume type ID: {required_data.storage_volume_type_id}")
     else:
         logger.info(f"Storage volume type {storage_volume_type.value} not found")
 
-    logger.info("Fetching cluster ID")
-    cluster_list = morpheus_api_service.cluster_service.list_clusters()
-    if cluster_list.meta.total:
-        required_data.cluster_id = cluster_list.clusters[0].id
-        required_data.cluster_name = cluster_list.clusters[0].name
+    cluster = lookups["cluster"]
+    if cluster:
+        required_data.cluster_id = cluster["id"]
+        required_data.cluster_name = cluster["name"]
         logger.info(f"Cluster ID: {required_data.cluster_id}, Cluster Name: {required_data.cluster_name}")
     else:
         logger.info("Cluster not found")
@@ -236,61 +375,47 @@ def get_required_data(
     # else:
     #     logger.info(f"Datastore {settings.instance_settings.datastore_name} not found")
 
-    logger.info("Fetching provision type ID")
-    provision_type_list = morpheus_api_service.provision_type_service.list_provision_types()
-    if provision_type_list.meta.total:
-        required_data.provision_type_id = provision_type_list.provision_types[0].id
+    provision_type = lookups["provision_type"]
+    if provision_type:
+        required_data.provision_type_id = provision_type["id"]
         logger.info(f"Provision type ID: {required_data.provision_type_id}")
     else:
         logger.info("Provision type not found")
 
-    logger.info("Fetching zone ID")
-    zone_list = morpheus_api_service.zone_service.list_zones()
-    if zone_list.meta.total:
-        required_data.zone_id = zone_list.zones[0].id
-        required_data.zone_name = zone_list.zones[0].name
+    zone = lookups["zone"]
+    if zone:
+        required_data.zone_id = zone["id"]
+        required_data.zone_name = zone["name"]
         logger.info(f"Zone ID: {required_data.zone_id}, Zone Name: {required_data.zone_name}")
     else:
         logger.info("Zone not found")
 
-    logger.info("Fetching network ID")
-    option_types = morpheus_api_service.option_service.get_network_options_for_cloud(
-        zone_id=required_data.zone_id,
-        provision_type_id=required_data.provision_type_id,
-    )
-    if option_types.data.networks:
-        required_data.network_id = option_types.data.networks[0].id
+    network = lookups["network"]
+    if network:
+        required_data.network_id = network["id"]
         logger.info(f"Network ID: {required_data.network_id}")
     else:
         logger.info("Network not found")
 
-    logger.info("Fetching instance type ID")
-    instance_type_list = morpheus_api_service.instance_type_service.get_all_instance_types()
-    if instance_type_list.meta.total:
-        required_data.instance_type_id = instance_type_list.instance_types[0].id
+    instance_type = lookups["instance_type"]
+    if instance_type:
+        required_data.instance_type_id = instance_type["id"]
         logger.info(f"Instance Type ID: {required_data.instance_type_id}")
     else:
         logger.info("Instance Type not found")
 
-    logger.info(f"Fetching instance type layout ID and CODE for instance type: {required_data.instance_type_id}")
-    layout_list = morpheus_api_service.instance_type_service.get_instance_type_layouts(
-        instance_type_id=required_data.instance_type_id
-    )
-    if len(layout_list):
-        layout = layout_list[0]
-        required_data.layout_id = layout.id
-        required_data.layout_code = layout.code
+    layout = lookups["layout"]
+    if layout:
+        required_data.layout_id = layout["id"]
+        required_data.layout_code = layout["code"]
         logger.info(f"Layout ID: {required_data.layout_id}, Layout Code: {required_data.layout_code}")
     else:
         logger.info("Layout not found")
 
-    logger.info(f"Fetching service plan: {service_plan_name.value}")
-    service_plans = morpheus_api_service.service_plan_service.list_service_plans(name=service_plan_name)
-    service_plan_filtered = [service_plan for service_plan in service_plans.service_plans if "kvm" in service_plan.code]
-    if service_plan_filtered:
-        service_plan = service_plan_filtered[0]
-        required_data.plan_id = service_plan.id
-        required_data.plan_code = service_plan.code
+    service_plan = lookups["service_plan"]
+    if service_plan:
+        required_data.plan_id = service_plan["id"]
+        required_data.plan_code = service_plan["code"]
         logger.info(f"Service Plan ID: {required_data.plan_id}, Service Plan Code: {required_data.plan_code}")
     else:
         logger.info(f"Service Plan {service_plan_name.value} not found")
@@ -298,6 +423,20 @@ def get_required_data(
     return required_data
 
 
+def invalidate_required_data_cache(morpheus_api_service: MorpheusAPIService) -> int:
+    """
+    Forgets the cached get_required_data lookups of the appliance and API token, e.g. after clusters or plans were
+    reconfigured.
+
+    Args:
+        morpheus_api_service (MorpheusAPIService): An instance of MorpheusAPIService for API interactions.
+
+    Returns:
+        int: The number of removed cache entries.
+    """
+    return morpheus_api_service.discovery_cache.invalidate(scope=morpheus_api_service.discovery_cache_scope)
+
+
 def build_volume(
     name: str, storage_type: int, size: int = None, id: int = -1, root_volume: bool = False, datastore_id: str = None
 ) -> Volume:
@@ -0,0 +1,320 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Iterator, Optional
+
+import requests
+
+from lib.common.enums.instance_status import InstanceStatus
+from lib.common.enums.resource_type import ResourceType
+from lib.common.exceptions import APIError
+from morpheus_api.api_endpoints.instance_service import InstanceService
+from morpheus_api.configuration.retry_policy import RetryPolicy
+from morpheus_api.dataclasses.instance import Instance, InstanceCreateData
+from morpheus_api.settings import MorpheusAPIService
+from tests.steps.morpheus.status_watcher import StatusWatcher
+
+logger = logging.getLogger()
+
+"""This module contains steps to provision a fleet of instances with a bounded number of creates in flight.
+
+Creates are submitted by a pool of `max_in_flight` workers. A worker holds its slot from the create call until the
+instance (and its copies) reached RUNNING or failed, so the appliance never has more than `max_in_flight` of the
+fleet's provisions running at once. All pending instances are watched by one StatusWatcher, i.e. one batched list
+call per polling tick for the whole fleet.
+"""
+
+# Number of instances of the fleet provisioning at the same time
+DEFAULT_MAX_IN_FLIGHT = 10
+
+# Number of times a create rejected with 429 Too Many Requests is resubmitted
+DEFAULT_THROTTLE_RETRIES = 5
+
+
+class ThrottleRetryPolicy(RetryPolicy):
+    """
+    A retry policy that resubmits creates rejected by appliance throttling and nothing else.
+
+    A 429 response means the appliance rejected the create before processing it, so resubmitting it cannot create
+    a duplicate instance. Connection failures and 5xx responses are not retried, as the create may have been
+    processed before the failure.
+    """
+
+    def __init__(self, max_retries: int = DEFAULT_THROTTLE_RETRIES, **kwargs):
+        """Initializes the ThrottleRetryPolicy class.
+
+        Args:
+            max_retries (int, optional): The maximum number of resubmissions of a throttled create. \
+                Defaults to DEFAULT_THROTTLE_RETRIES.
+            **kwargs: Extra arguments passed to RetryPolicy (backoff_factor, max_backoff, stats, ...).
+        """
+        super().__init__(max_retries=max_retries, retry_post=True, retryable_status_codes=frozenset({429}), **kwargs)
+
+    def is_retryable_exception(self, error: Exception) -> bool:
+        return False
+
+
+class FleetInstanceResult:
+    """
+    The outcome of provisioning one instance of a fleet.
+
+    Attributes:
+        index (int): The position of the payload in the fleet.
+        instance_name (str): The name of the instance from the payload.
+        instance_ids (list[int]): The IDs of the created instance and its copies; empty if the create failed.
+        success (bool): True if the instance and all its copies reached RUNNING.
+        status (Optional[str]): The last known status of the instance.
+        error (Optional[str]): The reason of the failure.
+        elapsed (float): The time from the create call until the outcome was known, in seconds.
+        cleaned_up (bool): True if the failed instances were deleted.
+    """
+
+    def __init__(self, index: int, instance_name: str):
+        self.index = index
+        self.instance_name = instance_name
+        self.instance_ids: list[int] = []
+        self.success = False
+        self.status: Optional[str] = None
+        self.error: Optional[str] = None
+        self.elapsed = 0.0
+        self.cleaned_up = False
+
+    def __repr__(self) -> str:
+        outcome = "running" if self.success else f"failed ({self.error})"
+        return f"{self.instance_name} {self.instance_ids}: {outcome} after {self.elapsed:.1f}s"
+
+
+class FleetProvisioning:
+    """
+    A fleet of instances being provisioned; iterate over it to receive the results as the instances finish.
+
+    Provisioning starts as soon as the object is built. Iterating yields one FleetInstanceResult per payload in
+    completion order; a failed instance does not stop the rest of the fleet. Failed instances are deleted when
+    `cleanup_failures` is set. Closing the fleet before every result was received abandons the unfinished
+    instances, which are reported (and cleaned up) as failures.
+
+    Usage:
+        with provision_fleet(morpheus_api_service, payloads, max_in_flight=10) as fleet:
+            for result in fleet:
+                logger.info(result)
+        assert not fleet.failed, fleet.summary()
+    """
+
+    def __init__(
+        self,
+        morpheus_api_service: MorpheusAPIService,
+        payloads: list[InstanceCreateData],
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        max_wait_time: float = 3600,
+        sleep_time: float = 10,
+        cleanup_failures: bool = True,
+        cleanup_force: str = "on",
+        throttle_policy: RetryPolicy = None,
+    ):
+        """Initializes the FleetProvisioning class and submits the creates.
+
+        Args:
+            morpheus_api_service (MorpheusAPIService): The service to interact with the Morpheus API.
+            payloads (list[InstanceCreateData]): The payloads built by create_instance_payload, one per instance.
+            max_in_flight (int, optional): The maximum number of instances provisioning at the same time. \
+                Defaults to DEFAULT_MAX_IN_FLIGHT.
+            max_wait_time (float, optional): The maximum time for one instance to reach RUNNING after its create, \
+                in seconds. Defaults to 3600.
+            sleep_time (float, optional): The lower bound of the longest interval between status checks, \
+                in seconds. Defaults to 10.
+            cleanup_failures (bool, optional): Delete the instances that failed to reach RUNNING. Defaults to True.
+            cleanup_force (str, optional): The force flag of the cleanup deletes. Defaults to "on", as failed \
+                provisions usually cannot be removed gracefully.
+            throttle_policy (RetryPolicy, optional): The retry policy of the create calls. Defaults to a \
+                ThrottleRetryPolicy with the backoff settings of the service's retry policy.
+        """
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
+        self.morpheus_api_service = morpheus_api_service
+        self.max_wait_time = max_wait_time
+        self.cleanup_failures = cleanup_failures
+        self.cleanup_force = cleanup_force
+        self.results: list[FleetInstanceResult] = []
+
+        if throttle_policy is None:
+            service_policy = morpheus_api_service.retry_policy
+            throttle_policy = ThrottleRetryPolicy(
+                backoff_factor=service_policy.backoff_factor,
+                max_backoff=service_policy.max_backoff,
+                stats=service_policy.stats,
+            )
+        instance_service = morpheus_api_service.instance_service
+        # Same session, cache and rate limiter as the service, only the retry policy of the creates differs
+        self._create_service = InstanceService(
+            base_url=instance_service.base_url,
+            api_token=instance_service.api_token,
+            session=instance_service.session,
+            retry_policy=throttle_policy,
+            response_cache=instance_service.response_cache,
+            rate_limiter=instance_service.rate_limiter,
+        )
+
+        self._lock = threading.Lock()
+        self._watcher = StatusWatcher.for_wait(morpheus_api_service, max_wait_time, sleep_time=sleep_time)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, min(max_in_flight, len(payloads))), thread_name_prefix="morpheus-fleet"
+        )
+        logger.info(f"Provisioning a fleet of {len(payloads)} instances, {max_in_flight} at a time")
+        self._futures: list[Future] = [
+            self._executor.submit(self._provision, index, payload) for index, payload in enumerate(payloads)
+        ]
+
+    def __enter__(self) -> "FleetProvisioning":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __iter__(self) -> Iterator[FleetInstanceResult]:
+        for future in as_completed(self._futures):
+            yield future.result()
+
+    def wait(self) -> list[FleetInstanceResult]:
+        """Blocks until every instance finished and logs the summary.
+
+        Returns:
+            list[FleetInstanceResult]: The results, in payload order.
+        """
+        results = [future.result() for future in self._futures]
+        self.log_summary()
+        return results
+
+    @property
+    def succeeded(self) -> list[FleetInstanceResult]:
+        with self._lock:
+            return sorted((result for result in self.results if result.success), key=lambda result: result.index)
+
+    @property
+    def failed(self) -> list[FleetInstanceResult]:
+        with self._lock:
+            return sorted((result for result in self.results if not result.success), key=lambda result: result.index)
+
+    def summary(self) -> str:
+        """Describes the outcome of the finished instances.
+
+        Returns:
+            str: The number of running instances and the reason of every failure.
+        """
+        failed = self.failed
+        lines = [f"{len(self.succeeded)}/{len(self._futures)} fleet instances running, {len(failed)} failed"]
+        lines.extend(
+            f"  {result.instance_name} {result.instance_ids}: {result.error}"
+            f"{' (cleaned up)' if result.cleaned_up else ''}"
+            for result in failed
+        )
+        return "\n".join(lines)
+
+    def log_summary(self):
+        """Logs the summary, as an error if any instance failed."""
+        if self.failed:
+            logger.error(self.summary())
+        else:
+            logger.info(self.summary())
+
+    def close(self):
+        """Abandons the creates that were not submitted yet and stops watching the pending instances."""
+        for future in self._futures:
+            future.cancel()
+        self._watcher.close()
+        self._executor.shutdown(wait=True)
+
+    def _provision(self, index: int, payload: InstanceCreateData) -> FleetInstanceResult:
+        result = FleetInstanceResult(index, payload.instance.name)
+        start = time.time()
+        try:
+            try:
+                created: Instance = self._create_service.create_instance(instance_payload=payload)
+            except (APIError, requests.RequestException) as error:
+                result.error = f"create failed: {error}"
+                return result
+
+            result.instance_ids = [created.instance.id] + [copy.id for copy in created.copies or []]
+            logger.info(f"Fleet instance '{result.instance_name}' created with IDs {result.instance_ids}")
+            try:
+                futures = [
+                    self._watcher.subscribe(
+                        ResourceType.INSTANCE,
+                        instance_id,
+                        InstanceStatus.RUNNING,
+                        max_wait_time=self.max_wait_time,
+                        failure_statuses=[InstanceStatus.FAILED],
+                    )
+                    for instance_id in result.instance_ids
+                ]
+                result.success = self._watcher.wait_all(futures)
+            except RuntimeError:
+                # The fleet was closed while the create was in flight
+                result.success = False
+            if result.success:
+                result.status = InstanceStatus.RUNNING.value
+            else:
+                result.status = self._get_status(result.instance_ids[0])
+                result.error = f"did not reach '{InstanceStatus.RUNNING.value}', last status '{result.status}'"
+                if self.cleanup_failures:
+                    result.cleaned_up = self._cleanup(result.instance_ids)
+            return result
+        finally:
+            result.elapsed = time.time() - start
+            with self._lock:
+                self.results.append(result)
+
+    def _get_status(self, instance_id: int) -> Optional[str]:
+        try:
+            return self.morpheus_api_service.instance_service.get_instance_status(instance_id).status
+        except (APIError, requests.RequestException) as error:
+            logger.warning(f"Unable to get the status of instance {instance_id}: {error}")
+            return None
+
+    def _cleanup(self, instance_ids: list[int]) -> bool:
+        cleaned_up = True
+        for instance_id in instance_ids:
+            try:
+                self.morpheus_api_service.instance_service.delete_instance(
+                    instance_id=instance_id, force=self.cleanup_force
+                )
+                logger.info(f"Deleted failed fleet instance {instance_id}")
+            except (APIError, requests.RequestException) as error:
+                logger.error(f"Unable to delete failed fleet instance {instance_id}: {error}")
+                cleaned_up = False
+        return cleaned_up
+
+
+def provision_fleet(
+    morpheus_api_service: MorpheusAPIService,
+    payloads: list[InstanceCreateData],
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    max_wait_time: float = 3600,
+    sleep_time: float = 10,
+    cleanup_failures: bool = True,
+) -> FleetProvisioning:
+    """
+    Provisions many instances concurrently, with at most `max_in_flight` of them provisioning at the same time.
+
+    Args:
+        morpheus_api_service (MorpheusAPIService): The service to interact with the Morpheus API.
+        payloads (list[InstanceCreateData]): The payloads built by create_instance_payload, one per instance.
+        max_in_flight (int, optional): The maximum number of instances provisioning at the same time. \
+            Defaults to DEFAULT_MAX_IN_FLIGHT.
+        max_wait_time (float, optional): The maximum time for one instance to reach RUNNING, in seconds. \
+            Defaults to 3600.
+        sleep_time (float, optional): The lower bound of the longest interval between status checks, in seconds. \
+            Defaults to 10.
+        cleanup_failures (bool, optional): Delete the instances that failed to reach RUNNING. Defaults to True.
+
+    Returns:
+        FleetProvisioning: The fleet; iterate over it to receive the results as the instances finish.
+    """
+    return FleetProvisioning(
+        morpheus_api_service,
+        payloads,
+        max_in_flight=max_in_flight,
+        max_wait_time=max_wait_time,
+        sleep_time=sleep_time,
+        cleanup_failures=cleanup_failures,
+    )
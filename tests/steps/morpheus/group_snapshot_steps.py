@@ -0,0 +1,350 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Union
+
+import requests
+
+from lib.common.enums.resource_type import ResourceType
+from lib.common.enums.snapshot_status import SnapshotStatus
+from lib.common.exceptions import APIError
+from morpheus_api.dataclasses.snapshot import CreateSnapshotData, Snapshot, SnapshotData
+from morpheus_api.settings import MorpheusAPIService
+from tests.steps.morpheus.status_watcher import StatusWatcher
+
+logger = logging.getLogger()
+
+"""This module contains the SnapshotEngine, which snapshots many instances at once.
+
+The snapshot requests of the instances are sent in parallel by a pool of workers, one instance per worker. With
+`barrier` set, every instance gets a worker, and the workers wait for each other before sending their first request
+together, so the snapshots of the group are taken as close in time as the appliance allows, approximating a
+crash-consistent group snapshot. Completion is tracked by one StatusWatcher: every polling tick lists the snapshots
+of all the pending instances, and an instance is done once all its new snapshots are listed and complete. The result
+holds the latency of every instance and the skew of the group, i.e. the spread of the request and completion times
+across the instances.
+"""
+
+# Status of a snapshot that could not be taken
+SNAPSHOT_FAILED_STATUS = "failed"
+
+# Number of instances whose snapshots are requested at the same time, without a barrier
+DEFAULT_MAX_IN_FLIGHT = 16
+
+
+class InstanceSnapshotResult:
+    """
+    The outcome of the snapshots of one instance of a group.
+
+    Attributes:
+        instance_id (int): The ID of the instance.
+        requested (list[SnapshotData]): The name and description of every requested snapshot, in request order.
+        existing_snapshot_ids (set[int]): The IDs of the snapshots the instance had before the requests.
+        snapshots (list[Snapshot]): The new snapshots of the instance, as last listed, in incremental order.
+        requested_at (Optional[float]): When the first snapshot request was sent, in seconds since the epoch.
+        acknowledged_at (Optional[float]): When the last snapshot request was answered, in seconds since the epoch.
+        completed_at (Optional[float]): When the polling saw every new snapshot complete, in seconds since the epoch.
+        success (bool): True if every requested snapshot completed.
+        error (Optional[str]): The reason of the failure.
+    """
+
+    def __init__(self, instance_id: int, requested: list[SnapshotData], existing_snapshot_ids: set[int]):
+        self.instance_id = instance_id
+        self.requested = requested
+        self.existing_snapshot_ids = existing_snapshot_ids
+        self.snapshots: list[Snapshot] = []
+        self.requested_at: Optional[float] = None
+        self.acknowledged_at: Optional[float] = None
+        self.completed_at: Optional[float] = None
+        self.success = False
+        self.error: Optional[str] = None
+
+    @property
+    def latency(self) -> Optional[float]:
+        """The seconds from the first request until the snapshots completed, None unless they completed."""
+        if self.requested_at is None or self.completed_at is None:
+            return None
+        return self.completed_at - self.requested_at
+
+    def __repr__(self) -> str:
+        outcome = f"complete after {self.latency:.1f}s" if self.success else f"failed ({self.error})"
+        return f"instance {self.instance_id}, {len(self.requested)} snapshots: {outcome}"
+
+
+class GroupSnapshotResult:
+    """
+    The outcome of the snapshots of a group of instances.
+
+    Attributes:
+        instances (list[InstanceSnapshotResult]): The result of every instance, in request order.
+        barrier (bool): Whether the first requests were sent behind a start barrier.
+    """
+
+    def __init__(self, instances: list[InstanceSnapshotResult], barrier: bool):
+        self.instances = instances
+        self.barrier = barrier
+
+    @property
+    def succeeded(self) -> list[InstanceSnapshotResult]:
+        return [result for result in self.instances if result.success]
+
+    @property
+    def failed(self) -> list[InstanceSnapshotResult]:
+        return [result for result in self.instances if not result.success]
+
+    @property
+    def snapshots(self) -> list[Snapshot]:
+        """The new snapshots of every instance, in request order, each instance's in incremental order."""
+        return [snapshot for result in self.instances for snapshot in result.snapshots]
+
+    @property
+    def request_skew(self) -> Optional[float]:
+        """The seconds between the first request of the first and of the last instance; the point-in-time spread \
+        of the group. None when no request was sent."""
+        return self._spread([result.requested_at for result in self.instances])
+
+    @property
+    def completion_skew(self) -> Optional[float]:
+        """The seconds between the first and the last instance completing, among the completed ones."""
+        return self._spread([result.completed_at for result in self.instances])
+
+    @property
+    def duration(self) -> Optional[float]:
+        """The seconds from the first request until the last instance completed, among the completed ones."""
+        requested = [result.requested_at for result in self.instances if result.requested_at is not None]
+        completed = [result.completed_at for result in self.instances if result.completed_at is not None]
+        if not requested or not completed:
+            return None
+        return max(completed) - min(requested)
+
+    def summary(self) -> str:
+        """Describes the outcome of the group.
+
+        Returns:
+            str: The number of instances snapshotted, the skews, and the latency or failure of every instance.
+        """
+        lines = [
+            f"{len(self.succeeded)}/{len(self.instances)} instances snapshotted"
+            f"{' behind a start barrier' if self.barrier else ''}, request skew {self._seconds(self.request_skew)}, "
+            f"completion skew {self._seconds(self.completion_skew)}, duration {self._seconds(self.duration)}"
+        ]
+        lines.extend(f"  {result}" for result in self.instances)
+        return "\n".join(lines)
+
+    @staticmethod
+    def _spread(times: list[Optional[float]]) -> Optional[float]:
+        times = [value for value in times if value is not None]
+        return max(times) - min(times) if times else None
+
+    @staticmethod
+    def _seconds(value: Optional[float]) -> str:
+        return "n/a" if value is None else f"{value:.3f}s"
+
+
+class SnapshotEngine:
+    """
+    Requests snapshots of many instances in parallel and tracks them to completion with batched polling.
+
+    Usage:
+        engine = SnapshotEngine(morpheus_api_service, barrier=True)
+        result = engine.snapshot([101, 102, 103])
+        assert not result.failed, result.summary()
+        logger.info(f"Group request skew: {result.request_skew}s")
+    """
+
+    def __init__(
+        self,
+        morpheus_api_service: MorpheusAPIService,
+        barrier: bool = False,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        max_wait_time: float = 600,
+        sleep_time: float = 10,
+    ):
+        """Initializes the SnapshotEngine class.
+
+        Args:
+            morpheus_api_service (MorpheusAPIService): The service to interact with the Morpheus API.
+            barrier (bool, optional): Send the first request of every instance together, once every worker is \
+                ready. Needs one worker per instance, so max_in_flight is ignored. Defaults to False.
+            max_in_flight (int, optional): The maximum number of instances whose snapshots are requested at the \
+                same time, without a barrier. Defaults to DEFAULT_MAX_IN_FLIGHT.
+            max_wait_time (float, optional): The maximum time for the snapshots of one instance to complete after \
+                its first request, in seconds. Defaults to 600.
+            sleep_time (float, optional): The lower bound of the longest interval between status checks, \
+                in seconds. Defaults to 10.
+        """
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
+        self.morpheus_api_service = morpheus_api_service
+        self.barrier = barrier
+        self.max_in_flight = max_in_flight
+        self.max_wait_time = max_wait_time
+        self.sleep_time = sleep_time
+        self._results: dict[int, InstanceSnapshotResult] = {}
+
+    def snapshot(
+        self,
+        instance_ids: list[int],
+        number_of_snapshots: Union[int, list[int]] = 1,
+        wait_for_completion: bool = True,
+    ) -> GroupSnapshotResult:
+        """Snapshots a group of instances.
+
+        Args:
+            instance_ids (list[int]): The IDs of the instances, each listed once.
+            number_of_snapshots (Union[int, list[int]], optional): The number of snapshots of every instance, or \
+                of each instance in order. Defaults to 1.
+            wait_for_completion (bool, optional): Whether to wait for the snapshots to complete. When False, the \
+                snapshots listed right after the requests are returned. Defaults to True.
+
+        Returns:
+            GroupSnapshotResult: The outcome of every instance and the skew of the group.
+        """
+        if isinstance(number_of_snapshots, int):
+            number_of_snapshots = [number_of_snapshots] * len(instance_ids)
+        if len(number_of_snapshots) != len(instance_ids):
+            raise ValueError(
+                f"Got {len(number_of_snapshots)} snapshot counts for {len(instance_ids)} instances, expected one each"
+            )
+        if len(set(instance_ids)) != len(instance_ids):
+            raise ValueError(f"Instances are listed more than once in {instance_ids}")
+
+        # The existing snapshots are listed before any request, so that no request waits on another's listing
+        self._results = {}
+        for instance_id, count in zip(instance_ids, number_of_snapshots):
+            existing = self.morpheus_api_service.snapshot_service.list_instance_snapshots(instance_id=instance_id)
+            first = len(existing.snapshots) + 1
+            requested = [
+                SnapshotData(
+                    name=f"{instance_id}-Snapshot-{number}", description=f"Snapshot {number} of instance {instance_id}"
+                )
+                for number in range(first, first + count)
+            ]
+            self._results[instance_id] = InstanceSnapshotResult(
+                instance_id, requested, {snapshot.id for snapshot in existing.snapshots}
+            )
+        results = list(self._results.values())
+        if not results:
+            return GroupSnapshotResult([], self.barrier)
+
+        start_barrier = threading.Barrier(len(results), timeout=self.max_wait_time) if self.barrier else None
+        workers = len(results) if self.barrier else min(self.max_in_flight, len(results))
+        logger.info(
+            f"Snapshotting {len(results)} instances{' behind a start barrier' if self.barrier else ''}, "
+            f"{workers} at a time"
+        )
+        with StatusWatcher.for_wait(
+            self.morpheus_api_service, self.max_wait_time, sleep_time=self.sleep_time
+        ) as watcher:
+            watcher.register_fetcher(ResourceType.INSTANCE_SNAPSHOTS, self._fetch_new_snapshot_statuses)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="morpheus-snapshot") as executor:
+                futures = [
+                    executor.submit(self._snapshot_instance, result, watcher, start_barrier, wait_for_completion)
+                    for result in results
+                ]
+            for future in futures:
+                future.result()
+
+        group = GroupSnapshotResult(results, self.barrier)
+        if group.failed:
+            logger.error(group.summary())
+        else:
+            logger.info(group.summary())
+        return group
+
+    def _snapshot_instance(
+        self,
+        result: InstanceSnapshotResult,
+        watcher: StatusWatcher,
+        start_barrier: Optional[threading.Barrier],
+        wait_for_completion: bool,
+    ):
+        if start_barrier is not None:
+            try:
+                start_barrier.wait()
+            except threading.BrokenBarrierError:
+                result.error = "the start barrier was broken"
+                return
+        try:
+            result.requested_at = time.time()
+            for snapshot_data in result.requested:
+                response = self.morpheus_api_service.snapshot_service.create_snapshot_of_an_instance(
+                    instance_id=result.instance_id, snapshot_payload=CreateSnapshotData(snapshot=snapshot_data)
+                )
+                if not response.success:
+                    result.error = f"create snapshot '{snapshot_data.name}' was not initiated: {response}"
+                    return
+            result.acknowledged_at = time.time()
+        except (APIError, requests.RequestException) as error:
+            result.error = f"create snapshot failed: {error}"
+            return
+
+        if not wait_for_completion:
+            self._fetch_new_snapshot_statuses([result.instance_id])
+            result.success = True
+            return
+        future = watcher.subscribe(
+            ResourceType.INSTANCE_SNAPSHOTS,
+            result.instance_id,
+            SnapshotStatus.COMPLETE,
+            max_wait_time=self.max_wait_time,
+            failure_statuses=[SNAPSHOT_FAILED_STATUS],
+        )
+        result.success = future.result()
+        if result.success:
+            result.completed_at = time.time()
+        else:
+            statuses = sorted({snapshot.status for snapshot in result.snapshots})
+            result.error = f"{len(result.snapshots)}/{len(result.requested)} snapshots listed, statuses {statuses}"
+
+    def _fetch_new_snapshot_statuses(self, instance_ids: list[int]) -> dict[int, Optional[str]]:
+        # The status of an instance is the status shared by its new snapshots once they are all listed, "failed" as
+        # soon as one failed, or None while they are listed or complete only in part
+        statuses: dict[int, Optional[str]] = {}
+        for instance_id in instance_ids:
+            result = self._results[instance_id]
+            snapshots = self.morpheus_api_service.snapshot_service.list_instance_snapshots(instance_id).snapshots
+            result.snapshots = sorted(
+                (snapshot for snapshot in snapshots if snapshot.id not in result.existing_snapshot_ids),
+                key=lambda snapshot: snapshot.id,
+            )
+            new_statuses = {snapshot.status.lower() for snapshot in result.snapshots}
+            if SNAPSHOT_FAILED_STATUS in new_statuses:
+                statuses[instance_id] = SNAPSHOT_FAILED_STATUS
+            elif len(result.snapshots) >= len(result.requested) and len(new_statuses) == 1:
+                statuses[instance_id] = new_statuses.pop()
+            else:
+                statuses[instance_id] = None
+        return statuses
+
+
+def create_group_snapshot(
+    morpheus_api_service: MorpheusAPIService,
+    instance_ids: list[int],
+    number_of_snapshots: Union[int, list[int]] = 1,
+    barrier: bool = True,
+    wait_for_completion: bool = True,
+    max_wait_time: float = 600,
+    sleep_time: float = 10,
+) -> GroupSnapshotResult:
+    """
+    Snapshots a group of instances at the same time, behind a start barrier by default.
+
+    Args:
+        morpheus_api_service (MorpheusAPIService): The service to interact with the Morpheus API.
+        instance_ids (list[int]): The IDs of the instances, each listed once.
+        number_of_snapshots (Union[int, list[int]], optional): The number of snapshots of every instance, or of \
+            each instance in order. Defaults to 1.
+        barrier (bool, optional): Send the first request of every instance together. Defaults to True.
+        wait_for_completion (bool, optional): Whether to wait for the snapshots to complete. Defaults to True.
+        max_wait_time (float, optional): The maximum time for the snapshots of one instance to complete, in \
+            seconds. Defaults to 600.
+        sleep_time (float, optional): The lower bound of the longest interval between status checks, in seconds. \
+            Defaults to 10.
+
+    Returns:
+        GroupSnapshotResult: The outcome of every instance, its latency, and the skew of the group.
+    """
+    engine = SnapshotEngine(morpheus_api_service, barrier=barrier, max_wait_time=max_wait_time, sleep_time=sleep_time)
+    return engine.snapshot(instance_ids, number_of_snapshots, wait_for_completion=wait_for_completion)
@@ -1,7 +1,8 @@
 import logging
 import time
 import random
-from typing import Any
+from datetime import datetime, timezone
+from typing import Any, Optional
 from lib.common.enums.backup_status import BackupStatus
 from lib.common.enums.environment_code import EnvironmentCode
 from lib.common.enums.instance_status import InstanceStatus
@@ -9,8 +10,10 @@ from lib.common.enums.instance_type_code import InstanceTypeCode
 from lib.common.enums.ip_mode import IPMode
 from lib.common.enums.process_status import ProcessStatus
 from lib.common.enums.process_type import ProcessType
+from lib.common.enums.resource_type import ResourceType
 from lib.common.enums.snapshot_status import SnapshotStatus
 from lib.common.enums.virtual_image_status import VirtualImageStatus
+from lib.common.poll_scheduler import AdaptivePollScheduler
 from morpheus_api.dataclasses.common_objects import ID, Code, IDCode, IDName, NameValue, CommonRequiredData
 from morpheus_api.dataclasses.instance import (
     Instance,
@@ -29,14 +32,18 @@ from morpheus_api.dataclasses.instance import (
 from morpheus_api.dataclasses.server import ServerNetworkInterface
 from morpheus_api.dataclasses.backup import BackupData
 from morpheus_api.dataclasses.network import Interface, InterfaceNetwork, NetworkID, NetworkInterface
-from morpheus_api.dataclasses.processes import ProcessList
+from morpheus_api.dataclasses.processes import Process
+from morpheus_api.dataclasses.query import ListQuery
 from morpheus_api.dataclasses.snapshot import SnapshotsList
 from morpheus_api.dataclasses.volume import Volume
 from morpheus_api.dataclasses.virtual_image import VirtualImage
+from morpheus_api.helpers.instance_history import InstanceHistoryCursor, history_record_matches
 from morpheus_api.settings import MorpheusAPIService, MorpheusSettings
 from tests.steps.morpheus.common_steps import get_required_data, build_network_interface
 from tests.steps.container_steps import wait_for_container_deletion, wait_for_container_status_update
 from tests.steps.morpheus.virtual_image_steps import wait_for_virtual_image_creation, wait_for_virtual_image_status
+from tests.steps.morpheus.lifecycle_timeline import timeline_operation
+from tests.steps.morpheus.status_watcher import StatusSubscription, StatusWatcher
 
 
 settings = MorpheusSettings()
@@ -56,8 +63,7 @@ def get_instance_status_by_id(morpheus_api_service: MorpheusAPIService, instance
     Returns:
         str: The status of the instance.
     """
-    vm: Instance = morpheus_api_service.instance_service.get_instance(instance_id)
-    return vm.instance.status
+    return morpheus_api_service.instance_service.get_instance_status(instance_id).status
 
 
 def get_instance_locked_state_by_id(morpheus_api_service: MorpheusAPIService, instance_id: int) -> bool:
@@ -70,8 +76,7 @@ def get_instance_locked_state_by_id(morpheus_api_service: MorpheusAPIService, in
     Returns:
         bool: The locked state of the instance.
     """
-    vm: Instance = morpheus_api_service.instance_service.get_instance(instance_id)
-    return vm.instance.locked
+    return morpheus_api_service.instance_service.get_instance_status(instance_id).locked
 
 
 def get_instance_id_by_name(morpheus_api_service: MorpheusAPIService, instance_name: str) -> str:
@@ -87,7 +92,9 @@ def get_instance_id_by_name(morpheus_api_service: MorpheusAPIService, instance_n
     Raises:
         IndexError: If no instance with the specified name is found.
     """
-    instance_list: InstanceList = morpheus_api_service.instance_service.list_instances(filter=f"name={instance_name}")
+    instance_list: InstanceList = morpheus_api_service.instance_service.list_instances(
+        max_results=1, filter=ListQuery(name=instance_name)
+    )
     return instance_list.instances[0].id
 
 
@@ -140,6 +147,7 @@ def instance_resize_payload(
     )
 
 
+@timeline_operation("reconfigure_instance")
 def reconfigure_instance(
     morpheus_api_service: MorpheusAPIService,
     instance_id: int,
@@ -259,7 +267,11 @@ def reconfigure_instance(
 
     # wait for the instance to reach a RUNNING state again.
     instance_result = wait_for_instance_status_update(
-        morpheus_api_service, instance_id, InstanceStatus.RUNNING, max_wait_time=3600  # 1 hour
+        morpheus_api_service,
+        instance_id,
+        InstanceStatus.RUNNING,
+        max_wait_time=3600,  # 1 hour
+        use_process_eta=True,
     )
 
     # get the updated instance to return (for disk size changes, for example)
@@ -440,7 +452,7 @@ def import_snapshot_for_instance(
     wait_for_virtual_image_creation(morpheus_api_service, virtual_image_name=template_name)
     # Get virtual image id
     virtual_image: VirtualImage = morpheus_api_service.virtual_image_service.list_virtual_images(
-        name=template_name
+        max=1, name=template_name
     ).virtual_images[0]
 
     logger.info(f"virtual image ID: {virtual_image.id}")
@@ -451,8 +463,7 @@ def import_snapshot_for_instance(
     return virtual_image
 
 
-def create_instance_from_template(
-    morpheus_api_service: MorpheusAPIService,
+def template_instance_payload(
     template_id: int,
     instance_name: str,
     storage_volume_type_id: int,
@@ -467,13 +478,11 @@ def create_instance_from_template(
     num_volumes: int = 1,
     layout_size: int = 1,
     instance_copies: int = 1,
-    wait_for_creation: bool = True,
-) -> tuple[bool, Instance]:
+) -> InstanceCreateData:
     """
-    Create an instance from a given template.
+    Builds the payload creating a bare metal instance from a given template.
 
     Args:
-        morpheus_api_service (MorpheusAPIService): The Morpheus API service instance.
         template_id (int): The ID of the template to use for the instance.
         instance_name (str): The name of the instance to be created.
         storage_volume_type_id (int): The ID of the storage volume type.
@@ -488,10 +497,9 @@ def create_instance_from_template(
         num_volumes (int, optional): The number of volumes. Defaults to 1.
         layout_size (int, optional): The size of the layout. Defaults to 1.
         instance_copies (int, optional): The number of instance copies. Defaults to 1.
-        wait_for_creation (bool, optional): Whether to wait for the instance creation & any copies to complete. Defaults to True.
 
     Returns:
-        tuple[bool, Instance]: A tuple containing a boolean indicating success and the created instance object.
+        InstanceCreateData: The payload of InstanceService.create_instance.
     """
     # Volumes
     volumes: list[Volume] = []
@@ -558,6 +566,69 @@ def create_instance_from_template(
         instance_type_code=InstanceTypeCode.BM
     )
 
+    return instance_payload
+
+
+@timeline_operation("create_instance", instance_id=lambda arguments, result: result[1].instance.id)
+def create_instance_from_template(
+    morpheus_api_service: MorpheusAPIService,
+    template_id: int,
+    instance_name: str,
+    storage_volume_type_id: int,
+    datastore_id: int,
+    network_id: str,
+    layout_id: int,
+    layout_code: str,
+    plan_id: int,
+    plan_code: str,
+    zone_id: int,
+    volume_size: int = 10,
+    num_volumes: int = 1,
+    layout_size: int = 1,
+    instance_copies: int = 1,
+    wait_for_creation: bool = True,
+) -> tuple[bool, Instance]:
+    """
+    Create an instance from a given template.
+
+    Args:
+        morpheus_api_service (MorpheusAPIService): The Morpheus API service instance.
+        template_id (int): The ID of the template to use for the instance.
+        instance_name (str): The name of the instance to be created.
+        storage_volume_type_id (int): The ID of the storage volume type.
+        datastore_id (int): The ID of the datastore.
+        network_id (str): The ID of the network.
+        layout_id (int): The ID of the layout.
+        layout_code (str): The code of the layout.
+        plan_id (int): The ID of the plan.
+        plan_code (str): The code of the plan.
+        zone_id (int): The ID of the zone.
+        volume_size (int, optional): The size of each volume. Defaults to 10.
+        num_volumes (int, optional): The number of volumes. Defaults to 1.
+        layout_size (int, optional): The size of the layout. Defaults to 1.
+        instance_copies (int, optional): The number of instance copies. Defaults to 1.
+        wait_for_creation (bool, optional): Whether to wait for the instance creation & any copies to complete. Defaults to True.
+
+    Returns:
+        tuple[bool, Instance]: A tuple containing a boolean indicating success and the created instance object.
+    """
+    instance_payload = template_instance_payload(
+        template_id=template_id,
+        instance_name=instance_name,
+        storage_volume_type_id=storage_volume_type_id,
+        datastore_id=datastore_id,
+        network_id=network_id,
+        layout_id=layout_id,
+        layout_code=layout_code,
+        plan_id=plan_id,
+        plan_code=plan_code,
+        zone_id=zone_id,
+        volume_size=volume_size,
+        num_volumes=num_volumes,
+        layout_size=layout_size,
+        instance_copies=instance_copies,
+    )
+
     # Create instance
     logger.info(f"Creating instance '{instance_name}'...")
     create_response: Instance = morpheus_api_service.instance_service.create_instance(instance_payload=instance_payload)
@@ -620,11 +691,12 @@ def wait_for_instance_status_update(
     status: InstanceStatus,
     max_wait_time: int = 3600,
     sleep_time: int = 10,
+    use_process_eta: bool = False,
 ):
     """
     Waits for a Morpheus instance to reach a specified status.
 
-    This function polls the status of a Morpheus instance at regular intervals until \
+    This function polls the status of a Morpheus instance at adaptive intervals until \
         the instance reaches the desired status or the maximum wait time is exceeded.
 
     Args:
@@ -633,28 +705,118 @@ def wait_for_instance_status_update(
         status (InstanceStatus): The desired status to wait for.
         max_wait_time (int, optional): The maximum time to wait for the instance to reach the desired status, \
             in seconds. Defaults to 3600 seconds (60 minutes).
-        sleep_time (int, optional): The time to wait between status checks, in seconds. Defaults to 10 seconds.
+        sleep_time (int, optional): The longest time to wait between status checks, in seconds; raised for long \
+            waits. Checks start after 1 second and back off geometrically. Defaults to 10 seconds.
+        use_process_eta (bool, optional): Schedule the status checks near the ETA of the running instance process. \
+            Costs one extra history call per check, worth it for long operations. Defaults to False.
 
     Return:
         Boolean: It will return true if successful else will return as False
     """
-    start_time = time.time()
-    while time.time() - start_time <= max_wait_time:
-        vm: Instance = morpheus_api_service.instance_service.get_instance(instance_id)
-        if vm.instance.status == status.value:
-            logger.info(f"Instance id {instance_id} status in the expected state now '{status.value}'")
-            return True
-        elif vm.instance.status == InstanceStatus.FAILED.value:
-            logger.error(f"Instance id {instance_id} status has changed to failed.")
-            return False
-        else:
-            logger.info(f"Waiting for instance status to be '{status.value}'...")
-            time.sleep(sleep_time)
+    return wait_for_instances_status_update(
+        morpheus_api_service,
+        [instance_id],
+        status,
+        max_wait_time=max_wait_time,
+        sleep_time=sleep_time,
+        use_process_eta=use_process_eta,
+    )[instance_id]
 
-    else:
-        logger.error(f"Max wait time exceeded for instance status '{status.value}' update.")
 
-    return False
+def wait_for_instances_status_update(
+    morpheus_api_service: MorpheusAPIService,
+    instance_id_list: list[int],
+    status: InstanceStatus,
+    max_wait_time: int = 3600,
+    sleep_time: int = 10,
+    use_process_eta: bool = False,
+) -> dict[int, bool]:
+    """
+    Waits for several Morpheus instances to reach a specified status.
+
+    All instances are polled together by a StatusWatcher, with one batched list call per polling tick. \
+        An instance changing to the failed status stops its wait unsuccessfully.
+
+    Args:
+        morpheus_api_service (MorpheusAPIService): The Morpheus API service used to interact with the Morpheus platform.
+        instance_id_list (list[int]): The IDs of the instances to check.
+        status (InstanceStatus): The desired status to wait for.
+        max_wait_time (int, optional): The maximum time to wait for the instances to reach the desired status, \
+            in seconds. Defaults to 3600 seconds (60 minutes).
+        sleep_time (int, optional): The longest time to wait between status checks, in seconds; raised for long \
+            waits. Checks start after 1 second and back off geometrically. Defaults to 10 seconds.
+        use_process_eta (bool, optional): Schedule the status checks near the ETA of the running instance processes. \
+            Costs one extra history call per pending instance per check. Defaults to False.
+
+    Returns:
+        dict[int, bool]: For every instance ID, True if it reached the status, False otherwise.
+    """
+    eta_provider = instance_process_eta_provider(morpheus_api_service) if use_process_eta else None
+    with StatusWatcher.for_wait(
+        morpheus_api_service, max_wait_time, sleep_time=sleep_time, eta_provider=eta_provider
+    ) as watcher:
+        futures = {
+            instance_id: watcher.subscribe(
+                ResourceType.INSTANCE,
+                instance_id,
+                status,
+                max_wait_time=max_wait_time,
+                failure_statuses=[InstanceStatus.FAILED],
+            )
+            for instance_id in instance_id_list
+        }
+        watcher.wait_all(futures.values())
+    return {instance_id: future.result() for instance_id, future in futures.items()}
+
+
+def get_process_eta(process: Process) -> Optional[float]:
+    """
+    Predicts the time until an instance process completes from its `statusEta` and `percent` fields.
+
+    Args:
+        process (Process): The instance process.
+
+    Returns:
+        Optional[float]: The predicted seconds until completion, or None if the process is not running or gives no hint.
+    """
+    if process.status != ProcessStatus.RUNNING.value:
+        return None
+    elapsed = None
+    try:
+        start_date = datetime.fromisoformat(process.start_date.replace("Z", "+00:00"))
+        elapsed = (datetime.now(timezone.utc) - start_date).total_seconds()
+    except ValueError:
+        logger.debug(f"Unable to parse the start date '{process.start_date}' of process {process.id}")
+    # statusEta is reported in milliseconds, like the process duration
+    return AdaptivePollScheduler.estimate_eta(
+        percent=process.percent, status_eta=process.status_eta / 1000, elapsed=elapsed
+    )
+
+
+def instance_process_eta_provider(morpheus_api_service: MorpheusAPIService):
+    """
+    Builds a StatusWatcher ETA provider reading the latest process of every pending instance.
+
+    Args:
+        morpheus_api_service (MorpheusAPIService): The Morpheus API service instance to interact with.
+
+    Returns:
+        Callable[[list[StatusSubscription]], Optional[float]]: Returns the earliest predicted completion, in seconds.
+    """
+
+    def eta_provider(pending: list[StatusSubscription]) -> Optional[float]:
+        etas = []
+        for subscription in pending:
+            if subscription.resource_type != ResourceType.INSTANCE:
+                continue
+            instance_history = morpheus_api_service.instance_service.get_instance_history(subscription.resource_id)
+            if instance_history.processes:
+                eta = get_process_eta(instance_history.processes[0])
+                if eta is not None:
+                    etas.append(eta)
+        return min(etas) if etas else None
+
+    return eta_provider
 
 
 def wait_for_instance_deletion(
@@ -671,19 +833,20 @@ def wait_for_instance_deletion(
         instance_id (int): The ID of the instance to wait for deletion.
         max_wait_time (int, optional): The maximum time to wait for the instance to be deleted, in seconds. \
             Defaults to 1800.
-        sleep_time (int, optional): The time to sleep between status checks, in seconds. Defaults to 10.
+        sleep_time (int, optional): The longest time to sleep between status checks, in seconds. Defaults to 10.
     Raises:
         AssertionError: If the maximum wait time is exceeded before the instance is deleted.
     """
+    poll_scheduler = AdaptivePollScheduler.for_wait(max_wait_time, min_max_interval=sleep_time)
     start_time = time.time()
     while time.time() - start_time <= max_wait_time:
         try:
-            morpheus_api_service.instance_service.get_instance(instance_id)
+            morpheus_api_service.instance_service.get_instance_status(instance_id)
         except Exception as e:
             if "Not Found" in str(e):
                 return
         logger.info(f"Waiting for instance {instance_id} to be deleted...")
-        time.sleep(sleep_time)
+        time.sleep(poll_scheduler.next_interval(remaining=max_wait_time - (time.time() - start_time)))
     else:
         assert False, f"Max wait time exceeded for instance deletion: {instance_id}."
 
@@ -703,28 +866,16 @@ def wait_for_instance_snapshot_status_update(
         instance_id (int): The ID of the instance whose snapshot status is to be checked.
         status (SnapshotStatus): The desired status to wait for.
         max_wait_time (int, optional): The maximum time to wait for the status update, in seconds. Defaults to 120.
-        sleep_time (int, optional): The time to sleep between status checks, in seconds. Defaults to 10.
+        sleep_time (int, optional): The longest time to sleep between status checks, in seconds. Defaults to 10.
     Raises:
         AssertionError: If the maximum wait time is exceeded without the snapshot status updating to the desired status.
     """
     # NOTE: This function has been updated to check the status of all Snapshots in the instance.
-
-    start_time = time.time()
-    while time.time() - start_time <= max_wait_time:
-        snapshots: SnapshotsList = morpheus_api_service.snapshot_service.list_instance_snapshots(instance_id)
-        logger.info(f"Checking {len(snapshots.snapshots)} snapshots for status '{status.value}'")
-        for snapshot in snapshots.snapshots:
-            if snapshot.status.lower() != status.value:
-                logger.info(f"Snapshot id {snapshot.id} status is not in the expected state now '{status.value}'")
-                break
-            # if we make it here, we're good
-            logger.info("were done checking - success")
-            return
-        # if we get here, we need to wait
-        logger.info(f"Waiting for snapshot to (complete): {status.value}...")
-        time.sleep(sleep_time)
-    else:
-        assert False, f"Max wait time exceeded for snapshot status '{status.value}' update."
+    with StatusWatcher.for_wait(morpheus_api_service, max_wait_time, sleep_time=sleep_time) as watcher:
+        snapshot_status = watcher.subscribe(
+            ResourceType.INSTANCE_SNAPSHOTS, instance_id, status, max_wait_time=max_wait_time
+        ).result()
+    assert snapshot_status, f"Max wait time exceeded for snapshot status '{status.value}' update."
 
 
 def wait_for_instance_cloning(
@@ -741,7 +892,7 @@ def wait_for_instance_cloning(
         cloned_instance_name (str): Name given to the cloned instance
         status (str, optional): Expected status of the cloned VM. Defaults to InstanceStatus.RUNNING.
         max_wait_time (int, optional): Maximum time to wait for the VM to be available. Defaults to 1800 seconds.
-        sleep_time (int, optional): Time to wait before trying to find the VM again. Defaults to 10 seconds.
+        sleep_time (int, optional): Longest time to wait before trying to find the VM again. Defaults to 10 seconds.
 
     Returns:
         Boolean: It will return true if successful else will return as False
@@ -749,10 +900,12 @@ def wait_for_instance_cloning(
     """
     result = False
     cloned_instance: InstanceDetails = None
+    poll_scheduler = AdaptivePollScheduler.for_wait(max_wait_time, min_max_interval=sleep_time)
     start_time = time.time()
     while time.time() - start_time <= max_wait_time:
+        # Two rows are enough to tell a unique match from a duplicate name
         instance_list: InstanceList = morpheus_api_service.instance_service.list_instances(
-            filter=f"name={cloned_instance_name}"
+            max_results=2, filter=ListQuery(name=cloned_instance_name)
         )
 
         if len(instance_list.instances) == 1 and instance_list.instances[0].name == cloned_instance_name:
@@ -761,7 +914,7 @@ def wait_for_instance_cloning(
             break
         else:
             logger.info(f"Waiting for cloned instance {cloned_instance_name} to become available")
-            time.sleep(sleep_time)
+            time.sleep(poll_scheduler.next_interval(remaining=max_wait_time - (time.time() - start_time)))
     else:
         logger.error(f"Max wait time exceeded for cloned instance {cloned_instance_name} to become available")
 
@@ -777,6 +930,7 @@ def wait_for_instance_cloning(
     return result, cloned_instance
 
 
+@timeline_operation("backup")
 def wait_for_instance_backup_status_update(
     morpheus_api_service: MorpheusAPIService,
     instance_id: int,
@@ -792,10 +946,11 @@ def wait_for_instance_backup_status_update(
         status (BackupStatus): The desired backup status to wait for.
         max_wait_time (int, optional): The maximum time to wait for the status update in seconds. \
             Defaults to 1800 seconds.
-        sleep_time (int, optional): The time to sleep between status checks in seconds. Defaults to 10 seconds.
+        sleep_time (int, optional): The longest time to sleep between status checks in seconds. Defaults to 10 seconds.
     Raises:
         AssertionError: If the maximum wait time is exceeded without the backup status updating to the desired status.
     """
+    poll_scheduler = AdaptivePollScheduler.for_wait(max_wait_time, min_max_interval=sleep_time)
     start_time = time.time()
     while time.time() - start_time <= max_wait_time:
         backups_list: BackupData = morpheus_api_service.backup_service.list_instance_backups(instance_id)
@@ -803,7 +958,7 @@ def wait_for_instance_backup_status_update(
             return
         else:
             logger.info(f"Waiting for backup to (be in succeeded state): '{status.value}'...")
-            time.sleep(sleep_time)
+            time.sleep(poll_scheduler.next_interval(remaining=max_wait_time - (time.time() - start_time)))
     else:
         assert False, f"Max wait time exceeded for backup status '{status.value}' update."
 
@@ -823,11 +978,12 @@ def wait_for_instance_backup_count(
         expected_backup_count (int): Number of backups expected for the provided instance
         max_wait_time (int, optional): The maximum time to wait for the status update in seconds. \
             Defaults to 1200 seconds.
-        sleep_time (int, optional): The time to sleep between status checks in seconds. Defaults to 30 seconds.
+        sleep_time (int, optional): The longest time to sleep between status checks in seconds. Defaults to 30 seconds.
     Raises:
         AssertionError: If the max wait time exceeds without the backup count equal to the expected backup count.
     """
     backup_list: BackupData = None
+    poll_scheduler = AdaptivePollScheduler.for_wait(max_wait_time, min_max_interval=sleep_time)
     start_time = time.time()
     while time.time() - start_time <= max_wait_time:
         backup_list = morpheus_api_service.backup_service.list_instance_backups(instance_id)
@@ -835,7 +991,7 @@ def wait_for_instance_backup_count(
             return
         else:
             logger.info(f"Waiting for backup count to reach {expected_backup_count}")
-            time.sleep(sleep_time)
+            time.sleep(poll_scheduler.next_interval(remaining=max_wait_time - (time.time() - start_time)))
     else:
         assert False, f"Expected backup count {expected_backup_count} != {len(backup_list.backups)}"
 
@@ -855,11 +1011,12 @@ def wait_for_instance_snapshot_count(
         expected_snapshot_count (int): Number of snapshots expected for the provided instance
         max_wait_time (int, optional): The maximum time to wait for the status update in seconds. \
             Defaults to 1200 seconds.
-        sleep_time (int, optional): The time to sleep between status checks in seconds. Defaults to 30 seconds.
+        sleep_time (int, optional): The longest time to sleep between status checks in seconds. Defaults to 30 seconds.
     Returns:
         Boolean: True if wait for snapshot count is successful, or False when time taken has exceeded maximum time.
     """
     snapshot_list: SnapshotsList = None
+    poll_scheduler = AdaptivePollScheduler.for_wait(max_wait_time, min_max_interval=sleep_time)
     start_time = time.time()
     while time.time() - start_time <= max_wait_time:
         snapshot_list: SnapshotsList = morpheus_api_service.snapshot_service.list_instance_snapshots(instance_id)
@@ -867,7 +1024,7 @@ def wait_for_instance_snapshot_count(
             return True
         else:
             logger.info(f"Waiting for snapshot count to reach {expected_snapshot_count}")
-            time.sleep(sleep_time)
+            time.sleep(poll_scheduler.next_interval(remaining=max_wait_time - (time.time() - start_time)))
     else:
         return False
 
@@ -880,7 +1037,12 @@ def wait_for_instance_history_process_status_update(
     max_wait_time: int = 1800,
     sleep_time: int = 10,
 ):
-    """Waits for the instance process type status to update to the specified status.
+    """Waits for a process of the given type to reach the specified status in the instance history.
+
+    The history is tailed with a cursor of its own, so every process added or updated while waiting is matched, even
+    when a newer process lands before the awaited one reaches its status. Only the newest process at call time and the
+    processes started after it are matched: older processes of the same type that already reached the status belong
+    to earlier operations. Events are not matched, as an event of a process can complete before its process does.
 
     Args:
         morpheus_api_service (MorpheusAPIService): The Morpheus API service instance to interact with.
@@ -888,17 +1050,35 @@ def wait_for_instance_history_process_status_update(
         status (ProcessStatus, optional): The desired status to wait for. Defaults to ProcessStatus.COMPLETE.
         process_type (ProcessType, optional): The type of process to check the status for. Defaults to ProcessType.STARTUP.
         max_wait_time (int, optional): The maximum time to wait for the status update, in seconds. Defaults to 1800.
-        sleep_time (int, optional): The time to sleep between status checks, in seconds. Defaults to 10.
+        sleep_time (int, optional): The longest time to sleep between status checks, in seconds. Defaults to 10.
     """
+    poll_scheduler = AdaptivePollScheduler.for_wait(max_wait_time, min_max_interval=sleep_time)
+    cursor = InstanceHistoryCursor(instance_id)
+    newest_process_id = None
+    process = None
     start_time = time.time()
     while time.time() - start_time <= max_wait_time:
-        instance_history: ProcessList = morpheus_api_service.instance_service.get_instance_history(instance_id)
-        process = instance_history.processes[0]
-        if process.process_type.name == process_type.value and process.status == status.value:
-            return
-        else:
-            logger.info(f"Waiting for instance status to be '{status.value}'...")
-            time.sleep(sleep_time)
+        processes = [
+            record
+            for record in morpheus_api_service.instance_service.tail_instance_history(instance_id, cursor=cursor)
+            if isinstance(record, Process)
+        ]
+        if newest_process_id is None:
+            # The first poll reads the whole history, the processes older than its newest one are left out
+            newest_process_id = max((record.id for record in processes), default=0)
+        for record in processes:
+            if record.id < newest_process_id or record.process_type.name != process_type.value:
+                continue
+            if history_record_matches(record, process_type.value, status.value):
+                return
+            process = record
+        logger.info(f"Waiting for instance status to be '{status.value}'...")
+        time.sleep(
+            poll_scheduler.next_interval(
+                eta=get_process_eta(process) if process is not None else None,
+                remaining=max_wait_time - (time.time() - start_time),
+            )
+        )
     else:
         assert False, f"Max wait time exceeded for instance status '{status.value}' update."
 
@@ -994,15 +1174,15 @@ def start_instances(
         logger.info(f"Instance id {instance_id} start Instance Response: {response}")
 
     if wait_for_instance:
-        for instance_id in instance_id_list:
-            logger.info(f"Waiting for instance id {instance_id} to start")
-            instance_status = wait_for_instance_status_update(
-                morpheus_api_service,
-                instance_id,
-                InstanceStatus.RUNNING,
-                max_wait_time,
-                sleep_time,
-            )
+        logger.info(f"Waiting for instance ids {instance_id_list} to start")
+        instance_statuses = wait_for_instances_status_update(
+            morpheus_api_service,
+            instance_id_list,
+            InstanceStatus.RUNNING,
+            max_wait_time,
+            sleep_time,
+        )
+        for instance_id, instance_status in instance_statuses.items():
             if instance_status is False:
                 result = instance_status
                 logger.error(f"Failed to start the instance id {instance_id}")
@@ -1049,15 +1229,15 @@ def stop_instances(
         logger.info(f"Instance id {instance_id} stop Instance Response: {response}")
 
     if wait_for_instance:
-        for instance_id in instance_id_list:
-            logger.info(f"Waiting for instance id {instance_id} to power off")
-            instance_status = wait_for_instance_status_update(
-                morpheus_api_service,
-                instance_id,
-                InstanceStatus.STOPPED,
-                max_wait_time,
-                sleep_time,
-            )
+        logger.info(f"Waiting for instance ids {instance_id_list} to power off")
+        instance_statuses = wait_for_instances_status_update(
+            morpheus_api_service,
+            instance_id_list,
+            InstanceStatus.STOPPED,
+            max_wait_time,
+            sleep_time,
+        )
+        for instance_id, instance_status in instance_statuses.items():
             if instance_status is False:
                 result = instance_status
                 logger.error(f"Failed to stop the instance id {instance_id}")
@@ -0,0 +1,411 @@
+import functools
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Callable, Iterable, Optional
+
+from morpheus_api.configuration.request_metrics import LatencyHistogram
+from morpheus_api.dataclasses.processes import Event
+from morpheus_api.helpers.instance_history import InstanceHistoryCursor
+
+logger = logging.getLogger()
+
+"""This module contains the LifecycleTimeline, which records where the appliance spends its time.
+
+The step functions decorated with timeline_operation record one span per call (the "total" phase of their
+operation), then read the new events of the instance history and record one span per finished event (provisioning,
+agent install, startup...), timed by the appliance itself. The spans are aggregated into p50/p95/p99 per operation
+and phase, and dumped as a JSON report at the end of the session so runs against different appliance builds can be
+compared with compare_timeline_reports.
+"""
+
+# Phase of the span covering a whole step function call
+TOTAL_PHASE = "total"
+
+# Quantiles reported per operation and phase
+TIMELINE_QUANTILES = (0.5, 0.95, 0.99)
+
+# Statuses of the history events that count as failed phases
+FAILED_STATUSES = ("failed", "error", "cancelled")
+
+
+def _parse_date(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        logger.debug(f"Unable to parse the history date '{value}'")
+        return None
+
+
+class PhaseSpan:
+    """The time spent by one instance in one phase of an operation.
+
+    Attributes:
+        operation (str): The operation, e.g. "create_instance".
+        phase (str): TOTAL_PHASE for a step function call, the process type of a history event otherwise.
+        instance_id (Optional[int]): The ID of the instance, None when it is not known (e.g. a failed create).
+        start (float): The start, in seconds since the epoch.
+        end (float): The end, in seconds since the epoch.
+        duration (float): The duration in seconds; the one reported by the appliance for history events.
+        failed (bool): Whether the step failed or the event ended in a failed status.
+        source (str): "step" or "history".
+    """
+
+    def __init__(
+        self,
+        operation: str,
+        phase: str,
+        instance_id: Optional[int],
+        start: float,
+        end: float,
+        duration: Optional[float] = None,
+        failed: bool = False,
+        source: str = "step",
+    ):
+        self.operation = operation
+        self.phase = phase
+        self.instance_id = instance_id
+        self.start = start
+        self.end = end
+        self.duration = duration if duration is not None else max(0.0, end - start)
+        self.failed = failed
+        self.source = source
+
+    @classmethod
+    def from_event(cls, operation: str, event: Event) -> Optional["PhaseSpan"]:
+        """Builds the span of a finished history event.
+
+        Args:
+            operation (str): The operation the event was observed in.
+            event (Event): The history event.
+
+        Returns:
+            Optional[PhaseSpan]: The span, or None when the event has not ended or its dates cannot be parsed.
+        """
+        start = _parse_date(event.start_date)
+        end = _parse_date(event.end_date)
+        if start is None or end is None:
+            return None
+        return cls(
+            operation=operation,
+            phase=event.process_type.name,
+            instance_id=event.instance_id,
+            start=start,
+            end=end,
+            # The event duration is reported in milliseconds
+            duration=event.duration / 1000 if event.duration is not None else None,
+            failed=event.status.lower() in FAILED_STATUSES,
+            source="history",
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "operation": self.operation,
+            "phase": self.phase,
+            "instance_id": self.instance_id,
+            "start": self.start,
+            "end": self.end,
+            "duration": self.duration,
+            "failed": self.failed,
+            "source": self.source,
+        }
+
+
+class LifecycleTimeline:
+    """Thread-safe recorder of the phase spans of the instance lifecycle operations.
+
+    Usage:
+        with LIFECYCLE_TIMELINE.span("reconfigure_instance", instance_id) as span:
+            ...
+            span.failed = not result
+        LIFECYCLE_TIMELINE.record_history(morpheus_api_service, "reconfigure_instance", instance_id)
+        LIFECYCLE_TIMELINE.dump("logs/metrics", build="8.0.1")
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._spans: list[PhaseSpan] = []
+        self._histograms: dict[tuple[str, str], LatencyHistogram] = defaultdict(LatencyHistogram)
+        self._failures: dict[tuple[str, str], int] = defaultdict(int)
+        self._cursors: dict[int, InstanceHistoryCursor] = {}
+        self._recorded_events: set[int] = set()
+
+    def record(self, span: PhaseSpan):
+        """Adds a span to the timeline and to the aggregates of its operation and phase.
+
+        Args:
+            span (PhaseSpan): The span.
+        """
+        key = (span.operation, span.phase)
+        with self._lock:
+            self._spans.append(span)
+            self._histograms[key].record(span.duration)
+            if span.failed:
+                self._failures[key] += 1
+
+    def span(self, operation: str, instance_id: Optional[int] = None) -> "_SpanRecorder":
+        """Returns a context manager recording the TOTAL_PHASE span of an operation.
+
+        The span is marked failed when the block raises; the block may also set `failed` or `instance_id` on the
+        yielded span.
+
+        Args:
+            operation (str): The operation.
+            instance_id (Optional[int], optional): The ID of the instance. Defaults to None.
+
+        Returns:
+            _SpanRecorder: The context manager, yielding the PhaseSpan being recorded.
+        """
+        return _SpanRecorder(self, operation, instance_id)
+
+    def record_events(self, operation: str, events: Iterable[Event]) -> list[PhaseSpan]:
+        """Records a span per finished history event, each event once.
+
+        Args:
+            operation (str): The operation the events were observed in.
+            events (Iterable[Event]): The events; the running ones and the ones already recorded are skipped.
+
+        Returns:
+            list[PhaseSpan]: The recorded spans.
+        """
+        spans = []
+        for event in events:
+            span = PhaseSpan.from_event(operation, event)
+            if span is None:
+                continue
+            with self._lock:
+                if event.id in self._recorded_events:
+                    continue
+                self._recorded_events.add(event.id)
+            self.record(span)
+            spans.append(span)
+        return spans
+
+    def record_history(self, morpheus_api_service, operation: str, instance_id: int) -> list[PhaseSpan]:
+        """Records the events finished in the history of an instance since the last call.
+
+        The history is tailed with a cursor per instance, so each call only validates the new or changed records.
+        A failed history read is logged and ignored, the timeline never fails a step.
+
+        Args:
+            morpheus_api_service (MorpheusAPIService): The Morpheus API service instance to interact with.
+            operation (str): The operation the events are attributed to.
+            instance_id (int): The ID of the instance.
+
+        Returns:
+            list[PhaseSpan]: The recorded spans.
+        """
+        with self._lock:
+            cursor = self._cursors.setdefault(instance_id, InstanceHistoryCursor(instance_id))
+        try:
+            records = list(morpheus_api_service.instance_service.tail_instance_history(instance_id, cursor=cursor))
+        except Exception as error:
+            logger.warning(f"Unable to read the history of instance {instance_id} for the timeline: {error!r}")
+            return []
+        return self.record_events(operation, (record for record in records if isinstance(record, Event)))
+
+    def seed_history(self, morpheus_api_service, instance_id: int):
+        """Moves a new cursor past the history an instance already has, so it is not credited to the next operation.
+
+        Does nothing when the instance already has a cursor. A failed history read is logged and ignored.
+
+        Args:
+            morpheus_api_service (MorpheusAPIService): The Morpheus API service instance to interact with.
+            instance_id (int): The ID of the instance.
+        """
+        with self._lock:
+            if instance_id in self._cursors:
+                return
+            cursor = self._cursors[instance_id] = InstanceHistoryCursor(instance_id)
+        try:
+            for _ in morpheus_api_service.instance_service.tail_instance_history(instance_id, cursor=cursor):
+                pass
+        except Exception as error:
+            logger.warning(f"Unable to read the history of instance {instance_id} for the timeline: {error!r}")
+
+    def spans(self, instance_id: Optional[int] = None) -> list[PhaseSpan]:
+        """Returns the recorded spans, in start order.
+
+        Args:
+            instance_id (Optional[int], optional): Only return the spans of this instance. Defaults to None.
+
+        Returns:
+            list[PhaseSpan]: The spans.
+        """
+        with self._lock:
+            spans = [span for span in self._spans if instance_id is None or span.instance_id == instance_id]
+        return sorted(spans, key=lambda span: span.start)
+
+    def to_dict(self, build: str = "") -> dict[str, Any]:
+        """Returns the session report.
+
+        Args:
+            build (str, optional): The label of the appliance build the spans were recorded against. Defaults to "".
+
+        Returns:
+            dict[str, Any]: The percentiles per operation and phase, and the spans per instance.
+        """
+        with self._lock:
+            operations: dict[str, dict[str, Any]] = defaultdict(dict)
+            for (operation, phase), histogram in sorted(self._histograms.items()):
+                operations[operation][phase] = {
+                    "count": histogram.count,
+                    "failures": self._failures[(operation, phase)],
+                    "mean": histogram.total / histogram.count if histogram.count else None,
+                    "max": histogram.max,
+                    **{f"p{quantile * 100:g}": histogram.quantile(quantile) for quantile in TIMELINE_QUANTILES},
+                }
+        instances: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for span in self.spans():
+            instances[str(span.instance_id)].append(span.to_dict())
+        return {"build": build, "generated_at": time.time(), "operations": operations, "instances": instances}
+
+    def dump(self, directory: str, name: str = "lifecycle_timeline", build: str = "") -> str:
+        """Writes the session report to <name>.json in a directory.
+
+        Args:
+            directory (str): The output directory; created when missing.
+            name (str, optional): The base name of the file. Defaults to "lifecycle_timeline".
+            build (str, optional): The label of the appliance build. Defaults to "".
+
+        Returns:
+            str: The path of the report.
+        """
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{name}.json")
+        report = self.to_dict(build=build)
+        with open(path, "w") as report_file:
+            json.dump(report, report_file, indent=2)
+        logger.info(f"Lifecycle timeline of {len(report['instances'])} instances written to {path}")
+        return path
+
+    def reset(self):
+        """Drops every recorded span and history cursor."""
+        with self._lock:
+            self._spans.clear()
+            self._histograms.clear()
+            self._failures.clear()
+            self._cursors.clear()
+            self._recorded_events.clear()
+
+
+class _SpanRecorder:
+    def __init__(self, timeline: LifecycleTimeline, operation: str, instance_id: Optional[int]):
+        self.timeline = timeline
+        self.span = PhaseSpan(operation, TOTAL_PHASE, instance_id, start=0.0, end=0.0)
+
+    def __enter__(self) -> PhaseSpan:
+        self.span.start = time.time()
+        return self.span
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.span.end = time.time()
+        self.span.duration = self.span.end - self.span.start
+        if exc_type is not None:
+            self.span.failed = True
+        self.timeline.record(self.span)
+
+
+# Timeline every decorated step records in, dumped at the end of the test session
+LIFECYCLE_TIMELINE = LifecycleTimeline()
+
+
+def _step_failed(result: Any) -> bool:
+    if isinstance(result, tuple) and result:
+        result = result[0]
+    return result is False
+
+
+def timeline_operation(
+    operation: str,
+    instance_id: Optional[Callable[[dict[str, Any], Any], Optional[int]]] = None,
+    history: bool = True,
+    timeline: Optional[LifecycleTimeline] = None,
+):
+    """Decorates a step function to record its calls in the lifecycle timeline.
+
+    Every call records a TOTAL_PHASE span, failed when the step raises or returns False (or a tuple starting with
+    False). When `history` is set, the events finished in the instance history during the call are then recorded
+    as the phases of the operation; the history an existing instance already has is read before the call, and left
+    out.
+
+    Usage:
+        @timeline_operation("revert_to_snapshot")
+        def revert_instance_to_snapshot(morpheus_api_service, instance_id, snapshot_id, ...):
+            ...
+
+    Args:
+        operation (str): The operation the spans are aggregated under.
+        instance_id (Optional[Callable[[dict[str, Any], Any], Optional[int]]], optional): Returns the instance ID \
+            given the bound arguments and the result of the step (None when it raised). Defaults to None, which \
+            reads the `instance_id` argument.
+        history (bool, optional): Record the finished history events of the instance. Defaults to True.
+        timeline (Optional[LifecycleTimeline], optional): The timeline to record in. Defaults to None, which uses \
+            LIFECYCLE_TIMELINE.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        signature = inspect.signature(function)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            recorder = timeline if timeline is not None else LIFECYCLE_TIMELINE
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            result = None
+            if history and arguments.get("instance_id") is not None and "morpheus_api_service" in arguments:
+                recorder.seed_history(arguments["morpheus_api_service"], arguments["instance_id"])
+            with recorder.span(operation, arguments.get("instance_id")) as span:
+                try:
+                    result = function(*args, **kwargs)
+                finally:
+                    if instance_id is not None:
+                        try:
+                            span.instance_id = instance_id(arguments, result)
+                        except (AttributeError, IndexError, TypeError):
+                            span.instance_id = None
+                span.failed = _step_failed(result)
+            if history and span.instance_id is not None and "morpheus_api_service" in arguments:
+                recorder.record_history(arguments["morpheus_api_service"], operation, span.instance_id)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def compare_timeline_reports(baseline: dict[str, Any], current: dict[str, Any]) -> dict[str, dict[str, float]]:
+    """Compares the percentiles of two session reports, e.g. of two appliance builds.
+
+    Args:
+        baseline (dict[str, Any]): The reference report, as written by LifecycleTimeline.dump.
+        current (dict[str, Any]): The report to compare.
+
+    Returns:
+        dict[str, dict[str, float]]: The current / baseline ratio of every percentile, keyed by \
+            "<operation>/<phase>", for the phases found in both reports. A ratio above 1 is a slowdown.
+    """
+    comparison = {}
+    for operation, phases in current.get("operations", {}).items():
+        for phase, stats in phases.items():
+            reference = baseline.get("operations", {}).get(operation, {}).get(phase)
+            if reference is None:
+                continue
+            ratios = {}
+            for quantile in TIMELINE_QUANTILES:
+                key = f"p{quantile * 100:g}"
+                if reference.get(key) and stats.get(key) is not None:
+                    ratios[key] = stats[key] / reference[key]
+            comparison[f"{operation}/{phase}"] = ratios
+    return comparison
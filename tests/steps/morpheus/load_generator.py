@@ -0,0 +1,618 @@
+import json
+import logging
+import math
+import os
+import random
+import threading
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional
+
+from lib.common.enums.backup_status import BackupStatus
+from lib.common.enums.instance_status import InstanceStatus
+from lib.common.enums.resource_type import ResourceType
+from lib.common.enums.snapshot_status import SnapshotStatus
+from lib.common.poll_scheduler import AdaptivePollScheduler
+from morpheus_api.configuration.request_metrics import LatencyHistogram
+from morpheus_api.dataclasses.instance import InstanceCreateData
+from morpheus_api.dataclasses.query import ListQuery
+from morpheus_api.dataclasses.snapshot import CreateSnapshotData, SnapshotData
+from morpheus_api.settings import MorpheusAPIService
+from tests.steps.morpheus.status_watcher import StatusWatcher, id_batches
+
+logger = logging.getLogger()
+
+"""This module contains the LoadGenerator, which offers the appliance a steady, open-loop stream of operations.
+
+Closed-loop tests (create, wait, delete) only send the next request once the previous one finished, so they never
+load the appliance beyond its current pace. The LoadGenerator instead schedules arrivals at a fixed rate (Poisson or
+evenly spaced), independently of the completions, and draws each arrival's operation from a weighted mix of instance
+creates and deletes, snapshots and backups. Arrivals wait for one of `max_in_flight` client slots, so the time they
+queue shows when the appliance stops keeping up. The report gives the queueing delay, completion latency and
+throughput per time window, and find_throughput_knee compares runs at increasing rates.
+"""
+
+# Distributions of the time between two arrivals
+ARRIVAL_PROCESSES = ("poisson", "constant")
+
+# Operations of the load mix
+LOAD_OPERATIONS = ("create", "snapshot", "backup", "delete")
+
+# Default weights of the operations, creates and deletes balance each other to keep the live set stable
+DEFAULT_OPERATION_MIX = {"create": 3.0, "snapshot": 3.0, "backup": 1.0, "delete": 3.0}
+
+# Quantiles reported for the queueing delay and the completion latency
+LOAD_QUANTILES = (0.5, 0.95, 0.99)
+
+# Status reported by the deletion watcher for an instance missing from the instance list
+DELETED_STATUS = "deleted"
+
+# Outcomes of an arrival
+COMPLETED = "completed"
+FAILED = "failed"
+REJECTED = "rejected"
+
+
+class LoadOperation:
+    """One arrival of the load and what became of it.
+
+    Attributes:
+        operation (str): The operation, one of LOAD_OPERATIONS.
+        arrival (float): The scheduled arrival, in seconds since the start of the run.
+        started (Optional[float]): When a client slot picked it up, in seconds since the start of the run.
+        finished (Optional[float]): When it completed, failed or was rejected, in seconds since the start of the run.
+        resource_id (Optional[int]): The ID of the instance it ran on.
+        outcome (Optional[str]): COMPLETED, FAILED, or REJECTED when the live set allowed no target (no idle \
+            instance to snapshot, back up or delete, or no room for a create); None while running.
+    """
+
+    def __init__(self, operation: str, arrival: float):
+        self.operation = operation
+        self.arrival = arrival
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.resource_id: Optional[int] = None
+        self.outcome: Optional[str] = None
+
+    @property
+    def queueing_delay(self) -> Optional[float]:
+        """The seconds between the arrival and the start, None before the start."""
+        return self.started - self.arrival if self.started is not None else None
+
+    @property
+    def completion_latency(self) -> Optional[float]:
+        """The seconds between the start and the end, None before the end."""
+        return self.finished - self.started if self.finished is not None else None
+
+
+def _quantiles(values: list[float]) -> dict[str, Any]:
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+    return {
+        "count": histogram.count,
+        "max": histogram.max,
+        **{f"p{quantile * 100:g}": histogram.quantile(quantile) for quantile in LOAD_QUANTILES},
+    }
+
+
+def _newest(records: list) -> Any:
+    # Snapshots and backup executions created in the same second are ordered by their ID
+    return max(records, key=lambda record: (record.date_created, record.id))
+
+
+class LoadReport:
+    """The arrivals of one load run, aggregated per time window and per operation.
+
+    Attributes:
+        rate_per_minute (float): The offered arrival rate.
+        arrival_process (str): The distribution of the time between arrivals, one of ARRIVAL_PROCESSES.
+        duration (float): The seconds arrivals were scheduled for.
+        makespan (float): The seconds from the start until the last arrival finished.
+        window (float): The length of the time windows, in seconds.
+        operations (list[LoadOperation]): Every arrival, in arrival order.
+        peak_live_instances (int): The largest number of instances alive at once.
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        arrival_process: str,
+        duration: float,
+        makespan: float,
+        window: float,
+        operations: list[LoadOperation],
+        peak_live_instances: int = 0,
+    ):
+        self.rate_per_minute = rate_per_minute
+        self.arrival_process = arrival_process
+        self.duration = duration
+        self.makespan = makespan
+        self.window = window
+        self.operations = operations
+        self.peak_live_instances = peak_live_instances
+
+    def _outcomes(self, outcome: str) -> list[LoadOperation]:
+        return [operation for operation in self.operations if operation.outcome == outcome]
+
+    def summary(self) -> dict[str, Any]:
+        """Returns the totals of the run.
+
+        The achieved throughput is measured over the makespan; run for several times the operation latency so the
+        drain after the last arrival weighs little.
+
+        Returns:
+            dict[str, Any]: The offered, accepted and achieved rates per minute, the count of every outcome, and the \
+                queueing delay and completion latency percentiles of the whole run and of every operation.
+        """
+        accepted = [operation for operation in self.operations if operation.outcome != REJECTED]
+        completed = self._outcomes(COMPLETED)
+        by_operation: dict[str, list[LoadOperation]] = defaultdict(list)
+        for operation in self.operations:
+            by_operation[operation.operation].append(operation)
+        return {
+            "rate_per_minute": self.rate_per_minute,
+            "arrival_process": self.arrival_process,
+            "duration": self.duration,
+            "makespan": self.makespan,
+            "arrivals": len(self.operations),
+            "accepted_rate_per_minute": len(accepted) / self.duration * 60 if self.duration else None,
+            "throughput_per_minute": len(completed) / self.makespan * 60 if self.makespan else None,
+            "completed": len(completed),
+            "failed": len(self._outcomes(FAILED)),
+            "rejected": len(self._outcomes(REJECTED)),
+            "peak_live_instances": self.peak_live_instances,
+            "queueing_delay": _quantiles([operation.queueing_delay for operation in accepted]),
+            "completion_latency": _quantiles([operation.completion_latency for operation in completed]),
+            "operations": {
+                name: {
+                    "arrivals": len(operations),
+                    "completed": sum(operation.outcome == COMPLETED for operation in operations),
+                    "failed": sum(operation.outcome == FAILED for operation in operations),
+                    "rejected": sum(operation.outcome == REJECTED for operation in operations),
+                    "queueing_delay": _quantiles(
+                        [operation.queueing_delay for operation in operations if operation.outcome != REJECTED]
+                    ),
+                    "completion_latency": _quantiles(
+                        [operation.completion_latency for operation in operations if operation.outcome == COMPLETED]
+                    ),
+                }
+                for name, operations in sorted(by_operation.items())
+            },
+        }
+
+    def windows(self) -> list[dict[str, Any]]:
+        """Returns the load over time, one entry per window from the start until the makespan.
+
+        Arrivals, rejections and queueing delays are counted in the window of the arrival; completions, failures
+        and completion latencies in the window of the end.
+
+        Returns:
+            list[dict[str, Any]]: The start of every window, its arrival, completion, failure and rejection counts, \
+                its throughput per minute, and its queueing delay and completion latency percentiles.
+        """
+        count = max(1, math.ceil(max(self.duration, self.makespan) / self.window))
+        arrived: list[list[LoadOperation]] = [[] for _ in range(count)]
+        ended: list[list[LoadOperation]] = [[] for _ in range(count)]
+        for operation in self.operations:
+            arrived[min(count - 1, int(operation.arrival // self.window))].append(operation)
+            if operation.finished is not None:
+                ended[min(count - 1, int(operation.finished // self.window))].append(operation)
+        windows = []
+        for index in range(count):
+            completed = [operation for operation in ended[index] if operation.outcome == COMPLETED]
+            accepted = [operation for operation in arrived[index] if operation.outcome != REJECTED]
+            windows.append(
+                {
+                    "start": index * self.window,
+                    "arrivals": len(arrived[index]),
+                    "rejected": len(arrived[index]) - len(accepted),
+                    "completed": len(completed),
+                    "failed": sum(operation.outcome == FAILED for operation in ended[index]),
+                    "throughput_per_minute": len(completed) / self.window * 60,
+                    "queueing_delay": _quantiles(
+                        [operation.queueing_delay for operation in accepted if operation.started is not None]
+                    ),
+                    "completion_latency": _quantiles([operation.completion_latency for operation in completed]),
+                }
+            )
+        return windows
+
+    def to_dict(self, target: str = "", build: str = "") -> dict[str, Any]:
+        """Returns the load report.
+
+        Args:
+            target (str, optional): What the load ran against, e.g. "simulated" or "appliance". Defaults to "".
+            build (str, optional): The label of the appliance build. Defaults to "".
+
+        Returns:
+            dict[str, Any]: The target, build, summary and windows of the run.
+        """
+        return {
+            "target": target,
+            "build": build,
+            "generated_at": time.time(),
+            "summary": self.summary(),
+            "windows": self.windows(),
+        }
+
+    def dump(self, directory: str, name: str = None, target: str = "", build: str = "") -> str:
+        """Writes the load report to <name>.json in a directory.
+
+        Args:
+            directory (str): The output directory; created when missing.
+            name (str, optional): The base name of the file. Defaults to "load_<rate>_per_minute_<timestamp>".
+            target (str, optional): What the load ran against. Defaults to "".
+            build (str, optional): The label of the appliance build. Defaults to "".
+
+        Returns:
+            str: The path of the report.
+        """
+        os.makedirs(directory, exist_ok=True)
+        name = name or f"load_{self.rate_per_minute:g}_per_minute_{time.strftime('%Y%m%d_%H%M%S')}"
+        path = os.path.join(directory, f"{name}.json")
+        with open(path, "w") as report_file:
+            json.dump(self.to_dict(target=target, build=build), report_file, indent=2)
+        logger.info(f"Load report of {len(self.operations)} arrivals written to {path}")
+        return path
+
+
+class LoadGenerator:
+    """Offers the appliance lifecycle operations at a steady rate, whatever its pace, and records what happens.
+
+    Arrivals are scheduled up front for `duration` seconds at `rate_per_minute`, with exponential (Poisson) or
+    constant gaps, and each draws its operation from `operation_mix`. They run on `max_in_flight` client slots
+    through InstanceService, SnapshotService and BackupService: an arrival finding every slot busy queues until one
+    frees up. The instances are the live set: creates are rejected once `max_live_instances` exist, and snapshots,
+    backups and deletes run on a random idle instance (one operation per instance at a time), or are rejected when
+    none is idle. Completions are tracked by StatusWatchers polling every `poll_interval` seconds, one batched call
+    per resource type per tick, so the completion latency is measured to within that interval. The instances left
+    at the end are deleted.
+
+    Usage:
+        generator = LoadGenerator(morpheus_api_service, payload_factory, rate_per_minute=30, duration=1800)
+        report = generator.run()
+        report.dump("logs/benchmarks")
+    """
+
+    def __init__(
+        self,
+        morpheus_api_service: MorpheusAPIService,
+        instance_payload: Callable[[str], InstanceCreateData],
+        rate_per_minute: float,
+        duration: float,
+        arrival_process: str = "poisson",
+        operation_mix: dict[str, float] = None,
+        max_live_instances: int = 10,
+        max_in_flight: int = 32,
+        window: float = 60.0,
+        poll_interval: float = 5.0,
+        max_wait_time: float = 1800,
+        seed: Optional[int] = None,
+        name_prefix: str = "HPE-BMaaS-Load",
+    ):
+        """Initializes the load generator.
+
+        Args:
+            morpheus_api_service (MorpheusAPIService): The service to interact with the Morpheus API; size \
+                APISettings.pool_maxsize for max_in_flight.
+            instance_payload (Callable[[str], InstanceCreateData]): Builds the create payload of an instance \
+                given its name, e.g. with template_instance_payload.
+            rate_per_minute (float): The offered arrival rate.
+            duration (float): The seconds arrivals are scheduled for.
+            arrival_process (str, optional): "poisson" for exponential gaps, "constant" for even ones. \
+                Defaults to "poisson".
+            operation_mix (dict[str, float], optional): The relative weight of every operation. \
+                Defaults to DEFAULT_OPERATION_MIX.
+            max_live_instances (int, optional): The bound of the live set, instances being created included. \
+                Defaults to 10.
+            max_in_flight (int, optional): The number of client slots. Defaults to 32.
+            window (float, optional): The length of the report windows, in seconds. Defaults to 60.0.
+            poll_interval (float, optional): The seconds between two status polls. Defaults to 5.0.
+            max_wait_time (float, optional): The longest wait for an operation to complete, in seconds. \
+                Defaults to 1800.
+            seed (Optional[int], optional): The seed of the arrival, operation and target draws. Defaults to None.
+            name_prefix (str, optional): The prefix of the instance names. Defaults to "HPE-BMaaS-Load".
+
+        Raises:
+            ValueError: If the rate is not positive, or the arrival process or an operation is unknown.
+        """
+        operation_mix = dict(operation_mix or DEFAULT_OPERATION_MIX)
+        if rate_per_minute <= 0:
+            raise ValueError(f"The arrival rate must be positive, got {rate_per_minute}")
+        if arrival_process not in ARRIVAL_PROCESSES:
+            raise ValueError(f"Unknown arrival process '{arrival_process}', expected one of {ARRIVAL_PROCESSES}")
+        unknown = set(operation_mix) - set(LOAD_OPERATIONS)
+        if unknown:
+            raise ValueError(f"Unknown load operations {sorted(unknown)}, expected {LOAD_OPERATIONS}")
+        self.morpheus_api_service = morpheus_api_service
+        self.instance_payload = instance_payload
+        self.rate_per_minute = rate_per_minute
+        self.duration = duration
+        self.arrival_process = arrival_process
+        self.operation_mix = operation_mix
+        self.max_live_instances = max_live_instances
+        self.max_in_flight = max_in_flight
+        self.window = window
+        self.poll_interval = poll_interval
+        self.max_wait_time = max_wait_time
+        self.name_prefix = name_prefix
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        # Live instances, by ID: True while an operation runs on it
+        self._live: dict[int, bool] = {}
+        self._creating = 0
+        self._leftovers: set[int] = set()
+        self._expected_snapshots: dict[int, int] = {}
+        self._expected_backups: dict[int, int] = {}
+        self._created = 0
+        self._peak_live = 0
+        self._start = 0.0
+
+    def arrivals(self) -> list[tuple[float, str]]:
+        """Draws the schedule of the run.
+
+        Returns:
+            list[tuple[float, str]]: The arrival time, in seconds since the start, and the operation of every \
+                arrival, in arrival order.
+        """
+        mean_gap = 60 / self.rate_per_minute
+        names = list(self.operation_mix)
+        weights = [self.operation_mix[name] for name in names]
+        schedule = []
+        offset = self._random.expovariate(1 / mean_gap) if self.arrival_process == "poisson" else 0.0
+        while offset < self.duration:
+            schedule.append((offset, self._random.choices(names, weights)[0]))
+            offset += self._random.expovariate(1 / mean_gap) if self.arrival_process == "poisson" else mean_gap
+        return schedule
+
+    def run(self) -> LoadReport:
+        """Runs the load, then deletes the instances left.
+
+        Returns:
+            LoadReport: The report of the run.
+        """
+        schedule = self.arrivals()
+        self._run_id = str(uuid.uuid4())[:5]
+        watcher = self._watcher()
+        watcher.register_fetcher(ResourceType.INSTANCE_SNAPSHOTS, self._fetch_snapshot_statuses)
+        watcher.register_fetcher(ResourceType.BACKUP, self._fetch_backup_statuses)
+        deletion_watcher = self._watcher()
+        deletion_watcher.register_fetcher(ResourceType.INSTANCE, self._fetch_deletions)
+        operations: list[LoadOperation] = []
+        logger.info(
+            f"Offering {len(schedule)} operations over {self.duration:g}s "
+            f"({self.rate_per_minute:g}/min, {self.arrival_process}) on {self.max_in_flight} client slots"
+        )
+        makespan = 0.0
+        try:
+            self._start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="load") as executor:
+                futures = []
+                for arrival, name in schedule:
+                    delay = arrival - self._now()
+                    if delay > 0:
+                        time.sleep(delay)
+                    operation = LoadOperation(name, arrival)
+                    operations.append(operation)
+                    futures.append(executor.submit(self._execute, operation, watcher, deletion_watcher))
+                wait(futures)
+            makespan = self._now()
+            self._cleanup(deletion_watcher)
+        finally:
+            watcher.close()
+            deletion_watcher.close()
+        report = LoadReport(
+            self.rate_per_minute,
+            self.arrival_process,
+            self.duration,
+            makespan,
+            self.window,
+            operations,
+            peak_live_instances=self._peak_live,
+        )
+        summary = report.summary()
+        logger.info(
+            f"Load at {self.rate_per_minute:g}/min: {summary['completed']} completed, {summary['failed']} failed, "
+            f"{summary['rejected']} rejected, p95 queueing delay {summary['queueing_delay']['p95']}s"
+        )
+        return report
+
+    def _now(self) -> float:
+        return time.perf_counter() - self._start
+
+    def _watcher(self) -> StatusWatcher:
+        return StatusWatcher(
+            self.morpheus_api_service,
+            sleep_time=self.poll_interval,
+            poll_scheduler=AdaptivePollScheduler(initial_interval=self.poll_interval, max_interval=self.poll_interval),
+        )
+
+    def _execute(self, operation: LoadOperation, watcher: StatusWatcher, deletion_watcher: StatusWatcher):
+        operation.started = self._now()
+        try:
+            if operation.operation == "create":
+                result = self._create(operation, watcher)
+            elif operation.operation == "delete":
+                result = self._delete(operation, deletion_watcher)
+            else:
+                result = self._protect(operation, watcher)
+        except Exception as error:
+            logger.error(f"Load {operation.operation} on instance {operation.resource_id} raised: {error!r}")
+            result = False
+        operation.finished = self._now()
+        operation.outcome = REJECTED if result is None else COMPLETED if result else FAILED
+
+    def _create(self, operation: LoadOperation, watcher: StatusWatcher) -> Optional[bool]:
+        with self._lock:
+            if len(self._live) + self._creating >= self.max_live_instances:
+                return None
+            self._creating += 1
+            self._created += 1
+            name = f"{self.name_prefix}-{self._run_id}-{self._created}"
+        created = False
+        try:
+            instance = self.morpheus_api_service.instance_service.create_instance(self.instance_payload(name))
+            operation.resource_id = instance.instance.id
+            with self._lock:
+                self._leftovers.add(operation.resource_id)
+            created = watcher.subscribe(
+                ResourceType.INSTANCE,
+                operation.resource_id,
+                InstanceStatus.RUNNING,
+                max_wait_time=self.max_wait_time,
+                failure_statuses=[InstanceStatus.FAILED],
+            ).result()
+            return created
+        finally:
+            with self._lock:
+                self._creating -= 1
+                if created:
+                    self._leftovers.discard(operation.resource_id)
+                    self._live[operation.resource_id] = False
+                    self._peak_live = max(self._peak_live, len(self._live))
+
+    def _acquire(self) -> Optional[int]:
+        with self._lock:
+            idle = sorted(instance_id for instance_id, busy in self._live.items() if not busy)
+            if not idle:
+                return None
+            instance_id = self._random.choice(idle)
+            self._live[instance_id] = True
+            return instance_id
+
+    def _protect(self, operation: LoadOperation, watcher: StatusWatcher) -> Optional[bool]:
+        # Snapshots and backups: the new snapshot or backup execution must show up, then reach its final status
+        instance_id = operation.resource_id = self._acquire()
+        if instance_id is None:
+            return None
+        try:
+            if operation.operation == "snapshot":
+                snapshot_service = self.morpheus_api_service.snapshot_service
+                self._expected_snapshots[instance_id] = (
+                    len(snapshot_service.list_instance_snapshots(instance_id).snapshots) + 1
+                )
+                name = f"{instance_id}-Load-Snapshot-{self._expected_snapshots[instance_id]}"
+                snapshot_service.create_snapshot_of_an_instance(
+                    instance_id=instance_id,
+                    snapshot_payload=CreateSnapshotData(snapshot=SnapshotData(name=name, description=name)),
+                )
+                resource_type, status, failure_statuses = ResourceType.INSTANCE_SNAPSHOTS, SnapshotStatus.COMPLETE, ()
+            else:
+                backup_service = self.morpheus_api_service.backup_service
+                self._expected_backups[instance_id] = self._backup_result_count(instance_id) + 1
+                backup_service.create_instance_backup(instance_id)
+                resource_type, status, failure_statuses = ResourceType.BACKUP, BackupStatus.SUCCEEDED, ("failed",)
+            return watcher.subscribe(
+                resource_type,
+                instance_id,
+                status,
+                max_wait_time=self.max_wait_time,
+                failure_statuses=failure_statuses,
+            ).result()
+        finally:
+            with self._lock:
+                self._live[instance_id] = False
+
+    def _delete(self, operation: LoadOperation, deletion_watcher: StatusWatcher) -> Optional[bool]:
+        with self._lock:
+            idle = sorted(instance_id for instance_id, busy in self._live.items() if not busy)
+            if not idle:
+                return None
+            instance_id = operation.resource_id = self._random.choice(idle)
+            del self._live[instance_id]
+            self._leftovers.add(instance_id)
+        self.morpheus_api_service.instance_service.delete_instance(instance_id)
+        deleted = deletion_watcher.subscribe(
+            ResourceType.INSTANCE, instance_id, DELETED_STATUS, max_wait_time=self.max_wait_time
+        ).result()
+        if deleted:
+            with self._lock:
+                self._leftovers.discard(instance_id)
+        return deleted
+
+    def _cleanup(self, deletion_watcher: StatusWatcher):
+        with self._lock:
+            instance_ids = sorted(set(self._live) | self._leftovers)
+            self._live.clear()
+            self._leftovers.clear()
+        futures = []
+        for instance_id in instance_ids:
+            try:
+                self.morpheus_api_service.instance_service.delete_instance(instance_id, force="on")
+                futures.append(
+                    deletion_watcher.subscribe(
+                        ResourceType.INSTANCE, instance_id, DELETED_STATUS, max_wait_time=self.max_wait_time
+                    )
+                )
+            except Exception as error:
+                logger.error(f"Unable to delete load instance {instance_id}: {error!r}")
+        if futures and not deletion_watcher.wait_all(futures):
+            logger.error(f"Some of the load instances {instance_ids} were not deleted")
+
+    def _backup_result_count(self, instance_id: int) -> int:
+        backups = self.morpheus_api_service.backup_service.list_instance_backups(instance_id).backups
+        return sum(len(backup.backup_results) for backup in backups)
+
+    def _fetch_snapshot_statuses(self, instance_ids: list[int]) -> dict[int, Optional[str]]:
+        # The status of the newest snapshot, once the snapshot just requested is listed; an earlier failed or stuck
+        # snapshot does not hold back the later ones
+        statuses: dict[int, Optional[str]] = {}
+        for instance_id in instance_ids:
+            snapshots = self.morpheus_api_service.snapshot_service.list_instance_snapshots(instance_id).snapshots
+            ready = snapshots and len(snapshots) >= self._expected_snapshots.get(instance_id, 0)
+            statuses[instance_id] = _newest(snapshots).status.lower() if ready else None
+        return statuses
+
+    def _fetch_backup_statuses(self, instance_ids: list[int]) -> dict[int, Optional[str]]:
+        # The status of the newest execution, once the execution just requested is listed
+        statuses: dict[int, Optional[str]] = {}
+        for instance_id in instance_ids:
+            backups = self.morpheus_api_service.backup_service.list_instance_backups(instance_id).backups
+            results = [result for backup in backups for result in backup.backup_results]
+            ready = results and len(results) >= self._expected_backups.get(instance_id, 0)
+            statuses[instance_id] = _newest(results).status.lower() if ready else None
+        return statuses
+
+    def _fetch_deletions(self, instance_ids: list[int]) -> dict[int, Optional[str]]:
+        statuses: dict[int, Optional[str]] = {}
+        for batch in id_batches(instance_ids):
+            instance_list = self.morpheus_api_service.instance_service.list_instance_statuses(
+                max_results=len(batch), filter=ListQuery(ids=batch)
+            )
+            statuses.update({instance.id: instance.status for instance in instance_list.instances})
+        return {instance_id: statuses.get(instance_id, DELETED_STATUS) for instance_id in instance_ids}
+
+
+def find_throughput_knee(
+    reports: list[LoadReport], min_efficiency: float = 0.9, max_queueing_delay: Optional[float] = None
+) -> Optional[float]:
+    """Finds the highest offered rate the appliance kept up with, from runs at increasing rates.
+
+    A run kept up when its achieved throughput is at least `min_efficiency` of its accepted rate (the arrivals not
+    rejected by the live set bound) and, with `max_queueing_delay`, its p95 queueing delay stayed under it. The
+    search stops at the first run, by rate, that did not keep up.
+
+    Args:
+        reports (list[LoadReport]): The reports of the runs, in any order.
+        min_efficiency (float, optional): The share of the accepted rate to achieve. Defaults to 0.9.
+        max_queueing_delay (Optional[float], optional): The longest acceptable p95 queueing delay, in seconds. \
+            Defaults to None.
+
+    Returns:
+        Optional[float]: The rate per minute of the knee, None when the lowest rate already fell behind.
+    """
+    knee = None
+    for report in sorted(reports, key=lambda report: report.rate_per_minute):
+        summary = report.summary()
+        accepted = summary["accepted_rate_per_minute"] or 0
+        kept_up = (summary["throughput_per_minute"] or 0) >= min_efficiency * accepted
+        if max_queueing_delay is not None:
+            delay = summary["queueing_delay"]["p95"]
+            kept_up = kept_up and (delay is None or delay <= max_queueing_delay)
+        if not kept_up:
+            break
+        knee = report.rate_per_minute
+    return knee
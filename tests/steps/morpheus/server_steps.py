@@ -2,12 +2,15 @@ import logging
 import time
 from lib.common.enums.server_type import ServerTypePlacementStrategy
 from lib.common.enums.server_status import ServerStatus
+from lib.common.enums.resource_type import ResourceType
 from morpheus_api.dataclasses.common_objects import ID
+from morpheus_api.dataclasses.query import ServerQuery
 from morpheus_api.dataclasses.server import (
     ServerPlacementServerData,
     ServerData,
 )
 from morpheus_api.settings import MorpheusAPIService
+from tests.steps.morpheus.status_watcher import StatusWatcher
 
 logger = logging.getLogger()
 
@@ -52,10 +55,9 @@ def get_new_available_server_id(
     Returns:
         int: The new available server ID for the VM.
     """
-    query_params = f"clusterId={instance_cluster_id}"
-    servers_list = morpheus_api_service.server_service.list_servers(query_params=query_params)
+    query_params = ServerQuery(cluster_id=instance_cluster_id)
     new_server_id: int = None
-    for server in servers_list.servers:
+    for server in morpheus_api_service.server_service.iter_servers(query_params=query_params):
         if server.id != original_server_id:
             new_server_id = server.id
             break
@@ -120,24 +122,15 @@ def wait_for_server_status_update(
         status (str): The desired status to wait for.
         max_wait_time (int, optional): The maximum time to wait for the server to reach the desired status, \
             in seconds. Defaults to 1800 seconds (30 minutes).
-        sleep_time (int, optional): The time to wait between status checks, in seconds. Defaults to 10 seconds.
+        sleep_time (int, optional): The longest time to wait between status checks, in seconds. Defaults to 10 seconds.
     Raises:
         AssertionError: If the maximum wait time is exceeded before the server reaches the desired status.
     
     Returns:
         bool: Indicates the success/failure in transition of the status
     """
-    start_time = time.time()
-    while time.time() - start_time <= max_wait_time:
-        server = morpheus_api_service.server_service.get_a_specific_server(server_id)
-        if server.server.status == status.value:
-            return True
-        else:
-            logger.info(f"Waiting for server status to be '{status.value}'...")
-            time.sleep(sleep_time)
-    else:
-        logger.info(f"Max wait time exceeded for server status '{status.value}' update.")
-        return False
+    with StatusWatcher.for_wait(morpheus_api_service, max_wait_time, sleep_time=sleep_time) as watcher:
+        return watcher.subscribe(ResourceType.SERVER, server_id, status, max_wait_time=max_wait_time).result()
 
 
 def wait_for_server_update(
@@ -2,15 +2,15 @@ import logging
 from lib.common.enums.instance_status import InstanceStatus
 from lib.common.enums.process_status import ProcessStatus
 from lib.common.enums.process_type import ProcessType
-from lib.common.enums.snapshot_status import SnapshotStatus
 from morpheus_api.settings import MorpheusAPIService
-from morpheus_api.dataclasses.snapshot import CreateSnapshotData, Snapshot, SnapshotData, SnapshotsList
+from morpheus_api.dataclasses.snapshot import Snapshot
 from tests.steps.morpheus.instance_steps import (
     wait_for_instance_status_update,
     wait_for_instance_history_process_status_update,
     wait_for_instance_snapshot_count,
-    wait_for_instance_snapshot_status_update,
 )
+from tests.steps.morpheus.group_snapshot_steps import SnapshotEngine
+from tests.steps.morpheus.lifecycle_timeline import timeline_operation
 
 logger = logging.getLogger()
 
@@ -100,47 +100,12 @@ def create_multiple_snapshots_of_an_instance(
     Returns:
         list[Snapshot]: The list of created snapshots in incremental order.
     """
-    original_snapshot_list: SnapshotsList = morpheus_api_service.snapshot_service.list_instance_snapshots(
-        instance_id=instance_id
+    return create_snapshots_of_multiple_instances(
+        morpheus_api_service=morpheus_api_service,
+        instance_ids=[instance_id],
+        number_of_snapshots=[number_of_snapshots],
+        wait_for_completion=wait_for_completion,
     )
-    original_snapshot_count: int = len(original_snapshot_list.snapshots)
-    expected_snapshot_count: int = original_snapshot_count + number_of_snapshots
-
-    for i in range(number_of_snapshots):
-        name = f"{instance_id}-Snapshot-{i+original_snapshot_count+1}"
-        description = f"Snapshot {i+original_snapshot_count+1} of instance {instance_id}"
-        snapshot_data = SnapshotData(name=name, description=description)
-        create_snapshot_data = CreateSnapshotData(snapshot=snapshot_data)
-        response = morpheus_api_service.snapshot_service.create_snapshot_of_an_instance(
-            instance_id=instance_id, snapshot_payload=create_snapshot_data
-        )
-        assert response.success, f"Failed to initiate create snapshot for instance {instance_id}. Response: {response}"
-
-    if wait_for_completion:
-        # wait for expected snapshot count to be reached
-        wait_for_instance_snapshot_count(
-            morpheus_api_service=morpheus_api_service,
-            instance_id=instance_id,
-            expected_snapshot_count=expected_snapshot_count,
-            max_wait_time=120,
-            sleep_time=10,
-        )
-        # wait until all instance snapshots are in a COMPLETE state
-        wait_for_instance_snapshot_status_update(
-            morpheus_api_service=morpheus_api_service,
-            instance_id=instance_id,
-            status=SnapshotStatus.COMPLETE,
-            max_wait_time=600,
-            sleep_time=10,
-        )
-
-    # Return the list of created snapshots in incremental order
-    latest_snapshot_list = morpheus_api_service.snapshot_service.list_instance_snapshots(instance_id=instance_id)
-    created_snapshots_list: list[Snapshot] = [
-        snapshot for snapshot in latest_snapshot_list.snapshots if snapshot not in original_snapshot_list.snapshots
-    ]
-
-    return created_snapshots_list
 
 
 def create_snapshots_of_multiple_instances(
@@ -148,49 +113,32 @@ def create_snapshots_of_multiple_instances(
     instance_ids: list[int],
     number_of_snapshots: list[int],
     wait_for_completion: bool = True,
+    barrier: bool = False,
 ) -> list[Snapshot]:
     """Create snapshots of multiple instances.
 
+    The snapshots of all the instances are requested in parallel, and their completion is tracked by one batched
+    poll per tick, see SnapshotEngine.
+
     Args:
         morpheus_api_service (MorpheusAPIService): The Morpheus API service object.
         instance_ids (list[int]): The IDs of the instances to create snapshots for.
         number_of_snapshots (list[int]): The number of snapshots to create for each instance.
         wait_for_completion (bool, optional): Whether to wait for the snapshots to be created. Defaults to True.
+        barrier (bool, optional): Whether to send the first snapshot request of every instance at the same time, \
+            for a group snapshot. Defaults to False.
 
     Returns:
         list[Snapshot]: The list of created snapshots in incremental order.
     """
-    created_snapshots_list: list[Snapshot] = []
-    old_instances_snapshot_count: list[int] = []
-
-    if wait_for_completion:
-        for instance_id in instance_ids:
-            snapshots_list = morpheus_api_service.snapshot_service.list_instance_snapshots(instance_id=instance_id)
-            old_instances_snapshot_count.append(len(snapshots_list.snapshots))
-
-    for instance_id, number_of_snapshot in zip(instance_ids, number_of_snapshots):
-        created_snapshots_list.extend(
-            create_multiple_snapshots_of_an_instance(
-                morpheus_api_service=morpheus_api_service,
-                instance_id=instance_id,
-                number_of_snapshots=number_of_snapshot,
-                wait_for_completion=False,
-            )
-        )
-    if wait_for_completion:
-        # Wait for all of the snapshot creations at the end rather than in-between snapshots to reduce the total wait time
-        for instance_id, snapshot_count in zip(instance_ids, old_instances_snapshot_count):
-            wait_for_instance_snapshot_count(
-                morpheus_api_service=morpheus_api_service,
-                instance_id=instance_id,
-                expected_snapshot_count=snapshot_count + number_of_snapshot,
-                max_wait_time=120,
-                sleep_time=10,
-            )
+    engine = SnapshotEngine(morpheus_api_service, barrier=barrier, sleep_time=10)
+    group = engine.snapshot(instance_ids, number_of_snapshots, wait_for_completion=wait_for_completion)
+    assert not group.failed, f"Failed to create the snapshots of instances {instance_ids}.\n{group.summary()}"
 
-    return created_snapshots_list
+    return group.snapshots
 
 
+@timeline_operation("revert_to_snapshot")
 def revert_instance_to_snapshot(
     morpheus_api_service: MorpheusAPIService, instance_id: int, snapshot_id: int, wait_for_completion: bool = True
 ):
@@ -0,0 +1,381 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future, wait
+from enum import Enum
+from typing import Callable, Iterable, Optional, Union
+
+import requests
+
+from lib.common.enums.resource_type import ResourceType
+from lib.common.exceptions import APIError
+from lib.common.poll_scheduler import DEFAULT_INITIAL_INTERVAL, AdaptivePollScheduler
+from morpheus_api.dataclasses.query import ListQuery, ServerQuery
+from morpheus_api.settings import MorpheusAPIService
+
+logger = logging.getLogger()
+
+"""This module contains the StatusWatcher, which waits for many resources to reach a status with batched polling.
+
+Every tick issues one list call per resource type for all pending subscriptions of that type (instances and servers
+are filtered by `id`), instead of one GET per resource. Resource types without a list endpoint that filters by ID
+(containers, virtual images, instance snapshots) fall back to one GET per pending resource in the same tick.
+"""
+
+# Fetches the current status of the given resource IDs. IDs that were not returned are treated as not ready.
+StatusFetcher = Callable[[list[int]], dict[int, Optional[str]]]
+
+# Predicts the seconds until the pending subscriptions complete, or None without a hint
+ETAProvider = Callable[[list["StatusSubscription"]], Optional[float]]
+
+# Number of IDs sent in one batched list call, keeping the query string well under URL length limits
+ID_BATCH_SIZE = 100
+
+
+class StatusSubscription:
+    """A single (resource type, id, target status) wait registered with the StatusWatcher."""
+
+    def __init__(
+        self,
+        resource_type: ResourceType,
+        resource_id: int,
+        statuses: set[str],
+        failure_statuses: set[str],
+        deadline: float,
+    ):
+        self.resource_type = resource_type
+        self.resource_id = resource_id
+        self.statuses = statuses
+        self.failure_statuses = failure_statuses
+        self.deadline = deadline
+        self.last_status: Optional[str] = None
+        self.future: Future = Future()
+
+    def __repr__(self) -> str:
+        return f"{self.resource_type.value} {self.resource_id} -> {'/'.join(sorted(self.statuses))}"
+
+
+def _status_value(status: Union[Enum, str]) -> str:
+    return status.value if isinstance(status, Enum) else status
+
+
+def id_batches(resource_ids: list[int]) -> Iterable[list[int]]:
+    """Splits resource IDs into batches of at most ID_BATCH_SIZE IDs, one batch per list call."""
+    for start in range(0, len(resource_ids), ID_BATCH_SIZE):
+        end = start + ID_BATCH_SIZE
+        yield resource_ids[start:end]
+
+
+class StatusWatcher:
+    """
+    Waits for many Morpheus resources to reach a target status with one polling loop.
+
+    Subscriptions resolve a Future with True when the resource reaches one of its target statuses, and with False
+    when it reaches a failure status or its max wait time is exceeded. The polling thread starts with the first
+    subscription and a fleet-wide wait costs one list call per resource type per tick regardless of the number of
+    resources. The time between ticks comes from an AdaptivePollScheduler: it ramps up geometrically to its max
+    interval, and jumps to the predicted completion when an ETA provider gives a hint.
+
+    Usage:
+        with StatusWatcher(morpheus_api_service) as watcher:
+            futures = [watcher.subscribe(ResourceType.INSTANCE, instance_id, InstanceStatus.RUNNING) for ...]
+            all_running = watcher.wait_all(futures)
+    """
+
+    def __init__(
+        self,
+        morpheus_api_service: MorpheusAPIService,
+        sleep_time: float = 10,
+        poll_scheduler: AdaptivePollScheduler = None,
+        eta_provider: ETAProvider = None,
+    ):
+        """Initializes the StatusWatcher class.
+
+        Args:
+            morpheus_api_service (MorpheusAPIService): The service to interact with the Morpheus API.
+            sleep_time (float, optional): The longest time to wait between polling ticks, in seconds, when no \
+                poll_scheduler is given. Defaults to 10.
+            poll_scheduler (AdaptivePollScheduler, optional): Computes the time between polling ticks. \
+                Defaults to a scheduler ramping from 1 second up to sleep_time.
+            eta_provider (ETAProvider, optional): Predicts the time until the pending subscriptions complete. \
+                Defaults to None.
+        """
+        self.morpheus_api_service = morpheus_api_service
+        self.sleep_time = sleep_time
+        self.poll_scheduler = (
+            poll_scheduler
+            if poll_scheduler is not None
+            else AdaptivePollScheduler(
+                initial_interval=min(DEFAULT_INITIAL_INTERVAL, sleep_time), max_interval=sleep_time
+            )
+        )
+        self.eta_provider = eta_provider
+        self.tick_count = 0
+        self._fetchers: dict[ResourceType, StatusFetcher] = {
+            ResourceType.INSTANCE: self._fetch_instance_statuses,
+            ResourceType.SERVER: self._fetch_server_statuses,
+            ResourceType.CONTAINER: self._fetch_container_statuses,
+            ResourceType.VIRTUAL_IMAGE: self._fetch_virtual_image_statuses,
+            ResourceType.INSTANCE_SNAPSHOTS: self._fetch_instance_snapshot_statuses,
+        }
+        self._subscriptions: list[StatusSubscription] = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread = None
+
+    @classmethod
+    def for_wait(
+        cls,
+        morpheus_api_service: MorpheusAPIService,
+        max_wait_time: float,
+        sleep_time: float = 10,
+        eta_provider: ETAProvider = None,
+    ) -> "StatusWatcher":
+        """Builds a watcher whose polling interval is sized for a wait of the given length.
+
+        Args:
+            morpheus_api_service (MorpheusAPIService): The service to interact with the Morpheus API.
+            max_wait_time (float): The maximum time of the wait, in seconds.
+            sleep_time (float, optional): The lower bound of the longest interval between polling ticks, \
+                in seconds. Defaults to 10.
+            eta_provider (ETAProvider, optional): Predicts the time until the pending subscriptions complete. \
+                Defaults to None.
+
+        Returns:
+            StatusWatcher: The watcher.
+        """
+        return cls(
+            morpheus_api_service,
+            sleep_time=sleep_time,
+            poll_scheduler=AdaptivePollScheduler.for_wait(max_wait_time, min_max_interval=sleep_time),
+            eta_provider=eta_provider,
+        )
+
+    def __enter__(self) -> "StatusWatcher":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def register_fetcher(self, resource_type: ResourceType, fetcher: StatusFetcher):
+        """Registers (or replaces) the function fetching the statuses of a resource type.
+
+        Args:
+            resource_type (ResourceType): The resource type the fetcher serves.
+            fetcher (StatusFetcher): Returns {resource_id: status} for a list of resource IDs.
+        """
+        self._fetchers[resource_type] = fetcher
+
+    def subscribe(
+        self,
+        resource_type: ResourceType,
+        resource_id: int,
+        status: Union[Enum, str, Iterable[Union[Enum, str]]],
+        max_wait_time: float = 3600,
+        failure_statuses: Iterable[Union[Enum, str]] = (),
+    ) -> Future:
+        """Subscribes to a resource reaching a status.
+
+        Args:
+            resource_type (ResourceType): The type of the resource.
+            resource_id (int): The ID of the resource.
+            status (Union[Enum, str, Iterable[Union[Enum, str]]]): The target status, or several accepted statuses.
+            max_wait_time (float, optional): The maximum time to wait for the status, in seconds. Defaults to 3600.
+            failure_statuses (Iterable[Union[Enum, str]], optional): Statuses that end the wait unsuccessfully. \
+                Defaults to ().
+
+        Returns:
+            Future: Resolves to True when the status is reached, False on a failure status or timeout.
+        """
+        if resource_type not in self._fetchers:
+            raise ValueError(f"No status fetcher registered for resource type '{resource_type.value}'")
+        statuses = [status] if isinstance(status, (Enum, str)) else list(status)
+        subscription = StatusSubscription(
+            resource_type=resource_type,
+            resource_id=resource_id,
+            statuses={_status_value(target) for target in statuses},
+            failure_statuses={_status_value(failure) for failure in failure_statuses},
+            deadline=time.time() + max_wait_time,
+        )
+        with self._lock:
+            if self._stopped.is_set():
+                raise RuntimeError("StatusWatcher is closed")
+            idle = not self._subscriptions
+            self._subscriptions.append(subscription)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="morpheus-status-watcher", daemon=True)
+                self._thread.start()
+        if idle:
+            # Poll right away instead of waiting out the sleep of an idle watcher
+            self._wakeup.set()
+        return subscription.future
+
+    def wait_all(self, futures: Iterable[Future]) -> bool:
+        """Blocks until every future is resolved.
+
+        Args:
+            futures (Iterable[Future]): The futures returned by subscribe().
+
+        Returns:
+            bool: True if every subscription reached its target status, False otherwise.
+        """
+        futures = list(futures)
+        wait(futures)
+        return all(future.result() for future in futures)
+
+    def pending(self) -> list[StatusSubscription]:
+        """Returns the subscriptions that are not resolved yet.
+
+        Returns:
+            list[StatusSubscription]: The pending subscriptions.
+        """
+        with self._lock:
+            return list(self._subscriptions)
+
+    def close(self):
+        """Stops the polling thread and resolves every pending subscription with False."""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        with self._lock:
+            pending, self._subscriptions = self._subscriptions, []
+        for subscription in pending:
+            subscription.future.set_result(False)
+
+    def poll_once(self):
+        """Runs one polling tick: fetches the statuses of every pending subscription and resolves the finished ones."""
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        self.tick_count += 1
+
+        by_type: dict[ResourceType, list[StatusSubscription]] = defaultdict(list)
+        for subscription in subscriptions:
+            by_type[subscription.resource_type].append(subscription)
+
+        resolved: list[tuple[StatusSubscription, bool]] = []
+        for resource_type, type_subscriptions in by_type.items():
+            resource_ids = sorted({subscription.resource_id for subscription in type_subscriptions})
+            try:
+                statuses = self._fetchers[resource_type](resource_ids)
+            except (APIError, requests.RequestException) as error:
+                # A failed tick is not fatal, the subscriptions are polled again on the next tick
+                logger.warning(f"Failed to fetch {resource_type.value} statuses: {error}")
+                statuses = {}
+            except Exception:
+                # Neither is a broken fetcher or response: the subscriptions still time out at their deadline
+                logger.exception(f"Unexpected error fetching {resource_type.value} statuses")
+                statuses = {}
+
+            for subscription in type_subscriptions:
+                status = statuses.get(subscription.resource_id)
+                if status is not None:
+                    subscription.last_status = status
+                if status in subscription.statuses:
+                    logger.info(f"{resource_type.value} id {subscription.resource_id} reached status '{status}'")
+                    resolved.append((subscription, True))
+                elif status in subscription.failure_statuses:
+                    logger.error(f"{resource_type.value} id {subscription.resource_id} status changed to '{status}'")
+                    resolved.append((subscription, False))
+                elif time.time() > subscription.deadline:
+                    logger.error(f"Max wait time exceeded for {subscription}, last status '{subscription.last_status}'")
+                    resolved.append((subscription, False))
+
+        if resolved:
+            with self._lock:
+                done = {id(subscription) for subscription, _ in resolved}
+                self._subscriptions = [
+                    subscription for subscription in self._subscriptions if id(subscription) not in done
+                ]
+            for subscription, result in resolved:
+                subscription.future.set_result(result)
+
+        pending = len(subscriptions) - len(resolved)
+        if pending:
+            logger.info(f"Waiting for {pending} resources to reach their status...")
+
+    def _run(self):
+        try:
+            self._poll_until_stopped()
+        except Exception as error:
+            # Resolve the pending subscriptions rather than leave their waiters blocked forever
+            logger.exception("The status watcher stopped on an unexpected error")
+            self._stopped.set()
+            with self._lock:
+                pending, self._subscriptions = self._subscriptions, []
+            for subscription in pending:
+                subscription.future.set_exception(error)
+
+    def _poll_until_stopped(self):
+        while not self._stopped.is_set():
+            self._wakeup.wait()
+            if self._stopped.is_set():
+                return
+            self.poll_once()
+            with self._lock:
+                pending = list(self._subscriptions)
+                if not pending:
+                    self._wakeup.clear()
+            if pending:
+                self._stopped.wait(self._next_interval(pending))
+            else:
+                self.poll_scheduler.reset()
+
+    def _next_interval(self, pending: list[StatusSubscription]) -> float:
+        eta = None
+        if self.eta_provider is not None:
+            try:
+                eta = self.eta_provider(pending)
+            except (APIError, requests.RequestException) as error:
+                logger.warning(f"Failed to fetch the ETA of the pending operations: {error}")
+            except Exception:
+                logger.exception("Unexpected error fetching the ETA of the pending operations")
+        remaining = min(subscription.deadline for subscription in pending) - time.time()
+        interval = self.poll_scheduler.next_interval(eta=eta, remaining=remaining)
+        logger.debug(f"Next status check in {interval:.1f}s (ETA hint: {eta})")
+        return interval
+
+    def _fetch_instance_statuses(self, instance_ids: list[int]) -> dict[int, Optional[str]]:
+        statuses: dict[int, Optional[str]] = {}
+        for batch in id_batches(instance_ids):
+            instance_list = self.morpheus_api_service.instance_service.list_instance_statuses(
+                max_results=len(batch), filter=ListQuery(ids=batch)
+            )
+            for instance in instance_list.instances:
+                statuses[instance.id] = instance.status
+        return statuses
+
+    def _fetch_server_statuses(self, server_ids: list[int]) -> dict[int, Optional[str]]:
+        statuses: dict[int, Optional[str]] = {}
+        for batch in id_batches(server_ids):
+            server_list = self.morpheus_api_service.server_service.list_server_statuses(
+                query_params=ServerQuery(ids=batch, max=len(batch))
+            )
+            for server in server_list.servers:
+                statuses[server.id] = server.status
+        return statuses
+
+    def _fetch_container_statuses(self, container_ids: list[int]) -> dict[int, Optional[str]]:
+        container_service = self.morpheus_api_service.container_service
+        return {
+            container_id: container_service.get_container_by_id(container_id).container.status
+            for container_id in container_ids
+        }
+
+    def _fetch_virtual_image_statuses(self, virtual_image_ids: list[int]) -> dict[int, Optional[str]]:
+        virtual_image_service = self.morpheus_api_service.virtual_image_service
+        return {
+            virtual_image_id: virtual_image_service.get_virtual_image_by_id(virtual_image_id=virtual_image_id).status
+            for virtual_image_id in virtual_image_ids
+        }
+
+    def _fetch_instance_snapshot_statuses(self, instance_ids: list[int]) -> dict[int, Optional[str]]:
+        # The status of an instance's snapshots is the status shared by all of them, or None while they differ
+        statuses: dict[int, Optional[str]] = {}
+        for instance_id in instance_ids:
+            snapshots = self.morpheus_api_service.snapshot_service.list_instance_snapshots(instance_id).snapshots
+            snapshot_statuses = {snapshot.status.lower() for snapshot in snapshots}
+            statuses[instance_id] = snapshot_statuses.pop() if len(snapshot_statuses) == 1 else None
+        return statuses
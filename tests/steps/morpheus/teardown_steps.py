@@ -0,0 +1,339 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+import requests
+
+from lib.common.enums.resource_type import ResourceType
+from lib.common.exceptions import APIError
+from lib.common.poll_scheduler import AdaptivePollScheduler
+from morpheus_api.dataclasses.query import ListQuery
+from morpheus_api.settings import MorpheusAPIService
+from tests.steps.morpheus.status_watcher import id_batches
+
+logger = logging.getLogger()
+
+"""This module contains the TeardownEngine, which deletes every resource created during a test session.
+
+Resources are deleted phase by phase in dependency order: snapshots, backups, instances, then virtual images (an
+image cannot be removed while instances use it). Within a phase all DELETE calls are sent in parallel, and the
+deletions are confirmed with batched list queries (one per resource type or owning instance per tick) instead of
+polling every resource for a 404.
+"""
+
+# Dependency order of the teardown phases; resources of a phase may depend on the resources of later phases
+TEARDOWN_ORDER = (
+    ResourceType.INSTANCE_SNAPSHOTS,
+    ResourceType.SNAPSHOT,
+    ResourceType.BACKUP,
+    ResourceType.INSTANCE,
+    ResourceType.VIRTUAL_IMAGE,
+)
+
+# Number of DELETE calls sent at the same time
+DEFAULT_MAX_WORKERS = 8
+
+# Returns the IDs of the given resources that still exist. The values of the mapping are the owning instance IDs.
+ExistenceCheck = Callable[[dict[int, Optional[int]]], set[int]]
+
+
+def _is_not_found(error: Exception) -> bool:
+    return "Not Found" in str(error)
+
+
+class TeardownEngine:
+    """
+    Collects the resources created during a session and deletes them in dependency order.
+
+    Tests register what they create with the track_* methods, and teardown() deletes everything at the end of the
+    session. A failed delete or an unconfirmed deletion does not stop the teardown: the remaining phases still run,
+    and the leftovers are returned and stay tracked so a following teardown() retries them.
+
+    Usage:
+        teardown_engine.track_instance(instance_id)
+        teardown_engine.track_snapshot(snapshot_id, instance_id=instance_id)
+        ...
+        leftovers = teardown_engine.teardown()
+    """
+
+    def __init__(
+        self,
+        morpheus_api_service: MorpheusAPIService,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_wait_time: float = 1800,
+        sleep_time: float = 10,
+        force: str = "off",
+    ):
+        """Initializes the TeardownEngine class.
+
+        Args:
+            morpheus_api_service (MorpheusAPIService): The service to interact with the Morpheus API.
+            max_workers (int, optional): The number of DELETE calls sent at the same time. \
+                Defaults to DEFAULT_MAX_WORKERS.
+            max_wait_time (float, optional): The maximum time to wait for the deletions of one phase, in seconds. \
+                Defaults to 1800.
+            sleep_time (float, optional): The lower bound of the longest interval between confirmation checks, \
+                in seconds. Defaults to 10.
+            force (str, optional): The force flag of the instance deletes. Defaults to "off".
+        """
+        self.morpheus_api_service = morpheus_api_service
+        self.max_workers = max_workers
+        self.max_wait_time = max_wait_time
+        self.sleep_time = sleep_time
+        self.force = force
+        self._tracked: dict[ResourceType, dict[int, Optional[int]]] = defaultdict(dict)
+        self._lock = threading.Lock()
+        self._deleters: dict[ResourceType, Callable[[int], object]] = {
+            ResourceType.INSTANCE_SNAPSHOTS: lambda instance_id: (
+                morpheus_api_service.snapshot_service.delete_all_snapshots_of_an_instance(instance_id=instance_id)
+            ),
+            ResourceType.SNAPSHOT: lambda snapshot_id: (
+                morpheus_api_service.snapshot_service.delete_snapshot_of_an_instance(snapshot_id=snapshot_id)
+            ),
+            ResourceType.BACKUP: lambda backup_id: morpheus_api_service.backup_service.delete_backup(backup_id),
+            ResourceType.INSTANCE: lambda instance_id: morpheus_api_service.instance_service.delete_instance(
+                instance_id=instance_id, force=self.force
+            ),
+            ResourceType.VIRTUAL_IMAGE: lambda virtual_image_id: (
+                morpheus_api_service.virtual_image_service.delete_virtual_image(virtual_image_id=virtual_image_id)
+            ),
+        }
+        self._existence_checks: dict[ResourceType, ExistenceCheck] = {
+            ResourceType.INSTANCE_SNAPSHOTS: self._existing_instance_snapshots,
+            ResourceType.SNAPSHOT: self._existing_snapshots,
+            ResourceType.BACKUP: self._existing_backups,
+            ResourceType.INSTANCE: self._existing_instances,
+            ResourceType.VIRTUAL_IMAGE: self._existing_virtual_images,
+        }
+
+    def track_instance(self, instance_id: int):
+        """Registers an instance to delete.
+
+        Args:
+            instance_id (int): The ID of the instance.
+        """
+        self._track(ResourceType.INSTANCE, instance_id)
+
+    def track_instance_snapshots(self, instance_id: int):
+        """Registers all the snapshots of an instance to delete.
+
+        Args:
+            instance_id (int): The ID of the instance whose snapshots are deleted.
+        """
+        self._track(ResourceType.INSTANCE_SNAPSHOTS, instance_id)
+
+    def track_snapshot(self, snapshot_id: int, instance_id: int = None):
+        """Registers a snapshot to delete.
+
+        Args:
+            snapshot_id (int): The ID of the snapshot.
+            instance_id (int, optional): The ID of the instance the snapshot belongs to. Its deletion is confirmed \
+                with the snapshot list of the instance, otherwise with one GET per snapshot. Defaults to None.
+        """
+        self._track(ResourceType.SNAPSHOT, snapshot_id, instance_id)
+
+    def track_backup(self, backup_id: int, instance_id: int):
+        """Registers a backup to delete.
+
+        Args:
+            backup_id (int): The ID of the backup.
+            instance_id (int): The ID of the backed up instance, whose backup list confirms the deletion.
+        """
+        self._track(ResourceType.BACKUP, backup_id, instance_id)
+
+    def track_virtual_image(self, virtual_image_id: int):
+        """Registers a virtual image to delete.
+
+        Args:
+            virtual_image_id (int): The ID of the virtual image.
+        """
+        self._track(ResourceType.VIRTUAL_IMAGE, virtual_image_id)
+
+    def untrack(self, resource_type: ResourceType, resource_id: int):
+        """Forgets a resource, e.g. because the test deleted it itself.
+
+        Args:
+            resource_type (ResourceType): The type of the resource.
+            resource_id (int): The ID of the resource.
+        """
+        with self._lock:
+            self._tracked[resource_type].pop(resource_id, None)
+
+    def tracked(self) -> dict[ResourceType, list[int]]:
+        """Returns the resources that are not deleted yet.
+
+        Returns:
+            dict[ResourceType, list[int]]: The IDs of the tracked resources by type.
+        """
+        with self._lock:
+            return {resource_type: sorted(ids) for resource_type, ids in self._tracked.items() if ids}
+
+    def teardown(self) -> dict[ResourceType, list[int]]:
+        """Deletes every tracked resource in dependency order and confirms the deletions.
+
+        Returns:
+            dict[ResourceType, list[int]]: The resources that could not be deleted or whose deletion was not \
+                confirmed within max_wait_time; empty when the teardown is clean.
+        """
+        start = time.time()
+        leftovers: dict[ResourceType, list[int]] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="morpheus-teardown") as executor:
+            for resource_type in TEARDOWN_ORDER:
+                with self._lock:
+                    resources = dict(self._tracked[resource_type])
+                if not resources:
+                    continue
+                remaining = self._teardown_phase(executor, resource_type, resources)
+                with self._lock:
+                    for resource_id in set(resources) - remaining:
+                        self._tracked[resource_type].pop(resource_id, None)
+                if remaining:
+                    leftovers[resource_type] = sorted(remaining)
+
+        if leftovers:
+            logger.error(f"Teardown finished in {time.time() - start:.1f}s with leftovers: {leftovers}")
+        else:
+            logger.info(f"Teardown finished in {time.time() - start:.1f}s")
+        return leftovers
+
+    def _track(self, resource_type: ResourceType, resource_id: int, instance_id: int = None):
+        with self._lock:
+            self._tracked[resource_type][resource_id] = instance_id
+        logger.debug(f"Tracking {resource_type.value} {resource_id} for teardown")
+
+    def _teardown_phase(
+        self, executor: ThreadPoolExecutor, resource_type: ResourceType, resources: dict[int, Optional[int]]
+    ) -> set[int]:
+        logger.info(f"Deleting {len(resources)} {resource_type.value} resources: {sorted(resources)}")
+        outcomes = list(executor.map(lambda resource_id: self._delete(resource_type, resource_id), resources))
+        failed: set[int] = set()
+        pending: dict[int, Optional[int]] = {}
+        for resource_id, outcome in zip(resources, outcomes):
+            if outcome is None:
+                pending[resource_id] = resources[resource_id]
+            elif outcome is False:
+                failed.add(resource_id)
+
+        pending_ids = self._confirm_deleted(resource_type, pending)
+        return failed | pending_ids
+
+    def _delete(self, resource_type: ResourceType, resource_id: int) -> Optional[bool]:
+        # None: the delete was accepted, True: the resource is already gone, False: the delete failed
+        try:
+            response = self._deleters[resource_type](resource_id)
+        except (APIError, requests.RequestException) as error:
+            if _is_not_found(error):
+                return True
+            logger.error(f"Failed to delete {resource_type.value} {resource_id}: {error}")
+            return False
+        except Exception:
+            # An undecodable response or a broken deleter fails this resource only, the teardown goes on
+            logger.exception(f"Unexpected error deleting {resource_type.value} {resource_id}")
+            return False
+        if getattr(response, "success", True) is False:
+            logger.error(f"Failed to delete {resource_type.value} {resource_id}: {response}")
+            return False
+        return None
+
+    def _confirm_deleted(self, resource_type: ResourceType, pending: dict[int, Optional[int]]) -> set[int]:
+        poll_scheduler = AdaptivePollScheduler.for_wait(self.max_wait_time, min_max_interval=self.sleep_time)
+        check_existing = self._existence_checks[resource_type]
+        start_time = time.time()
+        while pending:
+            try:
+                existing = check_existing(pending)
+                pending = {resource_id: owner for resource_id, owner in pending.items() if resource_id in existing}
+            except (APIError, requests.RequestException) as error:
+                # A failed check is not fatal, the deletions are checked again after the next interval
+                logger.warning(f"Failed to check the deletion of {resource_type.value} resources: {error}")
+            except Exception:
+                logger.exception(f"Unexpected error checking the deletion of {resource_type.value} resources")
+            remaining_time = self.max_wait_time - (time.time() - start_time)
+            if not pending or remaining_time <= 0:
+                break
+            logger.info(f"Waiting for {len(pending)} {resource_type.value} resources to be deleted...")
+            time.sleep(poll_scheduler.next_interval(remaining=remaining_time))
+
+        if pending:
+            logger.error(f"Max wait time exceeded for {resource_type.value} deletion: {sorted(pending)}")
+        return set(pending)
+
+    def _existing_instance_snapshots(self, pending: dict[int, Optional[int]]) -> set[int]:
+        # The pending IDs are instance IDs, an instance is done once it has no snapshot left
+        snapshot_service = self.morpheus_api_service.snapshot_service
+        existing: set[int] = set()
+        for instance_id in pending:
+            try:
+                if snapshot_service.list_instance_snapshots(instance_id=instance_id).snapshots:
+                    existing.add(instance_id)
+            except APIError as error:
+                if not _is_not_found(error):
+                    raise
+        return existing
+
+    def _existing_snapshots(self, pending: dict[int, Optional[int]]) -> set[int]:
+        snapshot_service = self.morpheus_api_service.snapshot_service
+        existing: set[int] = set()
+        for instance_id, snapshot_ids in self._group_by_owner(pending).items():
+            if instance_id is None:
+                existing.update(
+                    snapshot_id
+                    for snapshot_id in snapshot_ids
+                    if self._exists(snapshot_service.get_snapshot_by_id, snapshot_id)
+                )
+                continue
+            try:
+                snapshots = snapshot_service.list_instance_snapshots(instance_id=instance_id).snapshots
+            except APIError as error:
+                if not _is_not_found(error):
+                    raise
+                continue
+            existing.update({snapshot.id for snapshot in snapshots} & snapshot_ids)
+        return existing
+
+    def _existing_backups(self, pending: dict[int, Optional[int]]) -> set[int]:
+        backup_service = self.morpheus_api_service.backup_service
+        existing: set[int] = set()
+        for instance_id, backup_ids in self._group_by_owner(pending).items():
+            try:
+                backups = backup_service.list_instance_backups(instance_id=instance_id).backups
+            except APIError as error:
+                if not _is_not_found(error):
+                    raise
+                continue
+            existing.update({backup.id for backup in backups} & backup_ids)
+        return existing
+
+    def _existing_instances(self, pending: dict[int, Optional[int]]) -> set[int]:
+        existing: set[int] = set()
+        for batch in id_batches(sorted(pending)):
+            instance_list = self.morpheus_api_service.instance_service.list_instances(
+                max_results=len(batch), filter=ListQuery(ids=batch)
+            )
+            existing.update(instance.id for instance in instance_list.instances)
+        return existing & set(pending)
+
+    def _existing_virtual_images(self, pending: dict[int, Optional[int]]) -> set[int]:
+        # The virtual image list cannot be filtered by ID, but a scan of the user images is one paginated query
+        virtual_images = self.morpheus_api_service.virtual_image_service.iter_virtual_images()
+        return {virtual_image.id for virtual_image in virtual_images} & set(pending)
+
+    @staticmethod
+    def _group_by_owner(pending: dict[int, Optional[int]]) -> dict[Optional[int], set[int]]:
+        by_owner: dict[Optional[int], set[int]] = defaultdict(set)
+        for resource_id, instance_id in pending.items():
+            by_owner[instance_id].add(resource_id)
+        return by_owner
+
+    @staticmethod
+    def _exists(get: Callable[[int], object], resource_id: int) -> bool:
+        try:
+            get(resource_id)
+        except APIError as error:
+            if _is_not_found(error):
+                return False
+            raise
+        return True
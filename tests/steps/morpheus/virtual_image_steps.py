@@ -1,6 +1,7 @@
 import logging
 import time
 from lib.common.enums.os_type import OSType
+from lib.common.enums.resource_type import ResourceType
 from lib.common.enums.virtual_image_status import VirtualImageStatus
 from lib.common.enums.virtual_image_type import VirtualImageType
 from lib.common.enums.visibility import Visibility
@@ -10,7 +11,7 @@ from morpheus_api.dataclasses.virtual_image import (
     VirtualImageCreateData,
 )
 from morpheus_api.settings import MorpheusAPIService
-
+from tests.steps.morpheus.status_watcher import StatusWatcher
 
 logger = logging.getLogger()
 
@@ -115,7 +116,9 @@ def wait_for_virtual_image_creation(
     """
     start_time = time.time()
     while time.time() - start_time <= max_wait_time:
-        virtual_image_list = morpheus_api_service.virtual_image_service.list_virtual_images(name=virtual_image_name)
+        virtual_image_list = morpheus_api_service.virtual_image_service.list_virtual_images(
+            max=2, name=virtual_image_name
+        )
         if len(virtual_image_list.virtual_images) == 1:
             return
         else:
@@ -175,23 +178,16 @@ def wait_for_virtual_image_status(
         status (VirtualImageStatus): The desired status to wait for.
         max_wait_time (int, optional): The maximum time to wait for the virtual image to reach the desired status, \
             in seconds. Defaults to 1800 seconds (30 minutes).
-        sleep_time (int, optional): The time to wait between status checks, in seconds. Defaults to 30 seconds.
+        sleep_time (int, optional): The longest time to wait between status checks, in seconds. Defaults to 30 seconds.
 
     Raises:
         AssertionError: If the maximum wait time is exceeded before the virtual image reaches the desired status.
     """
-    start_time = time.time()
-    while time.time() - start_time <= max_wait_time:
-        virtual_image = morpheus_api_service.virtual_image_service.get_virtual_image_by_id(
-            virtual_image_id=virtual_image_id
-        )
-        if virtual_image.status == status.value:
-            return
-        else:
-            logger.info(f"Waiting for virtual image status to be '{status.value}'")
-            time.sleep(sleep_time)
-    else:
-        assert False, f"Max wait time exceeded for virtual image status '{status.value}' update."
+    with StatusWatcher.for_wait(morpheus_api_service, max_wait_time, sleep_time=sleep_time) as watcher:
+        virtual_image_status = watcher.subscribe(
+            ResourceType.VIRTUAL_IMAGE, virtual_image_id, status, max_wait_time=max_wait_time
+        ).result()
+    assert virtual_image_status, f"Max wait time exceeded for virtual image status '{status.value}' update."
 
 
 def create_and_upload_virtual_image(
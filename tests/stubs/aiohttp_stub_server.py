@@ -0,0 +1,89 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+
+from aiohttp import web
+
+"""This module contains a local aiohttp stub of the Morpheus API used to exercise the async services."""
+
+AsyncRouteHandler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+class AiohttpStubServer:
+    """An aiohttp application serving canned or computed Morpheus API responses.
+
+    Routes use aiohttp path syntax, e.g. `/api/instances/{id}`. A route is either a JSON-serializable body
+    (served with status 200) or a coroutine function taking an aiohttp Request and returning a Response.
+
+    Usage:
+        server = AiohttpStubServer(latency=0.05)
+        server.add_route("GET", "/api/instances/{id}", handler)
+        async with server:
+            service = AsyncInstanceService(base_url=server.base_url, api_token="token")
+    """
+
+    def __init__(self, latency: float = 0.0):
+        """Initializes the stub server.
+
+        Args:
+            latency (float, optional): Seconds of artificial latency added to every response. Defaults to 0.0.
+        """
+        self.latency = latency
+        self.request_count = 0
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._routes: dict[tuple[str, str], Any] = {}
+        self._runner: web.AppRunner = None
+        self.base_url: str = None
+
+    def add_route(self, method: str, path: str, handler: Any):
+        """Registers a route. Must be called before the server is started.
+
+        Args:
+            method (str): The HTTP method to match.
+            path (str): The aiohttp path pattern to match.
+            handler (Any): A JSON-serializable body or an AsyncRouteHandler coroutine function.
+        """
+        self._routes[(method.upper(), path)] = handler
+
+    def _wrap(self, handler: Any) -> AsyncRouteHandler:
+        async def wrapped(request: web.Request) -> web.StreamResponse:
+            self.request_count += 1
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+            try:
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                if callable(handler):
+                    return await handler(request)
+                return web.json_response(handler)
+            finally:
+                self._in_flight -= 1
+
+        return wrapped
+
+    async def start(self) -> "AiohttpStubServer":
+        """Starts serving on a free local port.
+
+        Returns:
+            AiohttpStubServer: The started server.
+        """
+        app = web.Application()
+        for (method, path), handler in self._routes.items():
+            app.router.add_route(method, path, self._wrap(handler))
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self
+
+    async def stop(self):
+        """Stops serving."""
+        await self._runner.cleanup()
+
+    async def __aenter__(self) -> "AiohttpStubServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
@@ -0,0 +1,110 @@
+import socketserver
+import threading
+from urllib.parse import parse_qs, urlsplit
+
+import h2.config
+import h2.connection
+import h2.events
+
+from tests.stubs.morpheus_stub_server import MorpheusStubServer, StubRequest
+
+"""This module contains an HTTP/2 variant of the Morpheus API stub, used by the transport benchmarks."""
+
+
+class MorpheusH2StubServer(MorpheusStubServer):
+    """A stub server speaking cleartext HTTP/2 with prior knowledge (h2c), with the routes of MorpheusStubServer.
+
+    Every stream of a connection is answered by its own thread, so concurrent requests multiplexed over one
+    connection are served concurrently, as an HTTP/2 appliance would. Clients must connect with prior knowledge,
+    e.g. HTTP2Session(http1=False).
+
+    Usage:
+        with MorpheusH2StubServer(latency=0.05) as server:
+            server.add_route("GET", "/api/instances/{id}", {...})
+            service = InstanceService(server.base_url, "token", session=HTTP2Session(http1=False))
+    """
+
+    def _build_handler(self) -> type:
+        stub = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            def setup(self):
+                stub._accept()
+                self.connection = h2.connection.H2Connection(
+                    h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+                )
+                # Guards the connection state machine and the socket, shared by the stream threads
+                self.condition = threading.Condition()
+                self.streams: dict[int, tuple[dict, bytearray]] = {}
+
+            def handle(self):
+                with self.condition:
+                    self.connection.initiate_connection()
+                    self._flush()
+                while True:
+                    data = self.request.recv(65536)
+                    if not data:
+                        return
+                    with self.condition:
+                        events = self.connection.receive_data(data)
+                        self._flush()
+                    for event in events:
+                        if isinstance(event, h2.events.RequestReceived):
+                            self.streams[event.stream_id] = (dict(event.headers), bytearray())
+                        elif isinstance(event, h2.events.DataReceived):
+                            self.streams[event.stream_id][1].extend(event.data)
+                            with self.condition:
+                                self.connection.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                                self._flush()
+                        elif isinstance(event, h2.events.StreamEnded):
+                            headers, body = self.streams.pop(event.stream_id)
+                            threading.Thread(
+                                target=self._respond, args=(event.stream_id, headers, bytes(body)), daemon=True
+                            ).start()
+                        elif isinstance(event, h2.events.WindowUpdated):
+                            with self.condition:
+                                self.condition.notify_all()
+                        elif isinstance(event, h2.events.ConnectionTerminated):
+                            return
+
+            def _flush(self):
+                data = self.connection.data_to_send()
+                if data:
+                    self.request.sendall(data)
+
+            def _respond(self, stream_id: int, headers: dict, body: bytes):
+                split = urlsplit(headers[":path"])
+                request = StubRequest(
+                    method=headers[":method"],
+                    path=split.path,
+                    query=parse_qs(split.query),
+                    headers={name: value for name, value in headers.items() if not name.startswith(":")},
+                    body=body,
+                    path_params={},
+                )
+                if stub.latency:
+                    threading.Event().wait(stub.latency)
+                response = stub._dispatch(request)
+                payload = response.encode()
+                response_headers = [
+                    (":status", str(response.status)),
+                    ("content-type", "application/json"),
+                    ("content-length", str(len(payload))),
+                    *((name.lower(), value) for name, value in response.headers.items()),
+                ]
+                with self.condition:
+                    self.connection.send_headers(stream_id, response_headers, end_stream=not payload)
+                    self._flush()
+                    while payload:
+                        window = min(
+                            self.connection.local_flow_control_window(stream_id),
+                            self.connection.max_outbound_frame_size,
+                        )
+                        if window <= 0:
+                            self.condition.wait()
+                            continue
+                        chunk, payload = payload[:window], payload[window:]
+                        self.connection.send_data(stream_id, chunk, end_stream=not payload)
+                        self._flush()
+
+        return Handler
@@ -0,0 +1,219 @@
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qs, urlsplit
+
+"""This module contains a local HTTP stub of the Morpheus API used by the client-side tests and benchmarks."""
+
+
+class StubRequest:
+    """A request received by the stub server.
+
+    Attributes:
+        method (str): The HTTP method.
+        path (str): The request path without the query string.
+        query (dict[str, list[str]]): The parsed query string.
+        headers (dict[str, str]): The request headers.
+        body (bytes): The raw request body.
+        path_params (dict[str, str]): The values captured by `{name}` placeholders in the route.
+    """
+
+    def __init__(self, method: str, path: str, query: dict, headers: dict, body: bytes, path_params: dict):
+        self.method = method
+        self.path = path
+        self.query = query
+        self.headers = headers
+        self.body = body
+        self.path_params = path_params
+
+    def json(self) -> Any:
+        """Decodes the request body as JSON.
+
+        Returns:
+            Any: The decoded body, or None when the body is empty.
+        """
+        return json.loads(self.body) if self.body else None
+
+
+class StubResponse:
+    """A response returned by a stub route.
+
+    Attributes:
+        status (int): The HTTP status code. Defaults to 200.
+        body (Any): The body, serialized as JSON unless it is already bytes. Defaults to None.
+        headers (dict[str, str]): Extra response headers. Defaults to None.
+    """
+
+    def __init__(self, status: int = 200, body: Any = None, headers: dict = None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+    def encode(self) -> bytes:
+        """Serializes the body.
+
+        Returns:
+            bytes: The encoded body.
+        """
+        if self.body is None:
+            return b""
+        if isinstance(self.body, bytes):
+            return self.body
+        return json.dumps(self.body).encode()
+
+
+RouteHandler = Callable[[StubRequest], StubResponse]
+
+
+class MorpheusStubServer:
+    """A threaded HTTP/1.1 keep-alive server that serves canned or computed Morpheus API responses.
+
+    Routes are registered per method and path. A path may contain `{name}` placeholders, e.g. `/api/instances/{id}`.
+    A route is either a JSON-serializable object (served with status 200) or a callable taking a StubRequest and
+    returning a StubResponse.
+
+    Usage:
+        with MorpheusStubServer() as server:
+            server.add_route("GET", "/api/instances/{id}", lambda request: StubResponse(body={...}))
+            service = InstanceService(base_url=server.base_url, api_token="token")
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, connect_latency: float = 0.0):
+        """Initializes the stub server.
+
+        Args:
+            host (str, optional): The interface to bind to. Defaults to "127.0.0.1".
+            port (int, optional): The port to bind to; 0 picks a free port. Defaults to 0.
+            latency (float, optional): Seconds of artificial latency added to every response. Defaults to 0.0.
+            connect_latency (float, optional): Seconds of artificial latency added once per connection, as a \
+                proxy CONNECT and a TLS handshake would. Defaults to 0.0.
+        """
+        self.latency = latency
+        self.connect_latency = connect_latency
+        self._routes: list[tuple[str, re.Pattern, Any]] = []
+        self._lock = threading.Lock()
+        self.connection_count = 0
+        self.request_count = 0
+        self.requests: list[StubRequest] = []
+        self._server = ThreadingHTTPServer((host, port), self._build_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """The base URL to hand to the Morpheus API services."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def add_route(self, method: str, path: str, handler: Any):
+        """Registers a route. Later registrations for the same method and path take precedence.
+
+        Args:
+            method (str): The HTTP method to match.
+            path (str): The path to match, with optional `{name}` placeholders.
+            handler (Any): A JSON-serializable body or a RouteHandler callable.
+        """
+        pattern = re.compile("^" + re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", path) + "$")
+        with self._lock:
+            self._routes.insert(0, (method.upper(), pattern, handler))
+
+    def reset_counters(self):
+        """Resets the connection and request counters."""
+        with self._lock:
+            self.connection_count = 0
+            self.request_count = 0
+            self.requests.clear()
+
+    def start(self) -> "MorpheusStubServer":
+        """Starts serving in a background thread.
+
+        Returns:
+            MorpheusStubServer: The started server.
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops serving and closes the listening socket."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> "MorpheusStubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _accept(self):
+        with self._lock:
+            self.connection_count += 1
+        if self.connect_latency:
+            threading.Event().wait(self.connect_latency)
+
+    def _dispatch(self, request: StubRequest) -> StubResponse:
+        with self._lock:
+            self.request_count += 1
+            self.requests.append(request)
+            routes = list(self._routes)
+
+        for method, pattern, handler in routes:
+            if method != request.method:
+                continue
+            match = pattern.match(request.path)
+            if match is None:
+                continue
+            request.path_params = match.groupdict()
+            if callable(handler):
+                return handler(request)
+            return StubResponse(body=handler)
+        return StubResponse(status=404, body={"success": False, "msg": "Not Found"})
+
+    def _build_handler(self) -> type:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                stub._accept()
+
+            def log_message(self, format, *args):
+                pass
+
+            def _handle(self):
+                split = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                request = StubRequest(
+                    method=self.command,
+                    path=split.path,
+                    query=parse_qs(split.query),
+                    headers=dict(self.headers),
+                    body=body,
+                    path_params={},
+                )
+                if stub.latency:
+                    threading.Event().wait(stub.latency)
+                response = stub._dispatch(request)
+                payload = response.encode()
+                self.send_response(response.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in response.headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = _handle
+            do_POST = _handle
+            do_PUT = _handle
+            do_DELETE = _handle
+
+        return Handler
@@ -0,0 +1,282 @@
+"""This module contains builders for Morpheus API response bodies served by the stub server."""
+
+
+def instance_payload(instance_id: int, status: str = "running", name: str = None) -> dict:
+    """Builds the `instance` object returned by /api/instances.
+
+    Args:
+        instance_id (int): The ID of the instance.
+        status (str, optional): The status of the instance. Defaults to "running".
+        name (str, optional): The name of the instance. Defaults to "stub-instance-<instance_id>".
+
+    Returns:
+        dict: The instance object in Morpheus camelCase.
+    """
+    return {
+        "id": instance_id,
+        "name": name or f"stub-instance-{instance_id}",
+        "uuid": f"00000000-0000-0000-0000-{instance_id:012d}",
+        "accountId": 1,
+        "tenant": {"id": 1, "name": "Stub Tenant"},
+        "instanceType": {"id": 7, "code": "mvm", "category": "os", "name": "HPE VM", "image": "/assets/mvm.svg"},
+        "status": status,
+        "volumes": [
+            {
+                "id": instance_id * 10 + i,
+                "rootVolume": i == 0,
+                "name": "root" if i == 0 else f"data-{i}",
+                "size": 10,
+                "storageType": 1,
+                "datastoreId": 6,
+            }
+            for i in range(3)
+        ],
+        "containers": [instance_id * 100],
+        "servers": [instance_id * 1000],
+        "connectionInfo": [{"ip": f"10.0.{instance_id % 250}.{instance_id % 200 + 10}"}],
+        "cluster": {"id": 1, "name": "stub-cluster"},
+        "locked": False,
+        "interfaces": [{"id": f"{instance_id * 7}", "row": 0, "ipMode": "dhcp", "ipAddress": None}],
+        "plan": {"id": 152, "code": "kvm-vm-1024"},
+    }
+
+
+def instance_list_payload(count: int, status: str = "running", offset: int = 0, total: int = None) -> dict:
+    """Builds the body returned by GET /api/instances.
+
+    Args:
+        count (int): The number of instances in the page.
+        status (str, optional): The status of every instance. Defaults to "running".
+        offset (int, optional): The offset of the page. Defaults to 0.
+        total (int, optional): The total number of instances. Defaults to offset + count.
+
+    Returns:
+        dict: The instance list body.
+    """
+    return {
+        "instances": [instance_payload(offset + i + 1, status) for i in range(count)],
+        "meta": {
+            "offset": offset,
+            "max": count,
+            "size": count,
+            "total": total if total is not None else offset + count,
+        },
+    }
+
+
+def server_payload(server_id: int, status: str = "provisioned", power_state: str = "on") -> dict:
+    """Builds the `server` object returned by /api/servers.
+
+    Args:
+        server_id (int): The ID of the server.
+        status (str, optional): The status of the server. Defaults to "provisioned".
+        power_state (str, optional): The power state of the server. Defaults to "on".
+
+    Returns:
+        dict: The server object in Morpheus camelCase.
+    """
+    return {
+        "id": server_id,
+        "name": f"stub-server-{server_id}",
+        "hostname": f"stub-host-{server_id}",
+        "status": status,
+        "parentServer": {"id": 1, "name": "stub-host"},
+        "powerState": power_state,
+        "agentInstalled": True,
+        "agentVersion": "5.0.0",
+        "stats": {"usedMemory": 1073741824, "maxMemory": 4294967296, "cpuUsage": 1.5},
+        "interfaces": [{"id": server_id * 3, "primaryInterface": True, "dhcp": True, "ipAddress": "10.0.0.10"}],
+    }
+
+
+def snapshot_payload(snapshot_id: int, status: str = "complete") -> dict:
+    """Builds a `snapshot` object returned by /api/instances/{id}/snapshots.
+
+    Args:
+        snapshot_id (int): The ID of the snapshot.
+        status (str, optional): The status of the snapshot. Defaults to "complete".
+
+    Returns:
+        dict: The snapshot object in Morpheus camelCase.
+    """
+    return {
+        "id": snapshot_id,
+        "name": f"stub-snapshot-{snapshot_id}",
+        "status": status,
+        "snapshotType": "vm",
+        "zone": {"id": 1, "name": "stub-zone"},
+        "currentlyActive": False,
+        "dateCreated": "2024-01-01T00:00:00Z",
+    }
+
+
+def backup_payload(backup_id: int, instance_id: int, results: list[dict] = None) -> dict:
+    """Builds a `backup` object returned by /api/instances/{id}/backups.
+
+    Args:
+        backup_id (int): The ID of the backup.
+        instance_id (int): The ID of the backed up instance.
+        results (list[dict], optional): The executions of the backup, newest first, see backup_result_payload. \
+            Defaults to none.
+
+    Returns:
+        dict: The backup object in Morpheus camelCase.
+    """
+    return {
+        "id": backup_id,
+        "name": f"stub-backup-{backup_id}",
+        "backupType": {"id": 1, "code": "kvmSnapshot", "name": "KVM VM Snapshot", "copyToStore": False},
+        "targetAll": False,
+        "backupJob": {"id": backup_id, "name": f"stub-backup-job-{instance_id}", "lastExecution": None},
+        "dateCreated": "2024-01-01T00:00:00Z",
+        "lastUpdated": "2024-01-01T00:00:00Z",
+        "backupResults": results or [],
+    }
+
+
+def backup_result_payload(result_id: int, instance_id: int, status: str = "succeeded") -> dict:
+    """Builds an execution of a `backup` object returned by /api/instances/{id}/backups.
+
+    Args:
+        result_id (int): The ID of the backup result.
+        instance_id (int): The ID of the backed up instance.
+        status (str, optional): The status of the execution. Defaults to "succeeded".
+
+    Returns:
+        dict: The backup result object in Morpheus camelCase.
+    """
+    return {
+        "id": result_id,
+        "durationMillis": 1000,
+        "containerId": instance_id * 100,
+        "serverId": instance_id * 1000,
+        "dateCreated": "2024-01-01T00:00:00Z",
+        "lastUpdated": "2024-01-01T00:00:00Z",
+        "startDate": "2024-01-01T00:00:00Z",
+        "endDate": "2024-01-01T00:00:01Z",
+        "backupName": f"stub-backup-result-{result_id}",
+        "status": status,
+        "error": status == "failed",
+        "sizeInBytes": 1048576,
+        "sizeInMb": 1,
+    }
+
+
+def virtual_image_payload(virtual_image_id: int, status: str = "Active") -> dict:
+    """Builds a `virtualImage` object returned by /api/virtual-images.
+
+    Args:
+        virtual_image_id (int): The ID of the virtual image.
+        status (str, optional): The status of the virtual image. Defaults to "Active".
+
+    Returns:
+        dict: The virtual image object in Morpheus camelCase.
+    """
+    return {
+        "id": virtual_image_id,
+        "name": f"stub-image-{virtual_image_id}",
+        "ownerId": 1,
+        "tenant": {"id": 1, "name": "Stub Tenant"},
+        "imageType": "iso",
+        "userUploaded": True,
+        "userDefined": True,
+        "systemImage": False,
+        "isCloudInit": False,
+        "osType": {
+            "id": 1,
+            "code": "rhel",
+            "name": "rhel",
+            "vendor": "Red Hat",
+            "category": "rhel",
+            "osVersion": "9",
+            "bitCount": 64,
+            "platform": "linux",
+            "owner": "stub",
+        },
+        "accounts": [{"id": 1, "name": "Stub Tenant"}],
+        "status": status,
+    }
+
+
+def process_payload(
+    process_id: int,
+    instance_id: int,
+    process_type: str = "startup",
+    status: str = "running",
+    last_updated: str = "2024-01-01T00:00:00Z",
+    events: list[dict] = None,
+) -> dict:
+    """Builds a `process` object returned by /api/instances/{id}/history.
+
+    Args:
+        process_id (int): The ID of the process.
+        instance_id (int): The ID of the instance.
+        process_type (str, optional): The process type code and name. Defaults to "startup".
+        status (str, optional): The status of the process. Defaults to "running".
+        last_updated (str, optional): The last update of the process. Defaults to "2024-01-01T00:00:00Z".
+        events (list[dict], optional): The events of the process, see event_payload. Defaults to none.
+
+    Returns:
+        dict: The process object in Morpheus camelCase.
+    """
+    user = {"username": "admin", "displayName": "Admin"}
+    return {
+        "id": process_id,
+        "accountId": 1,
+        "uniqueId": f"process-{process_id}",
+        "processType": {"code": process_type, "name": process_type},
+        "instanceId": instance_id,
+        "displayName": f"stub-instance-{instance_id}",
+        "status": status,
+        "percent": 100 if status == "complete" else 50,
+        "statusEta": 0,
+        "startDate": "2024-01-01T00:00:00Z",
+        "dateCreated": "2024-01-01T00:00:00Z",
+        "lastUpdated": last_updated,
+        "createdBy": user,
+        "updatedBy": user,
+        "events": events or [],
+    }
+
+
+def event_payload(
+    event_id: int,
+    process_id: int,
+    instance_id: int,
+    process_type: str = "provisionImage",
+    status: str = "running",
+    last_updated: str = "2024-01-01T00:00:00Z",
+) -> dict:
+    """Builds an event of a `process` object returned by /api/instances/{id}/history.
+
+    Args:
+        event_id (int): The ID of the event.
+        process_id (int): The ID of the process of the event.
+        instance_id (int): The ID of the instance.
+        process_type (str, optional): The event type code and name. Defaults to "provisionImage".
+        status (str, optional): The status of the event. Defaults to "running".
+        last_updated (str, optional): The last update of the event. Defaults to "2024-01-01T00:00:00Z".
+
+    Returns:
+        dict: The event object in Morpheus camelCase.
+    """
+    user = {"username": "admin", "displayName": "Admin"}
+    return {
+        "id": event_id,
+        "processId": process_id,
+        "accountId": 1,
+        "uniqueId": f"event-{event_id}",
+        "processType": {"code": process_type, "name": process_type},
+        "refType": "instance",
+        "refId": instance_id,
+        "instanceId": instance_id,
+        "displayName": f"stub-instance-{instance_id}",
+        "status": status,
+        "percent": 100 if status == "complete" else 50,
+        "statusEta": 0,
+        "startDate": "2024-01-01T00:00:00Z",
+        "dateCreated": "2024-01-01T00:00:00Z",
+        "lastUpdated": last_updated,
+        "createdBy": user,
+        "updatedBy": user,
+    }
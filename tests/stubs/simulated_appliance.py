@@ -0,0 +1,308 @@
+import heapq
+import random
+import threading
+import time
+from typing import Optional
+
+from lib.common.enums.backup_status import BackupStatus
+from lib.common.enums.instance_status import InstanceStatus
+from lib.common.enums.snapshot_status import SnapshotStatus
+from tests.stubs.morpheus_stub_server import MorpheusStubServer, StubRequest, StubResponse
+from tests.stubs.payloads import (
+    backup_payload,
+    backup_result_payload,
+    instance_payload,
+    server_payload,
+    snapshot_payload,
+)
+
+"""This module contains a stateful simulation of the appliance lifecycle endpoints, used by the benchmarks."""
+
+# Status of an instance while its create, power, resize or delete operation runs
+TRANSITION_STATUSES = {
+    "create": InstanceStatus.PROVISIONING.value,
+    "clone": InstanceStatus.PROVISIONING.value,
+    "start": "starting",
+    "stop": InstanceStatus.STOPPING.value,
+    "resize": "resizing",
+    "delete": InstanceStatus.REMOVING.value,
+}
+
+# Status of an instance once its operation succeeded, None for a removed instance
+FINAL_STATUSES = {
+    "create": InstanceStatus.RUNNING.value,
+    "clone": InstanceStatus.RUNNING.value,
+    "start": InstanceStatus.RUNNING.value,
+    "stop": InstanceStatus.STOPPED.value,
+    "resize": InstanceStatus.RUNNING.value,
+    "delete": None,
+}
+
+
+class SimulatedInstance:
+    """An instance of the simulated appliance and the operation it is going through.
+
+    Attributes:
+        id (int): The ID of the instance.
+        name (str): The name of the instance.
+        status (str): The status reached by the last finished operation.
+        pending (Optional[tuple[str, Optional[str], float]]): The running operation, its final status and the time \
+            it finishes at; None when the instance is idle.
+        snapshots (list[tuple[int, str, float]]): The ID, final status and finish time of every snapshot.
+        backup_results (list[tuple[int, str, float]]): The ID, final status and finish time of every backup \
+            execution.
+        removed (bool): Whether the instance was deleted.
+    """
+
+    def __init__(self, instance_id: int, name: str):
+        self.id = instance_id
+        self.name = name
+        self.status = InstanceStatus.PROVISIONING.value
+        self.pending: Optional[tuple[str, Optional[str], float]] = None
+        self.snapshots: list[tuple[int, str, float]] = []
+        self.backup_results: list[tuple[int, str, float]] = []
+        self.removed = False
+
+    def settle(self, now: float):
+        """Applies the final status of the running operation once it is due.
+
+        Args:
+            now (float): The current time, in seconds since the epoch.
+        """
+        if self.pending and now >= self.pending[2]:
+            operation, final_status, _ = self.pending
+            self.pending = None
+            if operation == "delete":
+                self.removed = True
+            else:
+                self.status = final_status
+
+    def current_status(self) -> str:
+        return TRANSITION_STATUSES[self.pending[0]] if self.pending else self.status
+
+    def snapshot_payloads(self, now: float) -> list[dict]:
+        return [
+            snapshot_payload(snapshot_id, status if now >= ready_at else "creating")
+            for snapshot_id, status, ready_at in self.snapshots
+        ]
+
+    def backup_payloads(self, now: float) -> list[dict]:
+        if not self.backup_results:
+            return []
+        results = [
+            backup_result_payload(result_id, self.id, status if now >= ready_at else "inProgress")
+            for result_id, status, ready_at in reversed(self.backup_results)
+        ]
+        return [backup_payload(self.id, self.id, results)]
+
+
+class SimulatedAppliance:
+    """A stateful stand-in for the appliance, serving the instance lifecycle endpoints driven by the step functions.
+
+    Creates, clones, power operations, resizes, deletes, snapshots and backups take `operation_time` seconds once
+    started, and the appliance runs at most `capacity` of them at once: the next ones queue behind, so throughput
+    levels off and latency grows past that concurrency, like a real appliance saturating its workers. A
+    `failure_rate` share of the creates, clones, power operations and resizes (drawn from a seeded generator) ends in
+    the failed status; deletes, snapshots and backups always succeed, as their waits have no failed status to stop
+    on. The discovery endpoints read by get_required_data answer with empty lists and one network.
+
+    Usage:
+        with MorpheusStubServer() as server:
+            appliance = SimulatedAppliance(operation_time=0.2, capacity=8)
+            appliance.register(server)
+            morpheus_api_service = MorpheusAPIService(APISettings(base_url=server.base_url, api_token="token"))
+    """
+
+    def __init__(self, operation_time: float = 0.5, capacity: int = 16, failure_rate: float = 0.0, seed: int = 0):
+        """Initializes the simulated appliance.
+
+        Args:
+            operation_time (float, optional): Seconds an operation takes once the appliance starts it. Defaults to 0.5.
+            capacity (int, optional): The number of operations run at once. Defaults to 16.
+            failure_rate (float, optional): The share of the instance operations ending in the failed status. \
+                Defaults to 0.0.
+            seed (int, optional): The seed of the failure draws. Defaults to 0.
+        """
+        self.operation_time = operation_time
+        self.capacity = capacity
+        self.failure_rate = failure_rate
+        self.instances: dict[int, SimulatedInstance] = {}
+        self.operation_count = 0
+        self.max_queue_delay = 0.0
+        self._random = random.Random(seed)
+        self._free_at: list[float] = [0.0] * capacity
+        self._next_snapshot_id = 1
+        self._next_backup_id = 1
+        self._lock = threading.Lock()
+
+    def register(self, stub_server: MorpheusStubServer):
+        """Registers the simulated endpoints on a stub server.
+
+        Args:
+            stub_server (MorpheusStubServer): The stub server.
+        """
+        stub_server.add_route("POST", "/api/instances", self.create_instance)
+        stub_server.add_route("GET", "/api/instances", self.list_instances)
+        stub_server.add_route("GET", "/api/instances/{id}", self.get_instance)
+        stub_server.add_route("DELETE", "/api/instances/{id}", self.delete_instance)
+        for operation in ("start", "stop", "resize"):
+            stub_server.add_route("PUT", f"/api/instances/{{id}}/{operation}", self._operation_handler(operation))
+        stub_server.add_route("PUT", "/api/instances/{id}/clone", self.clone_instance)
+        stub_server.add_route("PUT", "/api/instances/{id}/snapshot", self.create_snapshot)
+        stub_server.add_route("GET", "/api/instances/{id}/snapshots", self.list_snapshots)
+        stub_server.add_route("PUT", "/api/instances/{id}/backup", self.create_backup)
+        stub_server.add_route("GET", "/api/instances/{id}/backups", self.list_backups)
+        stub_server.add_route("GET", "/api/instances/{id}/history", self.history)
+        stub_server.add_route("GET", "/api/servers/{id}", self.get_server)
+        for path, key in (
+            ("/api/storage-buckets", "storageBuckets"),
+            ("/api/storage-volume-types", "storageVolumeTypes"),
+            ("/api/clusters", "clusters"),
+            ("/api/provision-types", "provisionTypes"),
+            ("/api/zones", "zones"),
+            ("/api/instance-types", "instanceTypes"),
+            ("/api/service-plans", "servicePlans"),
+        ):
+            stub_server.add_route("GET", path, {key: [], "meta": {"offset": 0, "max": 1, "size": 0, "total": 0}})
+        stub_server.add_route("GET", "/api/instance-types/{id}", {"instanceType": {"instanceTypeLayouts": []}})
+        stub_server.add_route(
+            "GET",
+            "/api/options/zoneNetworkOptions",
+            {
+                "success": True,
+                "data": {
+                    "networks": [{"id": "network-1", "name": "simulated-network", "allowStaticOverride": False}],
+                    "networkTypes": [],
+                },
+            },
+        )
+
+    def create_instance(self, request: StubRequest) -> StubResponse:
+        with self._lock:
+            instance = self._add_instance(request.json()["instance"]["name"], "create")
+            return StubResponse(body={"instance": self._payload(instance)})
+
+    def clone_instance(self, request: StubRequest) -> StubResponse:
+        with self._lock:
+            if self._find(request) is None:
+                return self._not_found()
+            self._add_instance(request.json()["name"], "clone")
+        return StubResponse(body={"success": True})
+
+    def list_instances(self, request: StubRequest) -> StubResponse:
+        ids = {int(instance_id) for instance_id in request.query.get("id", [])}
+        names = set(request.query.get("name", []))
+        with self._lock:
+            now = time.time()
+            payloads = []
+            for instance in self.instances.values():
+                instance.settle(now)
+                if instance.removed or (ids and instance.id not in ids) or (names and instance.name not in names):
+                    continue
+                payloads.append(self._payload(instance))
+        offset = int(request.query.get("offset", ["0"])[0])
+        max = int(request.query.get("max", [str(len(payloads) or 1)])[0])
+        end = offset + max
+        page = payloads[offset:end]
+        meta = {"offset": offset, "max": max, "size": len(page), "total": len(payloads)}
+        return StubResponse(body={"instances": page, "meta": meta})
+
+    def get_instance(self, request: StubRequest) -> StubResponse:
+        with self._lock:
+            instance = self._find(request)
+            if instance is None:
+                return self._not_found()
+            return StubResponse(body={"instance": self._payload(instance)})
+
+    def delete_instance(self, request: StubRequest) -> StubResponse:
+        return self._operation_handler("delete")(request)
+
+    def create_snapshot(self, request: StubRequest) -> StubResponse:
+        with self._lock:
+            instance = self._find(request)
+            if instance is None:
+                return self._not_found()
+            instance.snapshots.append((self._next_snapshot_id, SnapshotStatus.COMPLETE.value, self._schedule()))
+            self._next_snapshot_id += 1
+        return StubResponse(body={"success": True})
+
+    def list_snapshots(self, request: StubRequest) -> StubResponse:
+        with self._lock:
+            instance = self._find(request)
+            if instance is None:
+                return self._not_found()
+            return StubResponse(body={"snapshots": instance.snapshot_payloads(time.time())})
+
+    def create_backup(self, request: StubRequest) -> StubResponse:
+        with self._lock:
+            instance = self._find(request)
+            if instance is None:
+                return self._not_found()
+            instance.backup_results.append((self._next_backup_id, BackupStatus.SUCCEEDED.value, self._schedule()))
+            self._next_backup_id += 1
+        return StubResponse(body={"success": True})
+
+    def list_backups(self, request: StubRequest) -> StubResponse:
+        with self._lock:
+            instance = self._find(request)
+            if instance is None:
+                return self._not_found()
+            return StubResponse(
+                body={"instance": {"id": instance.id}, "backups": instance.backup_payloads(time.time())}
+            )
+
+    def history(self, request: StubRequest) -> StubResponse:
+        return StubResponse(body={"processes": [], "meta": {"offset": 0, "max": 25, "size": 0, "total": 0}})
+
+    def get_server(self, request: StubRequest) -> StubResponse:
+        return StubResponse(body={"server": server_payload(int(request.path_params["id"]))})
+
+    def _operation_handler(self, operation: str):
+        def handler(request: StubRequest) -> StubResponse:
+            with self._lock:
+                instance = self._find(request)
+                if instance is None:
+                    return self._not_found()
+                self._start(instance, operation)
+                body = {"success": True}
+                if operation == "resize":
+                    body["instance"] = self._payload(instance)
+            return StubResponse(body=body)
+
+        return handler
+
+    def _add_instance(self, name: str, operation: str) -> SimulatedInstance:
+        instance = SimulatedInstance(len(self.instances) + 1, name)
+        self.instances[instance.id] = instance
+        self._start(instance, operation)
+        return instance
+
+    def _start(self, instance: SimulatedInstance, operation: str):
+        ready_at = self._schedule()
+        failed = operation != "delete" and self._random.random() < self.failure_rate
+        final_status = InstanceStatus.FAILED.value if failed else FINAL_STATUSES[operation]
+        instance.pending = (operation, final_status, ready_at)
+
+    def _schedule(self) -> float:
+        # The operation starts on the first free worker and holds it for operation_time
+        now = time.time()
+        start = max(now, heapq.heappop(self._free_at))
+        ready_at = start + self.operation_time
+        heapq.heappush(self._free_at, ready_at)
+        self.operation_count += 1
+        self.max_queue_delay = max(self.max_queue_delay, start - now)
+        return ready_at
+
+    def _find(self, request: StubRequest) -> Optional[SimulatedInstance]:
+        instance = self.instances.get(int(request.path_params["id"]))
+        if instance is None:
+            return None
+        instance.settle(time.time())
+        return None if instance.removed else instance
+
+    def _payload(self, instance: SimulatedInstance) -> dict:
+        return instance_payload(instance.id, instance.current_status(), instance.name)
+
+    @staticmethod
+    def _not_found() -> StubResponse:
+        return StubResponse(status=404, body={"success": False, "msg": "Not Found"})